@@ -24,6 +24,9 @@ class TagManagerAdapter:
     def get_files_by_tags(self, tags: list) -> list:
         return self._tag_service.get_files_by_tags(tags)
 
+    def find_tags_by_partial(self, partial: str) -> List[str]:
+        return self._tag_service.find_tags_by_partial(partial)
+
     def delete_file_entry(self, file_path: str) -> bool:
         return self._tag_service.delete_file_entry(file_path)
 
@@ -38,18 +41,17 @@ class TagManagerAdapter:
 
     def get_files_with_tags(self, tags: List[str], match_all: bool = False) -> List[str]:
         if match_all:
-            # TODO: Implement logic for matching all tags
-            pass
-        else:
-            return self._tag_service.get_files_by_tags(tags)
+            return self._tag_service.get_files_with_all_tags(tags)
+        return self._tag_service.get_files_by_tags(tags)
+
+    def find_files_by_tag_query(self, expression: str) -> List[str]:
+        return self._tag_service.find_files_by_tag_query(expression)
 
     def get_all_tagged_files(self) -> List[str]:
-        # TODO: Implement this in TagService or TagRepository
-        return []
+        return self._tag_service.get_all_tagged_files()
 
     def get_tag_counts(self) -> dict:
-        # TODO: Implement this in TagService or TagRepository
-        return {}
+        return self._tag_service.get_tag_counts()
 
     def remove_tags_from_files(self, file_paths: List[str], tags_to_remove: List[str]) -> dict:
         return self._tag_service.remove_tags_from_files(file_paths, tags_to_remove)
@@ -0,0 +1,34 @@
+"""
+작업 스레드에서 실행되는 작업의 협력적 취소
+
+작업은 루프 중간중간 `raise_if_cancelled()`를 호출하고, 요청한 쪽은 새 요청이 들어오면
+이전 토큰의 `cancel()`을 호출합니다. 취소는 작업이 다음 확인 지점에 도달했을 때 반영됩니다.
+"""
+
+import threading
+
+
+class OperationCancelled(Exception):
+    """취소된 작업에서 발생하는 예외"""
+
+
+class CancellationToken:
+    """요청 세대(generation) 번호와 취소 상태를 가진 토큰
+
+    Args:
+        generation: 요청마다 증가하는 세대 번호. 결과가 최신 요청의 것인지 판단할 때 사용합니다.
+    """
+
+    def __init__(self, generation: int = 0):
+        self.generation = generation
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def raise_if_cancelled(self):
+        if self._cancelled.is_set():
+            raise OperationCancelled()
@@ -46,15 +46,48 @@ class ConfigManager:
                 "host": "localhost",
                 "port": 27018,
                 "database": "file_tagger",
-                "collection": "tags"
+                "collection": "tags",
+                # 태그 인덱스/검색에 사용할 collation (예: {"locale": "ko", "strength": 2})
+                "tag_collation": None
             },
             "application": {
                 "default_workspace_path": "",
-                "custom_tags_file": "custom_tags.json"
+                "custom_tags_file": "custom_tags.json",
+                # 작업공간 색인 등 로컬 캐시 저장 위치 (비어 있으면 ~/.filetagger/cache)
+                "cache_dir": ""
+            },
+            "storage": {
+                # 태그 저장소: "mongodb", "sqlite" (MongoDB 서버 없이 실행), "memory" (테스트/벤치마크용, 저장 안 됨)
+                "backend": "mongodb",
+                # sqlite 저장소 파일 경로 (비어 있으면 ~/.filetagger/tags.db)
+                "sqlite_path": ""
             },
             "ui": {
                 "theme": "default",
                 "language": "ko"
+            },
+            "performance": {
+                # 일괄 태그 추가/제거 시 bulk_write 한 번에 보낼 연산 수
+                "bulk_write_chunk_size": 1000,
+                # 검색 시 작업공간 색인을 증분 갱신하는 최소 간격(초)
+                "workspace_index_refresh_seconds": 10,
+                # 검색 결과를 화면에 나눠 보내는 단위 (파일 수 / 최대 간격 ms)
+                "search_chunk_size": 500,
+                "search_chunk_interval_ms": 50,
+                # 파일별 태그 캐시 한도 (항목 수 / 메모리 MB, 0이면 제한 없음)
+                "file_tag_cache_max_entries": 100000,
+                "file_tag_cache_max_mb": 64,
+                # 시작 시 태그 역색인 구축 여부 (끄면 태그 경로 블룸 필터만 구축)
+                "tag_index_enabled": True,
+                # 태그 없는 파일 판별용 블룸 필터의 목표 오탐률
+                "untagged_filter_false_positive_rate": 0.01,
+                # 미리보기 캐시 한도 (디스크 MB, 0이면 제한 없음 / 메모리에 둘 최근 미리보기 수)
+                "preview_cache_max_mb": 512,
+                "preview_memory_cache_entries": 64,
+                # 유휴 시간 미리보기 예열 (CPU 사용률 % / 원본 읽기 MB/s 한도)
+                "preview_prewarm_enabled": True,
+                "preview_prewarm_cpu_percent": 25,
+                "preview_prewarm_max_mb_per_second": 16
             }
         }
         
@@ -114,6 +147,84 @@ class ConfigManager:
         """MongoDB URI를 가져옵니다."""
         return self.get("mongodb", "uri", "mongodb://localhost:27018/")
     
+    def get_storage_backend(self) -> str:
+        """태그 저장소 종류("mongodb", "sqlite", "memory")를 가져옵니다."""
+        return str(self.get("storage", "backend", "mongodb")).lower()
+
+    def get_sqlite_path(self) -> str:
+        """sqlite 태그 저장소 파일 경로를 가져옵니다."""
+        path = self.get("storage", "sqlite_path", "")
+        if not path:
+            path = os.path.join(os.path.expanduser("~"), ".filetagger", "tags.db")
+        return path
+
+    def get_tag_collation(self) -> Optional[Dict[str, Any]]:
+        """태그 인덱스/검색용 collation 설정을 가져옵니다. 설정이 없으면 None입니다."""
+        return self.get("mongodb", "tag_collation", None)
+
+    def get_bulk_write_chunk_size(self) -> int:
+        """일괄 태그 작업의 bulk_write 청크 크기를 가져옵니다."""
+        return int(self.get("performance", "bulk_write_chunk_size", 1000))
+
+    def get_cache_dir(self) -> str:
+        """로컬 캐시 디렉토리 경로를 가져옵니다."""
+        path = self.get("application", "cache_dir", "")
+        if not path:
+            path = os.path.join(os.path.expanduser("~"), ".filetagger", "cache")
+        return path
+
+    def get_workspace_index_refresh_seconds(self) -> float:
+        """작업공간 색인 증분 갱신 간격(초)을 가져옵니다."""
+        return float(self.get("performance", "workspace_index_refresh_seconds", 10))
+
+    def get_search_chunk_size(self) -> int:
+        """검색 결과 스트리밍 청크 크기(파일 수)를 가져옵니다."""
+        return int(self.get("performance", "search_chunk_size", 500))
+
+    def get_search_chunk_interval(self) -> float:
+        """검색 결과 스트리밍 최대 간격(초)을 가져옵니다."""
+        return int(self.get("performance", "search_chunk_interval_ms", 50)) / 1000.0
+
+    def get_file_tag_cache_max_entries(self) -> int:
+        """파일별 태그 캐시의 최대 항목 수를 가져옵니다. 0이면 제한 없음"""
+        return int(self.get("performance", "file_tag_cache_max_entries", 100000))
+
+    def get_file_tag_cache_max_bytes(self) -> int:
+        """파일별 태그 캐시의 최대 메모리(바이트)를 가져옵니다. 0이면 제한 없음"""
+        return int(float(self.get("performance", "file_tag_cache_max_mb", 64)) * 1024 * 1024)
+
+    def is_tag_index_enabled(self) -> bool:
+        """시작 시 태그 역색인을 구축할지 여부를 가져옵니다."""
+        return bool(self.get("performance", "tag_index_enabled", True))
+
+    def get_untagged_filter_false_positive_rate(self) -> float:
+        """태그 없는 파일 판별용 블룸 필터의 목표 오탐률을 가져옵니다."""
+        return float(self.get("performance", "untagged_filter_false_positive_rate", 0.01))
+
+    def get_preview_cache_dir(self) -> str:
+        """미리보기 캐시 디렉토리 경로를 가져옵니다."""
+        return os.path.join(self.get_cache_dir(), "previews")
+
+    def get_preview_cache_max_bytes(self) -> int:
+        """디스크 미리보기 캐시의 총 크기 한도(바이트)를 가져옵니다."""
+        return int(float(self.get("performance", "preview_cache_max_mb", 512)) * 1024 * 1024)
+
+    def get_preview_memory_cache_entries(self) -> int:
+        """메모리에 둘 최근 미리보기 수를 가져옵니다."""
+        return int(self.get("performance", "preview_memory_cache_entries", 64))
+
+    def is_preview_prewarm_enabled(self) -> bool:
+        """유휴 시간 미리보기 예열 사용 여부를 가져옵니다."""
+        return bool(self.get("performance", "preview_prewarm_enabled", True))
+
+    def get_preview_prewarm_cpu_fraction(self) -> float:
+        """미리보기 예열이 사용할 CPU 시간 비율(0~1)을 가져옵니다."""
+        return min(1.0, max(0.01, float(self.get("performance", "preview_prewarm_cpu_percent", 25)) / 100.0))
+
+    def get_preview_prewarm_max_bytes_per_second(self) -> int:
+        """미리보기 예열의 원본 읽기 속도 한도(바이트/초)를 가져옵니다."""
+        return int(float(self.get("performance", "preview_prewarm_max_mb_per_second", 16)) * 1024 * 1024)
+
     def get_workspace_path(self) -> str:
         """작업 디렉토리 경로를 가져옵니다."""
         path = self.get("application", "default_workspace_path", "")
@@ -1,6 +1,6 @@
-from dataclasses import dataclass
-from typing import List
-from PyQt5.QtCore import QObject, pyqtSignal
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Tuple
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 import time
 
 @dataclass
@@ -15,14 +15,82 @@ class TagRemovedEvent:
     tag: str
     timestamp: float
 
+@dataclass
+class TagsChangedBatch:
+    """한 작업 또는 한 이벤트 루프 동안 모인 태그 변경
+    changes: {file_path: (추가된 태그 리스트, 제거된 태그 리스트)}
+    """
+    changes: Dict[str, Tuple[List[str], List[str]]] = field(default_factory=dict)
+    timestamp: float = 0.0
+
+    @property
+    def file_paths(self) -> List[str]:
+        return list(self.changes.keys())
+
+    def __contains__(self, file_path: str) -> bool:
+        return file_path in self.changes
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
 class EventBus(QObject):
+    """태그 변경 알림
+
+    tags_changed가 기준 시그널입니다. 모든 태그 변경(단건 포함)이 이 시그널로 모여 전달되므로
+    화면 갱신은 tags_changed만 구독합니다. tag_added/tag_removed는 단건 변경을 바로 알리는
+    기존 시그널로 남겨 두었으며, 같은 변경이 tags_changed로도 오므로 둘 다 구독하면 두 번 갱신됩니다.
+    """
+
     # 타입 안전한 시그널 정의
     tag_added = pyqtSignal(TagAddedEvent)
     tag_removed = pyqtSignal(TagRemovedEvent)
+    # 모아서 한 번에 보내는 태그 변경 (ViewModel은 이 시그널을 구독)
+    tags_changed = pyqtSignal(TagsChangedBatch)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending_changes: Dict[str, Tuple[List[str], List[str]]] = {}
+        self._flush_scheduled = False
+
+    def publish_tags_changed(self, changes: Dict[str, Tuple[Iterable[str], Iterable[str]]]):
+        """여러 파일의 태그 변경을 발행합니다. {file_path: (added, removed)}
+        현재 이벤트 루프 틱이 끝날 때 그동안 모인 변경과 함께 보냅니다."""
+        for file_path, (added, removed) in changes.items():
+            self._merge_change(file_path, added, removed)
+        self._schedule_flush()
+
+    def flush(self):
+        """모인 태그 변경을 즉시 tags_changed로 보냅니다."""
+        self._flush_scheduled = False
+        if not self._pending_changes:
+            return
+        changes, self._pending_changes = self._pending_changes, {}
+        self.tags_changed.emit(TagsChangedBatch(changes, time.time()))
+
+    def _merge_change(self, file_path: str, added: Iterable[str], removed: Iterable[str]):
+        pending_added, pending_removed = self._pending_changes.setdefault(file_path, ([], []))
+        # 같은 창 안에서 추가 후 제거(또는 그 반대)된 태그는 마지막 변경만 남긴다
+        for tag in added:
+            if tag in pending_removed:
+                pending_removed.remove(tag)
+            if tag not in pending_added:
+                pending_added.append(tag)
+        for tag in removed:
+            if tag in pending_added:
+                pending_added.remove(tag)
+            if tag not in pending_removed:
+                pending_removed.append(tag)
+
+    def _schedule_flush(self):
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+        QTimer.singleShot(0, self.flush)
     
     def publish_tag_added(self, file_path: str, tag: str):
         event = TagAddedEvent(file_path, tag, time.time())
         self.tag_added.emit(event)
+        self.publish_tags_changed({file_path: ([tag], [])})
     
     def subscribe_tag_added(self, callback):
         self.tag_added.connect(callback)
@@ -30,6 +98,10 @@ class EventBus(QObject):
     def publish_tag_removed(self, file_path: str, tag: str):
         event = TagRemovedEvent(file_path, tag, time.time())
         self.tag_removed.emit(event)
+        self.publish_tags_changed({file_path: ([], [tag])})
 
     def subscribe_tag_removed(self, callback):
         self.tag_removed.connect(callback)
+
+    def subscribe_tags_changed(self, callback):
+        self.tags_changed.connect(callback)
@@ -0,0 +1,219 @@
+"""
+미리보기 디코더
+
+작업 스레드에서 실행되므로 QPixmap이 아닌 QImage만 만듭니다 (QPixmap은 GUI 스레드 전용).
+디코더는 (file_path, target_size, token)을 받아 QImage를 반환하고, 실패하면 PreviewError를 발생시킵니다.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+import fitz  # type: ignore # PyMuPDF
+from PyQt5.QtCore import QSize, Qt
+from PyQt5.QtGui import QImage, QImageIOHandler, QImageReader, QTransform
+
+from core.cancellation import CancellationToken
+from core.preview.jpeg_exif import read_exif_thumbnail
+
+logger = logging.getLogger(__name__)
+
+# 목표 크기가 없을 때의 PDF 렌더링 배율
+PDF_RENDER_ZOOM = 2.0
+# 목표 크기에서 계산한 배율의 범위 (아주 작은 페이지를 큰 화면에 맞출 때 메모리 폭증 방지)
+MIN_PDF_ZOOM = 0.05
+MAX_PDF_ZOOM = 4.0
+# 미리보기 하나를 디코딩할 때 만들 수 있는 최대 픽셀 버퍼 (ARGB32 기준 약 256MB).
+# 디코딩 중 픽셀 수가 이보다 커지는 이미지는 읽기 전에 거부합니다.
+MAX_FULL_DECODE_PIXELS = 64 * 1000 * 1000
+# libjpeg는 DCT 단계에서 1/8까지 줄여 디코딩함 (다른 형식은 원본 크기로 디코딩한 뒤 줄임)
+JPEG_MAX_SCALE_DENOMINATOR = 8
+
+
+class PreviewError(Exception):
+    """미리보기를 만들 수 없는 파일"""
+
+
+def _fit(image: QImage, target_size: QSize) -> QImage:
+    if target_size.isEmpty() or (image.width() <= target_size.width() and image.height() <= target_size.height()):
+        return image
+    return image.scaled(target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def _apply_transformation(image: QImage, transformation: int) -> QImage:
+    """EXIF 방향(QImageIOHandler.Transformations)을 적용합니다. QImageReader.setAutoTransform과 같은 순서"""
+    if transformation & QImageIOHandler.TransformationMirror:
+        image = image.mirrored(True, False)
+    if transformation & QImageIOHandler.TransformationFlip:
+        image = image.mirrored(False, True)
+    if transformation & QImageIOHandler.TransformationRotate90:
+        image = image.transformed(QTransform().rotate(90))
+    return image
+
+
+def _decode_exif_thumbnail(file_path: str, fitted: QSize, transformation: int) -> Optional[QImage]:
+    """EXIF 썸네일이 fitted 크기 이상이면 그것을 반환합니다."""
+    data = read_exif_thumbnail(file_path)
+    if data is None:
+        return None
+    thumbnail = QImage.fromData(data, "JPEG")
+    if thumbnail.isNull():
+        return None
+    thumbnail = _apply_transformation(thumbnail, transformation)
+    if thumbnail.width() < fitted.width() or thumbnail.height() < fitted.height():
+        return None
+    return thumbnail
+
+
+def _decode_pixels(source_size: QSize, fitted: Optional[QSize], is_jpeg: bool) -> int:
+    """디코딩하는 동안 만들어지는 가장 큰 픽셀 버퍼의 픽셀 수 (추정)"""
+    source_pixels = source_size.width() * source_size.height()
+    if fitted is None or not is_jpeg:
+        return source_pixels
+    fitted_pixels = fitted.width() * fitted.height()
+    return max(fitted_pixels, source_pixels // (JPEG_MAX_SCALE_DENOMINATOR ** 2))
+
+
+def decode_image(file_path: str, target_size: QSize, token: CancellationToken) -> QImage:
+    """이미지 파일을 target_size 안에 맞춘 크기로 디코딩합니다.
+
+    QImageReader로 헤더의 크기만 먼저 읽고 축소 크기를 지정하여 디코딩합니다.
+    - JPEG: EXIF 썸네일이 충분히 크면 그것만 읽고, 아니면 libjpeg의 DCT 단계 축소(1/2, 1/4, 1/8)로
+      원본 해상도의 픽셀 버퍼를 만들지 않습니다.
+    - 플러그인이 축소 디코딩을 지원하는 형식(JPEG, SVG 등)은 처음부터 축소된 크기로 디코딩합니다.
+    - 그 밖의 형식(PNG, BMP, GIF)은 QImageReader가 원본 크기로 디코딩한 뒤 줄입니다.
+    헤더의 크기로 디코딩 중 픽셀 버퍼를 추정하여 MAX_FULL_DECODE_PIXELS를 넘으면 읽기 전에 거부하므로
+    미리보기 하나의 최대 메모리는 원본 해상도와 관계없이 제한됩니다.
+    """
+    reader = QImageReader(file_path)
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    if not reader.canRead() or not source_size.isValid():
+        raise PreviewError("이미지 로드 실패")
+
+    transformation = int(reader.transformation())
+    rotated = bool(transformation & QImageIOHandler.TransformationRotate90)
+    oriented_size = source_size.transposed() if rotated else QSize(source_size)
+    is_jpeg = bytes(reader.format()).lower() in (b"jpeg", b"jpg")
+    fitted = None
+
+    if not target_size.isEmpty() and (
+            oriented_size.width() > target_size.width() or oriented_size.height() > target_size.height()):
+        fitted = oriented_size.scaled(target_size, Qt.KeepAspectRatio)
+        if is_jpeg:
+            thumbnail = _decode_exif_thumbnail(file_path, fitted, transformation)
+            if thumbnail is not None:
+                return _fit(thumbnail, target_size)
+        token.raise_if_cancelled()
+        # JPEG 외에는 QImageReader가 전체 디코딩 후 줄임. 축소 크기는 회전 전 좌표계로 지정
+        reader.setScaledSize(fitted.transposed() if rotated else fitted)
+
+    if _decode_pixels(source_size, fitted, is_jpeg) > MAX_FULL_DECODE_PIXELS:
+        logger.debug(f"[PREVIEW] 디코딩 버퍼가 한도를 넘는 이미지: {file_path} ({source_size.width()}x{source_size.height()})")
+        raise PreviewError("미리보기를 만들기에는 이미지가 너무 큽니다")
+
+    image = reader.read()
+    if image.isNull():
+        raise PreviewError("이미지 로드 실패")
+    token.raise_if_cancelled()
+    return _fit(image, target_size)
+
+
+# PyMuPDF는 여러 스레드에서 동시에 사용할 수 없으므로 모든 fitz 호출을 직렬화
+_PDF_LOCK = threading.Lock()
+
+
+def pdf_zoom_for(page_width: float, page_height: float, target_size: QSize) -> float:
+    """페이지(포인트 단위)가 target_size 안에 딱 맞는 렌더링 배율"""
+    if target_size.isEmpty() or page_width <= 0 or page_height <= 0:
+        return PDF_RENDER_ZOOM
+    zoom = min(target_size.width() / page_width, target_size.height() / page_height)
+    return min(max(zoom, MIN_PDF_ZOOM), MAX_PDF_ZOOM)
+
+
+class PdfDocument:
+    """한 번 연 PDF 문서와 최근 렌더링한 페이지의 LRU
+
+    같은 문서의 여러 페이지를 요청할 때 파일을 다시 열지 않습니다.
+    페이지는 목표 크기에 맞는 배율로 바로 렌더링하므로 큰 배율로 그린 뒤 줄이지 않습니다.
+
+    Args:
+        file_path: PDF 파일 경로
+        max_cached_pages: 메모리에 둘 렌더링된 페이지 수 (0이면 캐시하지 않음)
+    """
+
+    DEFAULT_MAX_CACHED_PAGES = 8
+
+    def __init__(self, file_path: str, max_cached_pages: int = DEFAULT_MAX_CACHED_PAGES):
+        self.file_path = file_path
+        self._max_cached_pages = max(0, int(max_cached_pages))
+        self._pages: "OrderedDict[Tuple[int, int, int], QImage]" = OrderedDict()
+        with _PDF_LOCK:
+            try:
+                self._doc = fitz.open(file_path)
+            except Exception as e:
+                raise PreviewError(f"PDF 미리보기 오류: {e}") from e
+            self.page_count = self._doc.page_count
+
+    def render_page(self, index: int, target_size: QSize, token: CancellationToken) -> QImage:
+        """index 페이지를 target_size 안에 맞춰 렌더링합니다. 캐시에 있으면 다시 그리지 않습니다."""
+        key = (index, target_size.width(), target_size.height())
+        with _PDF_LOCK:
+            image = self._pages.get(key)
+            if image is not None:
+                self._pages.move_to_end(key)
+                return image
+            # 취소와 함께 닫힌 문서는 오류가 아니라 취소로 끝냄
+            token.raise_if_cancelled()
+            if self._doc is None or not 0 <= index < self.page_count:
+                raise PreviewError("PDF 페이지를 렌더링할 수 없습니다.")
+            page = self._doc.load_page(index)
+            zoom = pdf_zoom_for(page.rect.width, page.rect.height, target_size)
+            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+            # pix.samples 버퍼는 pix와 함께 사라지므로 복사본을 만든다
+            image = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format_RGB888).copy()
+            # 픽셀 경계 반올림으로 1px 넘칠 수 있음
+            image = _fit(image, target_size)
+            if self._max_cached_pages:
+                self._pages[key] = image
+                while len(self._pages) > self._max_cached_pages:
+                    self._pages.popitem(last=False)
+        token.raise_if_cancelled()
+        return image
+
+    def close(self):
+        with _PDF_LOCK:
+            if self._doc is not None:
+                self._doc.close()
+                self._doc = None
+            self._pages.clear()
+
+
+def render_pdf_first_page(file_path: str, target_size: QSize, token: CancellationToken) -> QImage:
+    """PDF 첫 페이지를 target_size 안에 맞춘 배율로 렌더링합니다."""
+    document = PdfDocument(file_path, max_cached_pages=0)
+    try:
+        return document.render_page(0, target_size, token)
+    finally:
+        document.close()
+
+
+# 미리보기 종류 → 디코더
+PREVIEW_DECODERS: Dict[str, Callable[[str, QSize, CancellationToken], QImage]] = {
+    "image": decode_image,
+    "pdf": render_pdf_first_page,
+}
+
+# 미리보기 종류별 확장자
+PREVIEW_EXTENSIONS: Dict[str, tuple] = {
+    "image": (".png", ".jpg", ".jpeg", ".bmp", ".gif"),
+    "pdf": (".pdf",),
+}
+_KIND_BY_EXTENSION = {ext: kind for kind, exts in PREVIEW_EXTENSIONS.items() for ext in exts}
+
+
+def preview_kind_for(file_path: str) -> Optional[str]:
+    """파일의 미리보기 종류 ("image", "pdf"). 작업 스레드에서 만들 수 있는 미리보기가 아니면 None"""
+    return _KIND_BY_EXTENSION.get(os.path.splitext(file_path)[1].lower())
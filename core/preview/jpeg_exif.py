@@ -0,0 +1,85 @@
+"""
+JPEG EXIF 썸네일 추출
+
+카메라/스캐너 JPEG는 APP1(EXIF) 세그먼트의 IFD1에 작은 JPEG 썸네일(보통 160x120)을 담고 있습니다.
+목표 크기가 이보다 작으면 본문을 디코딩하지 않고 이 썸네일만 읽습니다.
+파일 앞부분(APP 세그먼트)만 읽으며 본문 크기와 무관합니다.
+"""
+
+import struct
+from typing import Optional
+
+# EXIF는 APP1 세그먼트(최대 64KB) 안에 있음
+_MAX_HEADER_BYTES = 128 * 1024
+_SOI = b"\xff\xd8"
+_APP1 = 0xE1
+_SOS = 0xDA
+_TAG_THUMBNAIL_OFFSET = 0x0201
+_TAG_THUMBNAIL_LENGTH = 0x0202
+
+
+def _find_exif_segment(data: bytes) -> Optional[bytes]:
+    if not data.startswith(_SOI):
+        return None
+    pos = 2
+    while pos + 4 <= len(data):
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:  # 채움 바이트
+            pos += 1
+            continue
+        if marker == _SOS:
+            return None
+        length = struct.unpack(">H", data[pos + 2:pos + 4])[0]
+        segment = data[pos + 4:pos + 2 + length]
+        if marker == _APP1 and segment.startswith(b"Exif\x00\x00"):
+            return segment[6:]
+        pos += 2 + length
+    return None
+
+
+def _read_ifd_entries(tiff: bytes, offset: int, endian: str) -> dict:
+    count = struct.unpack(endian + "H", tiff[offset:offset + 2])[0]
+    entries = {}
+    for index in range(count):
+        start = offset + 2 + index * 12
+        tag, field_type, _, value = struct.unpack(endian + "HHII", tiff[start:start + 12])
+        if field_type == 3:  # SHORT는 값 필드의 앞 2바이트
+            value = struct.unpack(endian + "H", tiff[start + 8:start + 10])[0]
+        entries[tag] = value
+    return entries
+
+
+def extract_exif_thumbnail(data: bytes) -> Optional[bytes]:
+    """JPEG 앞부분 바이트에서 EXIF 썸네일 JPEG를 꺼냅니다. 없거나 형식이 맞지 않으면 None"""
+    tiff = _find_exif_segment(data)
+    if not tiff or len(tiff) < 8:
+        return None
+    try:
+        endian = {b"II": "<", b"MM": ">"}[tiff[:2]]
+        ifd0 = struct.unpack(endian + "I", tiff[4:8])[0]
+        ifd0_count = struct.unpack(endian + "H", tiff[ifd0:ifd0 + 2])[0]
+        next_offset = ifd0 + 2 + ifd0_count * 12
+        ifd1 = struct.unpack(endian + "I", tiff[next_offset:next_offset + 4])[0]
+        if ifd1 == 0:
+            return None
+        entries = _read_ifd_entries(tiff, ifd1, endian)
+    except (KeyError, struct.error):
+        return None
+    offset = entries.get(_TAG_THUMBNAIL_OFFSET)
+    length = entries.get(_TAG_THUMBNAIL_LENGTH)
+    if not offset or not length or offset + length > len(tiff):
+        return None
+    thumbnail = tiff[offset:offset + length]
+    return thumbnail if thumbnail.startswith(_SOI) else None
+
+
+def read_exif_thumbnail(file_path: str) -> Optional[bytes]:
+    """JPEG 파일의 EXIF 썸네일 JPEG 바이트. 없으면 None"""
+    try:
+        with open(file_path, "rb") as f:
+            data = f.read(_MAX_HEADER_BYTES)
+    except OSError:
+        return None
+    return extract_exif_thumbnail(data)
@@ -0,0 +1,231 @@
+"""
+PDF 여러 페이지 지연 렌더링
+
+PDF 미리보기에서 스크롤해 보이게 된 페이지만 작업 스레드에서 렌더링합니다.
+문서는 open()할 때 작업 스레드에서 한 번만 열고 같은 핸들로 첫 페이지를 그립니다.
+이후 페이지 요청도 같은 PdfDocument를 재사용하며, 다른 문서로 바뀌면 작업 스레드에서 명시적으로 닫습니다.
+닫기는 _PDF_LOCK을 잡아야 하므로 GUI 스레드에서 하지 않습니다 (렌더링 중인 페이지가 끝날 때까지 화면이 멈춤).
+렌더링한 페이지는 PdfDocument의 LRU에 남으므로 앞뒤로 스크롤해도 다시 그리지 않습니다.
+첫 페이지는 PreviewCache에도 저장하므로 예열된 결과를 그대로 씁니다.
+PreviewLoader와 같이 세대 번호로 이전 문서의 늦은 결과를 무시합니다.
+"""
+
+import logging
+from abc import abstractmethod
+from functools import partial
+from typing import Iterable, Optional, Set
+
+from PyQt5.QtCore import QObject, QRunnable, QSize, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QImage
+
+from core.cancellation import CancellationToken, OperationCancelled
+from core.preview.decoders import PdfDocument, PreviewError
+from core.preview.preview_cache import PreviewCache
+from core.preview.preview_loader import AbstractRunnableMeta, get_preview_thread_pool
+
+logger = logging.getLogger(__name__)
+
+
+class _PdfTaskSignals(QObject):
+    opened = pyqtSignal(int, object)  # generation, PdfDocument
+    page_ready = pyqtSignal(int, int, QImage)  # generation, page index, image
+    failed = pyqtSignal(int, int, str)  # generation, page index (문서 열기 실패는 -1), error message
+    done = pyqtSignal()
+
+
+class _PdfTask(QRunnable, metaclass=AbstractRunnableMeta):
+    def __init__(self, token: CancellationToken, index: int):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = _PdfTaskSignals()
+        self._token = token
+        self._index = index
+
+    def run(self):
+        try:
+            self._token.raise_if_cancelled()
+            self._run()
+        except OperationCancelled:
+            pass
+        except PreviewError as e:
+            self.signals.failed.emit(self._token.generation, self._index, str(e))
+        except Exception as e:
+            logger.exception(f"[PDF_PREVIEW] 페이지 {self._index} 렌더링 실패")
+            self.signals.failed.emit(self._token.generation, self._index, str(e))
+        finally:
+            self.signals.done.emit()
+
+    @abstractmethod
+    def _run(self):
+        """작업 스레드에서 실행할 본문. 취소는 OperationCancelled로 끝냅니다."""
+
+
+class _PdfOpenTask(_PdfTask):
+    """문서를 열고 같은 핸들로 첫 페이지를 렌더링합니다."""
+
+    def __init__(self, file_path: str, first_page_size: QSize, token: CancellationToken,
+                 cache: Optional[PreviewCache]):
+        super().__init__(token, -1)
+        self._file_path = file_path
+        self._first_page_size = QSize(first_page_size)
+        self._cache = cache
+
+    def _run(self):
+        generation = self._token.generation
+        key = PreviewCache.make_key("pdf", self._file_path, self._first_page_size) if self._cache else None
+        first_page = self._cache.get(key) if key is not None else None
+        if first_page is not None:
+            # 예열된 첫 페이지는 문서를 열기 전에 먼저 보여줌
+            self.signals.page_ready.emit(generation, 0, first_page)
+        document = PdfDocument(self._file_path)
+        if self._token.is_cancelled():
+            document.close()
+            return
+        # 이후로는 받는 쪽(PdfPageLoader)이 문서를 닫음
+        self.signals.opened.emit(generation, document)
+        if first_page is None:
+            # 여기부터의 실패는 문서 열기가 아닌 첫 페이지 실패로 알림
+            self._index = 0
+            first_page = document.render_page(0, self._first_page_size, self._token)
+            if key is not None:
+                self._cache.put(key, first_page)
+            self.signals.page_ready.emit(generation, 0, first_page)
+
+
+class _PdfPageTask(_PdfTask):
+    def __init__(self, document: PdfDocument, index: int, target_size: QSize, token: CancellationToken):
+        super().__init__(token, index)
+        self._document = document
+        self._target_size = QSize(target_size)
+
+    def _run(self):
+        image = self._document.render_page(self._index, self._target_size, self._token)
+        self.signals.page_ready.emit(self._token.generation, self._index, image)
+
+
+class _PdfCloseTask(QRunnable):
+    """문서를 작업 스레드에서 닫습니다. 렌더링 중인 페이지가 있으면 그 렌더링이 끝난 뒤 닫힙니다."""
+
+    def __init__(self, document: PdfDocument):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = _PdfTaskSignals()
+        self._document = document
+
+    def run(self):
+        try:
+            self._document.close()
+        except Exception:
+            logger.exception(f"[PDF_PREVIEW] 문서 닫기 실패: {self._document.file_path}")
+        finally:
+            self.signals.done.emit()
+
+
+class PdfPageLoader(QObject):
+    """현재 PDF 문서의 페이지를 요청받은 것만 렌더링합니다.
+
+    Args:
+        cache: 첫 페이지를 찾고 저장할 미리보기 캐시. None이면 매번 렌더링합니다.
+        thread_pool: 사용할 QThreadPool. None이면 미리보기 전용 풀(get_preview_thread_pool())을 사용합니다.
+    """
+
+    document_opened = pyqtSignal(int, str, int)  # generation, file_path, page_count
+    page_ready = pyqtSignal(int, int, QImage)  # generation, page index, image
+    page_failed = pyqtSignal(int, int, str)  # generation, page index (문서 열기 실패는 -1), error message
+
+    def __init__(self, cache: Optional[PreviewCache] = None, thread_pool: Optional[QThreadPool] = None,
+                 parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._cache = cache
+        self._thread_pool = thread_pool or get_preview_thread_pool()
+        self._generation = 0
+        self._token: Optional[CancellationToken] = None
+        self._document: Optional[PdfDocument] = None
+        self._requested: Set[int] = set()
+        self._tasks: Set[_PdfTask] = set()
+        # 닫기 작업은 취소(tryTake)하지 않으므로 따로 보관
+        self._close_tasks: Set[_PdfCloseTask] = set()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def page_count(self) -> int:
+        return self._document.page_count if self._document is not None else 0
+
+    def open(self, file_path: str, first_page_size: QSize) -> int:
+        """이전 문서를 닫고 file_path를 작업 스레드에서 엽니다.
+        열리면 document_opened가, 이어서 first_page_size에 맞춘 첫 페이지(인덱스 0)의 page_ready가 발생합니다.
+
+        Returns:
+            int: 이 문서의 세대 번호
+        """
+        self.cancel()
+        self._token = CancellationToken(self._generation)
+        # 첫 페이지는 open 작업이 그리므로 다시 요청하지 않음
+        self._requested.add(0)
+        task = _PdfOpenTask(file_path, first_page_size, self._token, self._cache)
+        task.signals.opened.connect(self._on_opened)
+        self._start(task)
+        return self._generation
+
+    def request_pages(self, indices: Iterable[int], target_size: QSize):
+        """아직 요청하지 않은 페이지를 렌더링합니다. 문서가 열리기 전에는 무시됩니다."""
+        if self._document is None or self._token is None:
+            return
+        for index in indices:
+            if index in self._requested or not 0 <= index < self._document.page_count:
+                continue
+            self._requested.add(index)
+            self._start(_PdfPageTask(self._document, index, target_size, self._token))
+
+    def cancel(self):
+        """현재 문서의 작업을 모두 취소하고 문서를 닫습니다."""
+        if self._token is not None:
+            self._token.cancel()
+            self._token = None
+        for task in list(self._tasks):
+            if self._thread_pool.tryTake(task):
+                self._tasks.discard(task)
+        # GC에 맡기면 fitz 해제가 _PDF_LOCK 밖에서 일어나므로 직접 닫는다.
+        # 실행 중인 페이지 작업이 있으면 그 렌더링이 끝난 뒤 닫히고, 작업은 취소된 토큰을 보고 멈춤
+        if self._document is not None:
+            self._close_later(self._document)
+        self._document = None
+        self._requested.clear()
+        self._generation += 1
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        return self._thread_pool.waitForDone(msecs)
+
+    def _start(self, task: _PdfTask):
+        task.signals.page_ready.connect(self._on_page_ready)
+        task.signals.failed.connect(self._on_failed)
+        task.signals.done.connect(partial(self._tasks.discard, task))
+        self._tasks.add(task)
+        self._thread_pool.start(task)
+
+    def _close_later(self, document: PdfDocument):
+        task = _PdfCloseTask(document)
+        task.signals.done.connect(partial(self._close_tasks.discard, task))
+        self._close_tasks.add(task)
+        self._thread_pool.start(task)
+
+    def _is_current(self, generation: int) -> bool:
+        return self._token is not None and generation == self._token.generation
+
+    def _on_opened(self, generation: int, document: PdfDocument):
+        if not self._is_current(generation):
+            self._close_later(document)
+            return
+        self._document = document
+        self.document_opened.emit(generation, document.file_path, document.page_count)
+
+    def _on_page_ready(self, generation: int, index: int, image: QImage):
+        if self._is_current(generation):
+            self.page_ready.emit(generation, index, image)
+
+    def _on_failed(self, generation: int, index: int, message: str):
+        if self._is_current(generation):
+            self.page_failed.emit(generation, index, message)
@@ -0,0 +1,207 @@
+"""
+미리보기 캐시
+
+디코딩한 미리보기를 로컬 디스크에 이미지 파일로 저장하여 다음 실행에서도 다시 디코딩하지 않습니다.
+키는 (종류, 경로, 수정 시각, 파일 크기, 목표 크기)의 해시이므로 파일이 바뀌면 자연히 다른 키가 됩니다.
+
+    <cache_dir>/ab/ab12...ef.webp   (WebP를 쓸 수 없으면 .png)
+
+- 디스크: 전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 파일부터 지웁니다.
+  사용 순서는 파일 수정 시각으로 기록하므로(조회 시 갱신) 재시작 후에도 유지됩니다.
+- 메모리: 최근 memory_entries개의 QImage를 그대로 들고 있어 디스크를 읽지 않습니다.
+작업 스레드에서 동시에 사용하므로 모든 접근은 락으로 보호합니다.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from PyQt5.QtCore import QSize
+from PyQt5.QtGui import QImage, QImageWriter
+
+from core.path_utils import normalize_path
+
+logger = logging.getLogger(__name__)
+
+
+def _preferred_format() -> str:
+    supported = {bytes(fmt).decode().lower() for fmt in QImageWriter.supportedImageFormats()}
+    return "webp" if "webp" in supported else "png"
+
+
+class PreviewCache:
+    """디스크 + 메모리 2단 미리보기 캐시
+
+    Args:
+        cache_dir: 미리보기 파일을 저장할 디렉토리
+        max_bytes: 디스크에 둘 미리보기 파일의 총 크기 한도 (0이면 제한 없음)
+        memory_entries: 메모리에 둘 최근 미리보기 수 (0이면 메모리 캐시 사용 안 함)
+    """
+
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+    DEFAULT_MEMORY_ENTRIES = 64
+    # WebP 품질 (PNG는 무손실이라 무시됨)
+    QUALITY = 85
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES,
+                 memory_entries: int = DEFAULT_MEMORY_ENTRIES):
+        self._cache_dir = cache_dir
+        self._max_bytes = max(0, int(max_bytes))
+        self._memory_entries = max(0, int(memory_entries))
+        self._format = _preferred_format()
+        self._lock = threading.RLock()
+        self._memory: "OrderedDict[str, QImage]" = OrderedDict()
+        # 디스크 항목 {key: 파일 크기} (오래 쓰지 않은 순). 첫 접근 시 디렉토리를 읽어 채움
+        self._disk: "Optional[OrderedDict[str, int]]" = None
+        self._disk_bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def image_format(self) -> str:
+        return self._format
+
+    @staticmethod
+    def make_key(kind: str, file_path: str, target_size: QSize) -> Optional[str]:
+        """원본 파일의 현재 상태로 캐시 키를 만듭니다. 파일이 없으면 None"""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        raw = (f"{kind}|{normalize_path(file_path)}|{stat.st_mtime_ns}|{stat.st_size}|"
+               f"{target_size.width()}x{target_size.height()}")
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self._cache_dir, key[:2], f"{key}.{self._format}")
+
+    def _load_disk_index(self):
+        if self._disk is not None:
+            return
+        entries = []
+        suffix = f".{self._format}"
+        if os.path.isdir(self._cache_dir):
+            for shard in os.scandir(self._cache_dir):
+                if not shard.is_dir():
+                    continue
+                for entry in os.scandir(shard.path):
+                    if entry.name.endswith(suffix):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((stat.st_mtime_ns, entry.name[:-len(suffix)], stat.st_size))
+        entries.sort()
+        self._disk = OrderedDict((key, size) for _, key, size in entries)
+        self._disk_bytes = sum(self._disk.values())
+        self._evict_disk()
+
+    def _remember_in_memory(self, key: str, image: QImage):
+        if self._memory_entries == 0:
+            return
+        self._memory[key] = image
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self):
+        if self._max_bytes == 0:
+            return
+        while self._disk and self._disk_bytes > self._max_bytes:
+            key, size = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            try:
+                os.remove(self._path_for(key))
+            except OSError:
+                pass
+
+    def contains(self, key: str) -> bool:
+        """이미지를 읽지 않고 캐시에 있는지만 확인합니다 (통계에 포함되지 않음)."""
+        with self._lock:
+            if key in self._memory:
+                return True
+            self._load_disk_index()
+            return key in self._disk
+
+    def get(self, key: str) -> Optional[QImage]:
+        """캐시된 미리보기. 없으면 None"""
+        with self._lock:
+            image = self._memory.get(key)
+            if image is not None:
+                self._memory.move_to_end(key)
+                self._hits += 1
+                return image
+            self._load_disk_index()
+            if key not in self._disk:
+                self._misses += 1
+                return None
+            path = self._path_for(key)
+            image = QImage(path)
+            if image.isNull():
+                # 지워졌거나 깨진 파일
+                self._disk_bytes -= self._disk.pop(key)
+                self._misses += 1
+                return None
+            self._disk.move_to_end(key)
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            self._remember_in_memory(key, image)
+            self._hits += 1
+            return image
+
+    def put(self, key: str, image: QImage) -> bool:
+        """미리보기를 저장합니다. 디스크에 쓰지 못해도 메모리 캐시에는 남습니다."""
+        if image.isNull():
+            return False
+        with self._lock:
+            self._remember_in_memory(key, image)
+            self._load_disk_index()
+            path = self._path_for(key)
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # 쓰는 도중 종료되어도 깨진 파일이 남지 않도록 임시 파일에 쓴 뒤 교체
+                if not image.save(temp_path, self._format, self.QUALITY):
+                    raise OSError("이미지 저장 실패")
+                os.replace(temp_path, path)
+                size = os.path.getsize(path)
+            except OSError as e:
+                logger.warning(f"[PREVIEW_CACHE] 미리보기 저장 실패: {e}")
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                return False
+            self._disk_bytes += size - self._disk.pop(key, 0)
+            self._disk[key] = size
+            self._evict_disk()
+            return True
+
+    def clear(self):
+        """메모리와 디스크의 모든 미리보기를 지웁니다."""
+        with self._lock:
+            self._load_disk_index()
+            for key in list(self._disk):
+                try:
+                    os.remove(self._path_for(key))
+                except OSError:
+                    pass
+            self._disk.clear()
+            self._disk_bytes = 0
+            self._memory.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._load_disk_index()
+            return {
+                "memory_entries": len(self._memory),
+                "disk_entries": len(self._disk),
+                "disk_bytes": self._disk_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
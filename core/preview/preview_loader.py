@@ -0,0 +1,197 @@
+"""
+비동기 미리보기 로더
+
+이미지/PDF 디코딩을 미리보기 전용 QThreadPool에서 실행하고 결과를 QImage로 전달합니다.
+요청마다 세대(generation) 번호를 붙이고, 새 요청이 들어오면 이전 요청을 취소합니다.
+대기열에서 아직 시작하지 않은 이전 작업은 풀에서 바로 빼내고, 실행 중인 작업은 다음 확인 지점에서 멈춥니다.
+결과 시그널은 메인 스레드에서 최신 세대의 결과일 때만 발생합니다.
+PreviewCache가 주어지면 작업 스레드에서 먼저 캐시를 확인하고, 새로 디코딩한 결과는 캐시에 저장합니다.
+"""
+
+import logging
+from abc import ABCMeta
+from functools import partial
+from typing import Dict, Optional, Set
+
+from PyQt5.QtCore import QObject, QRunnable, QSize, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QImage
+
+from core.cancellation import CancellationToken, OperationCancelled
+from core.preview.decoders import PREVIEW_DECODERS, PreviewError
+from core.preview.preview_cache import PreviewCache
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_THREAD_COUNT = 2
+
+_preview_thread_pool: Optional[QThreadPool] = None
+
+
+def get_preview_thread_pool() -> QThreadPool:
+    """미리보기 전용 스레드 풀을 반환합니다.
+
+    검색 풀(get_search_thread_pool)과 같은 이유로 프로세스가 끝날 때까지 유지합니다.
+    """
+    global _preview_thread_pool
+    if _preview_thread_pool is None:
+        _preview_thread_pool = QThreadPool()
+        # 큰 파일 여러 개를 동시에 디코딩하면 디스크와 메모리를 다투므로 작게 유지
+        _preview_thread_pool.setMaxThreadCount(PREVIEW_THREAD_COUNT)
+    return _preview_thread_pool
+
+
+class AbstractRunnableMeta(type(QRunnable), ABCMeta):
+    """QRunnable 하위 클래스에 @abstractmethod를 쓰기 위한 메타클래스 (sip 메타클래스와 ABCMeta를 합침)"""
+
+
+class _PreviewTaskSignals(QObject):
+    finished = pyqtSignal(int, str, QImage)  # generation, file_path, image
+    failed = pyqtSignal(int, str, str)  # generation, file_path, error message
+    done = pyqtSignal()  # 결과와 관계없이 run()이 끝남
+
+
+class PreviewTask(QRunnable):
+    """미리보기 하나를 작업 스레드에서 디코딩하는 QRunnable"""
+
+    def __init__(self, kind: str, file_path: str, target_size: QSize, token: CancellationToken,
+                 cache: Optional[PreviewCache] = None):
+        super().__init__()
+        # 취소된 작업을 tryTake()로 꺼낼 수 있도록 풀이 소유권을 갖지 않게 한다
+        self.setAutoDelete(False)
+        self.signals = _PreviewTaskSignals()
+        self._decoder = PREVIEW_DECODERS[kind]
+        self._file_path = file_path
+        self._kind = kind
+        self._target_size = QSize(target_size)
+        self._token = token
+        self._cache = cache
+
+    def run(self):
+        try:
+            self._run()
+        finally:
+            self.signals.done.emit()
+
+    def _run(self):
+        generation = self._token.generation
+        try:
+            self._token.raise_if_cancelled()
+            image = self._load()
+            self._token.raise_if_cancelled()
+        except OperationCancelled:
+            logger.debug(f"[PREVIEW] 미리보기 취소됨: {self._file_path}")
+            return
+        except PreviewError as e:
+            self.signals.failed.emit(generation, self._file_path, str(e))
+            return
+        except Exception as e:
+            logger.exception(f"[PREVIEW] 미리보기 실패: {self._file_path}")
+            self.signals.failed.emit(generation, self._file_path, str(e))
+            return
+        self.signals.finished.emit(generation, self._file_path, image)
+
+    def _load(self) -> QImage:
+        key = PreviewCache.make_key(self._kind, self._file_path, self._target_size) if self._cache else None
+        if key is not None:
+            image = self._cache.get(key)
+            if image is not None:
+                return image
+        image = self._decoder(self._file_path, self._target_size, self._token)
+        if key is not None:
+            self._cache.put(key, image)
+        return image
+
+
+class PreviewLoader(QObject):
+    """미리보기 요청을 작업 스레드로 보내고 최신 요청의 결과만 전달합니다.
+
+    Args:
+        cache: 미리보기 캐시. None이면 매번 디코딩합니다.
+        thread_pool: 사용할 QThreadPool. None이면 미리보기 전용 풀(get_preview_thread_pool())을 사용합니다.
+    """
+
+    preview_ready = pyqtSignal(int, str, QImage)  # generation, file_path, image
+    preview_failed = pyqtSignal(int, str, str)  # generation, file_path, error message
+
+    def __init__(self, cache: Optional[PreviewCache] = None, thread_pool: Optional[QThreadPool] = None,
+                 parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._cache = cache
+        self._thread_pool = thread_pool or get_preview_thread_pool()
+        self._generation = 0
+        self._current_token: Optional[CancellationToken] = None
+        self._current_task: Optional[PreviewTask] = None
+        # 풀이 소유하지 않는 작업이 실행 중에 해제되지 않도록 끝날 때까지 참조를 유지
+        self._tasks: Set[PreviewTask] = set()
+        # 종류별 마지막 요청 크기 (예열이 같은 캐시 키를 만들 때 사용)
+        self._last_target_sizes: Dict[str, QSize] = {}
+
+    @property
+    def cache(self) -> Optional[PreviewCache]:
+        return self._cache
+
+    @staticmethod
+    def supports(kind: str) -> bool:
+        return kind in PREVIEW_DECODERS
+
+    def last_target_size(self, kind: str) -> Optional[QSize]:
+        """kind 미리보기를 마지막으로 요청한 크기. 요청한 적이 없으면 None"""
+        size = self._last_target_sizes.get(kind)
+        return QSize(size) if size is not None else None
+
+    def remember_target_size(self, kind: str, target_size: QSize):
+        """다른 로더(PdfPageLoader 등)로 그린 kind 미리보기의 크기를 기록해 예열이 같은 캐시 키를 쓰게 합니다."""
+        self._last_target_sizes[kind] = QSize(target_size)
+
+    def request(self, kind: str, file_path: str, target_size: QSize) -> int:
+        """이전 요청을 취소하고 새 미리보기 디코딩을 시작합니다.
+
+        Returns:
+            int: 새 요청의 세대 번호
+        """
+        self.cancel()
+        self.remember_target_size(kind, target_size)
+        token = CancellationToken(self._generation)
+        self._current_token = token
+
+        task = PreviewTask(kind, file_path, target_size, token, self._cache)
+        task.signals.finished.connect(self._on_task_finished)
+        task.signals.failed.connect(self._on_task_failed)
+        task.signals.done.connect(partial(self._tasks.discard, task))
+        self._tasks.add(task)
+        self._current_task = task
+        self._thread_pool.start(task)
+        return token.generation
+
+    def cancel(self):
+        """진행 중인 요청을 취소합니다. 이미 도착 대기 중인 결과도 무시됩니다."""
+        if self._current_token is not None:
+            self._current_token.cancel()
+            self._current_token = None
+        if self._current_task is not None:
+            # 아직 시작하지 않았으면 대기열에서 바로 뺀다 (실행 중이면 False)
+            if self._thread_pool.tryTake(self._current_task):
+                self._tasks.discard(self._current_task)
+            self._current_task = None
+        self._generation += 1
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """실행 중인 미리보기 작업이 모두 끝날 때까지 기다립니다 (종료 시/테스트용)."""
+        return self._thread_pool.waitForDone(msecs)
+
+    def _is_current(self, generation: int) -> bool:
+        return self._current_token is not None and generation == self._current_token.generation
+
+    def _on_task_finished(self, generation: int, file_path: str, image: QImage):
+        if not self._is_current(generation):
+            return
+        self._current_token = None
+        self._current_task = None
+        self.preview_ready.emit(generation, file_path, image)
+
+    def _on_task_failed(self, generation: int, file_path: str, message: str):
+        if not self._is_current(generation):
+            return
+        self._current_token = None
+        self._current_task = None
+        self.preview_failed.emit(generation, file_path, message)
@@ -0,0 +1,248 @@
+"""
+유휴 시간 미리보기 예열
+
+파일 목록에 보이는 파일의 미리보기를 사용자가 입력하지 않는 동안 미리 만들어 PreviewCache에 넣습니다.
+처음 선택한 파일도 캐시에서 바로 표시되게 하는 것이 목적입니다.
+
+- 순서: 화면에 보이는 행(선택 행에 가까운 것부터) → 선택 행에서 위아래로 번갈아 멀어지는 순서
+- 예산: 파일 하나를 처리한 뒤 CPU 사용률(cpu_fraction)과 읽기 속도(max_bytes_per_second)를 넘지 않도록 쉽니다.
+- 일시정지: 키보드/마우스 입력이 있으면 멈추고, idle_delay_ms 동안 입력이 없으면 다시 시작합니다.
+  작업 스레드는 멈추면 바로 끝나므로 종료 시 기다릴 작업이 남지 않습니다.
+- 목표 크기: 화면의 미리보기와 같은 캐시 키를 쓰도록 PreviewLoader가 마지막으로 요청한 크기를 사용합니다.
+  아직 한 번도 표시하지 않은 종류는 건너뜁니다.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Iterable, List, NamedTuple, Optional
+
+from PyQt5.QtCore import QEvent, QObject, QRunnable, QThread, QThreadPool, QTimer
+
+from core.cancellation import CancellationToken
+from core.preview.decoders import PREVIEW_DECODERS, preview_kind_for
+from core.preview.preview_cache import PreviewCache
+from core.preview.preview_loader import PreviewLoader
+
+logger = logging.getLogger(__name__)
+
+_prewarm_thread_pool: Optional[QThreadPool] = None
+
+# 한 번에 기다리는 최대 시간(초). 긴 휴식은 이 단위로 나눠 기다림
+MAX_THROTTLE_SLEEP = 2.0
+# 미리보기가 없는 파일이 많은 목록에서 후보를 찾을 때 살펴볼 행 수 (limit의 배수)
+SCAN_FACTOR = 8
+
+
+def get_prewarm_thread_pool() -> QThreadPool:
+    """예열 전용 스레드 풀(스레드 1개)을 반환합니다. 화면의 미리보기 풀과 작업을 다투지 않도록 분리합니다."""
+    global _prewarm_thread_pool
+    if _prewarm_thread_pool is None:
+        _prewarm_thread_pool = QThreadPool()
+        _prewarm_thread_pool.setMaxThreadCount(1)
+    return _prewarm_thread_pool
+
+
+class PrewarmBudget(NamedTuple):
+    """예열 작업이 쓸 수 있는 자원
+
+    cpu_fraction: 작업 스레드가 일하는 시간의 최대 비율 (0.25면 1초 중 0.25초)
+    max_bytes_per_second: 원본 파일을 읽는 최대 속도
+    """
+    cpu_fraction: float = 0.25
+    max_bytes_per_second: int = 16 * 1024 * 1024
+
+    def delay_after(self, elapsed: float, bytes_read: int) -> float:
+        """elapsed초 동안 bytes_read 바이트를 처리한 뒤 쉬어야 할 시간(초)"""
+        cpu_delay = elapsed * (1.0 / self.cpu_fraction - 1.0) if 0 < self.cpu_fraction < 1 else 0.0
+        io_delay = bytes_read / self.max_bytes_per_second - elapsed if self.max_bytes_per_second > 0 else 0.0
+        return max(0.0, cpu_delay, io_delay)
+
+
+def prioritize(file_paths: List[str], center: int, first_visible: int, last_visible: int, limit: int,
+               accept: Callable[[str], bool] = lambda path: True) -> List[str]:
+    """예열 순서를 정합니다. 보이는 행 → 선택 행(center)에서 가까운 행 순으로 accept를 통과한 파일 최대 limit개.
+    목록이 아무리 커도 선택 행 주변 limit * SCAN_FACTOR행까지만 살펴봅니다."""
+    count = len(file_paths)
+    if count == 0 or limit <= 0:
+        return []
+    center = min(max(center, 0), count - 1)
+    order: List[str] = []
+    seen = set()
+
+    def take(rows: Iterable[int]):
+        for row in rows:
+            if len(order) >= limit:
+                return
+            if 0 <= row < count and row not in seen:
+                seen.add(row)
+                if accept(file_paths[row]):
+                    order.append(file_paths[row])
+
+    visible = range(max(first_visible, 0), min(last_visible, count - 1) + 1)
+    take(sorted(visible, key=lambda row: abs(row - center)))
+    max_distance = min(max(center, count - 1 - center), limit * SCAN_FACTOR)
+    for distance in range(max_distance + 1):
+        if len(order) >= limit:
+            break
+        take((center + distance, center - distance))
+    return order
+
+
+class _PrewarmTask(QRunnable):
+    def __init__(self, prewarmer: "PreviewPrewarmer"):
+        super().__init__()
+        self._prewarmer = prewarmer
+
+    def run(self):
+        QThread.currentThread().setPriority(QThread.LowestPriority)
+        self._prewarmer._run_worker()
+
+
+class PreviewPrewarmer(QObject):
+    """유휴 시간에 미리보기 캐시를 채우는 예열기
+
+    Args:
+        preview_loader: 캐시와 화면 미리보기 크기를 제공하는 PreviewLoader (캐시가 없으면 아무것도 하지 않음)
+        budget: CPU/읽기 예산
+        idle_delay_ms: 마지막 입력 후 예열을 다시 시작하기까지의 시간
+        max_files: 한 번에 예열할 최대 파일 수
+    """
+
+    DEFAULT_IDLE_DELAY_MS = 1500
+    DEFAULT_MAX_FILES = 200
+
+    # 이 이벤트가 발생하면 사용자가 작업 중인 것으로 봄
+    USER_INPUT_EVENTS = {
+        QEvent.KeyPress, QEvent.MouseButtonPress, QEvent.MouseButtonDblClick, QEvent.Wheel,
+    }
+
+    def __init__(self, preview_loader: PreviewLoader, budget: PrewarmBudget = PrewarmBudget(),
+                 idle_delay_ms: int = DEFAULT_IDLE_DELAY_MS, max_files: int = DEFAULT_MAX_FILES,
+                 thread_pool: Optional[QThreadPool] = None, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._loader = preview_loader
+        self._budget = budget
+        self._max_files = max(0, int(max_files))
+        self._thread_pool = thread_pool or get_prewarm_thread_pool()
+        self._lock = threading.Lock()
+        self._queue: Deque[str] = deque()
+        self._worker_running = False
+        # 작업 스레드는 이 이벤트가 설정되면 현재 파일까지만 처리하고 끝남
+        self._paused = threading.Event()
+        self._paused.set()
+        self._token = CancellationToken()
+        self._prewarmed = 0
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(max(0, int(idle_delay_ms)))
+        self._idle_timer.timeout.connect(self.resume)
+
+    @property
+    def prewarmed_count(self) -> int:
+        return self._prewarmed
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._queue)
+
+    def set_files(self, file_paths: List[str], center: int = 0, first_visible: int = 0, last_visible: int = -1):
+        """예열할 파일 목록을 바꿉니다. 이전 대기열은 버리고, 입력이 잠잠해지면 시작합니다."""
+        if self._loader.cache is None:
+            return
+        ordered = prioritize(file_paths, center, first_visible, last_visible, self._max_files,
+                             accept=lambda path: preview_kind_for(path) is not None)
+        with self._lock:
+            self._queue = deque(ordered)
+        self.notify_user_activity()
+
+    def notify_user_activity(self):
+        """사용자 입력이 있었음을 알립니다. 예열을 멈추고 idle_delay_ms 뒤에 다시 시작합니다."""
+        self._paused.set()
+        self._idle_timer.start()
+
+    def resume(self):
+        """예열을 (다시) 시작합니다."""
+        self._paused.clear()
+        with self._lock:
+            if self._worker_running or not self._queue:
+                return
+            self._worker_running = True
+        self._thread_pool.start(_PrewarmTask(self))
+
+    def stop(self):
+        """예열을 멈추고 대기열을 비웁니다 (종료 시)."""
+        self._idle_timer.stop()
+        self._paused.set()
+        # 디코딩 중인 파일도 다음 확인 지점에서 멈추고, 이후 예열은 새 토큰으로 시작
+        self._token.cancel()
+        self._token = CancellationToken()
+        with self._lock:
+            self._queue.clear()
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        return self._thread_pool.waitForDone(msecs)
+
+    def eventFilter(self, watched, event):
+        if event.type() in self.USER_INPUT_EVENTS:
+            self.notify_user_activity()
+        return False
+
+    def _next_path(self) -> Optional[str]:
+        with self._lock:
+            if self._paused.is_set() or not self._queue:
+                self._worker_running = False
+                return None
+            return self._queue.popleft()
+
+    def _run_worker(self):
+        try:
+            while True:
+                file_path = self._next_path()
+                if file_path is None:
+                    return
+                start = time.perf_counter()
+                bytes_read = self._prewarm(file_path)
+                delay = self._budget.delay_after(time.perf_counter() - start, bytes_read)
+                if delay > 0:
+                    # 도중에 일시정지되면 다음 _next_path()에서 끝남
+                    self._throttle(delay)
+        except Exception:
+            logger.exception("[PREVIEW_PREWARM] 예열 실패")
+            with self._lock:
+                self._worker_running = False
+
+    def _throttle(self, delay: float) -> bool:
+        """예산을 지키도록 delay초를 모두 쉽니다. 쉬는 동안 일시정지되면 바로 False를 반환합니다."""
+        deadline = time.monotonic() + delay
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            # MAX_THROTTLE_SLEEP씩 나눠 기다리며, 입력이 들어오면 바로 멈춘다
+            if self._paused.wait(min(remaining, MAX_THROTTLE_SLEEP)):
+                return False
+
+    def _prewarm(self, file_path: str) -> int:
+        """미리보기 하나를 만들어 캐시에 넣습니다. 읽은 원본 크기(바이트)를 반환합니다."""
+        kind = preview_kind_for(file_path)
+        target_size = self._loader.last_target_size(kind) if kind else None
+        cache = self._loader.cache
+        if target_size is None or cache is None:
+            return 0
+        key = PreviewCache.make_key(kind, file_path, target_size)
+        if key is None or cache.contains(key):
+            return 0
+        try:
+            image = PREVIEW_DECODERS[kind](file_path, target_size, self._token)
+        except Exception as e:
+            logger.debug(f"[PREVIEW_PREWARM] 건너뜀: {file_path} ({e})")
+            return 0
+        cache.put(key, image)
+        self._prewarmed += 1
+        try:
+            return os.path.getsize(file_path)
+        except OSError:
+            return 0
@@ -0,0 +1,205 @@
+"""
+비동기 텍스트/마크다운 미리보기 로더
+
+- 일반 텍스트: 첫 조각만 읽어 보여주고, 사용자가 끝까지 스크롤하면 request_more()로 다음 조각을 읽습니다.
+- 마크다운: 앞부분 markdown_max_bytes만 작업 스레드에서 QTextDocument로 만들어 전달합니다.
+  변환과 문서 구성이 끝난 문서를 GUI 스레드로 옮기므로 화면에서는 setDocument()만 하면 됩니다.
+PreviewLoader와 같이 세대 번호로 이전 파일의 늦은 결과를 무시합니다.
+"""
+
+import logging
+from abc import abstractmethod
+from functools import partial
+from typing import Optional, Set
+
+from PyQt5.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QTextCursor, QTextDocument
+
+from core.cancellation import CancellationToken, OperationCancelled
+from core.preview.preview_loader import AbstractRunnableMeta, get_preview_thread_pool
+from core.preview.text_reader import TextChunkReader, read_text_prefix
+
+logger = logging.getLogger(__name__)
+
+TRUNCATED_NOTICE = "… 파일이 커서 앞부분 {size}만 표시합니다."
+
+
+def format_truncated_notice(byte_count: int) -> str:
+    size = f"{byte_count / (1024 * 1024):.0f} MB" if byte_count >= 1024 * 1024 else f"{byte_count // 1024} KB"
+    return TRUNCATED_NOTICE.format(size=size)
+
+
+class _TextTaskSignals(QObject):
+    chunk_ready = pyqtSignal(int, str, str, bool)  # generation, file_path, text, at_end
+    markdown_ready = pyqtSignal(int, str, object)  # generation, file_path, QTextDocument
+    failed = pyqtSignal(int, str, str)  # generation, file_path, error message
+    done = pyqtSignal()
+
+
+class _TextTask(QRunnable, metaclass=AbstractRunnableMeta):
+    def __init__(self, file_path: str, token: CancellationToken):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = _TextTaskSignals()
+        self._file_path = file_path
+        self._token = token
+
+    def run(self):
+        try:
+            self._token.raise_if_cancelled()
+            self._run()
+        except OperationCancelled:
+            pass
+        except Exception as e:
+            logger.error(f"[TEXT_PREVIEW] 텍스트 파일 로드 실패: {self._file_path}, 오류: {e}")
+            self.signals.failed.emit(self._token.generation, self._file_path, str(e))
+        finally:
+            self.signals.done.emit()
+
+    @abstractmethod
+    def _run(self):
+        """작업 스레드에서 실행할 본문. 취소는 OperationCancelled로 끝냅니다."""
+
+
+class _TextChunkTask(_TextTask):
+    def __init__(self, reader: TextChunkReader, token: CancellationToken):
+        super().__init__(reader.file_path, token)
+        self._reader = reader
+
+    def _run(self):
+        text = self._reader.read_chunk()
+        self._token.raise_if_cancelled()
+        self.signals.chunk_ready.emit(self._token.generation, self._file_path, text, self._reader.at_end)
+
+
+class _MarkdownTask(_TextTask):
+    def __init__(self, file_path: str, max_bytes: int, token: CancellationToken):
+        super().__init__(file_path, token)
+        self._max_bytes = max_bytes
+
+    def _run(self):
+        text, truncated = read_text_prefix(self._file_path, self._max_bytes)
+        self._token.raise_if_cancelled()
+        document = QTextDocument()
+        document.setMarkdown(text)
+        if truncated:
+            cursor = QTextCursor(document)
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertBlock()
+            cursor.insertText(format_truncated_notice(self._max_bytes))
+        self._token.raise_if_cancelled()
+        # 받는 쪽(GUI 스레드)에서 부모를 지정하고 표시할 수 있도록 옮겨 둔다
+        document.moveToThread(QCoreApplication.instance().thread())
+        self.signals.markdown_ready.emit(self._token.generation, self._file_path, document)
+
+
+class TextPreviewLoader(QObject):
+    """텍스트 미리보기를 작업 스레드에서 조각 단위로 읽습니다.
+
+    Args:
+        chunk_bytes: 일반 텍스트를 한 번에 읽을 바이트 수
+        max_bytes: 일반 텍스트를 읽을 최대 바이트 수
+        markdown_max_bytes: 마크다운으로 렌더링할 앞부분 바이트 수
+        thread_pool: 사용할 QThreadPool. None이면 미리보기 전용 풀(get_preview_thread_pool())을 사용합니다.
+    """
+
+    DEFAULT_MARKDOWN_MAX_BYTES = 256 * 1024
+
+    chunk_ready = pyqtSignal(int, str, str, bool)  # generation, file_path, text, at_end
+    markdown_ready = pyqtSignal(int, str, object)  # generation, file_path, QTextDocument (부모 없음)
+    failed = pyqtSignal(int, str, str)  # generation, file_path, error message
+
+    def __init__(self, chunk_bytes: int = TextChunkReader.DEFAULT_CHUNK_BYTES,
+                 max_bytes: int = TextChunkReader.DEFAULT_MAX_BYTES,
+                 markdown_max_bytes: int = DEFAULT_MARKDOWN_MAX_BYTES,
+                 thread_pool: Optional[QThreadPool] = None, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._chunk_bytes = chunk_bytes
+        self._max_bytes = max_bytes
+        self._markdown_max_bytes = markdown_max_bytes
+        self._thread_pool = thread_pool or get_preview_thread_pool()
+        self._generation = 0
+        self._token: Optional[CancellationToken] = None
+        self._reader: Optional[TextChunkReader] = None
+        # 조각은 순서대로 하나씩만 읽음
+        self._loading = False
+        self._tasks: Set[_TextTask] = set()
+
+    @property
+    def at_end(self) -> bool:
+        return self._reader is None or self._reader.at_end
+
+    @property
+    def truncated(self) -> bool:
+        return self._reader is not None and self._reader.truncated
+
+    @property
+    def bytes_read(self) -> int:
+        return self._reader.bytes_read if self._reader is not None else 0
+
+    def open(self, file_path: str, markdown: bool = False) -> int:
+        """이전 파일을 취소하고 file_path의 첫 조각(마크다운이면 렌더링한 문서)을 요청합니다.
+
+        Returns:
+            int: 새 요청의 세대 번호
+        """
+        self.cancel()
+        self._token = CancellationToken(self._generation)
+        if markdown:
+            self._start(_MarkdownTask(file_path, self._markdown_max_bytes, self._token))
+        else:
+            self._reader = TextChunkReader(file_path, self._chunk_bytes, self._max_bytes)
+            self.request_more()
+        return self._generation
+
+    def request_more(self) -> bool:
+        """다음 조각을 요청합니다. 읽는 중이거나 더 읽을 것이 없으면 False"""
+        if self._token is None or self._reader is None or self._loading or self._reader.at_end:
+            return False
+        self._loading = True
+        self._start(_TextChunkTask(self._reader, self._token))
+        return True
+
+    def cancel(self):
+        """진행 중인 요청을 취소합니다."""
+        if self._token is not None:
+            self._token.cancel()
+            self._token = None
+        for task in list(self._tasks):
+            if self._thread_pool.tryTake(task):
+                self._tasks.discard(task)
+        self._reader = None
+        self._loading = False
+        self._generation += 1
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        return self._thread_pool.waitForDone(msecs)
+
+    def _start(self, task: _TextTask):
+        task.signals.chunk_ready.connect(self._on_chunk_ready)
+        task.signals.markdown_ready.connect(self._on_markdown_ready)
+        task.signals.failed.connect(self._on_failed)
+        task.signals.done.connect(partial(self._tasks.discard, task))
+        self._tasks.add(task)
+        self._thread_pool.start(task)
+
+    def _is_current(self, generation: int) -> bool:
+        return self._token is not None and generation == self._token.generation
+
+    def _on_chunk_ready(self, generation: int, file_path: str, text: str, at_end: bool):
+        if not self._is_current(generation):
+            return
+        self._loading = False
+        self.chunk_ready.emit(generation, file_path, text, at_end)
+
+    def _on_markdown_ready(self, generation: int, file_path: str, document: QTextDocument):
+        if not self._is_current(generation):
+            document.deleteLater()
+            return
+        self.markdown_ready.emit(generation, file_path, document)
+
+    def _on_failed(self, generation: int, file_path: str, message: str):
+        if not self._is_current(generation):
+            return
+        self._loading = False
+        self.failed.emit(generation, file_path, message)
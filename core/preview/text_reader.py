@@ -0,0 +1,123 @@
+"""
+텍스트 파일 조각 읽기
+
+큰 텍스트 파일을 한 번에 읽지 않고 chunk_bytes씩 순서대로 읽어 디코딩합니다.
+인코딩은 첫 조각의 앞부분(ENCODING_SAMPLE_BYTES)으로 판단하며,
+조각 경계에서 잘린 멀티바이트 문자는 증분 디코더가 다음 조각과 이어 붙입니다.
+max_bytes를 넘는 부분은 읽지 않으므로 파일 크기와 관계없이 메모리 사용량이 제한됩니다.
+"""
+
+import codecs
+import os
+from typing import Optional, Tuple
+
+ENCODING_SAMPLE_BYTES = 8 * 1024
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+# BOM이 없을 때 순서대로 시도 (cp949: 한국어 Windows에서 만든 파일)
+_FALLBACK_ENCODINGS = ("utf-8", "cp949")
+
+
+def _decodes_cleanly(sample: bytes, encoding: str) -> bool:
+    # 샘플 끝에서 잘린 멀티바이트 문자는 오류로 보지 않음 (final=False)
+    try:
+        codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def detect_encoding(sample: bytes) -> str:
+    """파일 앞부분으로 인코딩을 추정합니다. BOM → UTF-8 → CP949 → Latin-1 순서"""
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+    for encoding in _FALLBACK_ENCODINGS:
+        if _decodes_cleanly(sample, encoding):
+            return encoding
+    # 모든 바이트를 디코딩할 수 있으므로 깨진 글자로라도 표시됨
+    return "latin-1"
+
+
+class TextChunkReader:
+    """텍스트 파일을 앞에서부터 조각 단위로 읽습니다.
+
+    한 번에 한 스레드에서만 사용합니다. 조각을 읽을 때마다 파일을 열고 닫으므로
+    미리보기 중에도 파일 핸들을 들고 있지 않습니다.
+
+    Args:
+        file_path: 텍스트 파일 경로
+        chunk_bytes: 한 번에 읽을 바이트 수
+        max_bytes: 읽을 최대 바이트 수 (0이면 파일 끝까지)
+    """
+
+    DEFAULT_CHUNK_BYTES = 64 * 1024
+    DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+
+    def __init__(self, file_path: str, chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.file_path = file_path
+        self._chunk_bytes = max(1, int(chunk_bytes))
+        self._max_bytes = max(0, int(max_bytes))
+        self._offset = 0
+        # 첫 조각을 읽을 때 정해짐
+        self._file_size: Optional[int] = None
+        self._decoder = None
+        self.encoding: Optional[str] = None
+
+    @property
+    def bytes_read(self) -> int:
+        return self._offset
+
+    def _limit(self) -> int:
+        if self._max_bytes and self._file_size > self._max_bytes:
+            return self._max_bytes
+        return self._file_size
+
+    @property
+    def at_end(self) -> bool:
+        return self._file_size is not None and self._offset >= self._limit()
+
+    @property
+    def truncated(self) -> bool:
+        """max_bytes 때문에 파일 끝까지 읽지 못했는지"""
+        return self.at_end and self._offset < self._file_size
+
+    def read_chunk(self) -> str:
+        """다음 조각을 디코딩하여 반환합니다. 끝에 도달했으면 빈 문자열
+
+        Raises:
+            OSError: 파일을 읽을 수 없을 때
+        """
+        if self.at_end:
+            return ""
+        with open(self.file_path, "rb") as f:
+            if self._file_size is None:
+                # 읽는 도중 파일이 커져도(로그 등) 처음 크기까지만 읽음
+                self._file_size = os.fstat(f.fileno()).st_size
+            f.seek(self._offset)
+            data = f.read(max(0, min(self._chunk_bytes, self._limit() - self._offset)))
+        if self._decoder is None:
+            self.encoding = detect_encoding(data[:ENCODING_SAMPLE_BYTES])
+            self._decoder = codecs.getincrementaldecoder(self.encoding)(errors="replace")
+        if data:
+            self._offset += len(data)
+        else:
+            # 파일이 줄어든 경우
+            self._file_size = self._offset
+        return self._decoder.decode(data, final=self.at_end)
+
+
+def read_text_prefix(file_path: str, max_bytes: int) -> Tuple[str, bool]:
+    """파일 앞부분 max_bytes까지를 디코딩합니다.
+
+    Returns:
+        (텍스트, 뒤가 잘렸는지)
+    """
+    reader = TextChunkReader(file_path, chunk_bytes=max_bytes, max_bytes=max_bytes)
+    text = reader.read_chunk()
+    return text, reader.truncated
@@ -0,0 +1,100 @@
+"""
+태그 저장소 인터페이스
+
+TagService는 이 인터페이스에만 의존하며, 실제 저장소는 설정(storage.backend)에 따라
+core.repositories.factory.create_tag_repository()가 고릅니다.
+
+일괄 변경(bulk_update_tags)은 저장소 중립적인 TagUpdate 목록을 받습니다.
+MongoDB 저장소만 이를 pymongo.UpdateOne으로 바꿔 보내므로 다른 저장소는 pymongo 없이 동작합니다.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class TagUpdate(NamedTuple):
+    """파일 하나의 태그 변경
+
+    한 변경에는 추가와 제거 중 하나만 담습니다 (MongoDB는 한 갱신에서 같은 필드를
+    $addToSet과 $pullAll로 함께 바꿀 수 없음).
+
+    Attributes:
+        file_path: 정규화된 파일 경로
+        add_tags: 없으면 추가할 태그 (이미 있는 태그는 무시)
+        remove_tags: 있으면 제거할 태그
+        upsert: 항목이 없을 때 새로 만들지 여부
+    """
+    file_path: str
+    add_tags: List[str]
+    remove_tags: List[str]
+    upsert: bool
+
+
+class BaseTagRepository(ABC):
+    """파일 경로 ↔ 태그 목록 저장소
+
+    - 파일별 태그 목록은 추가된 순서를 유지합니다.
+    - 태그를 모두 제거해도 파일 항목은 남으며(find_files에서 빈 목록으로 조회됨),
+      delete_file_entry()로만 지워집니다.
+    """
+
+    @property
+    def tag_collation(self) -> Optional[dict]:
+        """태그 비교에 쓰는 collation. None이면 태그 이름을 그대로(대소문자 구분) 비교합니다."""
+        return None
+
+    @abstractmethod
+    def add_tag(self, file_path: str, tag: str) -> bool:
+        """태그를 추가합니다. 새로 추가되었으면 True"""
+
+    @abstractmethod
+    def remove_tag(self, file_path: str, tag: str) -> bool:
+        """태그를 제거합니다. 실제로 제거되었으면 True"""
+
+    @abstractmethod
+    def get_tags_for_file(self, file_path: str) -> list:
+        """파일의 태그 목록. 항목이 없으면 빈 리스트"""
+
+    @abstractmethod
+    def get_all_tags(self) -> list:
+        """한 파일 이상에 붙어 있는 태그 목록 (이름 순)"""
+
+    @abstractmethod
+    def get_tag_counts(self) -> dict:
+        """{tag: 사용 파일 수} (태그 이름 순)"""
+
+    @abstractmethod
+    def get_files_by_tags(self, tags: list) -> list:
+        """tags 중 하나라도 가진 파일 경로 목록"""
+
+    @abstractmethod
+    def find_files_by_tag_filter(self, all_of: List[str], none_of: List[str]) -> list:
+        """all_of의 태그를 모두 갖고 none_of의 태그는 하나도 없는 파일 경로 목록.
+        all_of가 비어 있으면 태그가 하나 이상 있는 모든 파일이 대상입니다.
+        all_of의 첫 태그로 후보를 좁히므로 호출하는 쪽에서 드문 태그부터 전달합니다."""
+
+    @abstractmethod
+    def iter_tagged_files(self, batch_size: int = 1000) -> Iterator[Tuple[str, List[str]]]:
+        """태그가 하나 이상 있는 파일을 (file_path, tags)로 순회"""
+
+    @abstractmethod
+    def iter_tagged_paths(self, batch_size: int = 1000) -> Iterator[str]:
+        """태그가 하나 이상 있는 파일 경로만 순회"""
+
+    @abstractmethod
+    def delete_file_entry(self, file_path: str) -> bool:
+        """파일 항목을 삭제합니다. 삭제되었으면 True"""
+
+    @abstractmethod
+    def find_files(self, file_paths: List[str]) -> Dict[str, List[str]]:
+        """주어진 경로 중 항목이 있는 파일의 {file_path: tags}"""
+
+    @abstractmethod
+    def bulk_update_tags(self, updates: List[TagUpdate], ordered: bool = True) -> dict:
+        """TagUpdate 목록을 적용합니다.
+
+        Returns:
+            dict: {"modified": 변경된 파일 수, "upserted": 새로 만든 파일 수,
+                   "failed": 적용되지 않은 변경의 updates 내 인덱스 목록 (오름차순)}
+                   ordered=True에서 실패한 연산 뒤로 실행되지 않은 연산도 failed에 포함됩니다.
+        """
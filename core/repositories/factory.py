@@ -0,0 +1,47 @@
+"""
+설정(storage.backend)에 따라 태그 저장소를 만듭니다.
+"""
+
+import logging
+from core.repositories.base import BaseTagRepository
+
+logger = logging.getLogger(__name__)
+
+MONGODB_BACKEND = "mongodb"
+SQLITE_BACKEND = "sqlite"
+MEMORY_BACKEND = "memory"
+
+
+def create_tag_repository(config, mongo_client=None) -> BaseTagRepository:
+    """설정에 맞는 태그 저장소를 만듭니다.
+
+    Args:
+        config: ConfigManager
+        mongo_client: mongodb 저장소가 사용할 클라이언트. None이면 설정의 URI로 새로 만듭니다.
+
+    Raises:
+        ValueError: 알 수 없는 저장소 종류
+    """
+    backend = config.get_storage_backend()
+    if backend == MONGODB_BACKEND:
+        from core.repositories.tag_repository import TagRepository
+        if mongo_client is None:
+            from pymongo import MongoClient
+            mongo_client = MongoClient(config.get_mongodb_uri(), serverSelectionTimeoutMS=5000)
+        return TagRepository(mongo_client, tag_collation=config.get_tag_collation())
+    if backend == SQLITE_BACKEND:
+        from core.repositories.sqlite_tag_repository import SqliteTagRepository
+        db_path = config.get_sqlite_path()
+        logger.info(f"[REPOSITORY] sqlite 태그 저장소 사용: {db_path}")
+        return SqliteTagRepository(db_path)
+    if backend == MEMORY_BACKEND:
+        # 저장되지 않으므로 테스트/벤치마크용
+        from core.repositories.memory_tag_repository import InMemoryTagRepository
+        logger.warning("[REPOSITORY] 메모리 태그 저장소 사용: 종료 시 태그가 저장되지 않습니다")
+        return InMemoryTagRepository()
+    raise ValueError(f"알 수 없는 태그 저장소: {backend}")
+
+
+def requires_mongodb(config) -> bool:
+    """설정된 저장소가 MongoDB 서버를 필요로 하는지 여부"""
+    return config.get_storage_backend() == MONGODB_BACKEND
@@ -0,0 +1,111 @@
+"""
+메모리 태그 저장소
+
+딕셔너리만 사용하는 저장소로, 테스트와 벤치마크에서 데이터베이스 비용을 빼고
+서비스/ViewModel 자체의 비용만 측정할 때 기준으로 사용합니다.
+업서트, $addToSet 중복 무시, bulk_update_tags 결과 수는 MongoDB 저장소와 같은 기준을 따릅니다.
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from core.repositories.base import BaseTagRepository, TagUpdate
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryTagRepository(BaseTagRepository):
+    """{file_path: [tags]} 딕셔너리 기반 태그 저장소
+
+    Args:
+        initial: 미리 넣어 둘 (file_path, tags) 목록
+    """
+
+    def __init__(self, initial: Iterable[Tuple[str, List[str]]] = ()):
+        self._files: Dict[str, List[str]] = {}
+        # 검색이 작업 스레드에서 실행되므로 모든 접근은 락으로 보호합니다
+        self._lock = threading.RLock()
+        for file_path, tags in initial:
+            self._files[file_path] = list(dict.fromkeys(tags))
+
+    def _apply(self, update: TagUpdate) -> Tuple[bool, bool]:
+        """변경 하나를 적용합니다. (변경됨, 새로 만듦)"""
+        tags = self._files.get(update.file_path)
+        if tags is None:
+            if not update.upsert:
+                return False, False
+            tags = self._files[update.file_path] = []
+            created = True
+        else:
+            created = False
+        before = list(tags)
+        for tag in update.add_tags:
+            if tag not in tags:
+                tags.append(tag)
+        tags[:] = [tag for tag in tags if tag not in update.remove_tags]
+        # 새로 만든 항목은 upserted로만 센다
+        return (not created and tags != before), created
+
+    def add_tag(self, file_path: str, tag: str) -> bool:
+        with self._lock:
+            modified, upserted = self._apply(TagUpdate(file_path, [tag], [], True))
+        return modified or upserted
+
+    def remove_tag(self, file_path: str, tag: str) -> bool:
+        with self._lock:
+            modified, _ = self._apply(TagUpdate(file_path, [], [tag], False))
+        return modified
+
+    def get_tags_for_file(self, file_path: str) -> list:
+        with self._lock:
+            return list(self._files.get(file_path, []))
+
+    def get_all_tags(self) -> list:
+        with self._lock:
+            return sorted({tag for tags in self._files.values() for tag in tags})
+
+    def get_tag_counts(self) -> dict:
+        counts: Dict[str, int] = {}
+        with self._lock:
+            for tags in self._files.values():
+                for tag in tags:
+                    counts[tag] = counts.get(tag, 0) + 1
+        return {tag: counts[tag] for tag in sorted(counts)}
+
+    def get_files_by_tags(self, tags: list) -> list:
+        wanted = set(tags)
+        with self._lock:
+            return [file_path for file_path, file_tags in self._files.items() if wanted.intersection(file_tags)]
+
+    def find_files_by_tag_filter(self, all_of: List[str], none_of: List[str]) -> list:
+        required, excluded = set(all_of), set(none_of)
+        with self._lock:
+            return [file_path for file_path, file_tags in self._files.items()
+                    if file_tags and required.issubset(file_tags) and excluded.isdisjoint(file_tags)]
+
+    def iter_tagged_files(self, batch_size: int = 1000) -> Iterator[Tuple[str, List[str]]]:
+        with self._lock:
+            snapshot = [(file_path, list(tags)) for file_path, tags in self._files.items() if tags]
+        return iter(snapshot)
+
+    def iter_tagged_paths(self, batch_size: int = 1000) -> Iterator[str]:
+        return (file_path for file_path, _ in self.iter_tagged_files(batch_size))
+
+    def delete_file_entry(self, file_path: str) -> bool:
+        with self._lock:
+            return self._files.pop(file_path, None) is not None
+
+    def find_files(self, file_paths: List[str]) -> Dict[str, List[str]]:
+        with self._lock:
+            return {file_path: list(self._files[file_path]) for file_path in file_paths if file_path in self._files}
+
+    def bulk_update_tags(self, updates: List[TagUpdate], ordered: bool = True) -> dict:
+        """TagUpdate 목록을 순서대로 적용합니다. 메모리에서는 실패하는 변경이 없습니다."""
+        modified = upserted = 0
+        with self._lock:
+            for update in updates:
+                was_modified, was_upserted = self._apply(update)
+                modified += was_modified
+                upserted += was_upserted
+        return {"modified": modified, "upserted": upserted, "failed": []}
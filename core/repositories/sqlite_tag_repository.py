@@ -0,0 +1,320 @@
+"""
+SQLite 태그 저장소
+
+MongoDB 없이 실행할 수 있는 내장 저장소입니다 (노트북, CI 등).
+정규화된 세 테이블을 사용합니다.
+
+    files(id, path UNIQUE)
+    tags(id, name UNIQUE)
+    file_tags(file_id, tag_id, seq)  -- PRIMARY KEY (file_id, tag_id), WITHOUT ROWID
+
+- file_tags는 (file_id, tag_id) 순으로 클러스터링되어 파일 → 태그 조회가 테이블만으로 끝나고,
+  (tag_id, file_id) 인덱스가 태그 → 파일 조회와 태그별 개수 집계를 인덱스만으로 처리합니다.
+- seq는 파일 안에서 태그가 추가된 순서입니다 (MongoDB 배열 순서와 같은 결과를 내기 위함).
+- 일괄 변경은 변경 전 상태를 한 번에 읽어 최종 상태와의 차이만 executemany로 씁니다.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterator, List, Set, Tuple
+
+from core.repositories.base import BaseTagRepository, TagUpdate
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteTagRepository(BaseTagRepository):
+    """SQLite(WAL) 기반 태그 저장소
+
+    Args:
+        db_path: 데이터베이스 파일 경로. ":memory:"이면 메모리 데이터베이스를 사용합니다.
+    """
+
+    # SQLite 바인드 변수 수 제한(기본 999)보다 작게 IN 목록을 나눈다
+    MAX_IN_PARAMS = 500
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS files (
+            id INTEGER PRIMARY KEY,
+            path TEXT NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS tags (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS file_tags (
+            file_id INTEGER NOT NULL REFERENCES files (id) ON DELETE CASCADE,
+            tag_id INTEGER NOT NULL REFERENCES tags (id),
+            seq INTEGER NOT NULL,
+            PRIMARY KEY (file_id, tag_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS file_tags_tag ON file_tags (tag_id, file_id);
+    """
+
+    def __init__(self, db_path: str):
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        # 검색이 작업 스레드에서 실행되므로 연결 하나를 락으로 보호하며 공유합니다
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(self.SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _chunks(self, items: List[str]):
+        for start in range(0, len(items), self.MAX_IN_PARAMS):
+            yield items[start:start + self.MAX_IN_PARAMS]
+
+    def _load_state(self, file_paths: List[str]) -> Dict[str, List[Tuple[str, int]]]:
+        """항목이 있는 파일의 {path: [(tag, seq), ...]} (seq 순). 항목이 없는 파일은 포함하지 않습니다."""
+        state: Dict[str, List[Tuple[str, int]]] = {}
+        for chunk in self._chunks(file_paths):
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"""SELECT f.path, t.name, ft.seq
+                    FROM files f
+                    LEFT JOIN file_tags ft ON ft.file_id = f.id
+                    LEFT JOIN tags t ON t.id = ft.tag_id
+                    WHERE f.path IN ({placeholders})
+                    ORDER BY f.id, ft.seq""",
+                chunk,
+            )
+            for path, tag, seq in rows:
+                tags = state.setdefault(path, [])
+                if tag is not None:
+                    tags.append((tag, seq))
+        return state
+
+    def _apply_updates(self, updates: List[TagUpdate]) -> Tuple[int, int]:
+        """변경 목록을 순서대로 적용한 최종 상태를 계산하고 차이만 기록합니다.
+
+        Returns:
+            (변경된 파일 수, 새로 만든 파일 수): MongoDB bulk_write 결과와 같은 기준으로 셉니다.
+        """
+        paths = list(dict.fromkeys(update.file_path for update in updates))
+        with self._lock:
+            initial = self._load_state(paths)
+            current: Dict[str, List[str]] = {path: [tag for tag, _ in tags] for path, tags in initial.items()}
+            created: Set[str] = set()
+            modified = 0
+            for update in updates:
+                tags = current.get(update.file_path)
+                existed = tags is not None
+                if not existed:
+                    if not update.upsert:
+                        continue
+                    tags = current[update.file_path] = []
+                    created.add(update.file_path)
+                before = list(tags)
+                for tag in update.add_tags:
+                    if tag not in tags:
+                        tags.append(tag)
+                tags[:] = [tag for tag in tags if tag not in update.remove_tags]
+                # 새로 만든 항목은 upserted로만 센다
+                if existed and tags != before:
+                    modified += 1
+
+            inserts: List[Tuple[int, str, str]] = []
+            deletes: List[Tuple[str, str]] = []
+            for path in paths:
+                if path not in current:
+                    continue
+                old = initial.get(path, [])
+                old_tags = {tag for tag, _ in old}
+                next_seq = max((seq for _, seq in old), default=0) + 1
+                new_tags = current[path]
+                for tag in new_tags:
+                    if tag not in old_tags:
+                        inserts.append((next_seq, path, tag))
+                        next_seq += 1
+                kept = set(new_tags)
+                deletes.extend((path, tag) for tag in old_tags if tag not in kept)
+
+            with self._conn:
+                self._conn.executemany("INSERT OR IGNORE INTO files (path) VALUES (?)",
+                                       ((path,) for path in created))
+                self._conn.executemany("INSERT OR IGNORE INTO tags (name) VALUES (?)",
+                                       ((tag,) for tag in {tag for _, _, tag in inserts}))
+                self._conn.executemany(
+                    """DELETE FROM file_tags
+                       WHERE file_id = (SELECT id FROM files WHERE path = ?)
+                         AND tag_id = (SELECT id FROM tags WHERE name = ?)""",
+                    deletes,
+                )
+                self._conn.executemany(
+                    """INSERT OR IGNORE INTO file_tags (file_id, tag_id, seq)
+                       SELECT f.id, t.id, ? FROM files f, tags t WHERE f.path = ? AND t.name = ?""",
+                    inserts,
+                )
+        return modified, len(created)
+
+    def add_tag(self, file_path: str, tag: str) -> bool:
+        modified, upserted = self._apply_updates([TagUpdate(file_path, [tag], [], True)])
+        return modified > 0 or upserted > 0
+
+    def remove_tag(self, file_path: str, tag: str) -> bool:
+        modified, _ = self._apply_updates([TagUpdate(file_path, [], [tag], False)])
+        return modified > 0
+
+    def get_tags_for_file(self, file_path: str) -> list:
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT t.name FROM files f
+                   JOIN file_tags ft ON ft.file_id = f.id
+                   JOIN tags t ON t.id = ft.tag_id
+                   WHERE f.path = ? ORDER BY ft.seq""",
+                (file_path,),
+            ).fetchall()
+        return [name for (name,) in rows]
+
+    def get_all_tags(self) -> list:
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT name FROM tags
+                   WHERE EXISTS (SELECT 1 FROM file_tags WHERE tag_id = tags.id)
+                   ORDER BY name"""
+            ).fetchall()
+        return [name for (name,) in rows]
+
+    def get_tag_counts(self) -> dict:
+        """태그별 사용 파일 수. file_tags_tag 인덱스만 읽어 집계합니다."""
+        with self._lock:
+            rows = self._conn.execute(
+                """SELECT t.name, c.count
+                   FROM (SELECT tag_id, COUNT(*) AS count FROM file_tags GROUP BY tag_id) c
+                   JOIN tags t ON t.id = c.tag_id
+                   ORDER BY t.name"""
+            ).fetchall()
+        return {name: count for name, count in rows}
+
+    def get_files_by_tags(self, tags: list) -> list:
+        tags = list(dict.fromkeys(tags))
+        result: List[str] = []
+        seen: Set[str] = set()
+        with self._lock:
+            for chunk in self._chunks(tags):
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"""SELECT DISTINCT f.path FROM tags t
+                        JOIN file_tags ft ON ft.tag_id = t.id
+                        JOIN files f ON f.id = ft.file_id
+                        WHERE t.name IN ({placeholders})""",
+                    chunk,
+                )
+                for (path,) in rows:
+                    if path not in seen:
+                        seen.add(path)
+                        result.append(path)
+        return result
+
+    def find_files_by_tag_filter(self, all_of: List[str], none_of: List[str]) -> list:
+        """첫 태그(가장 드문 태그)의 posting을 file_tags_tag 인덱스로 읽고,
+        나머지 조건은 (file_id, tag_id) 기본 키 조회로 확인합니다."""
+        all_of = list(dict.fromkeys(all_of))
+        none_of = list(dict.fromkeys(none_of))
+        if len(all_of) + len(none_of) > self.MAX_IN_PARAMS:
+            raise ValueError(f"태그 조건이 너무 많습니다: {len(all_of) + len(none_of)}개")
+
+        if all_of:
+            base = """SELECT ft.file_id FROM tags t JOIN file_tags ft ON ft.tag_id = t.id
+                      WHERE t.name = ?"""
+            params: List[str] = [all_of[0]]
+        else:
+            base = "SELECT DISTINCT file_id FROM file_tags"
+            params = []
+        has_tag = ("EXISTS (SELECT 1 FROM file_tags x JOIN tags xt ON xt.id = x.tag_id"
+                   " WHERE x.file_id = base.file_id AND xt.name {})")
+        conditions = [has_tag.format("= ?") for _ in all_of[1:]]
+        params.extend(all_of[1:])
+        if none_of:
+            conditions.append("NOT " + has_tag.format(f"IN ({','.join('?' * len(none_of))})"))
+            params.extend(none_of)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"""SELECT f.path FROM ({base}) base
+                    JOIN files f ON f.id = base.file_id
+                    {where}""",
+                params,
+            ).fetchall()
+        return [path for (path,) in rows]
+
+    def _iter_tagged_file_ids(self, batch_size: int) -> Iterator[List[int]]:
+        # 커서를 락 밖으로 들고 나가지 않도록 file_id 기준으로 나눠 읽는다
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT DISTINCT file_id FROM file_tags WHERE file_id > ? ORDER BY file_id LIMIT ?",
+                    (last_id, batch_size),
+                ).fetchall()
+            if not rows:
+                return
+            file_ids = [file_id for (file_id,) in rows]
+            last_id = file_ids[-1]
+            yield file_ids
+
+    def iter_tagged_files(self, batch_size: int = 1000) -> Iterator[Tuple[str, List[str]]]:
+        batch_size = max(1, min(batch_size, self.MAX_IN_PARAMS))
+        for file_ids in self._iter_tagged_file_ids(batch_size):
+            placeholders = ",".join("?" * len(file_ids))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"""SELECT f.path, t.name FROM file_tags ft
+                        JOIN files f ON f.id = ft.file_id
+                        JOIN tags t ON t.id = ft.tag_id
+                        WHERE ft.file_id IN ({placeholders})
+                        ORDER BY ft.file_id, ft.seq""",
+                    file_ids,
+                ).fetchall()
+            path, tags = None, []
+            for row_path, tag in rows:
+                if row_path != path:
+                    if path is not None:
+                        yield path, tags
+                    path, tags = row_path, []
+                tags.append(tag)
+            if path is not None:
+                yield path, tags
+
+    def iter_tagged_paths(self, batch_size: int = 1000) -> Iterator[str]:
+        batch_size = max(1, min(batch_size, self.MAX_IN_PARAMS))
+        for file_ids in self._iter_tagged_file_ids(batch_size):
+            placeholders = ",".join("?" * len(file_ids))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT path FROM files WHERE id IN ({placeholders}) ORDER BY id", file_ids
+                ).fetchall()
+            for (path,) in rows:
+                yield path
+
+    def delete_file_entry(self, file_path: str) -> bool:
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM files WHERE path = ?", (file_path,))
+        return cursor.rowcount > 0
+
+    def find_files(self, file_paths: List[str]) -> Dict[str, List[str]]:
+        """주어진 파일 경로 중 항목이 있는 파일의 {file_path: [tag1, tag2], ...}"""
+        with self._lock:
+            state = self._load_state(list(dict.fromkeys(file_paths)))
+        return {path: [tag for tag, _ in tags] for path, tags in state.items()}
+
+    def bulk_update_tags(self, updates: List[TagUpdate], ordered: bool = True) -> dict:
+        """TagUpdate 목록을 한 트랜잭션으로 적용합니다. 트랜잭션이므로 ordered와 관계없이 모두 적용되거나 모두 실패합니다."""
+        if not updates:
+            return {"modified": 0, "upserted": 0, "failed": []}
+
+        try:
+            modified, upserted = self._apply_updates(list(updates))
+        except sqlite3.Error as e:
+            # 트랜잭션이 롤백되었으므로 모든 변경이 적용되지 않았다
+            logger.error(f"[SQLITE_TAG_REPOSITORY] 일괄 변경 실패: {e}")
+            return {"modified": 0, "upserted": 0, "failed": list(range(len(updates)))}
+        return {"modified": modified, "upserted": upserted, "failed": []}
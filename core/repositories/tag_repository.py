@@ -1,10 +1,76 @@
-from pymongo import MongoClient
+import logging
+from typing import List, Optional
+from pymongo import MongoClient, ASCENDING, UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
 
-class TagRepository:
-    def __init__(self, mongo_client: MongoClient):
+from core.repositories.base import BaseTagRepository, TagUpdate
+
+logger = logging.getLogger(__name__)
+
+
+def _to_update_one(update: TagUpdate) -> UpdateOne:
+    """TagUpdate를 `$addToSet`/`$pullAll` 갱신으로 바꿉니다. 읽기 없이 서버에서 바로 적용됩니다."""
+    document = {}
+    # 추가할 태그가 없는 업서트도 빈 tags 배열로 항목을 만든다
+    if update.add_tags or not update.remove_tags:
+        document["$addToSet"] = {"tags": {"$each": list(update.add_tags)}}
+    # 둘 다 있으면 서버가 같은 필드 충돌로 거부하고 결과의 failed에 들어감
+    if update.remove_tags:
+        document["$pullAll"] = {"tags": list(update.remove_tags)}
+    return UpdateOne({"file_path": update.file_path}, document, upsert=update.upsert)
+
+class TagRepository(BaseTagRepository):
+    """MongoDB(tagged_files 컬렉션) 기반 태그 저장소"""
+
+    def __init__(self, mongo_client: MongoClient, tag_collation: Optional[dict] = None,
+                 db_name: str = "filetagger_db"):
+        """
+        Args:
+            mongo_client: MongoDB 클라이언트
+            tag_collation: 태그 비교에 사용할 collation (예: {"locale": "ko", "strength": 2}는
+                대소문자를 구분하지 않음). None이면 기본(바이너리) 비교를 사용합니다.
+            db_name: 사용할 데이터베이스 이름
+        """
         self._client = mongo_client
-        self._db = self._client.filetagger_db
+        self._db = self._client.get_database(db_name)
         self._collection = self._db.tagged_files
+        self._tag_collation = tag_collation
+        self.ensure_indexes()
+
+    def ensure_indexes(self):
+        """조회/업서트 경로에서 컬렉션 전체 스캔이 일어나지 않도록 인덱스를 보장합니다.
+
+        - file_path: 고유 인덱스 (find_one, 업서트, $in 조회)
+        - tags: 멀티키 인덱스 ($in/$all 태그 검색). tag_collation이 있으면 같은 collation으로 생성합니다.
+        이미 같은 인덱스가 있으면 create_index는 아무 작업도 하지 않습니다.
+        """
+        try:
+            self._collection.create_index(
+                [("file_path", ASCENDING)], unique=True, name="file_path_unique"
+            )
+        except PyMongoError as e:
+            # 기존 데이터에 중복 경로가 있으면 고유 인덱스를 만들 수 없으므로 일반 인덱스로 대체
+            logger.error(f"[TAG_REPOSITORY] file_path 고유 인덱스 생성 실패, 일반 인덱스로 대체: {e}")
+            try:
+                self._collection.create_index([("file_path", ASCENDING)], name="file_path")
+            except PyMongoError as e2:
+                logger.error(f"[TAG_REPOSITORY] file_path 인덱스 생성 실패: {e2}")
+
+        tags_index_options = {"name": "tags"}
+        if self._tag_collation:
+            tags_index_options["collation"] = self._tag_collation
+        try:
+            self._collection.create_index([("tags", ASCENDING)], **tags_index_options)
+        except PyMongoError as e:
+            logger.error(f"[TAG_REPOSITORY] tags 인덱스 생성 실패: {e}")
+
+    @property
+    def tag_collation(self) -> Optional[dict]:
+        return self._tag_collation
+
+    def _tag_query_options(self) -> dict:
+        """태그 조건이 포함된 쿼리가 tags 인덱스를 사용하도록 collation 옵션을 맞춥니다."""
+        return {"collation": self._tag_collation} if self._tag_collation else {}
 
     def add_tag(self, file_path: str, tag: str) -> bool:
         result = self._collection.update_one(
@@ -26,18 +92,62 @@ class TagRepository:
         return doc.get("tags", []) if doc else []
 
     def get_all_tags(self) -> list:
-        # distinct 대신 find와 집합 연산을 사용
-        all_tags = set()
-        cursor = self._collection.find({}, {"tags": 1})
-        for doc in cursor:
-            if "tags" in doc and doc["tags"]:
-                all_tags.update(doc["tags"])
-        return sorted(list(all_tags))
+        # 문서 전체를 가져오지 않고 서버에서 $unwind/$group으로 중복을 제거
+        pipeline = [
+            {"$unwind": "$tags"},
+            {"$group": {"_id": "$tags"}},
+            {"$sort": {"_id": 1}},
+        ]
+        return [doc["_id"] for doc in self._collection.aggregate(pipeline, allowDiskUse=True)]
+
+    def get_tag_counts(self) -> dict:
+        """태그별 사용 파일 수를 서버 측 집계로 계산합니다.
+        반환 형식: {tag: count, ...} (태그 이름 순)
+        """
+        pipeline = [
+            {"$unwind": "$tags"},
+            {"$group": {"_id": "$tags", "count": {"$sum": 1}}},
+            {"$sort": {"_id": 1}},
+        ]
+        return {doc["_id"]: doc["count"] for doc in self._collection.aggregate(pipeline, allowDiskUse=True)}
 
     def get_files_by_tags(self, tags: list) -> list:
-        docs = self._collection.find({"tags": {"$in": tags}})
+        docs = self._collection.find(
+            {"tags": {"$in": tags}}, {"_id": 0, "file_path": 1}, **self._tag_query_options()
+        )
+        return [doc["file_path"] for doc in docs]
+
+    def find_files_by_tag_filter(self, all_of: list, none_of: list) -> list:
+        """$all/$nin 조건을 서버에서 평가합니다.
+        $all은 첫 태그로 tags 인덱스 범위를 잡으므로 all_of는 드문 태그부터 전달해야 합니다."""
+        condition = {"$all": list(all_of)} if all_of else {"$exists": True, "$ne": []}
+        if none_of:
+            condition["$nin"] = list(none_of)
+        docs = self._collection.find(
+            {"tags": condition}, {"_id": 0, "file_path": 1}, **self._tag_query_options()
+        )
         return [doc["file_path"] for doc in docs]
 
+    def iter_tagged_files(self, batch_size: int = 1000):
+        """태그가 하나 이상 있는 모든 파일을 (file_path, tags) 형태로 순회합니다.
+        커서 기반으로 batch_size 단위씩 읽으므로 컬렉션 전체를 한 번에 메모리에 올리지 않습니다.
+        """
+        cursor = self._collection.find(
+            {"tags": {"$exists": True, "$ne": []}},
+            {"_id": 0, "file_path": 1, "tags": 1},
+        ).batch_size(batch_size)
+        for doc in cursor:
+            yield doc["file_path"], doc.get("tags", [])
+
+    def iter_tagged_paths(self, batch_size: int = 1000):
+        """태그가 하나 이상 있는 모든 파일의 경로만 순회합니다 (태그 목록은 읽지 않음)."""
+        cursor = self._collection.find(
+            {"tags": {"$exists": True, "$ne": []}},
+            {"_id": 0, "file_path": 1},
+        ).batch_size(batch_size)
+        for doc in cursor:
+            yield doc["file_path"]
+
     def delete_file_entry(self, file_path: str) -> bool:
         result = self._collection.delete_one({"file_path": file_path})
         return result.deleted_count > 0
@@ -46,15 +156,29 @@ class TagRepository:
         """주어진 파일 경로 목록에 해당하는 문서들을 찾아 반환합니다.
         반환 형식: {normalized_file_path: [tag1, tag2], ...}
         """
-        docs = self._collection.find({"file_path": {"$in": file_paths}})
+        docs = self._collection.find(
+            {"file_path": {"$in": file_paths}}, {"_id": 0, "file_path": 1, "tags": 1}
+        )
         return {doc["file_path"]: doc.get("tags", []) for doc in docs}
 
-    def bulk_update_tags(self, operations: list) -> dict:
-        """주어진 bulk operations 리스트를 실행합니다.
-        operations는 pymongo.UpdateOne 인스턴스 리스트여야 합니다.
+    def bulk_update_tags(self, updates: List[TagUpdate], ordered: bool = True) -> dict:
+        """TagUpdate 목록을 UpdateOne으로 바꿔 bulk_write 한 번으로 실행합니다.
+        ordered=False이면 서버가 연산을 병렬로 적용하고, 일부 연산이 실패해도 나머지는 계속 실행됩니다.
+        실패한 연산의 인덱스는 결과의 "failed"로 돌려주어 호출 측이 그 파일의 캐시/색인을 갱신하지 않게 합니다.
         """
-        if not operations:
-            return {"modified": 0, "upserted": 0}
+        if not updates:
+            return {"modified": 0, "upserted": 0, "failed": []}
         
-        result = self._collection.bulk_write(operations)
-        return {"modified": result.modified_count, "upserted": result.upserted_count}
+        operations = [_to_update_one(update) for update in updates]
+        try:
+            result = self._collection.bulk_write(operations, ordered=ordered)
+        except BulkWriteError as e:
+            details = e.details
+            failed = {error["index"] for error in details.get("writeErrors", [])}
+            if ordered and failed:
+                # 순서 있는 쓰기는 첫 실패에서 멈추므로 그 뒤 연산은 실행되지 않았다
+                failed.update(range(min(failed), len(operations)))
+            logger.error(f"[TAG_REPOSITORY] bulk_write 일부 실패: {len(details.get('writeErrors', []))}건")
+            return {"modified": details.get("nModified", 0), "upserted": details.get("nUpserted", 0),
+                    "failed": sorted(failed)}
+        return {"modified": result.modified_count, "upserted": result.upserted_count, "failed": []}
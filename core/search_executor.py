@@ -0,0 +1,171 @@
+"""
+검색 실행기
+
+SearchManager.iter_search_results()를 QThreadPool의 작업 스레드에서 실행합니다.
+요청마다 세대(generation) 번호를 붙이고, 새 요청이 들어오면 이전 요청의 토큰을 취소합니다.
+결과는 chunk_size개 또는 chunk_interval초마다 청크로 먼저 전달되고, 검색이 끝나면 전체 결과가 전달됩니다.
+결과 시그널은 메인 스레드에서 최신 세대의 결과일 때만 발생합니다.
+"""
+
+import logging
+import time
+from typing import Optional
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from core.cancellation import CancellationToken, OperationCancelled
+from core.search_manager import SearchManager
+from core.tag_query import TagQuerySyntaxError
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_CHUNK_INTERVAL = 0.05  # 초
+
+_search_thread_pool: Optional[QThreadPool] = None
+
+
+def get_search_thread_pool() -> QThreadPool:
+    """검색 전용 스레드 풀(스레드 1개)을 반환합니다.
+
+    풀은 프로세스가 끝날 때까지 유지합니다. 실행기 객체에 딸린 풀이 가비지 컬렉션으로 파괴되면
+    소멸자가 GIL을 쥔 채 작업 스레드를 기다리고, 작업 스레드는 GIL을 기다려 교착 상태가 됩니다.
+    """
+    global _search_thread_pool
+    if _search_thread_pool is None:
+        _search_thread_pool = QThreadPool()
+        # 취소된 검색이 쌓이지 않도록 한 번에 하나씩 실행
+        _search_thread_pool.setMaxThreadCount(1)
+    return _search_thread_pool
+
+
+class _SearchTaskSignals(QObject):
+    chunk_ready = pyqtSignal(int, list)  # generation, file_paths
+    finished = pyqtSignal(int, dict, list)  # generation, conditions, file_paths
+    failed = pyqtSignal(int, str)  # generation, error message
+
+
+class SearchTask(QRunnable):
+    """한 번의 검색 요청을 작업 스레드에서 실행하는 QRunnable"""
+
+    def __init__(self, search_manager: SearchManager, conditions: dict, token: CancellationToken,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, chunk_interval: float = DEFAULT_CHUNK_INTERVAL):
+        super().__init__()
+        self.signals = _SearchTaskSignals()
+        self._search_manager = search_manager
+        self._conditions = conditions
+        self._token = token
+        self._chunk_size = max(1, chunk_size)
+        self._chunk_interval = chunk_interval
+
+    def run(self):
+        generation = self._token.generation
+        try:
+            # 대기열에 있는 동안 더 새로운 요청이 들어왔으면 시작하지 않는다
+            self._token.raise_if_cancelled()
+            results = []
+            chunk = []
+            last_flush = time.monotonic()
+            for file_path in self._search_manager.iter_search_results(self._conditions, self._token):
+                chunk.append(file_path)
+                if len(chunk) >= self._chunk_size or time.monotonic() - last_flush >= self._chunk_interval:
+                    self._token.raise_if_cancelled()
+                    self.signals.chunk_ready.emit(generation, chunk)
+                    results.extend(chunk)
+                    chunk = []
+                    last_flush = time.monotonic()
+            self._token.raise_if_cancelled()
+            if chunk:
+                self.signals.chunk_ready.emit(generation, chunk)
+                results.extend(chunk)
+        except OperationCancelled:
+            logger.debug(f"[SEARCH] 검색 취소됨: generation={generation}")
+            return
+        except TagQuerySyntaxError as e:
+            # 입력 중인 검색식("a AND", "(a")은 흔하므로 추적 정보 없이 기록
+            logger.info(f"[SEARCH] 검색식 오류: generation={generation}, {e}")
+            self.signals.failed.emit(generation, str(e))
+            return
+        except Exception as e:
+            logger.exception(f"[SEARCH] 검색 실패: generation={generation}")
+            self.signals.failed.emit(generation, str(e))
+            return
+        self.signals.finished.emit(generation, self._conditions, results)
+
+
+class SearchExecutor(QObject):
+    """검색 요청을 작업 스레드로 보내고 최신 요청의 결과만 전달합니다.
+
+    Args:
+        search_manager: 검색을 수행할 SearchManager
+        thread_pool: 사용할 QThreadPool. None이면 검색 전용 풀(get_search_thread_pool())을 사용합니다.
+        chunk_size: 중간 결과를 전달할 파일 수
+        chunk_interval: 중간 결과를 전달할 최대 간격(초)
+    """
+
+    results_chunk = pyqtSignal(int, list)  # generation, file_paths (이번 청크)
+    results_ready = pyqtSignal(int, dict, list)  # generation, conditions, file_paths
+    search_failed = pyqtSignal(int, str)  # generation, error message
+
+    def __init__(self, search_manager: SearchManager, thread_pool: Optional[QThreadPool] = None,
+                 parent: Optional[QObject] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 chunk_interval: float = DEFAULT_CHUNK_INTERVAL):
+        super().__init__(parent)
+        self._search_manager = search_manager
+        self._chunk_size = chunk_size
+        self._chunk_interval = chunk_interval
+        self._thread_pool = thread_pool or get_search_thread_pool()
+        self._generation = 0
+        self._current_token: Optional[CancellationToken] = None
+
+    @property
+    def current_generation(self) -> int:
+        return self._generation
+
+    def submit(self, conditions: dict) -> int:
+        """이전 검색을 취소하고 새 검색을 시작합니다.
+
+        Returns:
+            int: 새 검색의 세대 번호
+        """
+        self.cancel()
+        token = CancellationToken(self._generation)
+        self._current_token = token
+
+        task = SearchTask(self._search_manager, dict(conditions), token, self._chunk_size, self._chunk_interval)
+        task.signals.chunk_ready.connect(self._on_task_chunk)
+        task.signals.finished.connect(self._on_task_finished)
+        task.signals.failed.connect(self._on_task_failed)
+        self._thread_pool.start(task)
+        return token.generation
+
+    def cancel(self):
+        """진행 중인 검색을 취소합니다. 이미 도착 대기 중인 결과도 무시됩니다."""
+        if self._current_token is not None:
+            self._current_token.cancel()
+            self._current_token = None
+        self._generation += 1
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """실행 중인 검색 작업이 모두 끝날 때까지 기다립니다 (종료 시/테스트용)."""
+        return self._thread_pool.waitForDone(msecs)
+
+    def _is_current(self, generation: int) -> bool:
+        return self._current_token is not None and generation == self._current_token.generation
+
+    def _on_task_chunk(self, generation: int, file_paths: list):
+        if self._is_current(generation):
+            self.results_chunk.emit(generation, file_paths)
+
+    def _on_task_finished(self, generation: int, conditions: dict, results: list):
+        if not self._is_current(generation):
+            return
+        self._current_token = None
+        self.results_ready.emit(generation, conditions, results)
+
+    def _on_task_failed(self, generation: int, message: str):
+        if not self._is_current(generation):
+            return
+        self._current_token = None
+        self.search_failed.emit(generation, message)
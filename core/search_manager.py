@@ -1,58 +1,103 @@
+from typing import Iterator, Optional
 from core.adapters.tag_manager_adapter import TagManagerAdapter
+from core.cancellation import CancellationToken
+from core.path_utils import normalize_path
+from core.workspace_index import WorkspaceIndex
 import os
+import threading
+
+
+def _raise_if_cancelled(cancel_token: Optional[CancellationToken]):
+    if cancel_token is not None:
+        cancel_token.raise_if_cancelled()
+
 
 class SearchManager:
-    def __init__(self, tag_manager: TagManagerAdapter):
+    def __init__(self, tag_manager: TagManagerAdapter, index_store_dir: Optional[str] = None,
+                 index_refresh_interval: Optional[float] = None):
+        """
+        Args:
+            tag_manager: 태그 조회에 사용할 TagManagerAdapter
+            index_store_dir: 작업공간 색인 저장 디렉토리 (None이면 설정의 cache_dir)
+            index_refresh_interval: 작업공간 색인 증분 갱신 간격(초) (None이면 설정값)
+        """
         self.tag_manager = tag_manager
+        self._index_store_dir = index_store_dir
+        self._index_refresh_interval = index_refresh_interval
+        self._workspace_index: Optional[WorkspaceIndex] = None
+        # 검색은 작업 스레드에서 실행되므로 색인 교체를 보호한다
+        self._index_lock = threading.Lock()
+
+    def _get_workspace_path(self) -> str:
+        workspace_path = getattr(self.tag_manager, 'workspace_path', None)
+        if not workspace_path:
+            from core.config_manager import config_manager
+            workspace_path = config_manager.get_workspace_path()
+        return workspace_path
+
+    def get_workspace_index(self) -> WorkspaceIndex:
+        """현재 작업공간의 파일 색인을 최신 상태로 만들어 반환합니다.
+        작업공간 경로가 바뀌면 해당 경로의 색인으로 교체합니다."""
+        workspace_path = normalize_path(os.path.abspath(self._get_workspace_path()))
+        with self._index_lock:
+            if self._workspace_index is None or self._workspace_index.root_path != workspace_path:
+                from core.config_manager import config_manager
+                store_dir = self._index_store_dir or config_manager.get_cache_dir()
+                refresh_interval = self._index_refresh_interval
+                if refresh_interval is None:
+                    refresh_interval = config_manager.get_workspace_index_refresh_seconds()
+                if self._workspace_index is not None:
+                    self._workspace_index.close()
+                self._workspace_index = WorkspaceIndex(workspace_path, store_dir, refresh_interval)
+            workspace_index = self._workspace_index
+        workspace_index.ensure_fresh()
+        return workspace_index
 
-    def search_files(self, conditions: dict) -> list:
+    def search_files(self, conditions: dict, cancel_token: Optional[CancellationToken] = None) -> list:
         """
         통합 검색: 파일명, 확장자, 태그 등 다양한 조건을 받아 파일 경로 리스트를 반환
         완전일치 검색과 부분일치 검색을 모두 지원
+        
+        cancel_token이 취소되면 다음 확인 지점에서 OperationCancelled를 발생시킨다
+        """
+        return list(self.iter_search_results(conditions, cancel_token))
+    
+    def iter_search_results(self, conditions: dict,
+                            cancel_token: Optional[CancellationToken] = None) -> Iterator[str]:
+        """
+        search_files()와 같은 검색을 수행하되, 찾은 파일 경로를 하나씩 내보낸다
+        (검색 실행기가 결과를 청크 단위로 화면에 전달할 때 사용)
         """
         # 부분일치 검색 처리
         if 'partial' in conditions:
-            return self._search_files_with_partial_conditions(conditions)
+            yield from self._search_files_with_partial_conditions(conditions, cancel_token)
+            return
         
         # 완전일치 검색 처리
         # 복합 검색: 파일명 + 태그
         if 'filename' in conditions and 'tags' in conditions:
-            return self._search_files_with_both_conditions(conditions)
+            yield from self._search_files_with_both_conditions(conditions, cancel_token)
+            return
         
-        # 1. 태그 기반 검색 (단일 태그만 우선)
+        # 1. 태그 기반 검색 (AND/OR/NOT 검색식, 단일 태그도 같은 경로)
         if 'tags' in conditions:
             tag_cond = conditions['tags']
             tag_query = tag_cond.get('query', '').strip()
             if tag_query:
-                return self.tag_manager.get_files_by_tags([tag_query])
+                yield from self.tag_manager.find_files_by_tag_query(tag_query)
+                return
 
-        # 2. 파일명/확장자 기반 검색
+        # 2. 파일명/확장자 기반 검색 (작업공간 색인 사용)
         if 'filename' in conditions:
             filename_cond = conditions['filename']
             search_text = filename_cond.get('name', '').strip()
             extensions = filename_cond.get('extensions', [])
-            workspace_path = getattr(self.tag_manager, 'workspace_path', None)
-            if not workspace_path:
-                from core.config_manager import config_manager
-                workspace_path = config_manager.get_workspace_path()
-            search_results = []
-            for root, _, files in os.walk(workspace_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    # 파일명 검색 (완전일치)
-                    if search_text and search_text.lower() not in file.lower():
-                        continue
-                    # 확장자 필터
-                    if extensions:
-                        file_ext = os.path.splitext(file)[1].lower()
-                        if not any(ext.lower() in file_ext for ext in extensions):
-                            continue
-                    search_results.append(file_path)
-            return search_results
-
-        return []
+            for entry in self.get_workspace_index().iter_entries(search_text, extensions):
+                _raise_if_cancelled(cancel_token)
+                yield entry.path
     
-    def _search_files_with_both_conditions(self, conditions: dict) -> list:
+    def _search_files_with_both_conditions(self, conditions: dict,
+                                           cancel_token: Optional[CancellationToken] = None) -> Iterator[str]:
         """
         파일명과 태그 조건을 모두 만족하는 파일들을 검색합니다.
         """
@@ -60,19 +105,19 @@ class SearchManager:
         tag_cond = conditions['tags']
         tag_query = tag_cond.get('query', '').strip()
         if not tag_query:
-            return []
+            return
         
-        tag_files = self.tag_manager.get_files_by_tags([tag_query])
+        tag_files = self.tag_manager.find_files_by_tag_query(tag_query)
         if not tag_files:
-            return []
+            return
         
         # 2. 파일명 조건으로 필터링
         filename_cond = conditions['filename']
         search_text = filename_cond.get('name', '').strip()
         extensions = filename_cond.get('extensions', [])
         
-        filtered_files = []
         for file_path in tag_files:
+            _raise_if_cancelled(cancel_token)
             if not os.path.exists(file_path):
                 continue
                 
@@ -88,70 +133,64 @@ class SearchManager:
                 if not any(ext.lower() in file_ext for ext in extensions):
                     continue
                     
-            filtered_files.append(file_path)
-        
-        return filtered_files
+            yield file_path
     
-    def _search_files_with_partial_conditions(self, conditions: dict) -> list:
+    def _search_files_with_partial_conditions(self, conditions: dict,
+                                              cancel_token: Optional[CancellationToken] = None) -> Iterator[str]:
         """
         부분일치 검색: 파일명, 확장자, 태그의 일부만 입력해도 검색 가능
         """
         partial_cond = conditions['partial']
+        workspace_index = self.get_workspace_index()
+        _raise_if_cancelled(cancel_token)
         
-        workspace_path = getattr(self.tag_manager, 'workspace_path', None)
-        if not workspace_path:
-            from core.config_manager import config_manager
-            workspace_path = config_manager.get_workspace_path()
+        partial_filename = ''
+        if 'filename' in partial_cond:
+            partial_filename = partial_cond['filename'].get('partial', '').strip().lower()
+        partial_extensions = []
+        if 'extensions' in partial_cond:
+            partial_extensions = partial_cond['extensions'].get('partial', [])
+        partial_tags = []
+        if 'tags' in partial_cond:
+            partial_tags = partial_cond['tags'].get('partial', [])
         
-        search_results = []
+        # 후보 파일 결정: 태그 조건이 있으면 부분일치 태그를 가진 파일만,
+        # 없으면 파일명 트라이그램 색인으로 좁힌 파일만 확인한다
+        if partial_tags:
+            tagged_files = self._find_files_by_partial_tags(partial_tags)
+            _raise_if_cancelled(cancel_token)
+            candidates = self._iter_tagged_entries(workspace_index, tagged_files, partial_filename)
+        else:
+            candidates = workspace_index.iter_entries(partial_filename)
         
-        for root, _, files in os.walk(workspace_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                file_name = os.path.basename(file_path)
-                file_ext = os.path.splitext(file_name)[1].lower().lstrip('.')
-                
-                # 파일명 부분일치 검색
-                if 'filename' in partial_cond:
-                    partial_filename = partial_cond['filename'].get('partial', '').strip().lower()
-                    if partial_filename and partial_filename not in file_name.lower():
-                        continue
-                
-                # 확장자 부분일치 검색
-                if 'extensions' in partial_cond:
-                    partial_extensions = partial_cond['extensions'].get('partial', [])
-                    if partial_extensions:
-                        # 확장자 중 하나라도 포함되어야 함
-                        if not any(ext.lower() in file_ext for ext in partial_extensions):
-                            continue
-                
-                # 태그 부분일치 검색
-                if 'tags' in partial_cond:
-                    partial_tags = partial_cond['tags'].get('partial', [])
-                    if partial_tags:
-                        # 파일의 태그 중 하나라도 부분일치해야 함
-                        file_tags = self.tag_manager.get_tags_for_file(file_path)
-                        file_tags_lower = [tag.lower() for tag in file_tags]
-                        
-                        # 태그가 없는 파일은 제외
-                        if not file_tags:
-                            continue
-                        
-                        # 입력된 태그 중 하나라도 파일 태그에 포함되어야 함
-                        tag_found = False
-                        for partial_tag in partial_tags:
-                            partial_tag_lower = partial_tag.lower()
-                            for file_tag in file_tags_lower:
-                                # 부분일치: 검색어가 파일 태그에 포함되거나, 파일 태그가 검색어에 포함되면 매치
-                                if partial_tag_lower in file_tag or file_tag in partial_tag_lower:
-                                    tag_found = True
-                                    break
-                            if tag_found:
-                                break
-                        
-                        if not tag_found:
-                            continue
-                
-                search_results.append(file_path)
-        
-        return search_results 
\ No newline at end of file
+        for entry in candidates:
+            _raise_if_cancelled(cancel_token)
+            # 확장자 부분일치 검색 (확장자 중 하나라도 포함되어야 함)
+            if partial_extensions:
+                file_ext = entry.ext.lstrip('.')
+                if not any(ext.lower() in file_ext for ext in partial_extensions):
+                    continue
+            yield entry.path
+    
+    @staticmethod
+    def _iter_tagged_entries(workspace_index: WorkspaceIndex, tagged_files: set, partial_filename: str):
+        for file_path in tagged_files:
+            entry = workspace_index.get_entry(file_path)
+            # 작업공간 밖이거나 더 이상 존재하지 않는 파일은 제외
+            if entry is None:
+                continue
+            if partial_filename and partial_filename not in entry.name_lower:
+                continue
+            yield entry
+    
+    def _find_files_by_partial_tags(self, partial_tags: list) -> set:
+        """
+        입력된 태그 중 하나라도 부분일치하는 태그를 가진 파일 경로 집합을 반환합니다.
+        부분일치: 검색어가 파일 태그에 포함되거나, 파일 태그가 검색어에 포함되면 매치
+        """
+        matched_tags = set()
+        for partial_tag in partial_tags:
+            matched_tags.update(self.tag_manager.find_tags_by_partial(partial_tag))
+        if not matched_tags:
+            return set()
+        return set(self.tag_manager.get_files_by_tags(sorted(matched_tags)))
@@ -0,0 +1,111 @@
+import struct
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+_EMPTY_LIST_SIZE = sys.getsizeof([])
+_POINTER_SIZE = struct.calcsize("P")
+
+
+class FileTagCache:
+    """파일 경로 → 태그 목록을 보관하는 크기 제한 LRU 캐시
+
+    항목 수(max_entries)와 추정 메모리 사용량(max_bytes) 중 하나라도 넘으면
+    가장 오래 사용하지 않은 항목부터 내보냅니다. 0 이하의 한도는 제한 없음으로 취급합니다.
+    메모리 사용량은 경로 문자열, 태그 리스트, 태그 문자열의 크기 합으로 추정합니다.
+    검색이 작업 스레드에서 실행되므로 모든 접근은 내부 락으로 보호됩니다.
+    """
+
+    def __init__(self, max_entries: int = 0, max_bytes: int = 0):
+        self._max_entries = max(0, int(max_entries))
+        self._max_bytes = max(0, int(max_bytes))
+        self._entries: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _estimate_size(file_path: str, tags: List[str]) -> int:
+        # 리스트는 여유 할당 크기가 만드는 방식에 따라 달라지므로 빈 리스트 + 포인터 수로 계산
+        return (sys.getsizeof(file_path) + _EMPTY_LIST_SIZE + _POINTER_SIZE * len(tags)
+                + sum(sys.getsizeof(tag) for tag in tags))
+
+    def get(self, file_path: str) -> Optional[List[str]]:
+        """캐시된 태그 목록의 복사본을 반환합니다. 없으면 None (적중/실패 횟수에 반영)"""
+        with self._lock:
+            tags = self._entries.get(file_path)
+            if tags is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(file_path)
+            return list(tags)
+
+    def peek(self, file_path: str) -> Optional[List[str]]:
+        """통계와 사용 순서를 바꾸지 않고 캐시된 태그 목록의 복사본을 반환합니다."""
+        with self._lock:
+            tags = self._entries.get(file_path)
+            return None if tags is None else list(tags)
+
+    def put(self, file_path: str, tags: List[str]):
+        """태그 목록을 저장(또는 교체)하고 한도를 넘으면 오래된 항목을 내보냅니다."""
+        tags = list(tags)
+        size = self._estimate_size(file_path, tags)
+        with self._lock:
+            self._discard(file_path)
+            if self._max_bytes and size > self._max_bytes:
+                # 항목 하나가 전체 한도보다 크면 저장하지 않는다
+                return
+            self._entries[file_path] = tags
+            self._sizes[file_path] = size
+            self._total_bytes += size
+            self._evict()
+
+    def discard(self, file_path: str):
+        with self._lock:
+            self._discard(file_path)
+
+    def _discard(self, file_path: str):
+        if self._entries.pop(file_path, None) is not None:
+            self._total_bytes -= self._sizes.pop(file_path)
+
+    def _evict(self):
+        while self._entries and (
+            (self._max_entries and len(self._entries) > self._max_entries)
+            or (self._max_bytes and self._total_bytes > self._max_bytes)
+        ):
+            file_path, _ = self._entries.popitem(last=False)
+            self._total_bytes -= self._sizes.pop(file_path)
+            self._evictions += 1
+
+    def clear(self):
+        """모든 항목을 비웁니다. 통계는 유지됩니다."""
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 크기 조정용 통계를 반환합니다."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+                "max_entries": self._max_entries,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def __contains__(self, file_path: str) -> bool:
+        with self._lock:
+            return file_path in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,175 @@
+import threading
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+from core.path_utils import normalize_path
+from core.trigram_index import TrigramIndex
+
+
+class TagIndex:
+    """태그 ↔ 파일 경로 관계를 메모리에 유지하는 역색인
+
+    - tag → 정규화된 파일 경로 집합 (태그 검색용)
+    - path → 태그 목록 (파일별 태그 조회용, 저장 순서 유지)
+    - 태그 어휘의 소문자 트라이그램 색인 (태그 부분일치 검색용)
+
+    `build()`로 한 번에 구축한 뒤, TagService의 태그 추가/제거 시점에
+    `add()` / `remove()`로 최신 상태를 유지합니다.
+    검색이 작업 스레드에서 실행되므로 모든 접근은 내부 락으로 보호됩니다.
+    """
+
+    def __init__(self):
+        self._tag_to_paths: Dict[str, Set[str]] = {}
+        self._path_to_tags: Dict[str, List[str]] = {}
+        self._tag_trigrams = TrigramIndex()
+        self._is_built = False
+        self._lock = threading.RLock()
+
+    @property
+    def is_built(self) -> bool:
+        return self._is_built
+
+    def build(self, entries: Iterable[Tuple[str, List[str]]]) -> int:
+        """(file_path, tags) 목록으로 색인을 새로 구축합니다.
+
+        Args:
+            entries: (파일 경로, 태그 리스트) 튜플을 순회하는 iterable
+
+        Returns:
+            int: 색인된 파일 수
+        """
+        with self._lock:
+            self._tag_to_paths = {}
+            self._path_to_tags = {}
+            self._tag_trigrams.clear()
+            for file_path, tags in entries:
+                if tags:
+                    self.add(file_path, tags)
+            self._is_built = True
+            return len(self._path_to_tags)
+
+    def clear(self):
+        """색인을 비우고 미구축 상태로 되돌립니다."""
+        with self._lock:
+            self._tag_to_paths = {}
+            self._path_to_tags = {}
+            self._tag_trigrams.clear()
+            self._is_built = False
+
+    def add(self, file_path: str, tags: Iterable[str]):
+        """파일에 태그들을 추가합니다. 이미 있는 태그는 무시합니다."""
+        with self._lock:
+            path = normalize_path(file_path)
+            current = self._path_to_tags.setdefault(path, [])
+            for tag in tags:
+                if tag not in current:
+                    current.append(tag)
+                paths = self._tag_to_paths.get(tag)
+                if paths is None:
+                    paths = self._tag_to_paths[tag] = set()
+                    self._tag_trigrams.add(tag, tag.lower())
+                paths.add(path)
+            if not current:
+                del self._path_to_tags[path]
+
+    def remove(self, file_path: str, tags: Iterable[str]):
+        """파일에서 태그들을 제거합니다. 태그가 모두 사라지면 파일 항목도 제거합니다."""
+        with self._lock:
+            path = normalize_path(file_path)
+            current = self._path_to_tags.get(path)
+            if current is None:
+                return
+            for tag in tags:
+                if tag in current:
+                    current.remove(tag)
+                paths = self._tag_to_paths.get(tag)
+                if paths is not None:
+                    paths.discard(path)
+                    if not paths:
+                        del self._tag_to_paths[tag]
+                        self._tag_trigrams.remove(tag)
+            if not current:
+                del self._path_to_tags[path]
+
+    def remove_file(self, file_path: str):
+        """파일 항목과 그 파일의 모든 태그 연결을 제거합니다."""
+        with self._lock:
+            path = normalize_path(file_path)
+            tags = self._path_to_tags.get(path)
+            if tags:
+                self.remove(path, list(tags))
+
+    def get_tags(self, file_path: str) -> List[str]:
+        with self._lock:
+            return list(self._path_to_tags.get(normalize_path(file_path), []))
+
+    def get_files(self, tags: Iterable[str]) -> Set[str]:
+        """주어진 태그 중 하나라도 가진 파일 경로 집합을 반환합니다 ($in 과 동일)."""
+        with self._lock:
+            result: Set[str] = set()
+            for tag in tags:
+                result |= self._tag_to_paths.get(tag, set())
+            return result
+
+    def posting_size(self, tag: str) -> int:
+        with self._lock:
+            return len(self._tag_to_paths.get(tag, ()))
+
+    def get_files_with_all(self, all_of: Iterable[str], none_of: Iterable[str] = ()) -> Set[str]:
+        """all_of의 태그를 모두 갖고 none_of의 태그는 없는 파일 경로 집합 ($all/$nin 과 동일).
+        가장 작은 posting 집합에서 시작해 교집합하므로 결과는 그 크기를 넘지 않습니다.
+        all_of가 비어 있으면 태그가 있는 모든 파일이 대상입니다."""
+        with self._lock:
+            postings = sorted((self._tag_to_paths.get(tag, set()) for tag in all_of), key=len)
+            if postings:
+                result = set(postings[0])
+                for paths in postings[1:]:
+                    if not result:
+                        break
+                    result &= paths
+            else:
+                result = set(self._path_to_tags)
+            for tag in none_of:
+                if not result:
+                    break
+                result -= self._tag_to_paths.get(tag, set())
+            return result
+
+    def get_files_ignoring_case(self, tag: str) -> Set[str]:
+        """대소문자를 무시하고 tag와 같은 태그를 가진 파일 경로 집합을 반환합니다.
+        태그 어휘의 소문자 색인으로 해당 태그들을 찾아 posting 집합을 합칩니다."""
+        with self._lock:
+            result: Set[str] = set()
+            for matched in self._tag_trigrams.find_exact(tag.lower()):
+                result |= self._tag_to_paths.get(matched, set())
+            return result
+
+    def find_tags_by_partial(self, partial: str) -> List[str]:
+        """부분일치하는 태그를 반환합니다 (대소문자 무시).
+        검색어가 태그에 포함되거나, 태그가 검색어에 포함되면 매치입니다."""
+        with self._lock:
+            partial_lower = partial.lower()
+            matched = self._tag_trigrams.search(partial_lower)
+            matched |= self._tag_trigrams.search_contained_in(partial_lower)
+            return sorted(matched)
+
+    def get_all_tags(self) -> List[str]:
+        with self._lock:
+            return sorted(self._tag_to_paths.keys())
+
+    def get_tag_counts(self) -> Dict[str, int]:
+        with self._lock:
+            return {tag: len(paths) for tag, paths in sorted(self._tag_to_paths.items())}
+
+    def iter_files(self) -> Iterator[Tuple[str, List[str]]]:
+        """색인된 (file_path, tags)를 순회합니다. 순회 중 변경에 안전하도록 스냅샷을 사용합니다."""
+        with self._lock:
+            snapshot = [(file_path, list(tags)) for file_path, tags in self._path_to_tags.items()]
+        yield from snapshot
+
+    def has_file(self, file_path: str) -> bool:
+        with self._lock:
+            return normalize_path(file_path) in self._path_to_tags
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._path_to_tags)
@@ -1,30 +1,144 @@
 import os
-from pymongo import UpdateOne
-from typing import List, Dict
-from core.repositories.tag_repository import TagRepository
+import logging
+import unicodedata
+from typing import Callable, List, Dict, Optional, Set
+from core.repositories.base import BaseTagRepository, TagUpdate
 from core.events import EventBus, TagAddedEvent, TagRemovedEvent
 from core.path_utils import normalize_path
+from core.services.file_tag_cache import FileTagCache
+from core.services.tag_index import TagIndex
+from core.services.tagged_path_filter import TaggedPathFilter
+from core.tag_query import AndNode, TagPostingSource, TagQueryPlanner, TagTerm, parse_tag_query
+
+logger = logging.getLogger(__name__)
+
+
+class _IndexPostingSource(TagPostingSource):
+    """역색인의 posting 집합으로 검색식을 평가합니다."""
+
+    def __init__(self, tag_index: TagIndex):
+        self._tag_index = tag_index
+
+    def posting_size(self, tag: str) -> int:
+        return self._tag_index.posting_size(tag)
+
+    def files_with_all(self, all_of: List[str], none_of: List[str]) -> Set[str]:
+        return self._tag_index.get_files_with_all(all_of, none_of)
+
+    def files_with_any(self, tags: List[str]) -> Set[str]:
+        return self._tag_index.get_files(tags)
+
+
+class _RepositoryPostingSource(TagPostingSource):
+    """역색인이 없을 때 AND/NOT 조건을 저장소 조회($all/$nin) 한 번으로 내려보냅니다.
+
+    저장소에 collation이 있으면 저장소가 대소문자(강도에 따라 악센트도)를 무시하고 비교하므로,
+    태그 수를 그보다 느슨하게 접은 이름으로 모아 있는 태그를 없다고 잘못 판정하지 않게 합니다.
+    """
+
+    def __init__(self, repository: BaseTagRepository, tag_counts: Dict[str, int]):
+        self._repository = repository
+        self._ignore_case = repository.tag_collation is not None
+        self._tag_counts: Dict[str, int] = {}
+        for tag, count in tag_counts.items():
+            key = self._key(tag)
+            self._tag_counts[key] = self._tag_counts.get(key, 0) + count
+
+    def _key(self, tag: str) -> str:
+        if not self._ignore_case:
+            return tag
+        # 악센트를 떼고 대소문자를 접음 (collation 강도 1, 2를 모두 포함하는 느슨한 비교)
+        decomposed = unicodedata.normalize("NFKD", tag)
+        return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+    def posting_size(self, tag: str) -> int:
+        return self._tag_counts.get(self._key(tag), 0)
+
+    def files_with_all(self, all_of: List[str], none_of: List[str]) -> Set[str]:
+        # 없는 태그가 하나라도 있으면 데이터베이스에 묻지 않아도 결과가 비어 있다
+        if any(self._key(tag) not in self._tag_counts for tag in all_of):
+            return set()
+        return set(self._repository.find_files_by_tag_filter(all_of, none_of))
+
+    def files_with_any(self, tags: List[str]) -> Set[str]:
+        return set(self._repository.get_files_by_tags(tags))
 
 class TagService:
-    def __init__(self, tag_repository: TagRepository, event_bus: EventBus):
+    DEFAULT_BULK_CHUNK_SIZE = 1000
+    DEFAULT_FILE_TAG_CACHE_ENTRIES = 100000
+    DEFAULT_FILE_TAG_CACHE_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, tag_repository: BaseTagRepository, event_bus: EventBus,
+                 bulk_chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+                 file_tag_cache_entries: int = DEFAULT_FILE_TAG_CACHE_ENTRIES,
+                 file_tag_cache_bytes: int = DEFAULT_FILE_TAG_CACHE_BYTES,
+                 untagged_filter_false_positive_rate: float = 0.01):
         self._repository = tag_repository
         self._event_bus = event_bus
-        # 캐시 추가
-        self._file_tags_cache: Dict[str, List[str]] = {}
+        # 일괄 태그 작업 시 bulk_write 한 번에 보낼 연산 수
+        self._bulk_chunk_size = max(1, int(bulk_chunk_size))
+        # 파일별 태그 캐시 (항목 수/메모리 한도를 넘으면 오래 안 쓴 항목부터 내보냄)
+        self._file_tags_cache = FileTagCache(file_tag_cache_entries, file_tag_cache_bytes)
         self._all_tags_cache: List[str] = None
+        self._tag_counts_cache: Dict[str, int] = None
+        # 태그 ↔ 파일 역색인 (build_tag_index() 호출 후 사용)
+        self._tag_index = TagIndex()
+        # 태그가 있는 경로의 블룸 필터 (build_tagged_path_filter() 호출 후 사용)
+        # 역색인 없이도 태그 없는 파일은 데이터베이스 조회 없이 빈 목록으로 응답
+        self._tagged_path_filter = TaggedPathFilter(untagged_filter_false_positive_rate)
+
+    def build_tag_index(self) -> int:
+        """tagged_files 컬렉션을 한 번 순회하여 메모리 역색인을 구축합니다.
+        구축 이후 태그 검색과 파일별 태그 조회는 데이터베이스 왕복 없이 처리됩니다.
+
+        Returns:
+            int: 색인된 파일 수
+        """
+        count = self._tag_index.build(self._repository.iter_tagged_files())
+        logger.info(f"[TAG_SERVICE] 태그 역색인 구축 완료: {count}개 파일")
+        return count
+
+    def is_tag_index_built(self) -> bool:
+        return self._tag_index.is_built
+
+    def build_tagged_path_filter(self) -> int:
+        """태그가 있는 파일 경로만 한 번 읽어 블룸 필터를 구축합니다.
+        역색인을 쓰지 않을 때 태그 없는 파일의 조회를 데이터베이스 왕복 없이 처리하기 위해 사용합니다.
+
+        Returns:
+            int: 등록된 경로 수
+        """
+        count = self._tagged_path_filter.build(self._repository.iter_tagged_paths())
+        logger.info(f"[TAG_SERVICE] 태그 경로 필터 구축 완료: {count}개 파일")
+        return count
+
+    def _is_known_untagged(self, file_path: str) -> bool:
+        return not self._tagged_path_filter.might_contain(file_path)
+
+    def _mark_tagged(self, file_paths: List[str]):
+        for file_path in file_paths:
+            self._tagged_path_filter.add(file_path)
+        # 용량을 넘으면 오탐이 늘어나므로 더 큰 용량으로 다시 구축한다
+        if self._tagged_path_filter.is_saturated():
+            capacity = self._tagged_path_filter.capacity
+            count = self._tagged_path_filter.build(self._repository.iter_tagged_paths(), expected_count=capacity)
+            logger.info(f"[TAG_SERVICE] 태그 경로 필터 용량 초과, 다시 구축: {count}개 파일 (용량 {capacity} → {self._tagged_path_filter.capacity})")
 
     def add_tag_to_file(self, file_path: str, tag: str) -> bool:
         result = self._repository.add_tag(file_path, tag)
         if result:
+            if self._tag_index.is_built:
+                self._tag_index.add(file_path, [tag])
+            self._mark_tagged([file_path])
             # 캐시 업데이트
-            if file_path in self._file_tags_cache:
-                if tag not in self._file_tags_cache[file_path]:
-                    self._file_tags_cache[file_path].append(tag)
-            else:
-                self._file_tags_cache[file_path] = [tag]
+            cached = self._file_tags_cache.peek(file_path)
+            if cached is None:
+                self._file_tags_cache.put(file_path, [tag])
+            elif tag not in cached:
+                self._file_tags_cache.put(file_path, cached + [tag])
             
             # 전체 태그 캐시 무효화
-            self._all_tags_cache = None
+            self._invalidate_tag_summary_cache()
             
             self._event_bus.publish_tag_added(file_path, tag)
         return result
@@ -32,101 +146,273 @@ class TagService:
     def remove_tag_from_file(self, file_path: str, tag: str) -> bool:
         result = self._repository.remove_tag(file_path, tag)
         if result:
+            if self._tag_index.is_built:
+                self._tag_index.remove(file_path, [tag])
             # 캐시 업데이트
-            if file_path in self._file_tags_cache:
-                if tag in self._file_tags_cache[file_path]:
-                    self._file_tags_cache[file_path].remove(tag)
+            cached = self._file_tags_cache.peek(file_path)
+            if cached is not None and tag in cached:
+                cached.remove(tag)
+                self._file_tags_cache.put(file_path, cached)
             
             # 전체 태그 캐시 무효화
-            self._all_tags_cache = None
+            self._invalidate_tag_summary_cache()
             
             self._event_bus.publish_tag_removed(file_path, tag)
         return result
 
     def get_tags_for_file(self, file_path: str) -> list:
+        # 역색인이 구축되어 있으면 메모리에서 바로 응답
+        if self._tag_index.is_built:
+            return self._tag_index.get_tags(file_path)
+
+        # 태그가 없다고 확정된 파일은 조회하지 않는다
+        if self._is_known_untagged(file_path):
+            return []
+
         # 캐시에서 먼저 확인
-        if file_path in self._file_tags_cache:
-            return self._file_tags_cache[file_path].copy()
+        cached = self._file_tags_cache.get(file_path)
+        if cached is not None:
+            return cached
         
         # 캐시에 없으면 데이터베이스에서 조회
         tags = self._repository.get_tags_for_file(file_path)
-        self._file_tags_cache[file_path] = tags.copy()
+        self._file_tags_cache.put(file_path, tags)
         return tags
 
+    def get_tags_for_files(self, file_paths: List[str]) -> Dict[str, List[str]]:
+        """여러 파일의 태그를 한 번에 조회합니다. {file_path: tags}
+        캐시에 없는 파일만 bulk_chunk_size 단위의 find_files 호출로 가져옵니다."""
+        if self._tag_index.is_built:
+            return {file_path: self._tag_index.get_tags(file_path) for file_path in file_paths}
+
+        result: Dict[str, List[str]] = {}
+        missing: List[str] = []
+        for file_path in file_paths:
+            if self._is_known_untagged(file_path):
+                result[file_path] = []
+                continue
+            cached = self._file_tags_cache.get(file_path)
+            if cached is not None:
+                result[file_path] = cached
+            else:
+                missing.append(file_path)
+
+        for start in range(0, len(missing), self._bulk_chunk_size):
+            chunk = missing[start:start + self._bulk_chunk_size]
+            found = self._repository.find_files(chunk)
+            for file_path in chunk:
+                tags = list(found.get(file_path, []))
+                self._file_tags_cache.put(file_path, tags)
+                result[file_path] = tags
+        return result
+
     def get_all_tags(self) -> list:
         # 캐시에서 먼저 확인
         if self._all_tags_cache is not None:
             return self._all_tags_cache.copy()
         
+        if self._tag_index.is_built:
+            tags = self._tag_index.get_all_tags()
+            self._all_tags_cache = tags.copy()
+            return tags
+
         # 캐시에 없으면 데이터베이스에서 조회
         tags = self._repository.get_all_tags()
         self._all_tags_cache = tags.copy()
         return tags
 
+    def find_tags_by_partial(self, partial: str) -> List[str]:
+        """부분일치하는 태그 목록을 반환합니다 (대소문자 무시).
+        검색어가 태그에 포함되거나 태그가 검색어에 포함되면 매치입니다."""
+        if self._tag_index.is_built:
+            return self._tag_index.find_tags_by_partial(partial)
+
+        partial_lower = partial.lower()
+        return [
+            tag for tag in self.get_all_tags()
+            if partial_lower in tag.lower() or tag.lower() in partial_lower
+        ]
+
+    def get_tag_counts(self) -> Dict[str, int]:
+        """태그별 사용 파일 수를 반환합니다. {tag: count}"""
+        if self._tag_counts_cache is not None:
+            return dict(self._tag_counts_cache)
+
+        if self._tag_index.is_built:
+            counts = self._tag_index.get_tag_counts()
+        else:
+            counts = self._repository.get_tag_counts()
+        self._tag_counts_cache = dict(counts)
+        return counts
+
+    def iter_tagged_files(self):
+        """태그가 있는 모든 파일을 (file_path, tags) 형태로 순회합니다.
+        역색인이 있으면 메모리에서, 없으면 DB 커서에서 읽습니다."""
+        if self._tag_index.is_built:
+            return self._tag_index.iter_files()
+        return self._repository.iter_tagged_files()
+
+    def get_all_tagged_files(self) -> List[str]:
+        """태그가 하나 이상 있는 모든 파일 경로를 반환합니다."""
+        return [file_path for file_path, _ in self.iter_tagged_files()]
+
+    def _invalidate_tag_summary_cache(self):
+        """전체 태그 목록/태그 개수 캐시를 무효화합니다."""
+        self._all_tags_cache = None
+        self._tag_counts_cache = None
+
     def get_files_by_tags(self, tags: list) -> list:
+        if self._tag_index.is_built:
+            return sorted(self._tag_index.get_files(tags))
         return self._repository.get_files_by_tags(tags)
 
+    def _tag_query_planner(self) -> TagQueryPlanner:
+        if self._tag_index.is_built:
+            return TagQueryPlanner(_IndexPostingSource(self._tag_index))
+        return TagQueryPlanner(_RepositoryPostingSource(self._repository, self.get_tag_counts()))
+
+    def find_files_by_tag_query(self, expression: str) -> list:
+        """태그 불리언 검색식(AND/OR/NOT, 괄호)에 맞는 파일 경로 목록을 반환합니다.
+        문법은 core.tag_query를 참고하세요.
+
+        Raises:
+            TagQuerySyntaxError: 검색식 문법 오류
+        """
+        query = parse_tag_query(expression)
+        return sorted(self._tag_query_planner().evaluate(query))
+
+    def get_files_with_all_tags(self, tags: list) -> list:
+        """tags를 모두 가진 파일 경로 목록 ($all). 태그가 없으면 빈 목록"""
+        tags = list(dict.fromkeys(tags))
+        if not tags:
+            return []
+        planner = self._tag_query_planner()
+        return sorted(planner.evaluate(AndNode(tuple(TagTerm(tag) for tag in tags))))
+
+    def get_files_by_tag_ignoring_case(self, tag: str) -> Set[str]:
+        """대소문자를 무시하고 tag를 가진 파일 경로(정규화) 집합을 반환합니다.
+        역색인이 있으면 posting 집합 조회 한 번, 없으면 태그 어휘에서 같은 태그들을 찾아 저장소 조회 한 번으로 처리합니다."""
+        if self._tag_index.is_built:
+            return self._tag_index.get_files_ignoring_case(tag)
+        tag_lower = tag.lower()
+        matched = [name for name in self.get_all_tags() if name.lower() == tag_lower]
+        if not matched:
+            return set()
+        return {normalize_path(file_path) for file_path in self._repository.get_files_by_tags(matched)}
+
     def delete_file_entry(self, file_path: str) -> bool:
         result = self._repository.delete_file_entry(file_path)
         if result:
+            if self._tag_index.is_built:
+                self._tag_index.remove_file(file_path)
             # 캐시에서 제거
-            if file_path in self._file_tags_cache:
-                del self._file_tags_cache[file_path]
+            self._file_tags_cache.discard(file_path)
         return result
 
-    def add_tags_to_files(self, file_paths: List[str], tags_to_add: List[str]) -> dict:
+    def add_tags_to_files(self, file_paths: List[str], tags_to_add: List[str],
+                          progress_callback: Optional[Callable[[int, int], None]] = None) -> dict:
+        """여러 파일에 태그를 일괄 추가합니다.
+
+        기존 태그를 읽지 않고 추가만 하는 업서트 TagUpdate(MongoDB에서는 `$addToSet`)만 보내므로
+        파일 수와 무관하게 DB 읽기가 없고, 동시에 다른 곳에서 태그를 수정해도 덮어쓰지 않습니다.
+
+        Args:
+            file_paths: 대상 파일 경로 리스트
+            tags_to_add: 추가할 태그 리스트
+            progress_callback: 청크 하나가 끝날 때마다 (처리된 파일 수, 전체 파일 수)로 호출됩니다.
+        """
         if not isinstance(file_paths, list) or not file_paths:
             return {"success": False, "error": "잘못된 파일 경로 리스트"}
 
-        bulk_operations = []
-        for file_path in file_paths:
-            normalized_path = normalize_path(file_path)
-            existing_tags = self._repository.get_tags_for_file(normalized_path)
-            new_tags = list(set(existing_tags + tags_to_add))
-            bulk_operations.append(
-                UpdateOne({"file_path": normalized_path}, {"$set": {"tags": new_tags}}, upsert=True)
-            )
-        
-        result = self._repository.bulk_update_tags(bulk_operations)
+        tags_to_add = list(dict.fromkeys(tags_to_add))
+        result = self._bulk_update_in_chunks(
+            file_paths,
+            lambda path: TagUpdate(path, tags_to_add, [], True),
+            progress_callback,
+        )
         if result.get("modified", 0) > 0 or result.get("upserted", 0) > 0:
-            # 캐시 무효화
+            # 쓰기에 실패한 파일은 저장소가 바뀌지 않았으므로 색인/필터/이벤트에서 뺀다
+            applied = self._without_failed(file_paths, result["failed_paths"])
+            if self._tag_index.is_built:
+                for file_path in applied:
+                    self._tag_index.add(file_path, tags_to_add)
+            self._mark_tagged(applied)
+            # 캐시 무효화 (실패한 파일도 저장소에서 다시 읽도록 함께 비움)
             for file_path in file_paths:
-                if file_path in self._file_tags_cache:
-                    del self._file_tags_cache[file_path]
-            self._all_tags_cache = None
+                self._file_tags_cache.discard(file_path)
+            self._invalidate_tag_summary_cache()
             
-            for file_path in file_paths:
-                for tag in tags_to_add:
-                    self._event_bus.publish_tag_added(file_path, tag)
+            # 파일 × 태그마다 이벤트를 보내지 않고 변경 전체를 배치 하나로 발행
+            self._event_bus.publish_tags_changed({file_path: (list(tags_to_add), []) for file_path in applied})
         return {"success": True, "processed": len(file_paths), "successful": result.get("modified", 0) + result.get("upserted", 0)}
 
-    def remove_tags_from_files(self, file_paths: List[str], tags_to_remove: List[str]) -> dict:
+    def remove_tags_from_files(self, file_paths: List[str], tags_to_remove: List[str],
+                               progress_callback: Optional[Callable[[int, int], None]] = None) -> dict:
+        """여러 파일에서 태그를 일괄 제거합니다. 읽기 없이 제거만 하는 TagUpdate(MongoDB에서는 `$pullAll`)를 보냅니다.
+
+        Args:
+            file_paths: 대상 파일 경로 리스트
+            tags_to_remove: 제거할 태그 리스트
+            progress_callback: 청크 하나가 끝날 때마다 (처리된 파일 수, 전체 파일 수)로 호출됩니다.
+        """
         if not isinstance(file_paths, list) or not file_paths:
             return {"success": False, "error": "잘못된 파일 경로 리스트"}
 
-        bulk_operations = []
-        for file_path in file_paths:
-            normalized_path = normalize_path(file_path)
-            existing_tags = set(self._repository.get_tags_for_file(normalized_path))
-            updated_tags = list(existing_tags - set(tags_to_remove))
-            bulk_operations.append(
-                UpdateOne({"file_path": normalized_path}, {"$set": {"tags": updated_tags}}, upsert=True)
-            )
-
-        result = self._repository.bulk_update_tags(bulk_operations)
+        tags_to_remove = list(dict.fromkeys(tags_to_remove))
+        result = self._bulk_update_in_chunks(
+            file_paths,
+            lambda path: TagUpdate(path, [], tags_to_remove, False),
+            progress_callback,
+        )
         if result.get("modified", 0) > 0:
-            # 캐시 무효화
+            # 쓰기에 실패한 파일은 저장소가 바뀌지 않았으므로 색인/이벤트에서 뺀다
+            applied = self._without_failed(file_paths, result["failed_paths"])
+            if self._tag_index.is_built:
+                for file_path in applied:
+                    self._tag_index.remove(file_path, tags_to_remove)
+            # 캐시 무효화 (실패한 파일도 저장소에서 다시 읽도록 함께 비움)
             for file_path in file_paths:
-                if file_path in self._file_tags_cache:
-                    del self._file_tags_cache[file_path]
-            self._all_tags_cache = None
+                self._file_tags_cache.discard(file_path)
+            self._invalidate_tag_summary_cache()
             
-            for file_path in file_paths:
-                for tag in tags_to_remove:
-                    self._event_bus.publish_tag_removed(file_path, tag)
+            # 파일 × 태그마다 이벤트를 보내지 않고 변경 전체를 배치 하나로 발행
+            self._event_bus.publish_tags_changed({file_path: ([], list(tags_to_remove)) for file_path in applied})
         return {"success": True, "processed": len(file_paths), "successful": result.get("modified", 0) + result.get("upserted", 0)}
 
-    def add_tags_to_directory(self, directory_path, tags, recursive=False, file_extensions=None):
+    def _bulk_update_in_chunks(self, file_paths: List[str], make_update: Callable[[str], TagUpdate],
+                               progress_callback: Optional[Callable[[int, int], None]] = None) -> dict:
+        """파일별 TagUpdate를 bulk_chunk_size 단위로 나눠 순서 없는(bulk ordered=False) 쓰기로 실행합니다.
+        청크마다 연산을 만들어 보내므로 수만 개 파일이어도 연산 리스트 전체를 메모리에 쌓지 않습니다.
+
+        Returns:
+            dict: {"modified", "upserted": 청크별 합계, "failed_paths": 쓰기에 실패한 file_paths의 경로 목록}
+        """
+        total = len(file_paths)
+        modified = 0
+        upserted = 0
+        failed_paths: List[str] = []
+        for start in range(0, total, self._bulk_chunk_size):
+            chunk = file_paths[start:start + self._bulk_chunk_size]
+            updates = [make_update(normalize_path(file_path)) for file_path in chunk]
+            result = self._repository.bulk_update_tags(updates, ordered=False)
+            modified += result.get("modified", 0)
+            upserted += result.get("upserted", 0)
+            failed_paths.extend(chunk[index] for index in result.get("failed", []))
+            if progress_callback:
+                progress_callback(start + len(chunk), total)
+        if failed_paths:
+            logger.error(f"[TAG_SERVICE] 일괄 태그 변경 실패: {len(failed_paths)}개 파일")
+        return {"modified": modified, "upserted": upserted, "failed_paths": failed_paths}
+
+    @staticmethod
+    def _without_failed(file_paths: List[str], failed_paths: List[str]) -> List[str]:
+        if not failed_paths:
+            return file_paths
+        failed = set(failed_paths)
+        return [file_path for file_path in file_paths if file_path not in failed]
+
+    def add_tags_to_directory(self, directory_path, tags, recursive=False, file_extensions=None,
+                              progress_callback=None):
         target_files = self._get_files_in_directory(directory_path, recursive, file_extensions)
         
         # 디버깅 로그 추가
@@ -140,7 +426,7 @@ class TagService:
         if not target_files:
             return {"success": True, "message": "조건에 맞는 파일이 없습니다", "processed": 0}
         
-        return self.add_tags_to_files(target_files, tags)
+        return self.add_tags_to_files(target_files, tags, progress_callback)
 
     def _get_files_in_directory(self, directory_path, recursive=False, file_extensions=None):
         if not directory_path or not os.path.isdir(directory_path):
@@ -182,4 +468,16 @@ class TagService:
     def clear_cache(self):
         """캐시를 초기화합니다."""
         self._file_tags_cache.clear()
-        self._all_tags_cache = None
+        self._invalidate_tag_summary_cache()
+
+    def get_file_tag_cache_stats(self) -> Dict[str, int]:
+        """파일별 태그 캐시의 크기와 적중/실패/내보냄 횟수를 반환합니다."""
+        return self._file_tags_cache.stats()
+
+    def clear_tag_index(self):
+        """역색인을 비웁니다. 이후 조회는 다시 데이터베이스를 사용합니다."""
+        self._tag_index.clear()
+
+    def clear_tagged_path_filter(self):
+        """태그 경로 필터를 비웁니다. 이후 태그 없는 파일도 데이터베이스에서 확인합니다."""
+        self._tagged_path_filter.clear()
@@ -0,0 +1,115 @@
+import hashlib
+import math
+import threading
+from typing import Iterable
+
+from core.path_utils import normalize_path
+
+
+class TaggedPathFilter:
+    """태그가 있는 파일 경로의 블룸 필터
+
+    `might_contain()`이 False이면 그 경로에는 태그가 없다고 확정할 수 있어
+    데이터베이스 조회 없이 빈 태그 목록으로 응답할 수 있습니다. True는 "있을 수도 있음"이므로
+    호출 측에서 실제로 조회해야 합니다. 경로는 TagIndex와 같이 정규화하여 저장/비교하므로
+    같은 파일을 다른 표기("a/../b.txt", "/"와 "\\")로 물어도 놓치지 않습니다. 블룸 필터는 항목을 지울 수 없으므로 태그가 모두 제거된
+    경로는 계속 "있을 수도 있음"으로 남으며, 이는 조회 한 번이 더 생길 뿐 결과는 정확합니다.
+
+    Args:
+        false_positive_rate: 목표 오탐률. 구축 시점의 경로 수와 함께 비트 수/해시 수를 정합니다.
+    """
+
+    MIN_CAPACITY = 1024
+
+    def __init__(self, false_positive_rate: float = 0.01):
+        self._false_positive_rate = min(max(float(false_positive_rate), 1e-6), 0.5)
+        self._bits = bytearray()
+        self._num_bits = 0
+        self._num_hashes = 0
+        self._capacity = 0
+        self._count = 0
+        self._is_built = False
+        self._lock = threading.RLock()
+
+    @property
+    def is_built(self) -> bool:
+        return self._is_built
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._count
+
+    def build(self, file_paths: Iterable[str], expected_count: int = 0) -> int:
+        """태그가 있는 파일 경로 목록으로 필터를 새로 구축합니다.
+        이후 추가될 경로를 고려해 경로 수의 두 배(최소 MIN_CAPACITY)를 용량으로 잡습니다.
+
+        Returns:
+            int: 등록된 경로 수
+        """
+        file_paths = list(file_paths)
+        capacity = max(self.MIN_CAPACITY, 2 * max(len(file_paths), expected_count))
+        num_bits = max(8, int(math.ceil(-capacity * math.log(self._false_positive_rate) / (math.log(2) ** 2))))
+        num_hashes = max(1, int(round(num_bits / capacity * math.log(2))))
+        with self._lock:
+            self._capacity = capacity
+            self._num_bits = num_bits
+            self._num_hashes = num_hashes
+            self._bits = bytearray((num_bits + 7) // 8)
+            self._count = 0
+            for file_path in file_paths:
+                self._add(file_path)
+            self._is_built = True
+            return self._count
+
+    def clear(self):
+        with self._lock:
+            self._bits = bytearray()
+            self._num_bits = 0
+            self._num_hashes = 0
+            self._capacity = 0
+            self._count = 0
+            self._is_built = False
+
+    def add(self, file_path: str) -> bool:
+        """태그가 추가된 경로를 등록합니다. 구축 전에는 아무것도 하지 않습니다.
+        이미 들어 있는(또는 그렇게 보이는) 경로는 비트가 늘지 않으므로 개수에 더하지 않습니다.
+
+        Returns:
+            bool: 새 경로로 등록되었으면 True
+        """
+        with self._lock:
+            if not self._is_built or self._contains(file_path):
+                return False
+            self._add(file_path)
+            return True
+
+    def might_contain(self, file_path: str) -> bool:
+        """경로에 태그가 있을 수 있으면 True, 확실히 없으면 False
+        구축 전에는 판단할 수 없으므로 항상 True입니다."""
+        with self._lock:
+            if not self._is_built:
+                return True
+            return self._contains(file_path)
+
+    def is_saturated(self) -> bool:
+        """등록된 경로가 용량을 넘어 오탐률이 목표보다 높아졌는지 여부 (다시 구축할 시점)"""
+        return self._is_built and self._count > self._capacity
+
+    def _contains(self, file_path: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(file_path))
+
+    def _add(self, file_path: str):
+        for pos in self._positions(file_path):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self._count += 1
+
+    def _positions(self, file_path: str):
+        # 해시 하나를 두 값으로 나눠 k개 위치를 만든다 (Kirsch-Mitzenmacher)
+        digest = hashlib.blake2b(normalize_path(file_path).encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self._num_hashes):
+            yield (h1 + i * h2) % self._num_bits
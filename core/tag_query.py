@@ -0,0 +1,257 @@
+"""
+태그 불리언 검색식
+
+    project AND (draft OR review) NOT archived
+    project, draft | review, *archived
+
+문법 (우선순위: NOT > AND > OR)
+    - AND: `AND` 또는 `,`. 피연산자 사이에 연산자가 없으면 AND로 봅니다 (`(a | b) NOT c`).
+    - OR: `OR` 또는 `|`
+    - NOT: `NOT` 또는 `*` (앞에 붙임)
+    - 괄호로 묶을 수 있고, 연산자 문자가 들어간 태그는 큰따옴표로 감쌉니다 ("R&D, 2024").
+    - 키워드는 대문자일 때만 연산자이며, 연산자 없이 이어진 단어는 공백 하나로 이어 붙인 태그 하나입니다.
+
+평가는 TagQueryPlanner가 TagPostingSource를 통해 수행합니다. AND는 단순 태그 조건을 모아
+posting 크기가 작은 순서로 한 번에 조회하고(files_with_all), 복합 조건은 그 결과와 교집합합니다.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List, Optional, Set, Tuple, Union
+
+
+class TagQuerySyntaxError(ValueError):
+    """검색식 문법 오류"""
+
+
+@dataclass(frozen=True)
+class TagTerm:
+    name: str
+
+
+@dataclass(frozen=True)
+class AndNode:
+    children: Tuple["TagQueryNode", ...]
+
+
+@dataclass(frozen=True)
+class OrNode:
+    children: Tuple["TagQueryNode", ...]
+
+
+@dataclass(frozen=True)
+class NotNode:
+    child: "TagQueryNode"
+
+
+TagQueryNode = Union[TagTerm, AndNode, OrNode, NotNode]
+
+_KEYWORDS = {"AND": "AND", "OR": "OR", "NOT": "NOT"}
+_SYMBOLS = {",": "AND", "|": "OR", "*": "NOT", "(": "LPAREN", ")": "RPAREN"}
+
+
+def _tokenize(text: str) -> List[Tuple[str, Optional[str]]]:
+    tokens: List[Tuple[str, Optional[str]]] = []
+    words: List[str] = []
+
+    def flush_words():
+        if words:
+            tokens.append(("TAG", " ".join(words)))
+            words.clear()
+
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if char.isspace():
+            i += 1
+        elif char in _SYMBOLS:
+            flush_words()
+            tokens.append((_SYMBOLS[char], None))
+            i += 1
+        elif char == '"':
+            flush_words()
+            end = text.find('"', i + 1)
+            if end < 0:
+                raise TagQuerySyntaxError("닫는 따옴표가 없습니다")
+            name = text[i + 1:end].strip()
+            if not name:
+                raise TagQuerySyntaxError("빈 태그가 있습니다")
+            tokens.append(("TAG", name))
+            i = end + 1
+        else:
+            start = i
+            while i < len(text) and not text[i].isspace() and text[i] not in _SYMBOLS and text[i] != '"':
+                i += 1
+            word = text[start:i]
+            if word in _KEYWORDS:
+                flush_words()
+                tokens.append((_KEYWORDS[word], None))
+            else:
+                words.append(word)
+    flush_words()
+    return tokens
+
+
+class _Parser:
+    def __init__(self, tokens: List[Tuple[str, Optional[str]]]):
+        self._tokens = tokens
+        self._pos = 0
+
+    def _peek(self) -> Optional[str]:
+        return self._tokens[self._pos][0] if self._pos < len(self._tokens) else None
+
+    def _take(self) -> Tuple[str, Optional[str]]:
+        token = self._tokens[self._pos]
+        self._pos += 1
+        return token
+
+    def parse(self) -> TagQueryNode:
+        if not self._tokens:
+            raise TagQuerySyntaxError("검색식이 비어 있습니다")
+        node = self._parse_or()
+        if self._peek() is not None:
+            raise TagQuerySyntaxError(f"예상하지 못한 '{self._describe(self._take())}'")
+        return node
+
+    def _parse_or(self) -> TagQueryNode:
+        children = [self._parse_and()]
+        while self._peek() == "OR":
+            self._take()
+            children.append(self._parse_and())
+        return _combine(OrNode, children)
+
+    def _parse_and(self) -> TagQueryNode:
+        children = [self._parse_unary()]
+        while True:
+            kind = self._peek()
+            if kind == "AND":
+                self._take()
+            elif kind not in ("TAG", "NOT", "LPAREN"):
+                break
+            # 연산자 없이 이어진 피연산자는 AND
+            children.append(self._parse_unary())
+        return _combine(AndNode, children)
+
+    def _parse_unary(self) -> TagQueryNode:
+        kind = self._peek()
+        if kind is None:
+            raise TagQuerySyntaxError("검색식이 연산자로 끝났습니다")
+        if kind == "NOT":
+            self._take()
+            child = self._parse_unary()
+            return child.child if isinstance(child, NotNode) else NotNode(child)
+        if kind == "LPAREN":
+            self._take()
+            node = self._parse_or()
+            if self._peek() != "RPAREN":
+                raise TagQuerySyntaxError("닫는 괄호가 없습니다")
+            self._take()
+            return node
+        if kind == "TAG":
+            return TagTerm(self._take()[1])
+        raise TagQuerySyntaxError(f"예상하지 못한 '{self._describe(self._take())}'")
+
+    @staticmethod
+    def _describe(token: Tuple[str, Optional[str]]) -> str:
+        kind, value = token
+        return value if kind == "TAG" else {"LPAREN": "(", "RPAREN": ")"}.get(kind, kind)
+
+
+def _combine(node_type, children: List[TagQueryNode]) -> TagQueryNode:
+    if len(children) == 1:
+        return children[0]
+    flattened: List[TagQueryNode] = []
+    for child in children:
+        if isinstance(child, node_type):
+            flattened.extend(child.children)
+        else:
+            flattened.append(child)
+    return node_type(tuple(flattened))
+
+
+def parse_tag_query(text: str) -> TagQueryNode:
+    """검색식을 구문 트리로 변환합니다.
+
+    Raises:
+        TagQuerySyntaxError: 문법 오류
+    """
+    return _Parser(_tokenize(text)).parse()
+
+
+class TagPostingSource(ABC):
+    """TagQueryPlanner가 태그별 파일 집합을 얻는 곳 (역색인 또는 저장소)"""
+
+    @abstractmethod
+    def posting_size(self, tag: str) -> int:
+        """tag를 가진 파일 수 (교집합 순서를 정하는 데 사용)"""
+
+    @abstractmethod
+    def files_with_all(self, all_of: List[str], none_of: List[str]) -> Set[str]:
+        """all_of의 태그를 모두 갖고 none_of의 태그는 하나도 없는 파일 집합.
+        all_of는 posting 크기 오름차순으로 전달됩니다. 비어 있으면 태그가 있는 모든 파일이 대상입니다."""
+
+    @abstractmethod
+    def files_with_any(self, tags: List[str]) -> Set[str]:
+        """tags 중 하나라도 가진 파일 집합"""
+
+
+class TagQueryPlanner:
+    """구문 트리를 TagPostingSource 조회로 바꿔 평가합니다.
+
+    - AND: 단순 태그(와 NOT 단순 태그)는 posting 크기 순으로 정렬해 files_with_all 한 번으로 조회하고,
+      복합 조건은 그 결과가 비어 있지 않을 때만 평가하여 교집합/차집합합니다.
+    - OR: 단순 태그는 files_with_any 한 번으로 조회하고 복합 조건의 결과와 합집합합니다.
+    - 최상위 NOT은 태그가 있는 모든 파일에서 뺍니다.
+    """
+
+    def __init__(self, source: TagPostingSource):
+        self._source = source
+
+    def evaluate(self, node: TagQueryNode) -> Set[str]:
+        if isinstance(node, TagTerm):
+            return self._source.files_with_all([node.name], [])
+        if isinstance(node, OrNode):
+            return self._evaluate_or(node)
+        if isinstance(node, AndNode):
+            return self._evaluate_and(node.children)
+        if isinstance(node, NotNode):
+            return self._evaluate_and((node,))
+        raise TypeError(f"알 수 없는 노드: {node!r}")
+
+    def _evaluate_or(self, node: OrNode) -> Set[str]:
+        plain = [child.name for child in node.children if isinstance(child, TagTerm)]
+        result = self._source.files_with_any(plain) if plain else set()
+        for child in node.children:
+            if not isinstance(child, TagTerm):
+                result |= self.evaluate(child)
+        return result
+
+    def _evaluate_and(self, children) -> Set[str]:
+        all_of: List[str] = []
+        none_of: List[str] = []
+        complex_positive: List[TagQueryNode] = []
+        complex_negative: List[TagQueryNode] = []
+        for child in children:
+            if isinstance(child, TagTerm):
+                all_of.append(child.name)
+            elif isinstance(child, NotNode) and isinstance(child.child, TagTerm):
+                none_of.append(child.child.name)
+            elif isinstance(child, NotNode):
+                complex_negative.append(child.child)
+            else:
+                complex_positive.append(child)
+
+        all_of = sorted(dict.fromkeys(all_of), key=self._source.posting_size)
+        if all_of or none_of or not complex_positive:
+            result = self._source.files_with_all(all_of, list(dict.fromkeys(none_of)))
+        else:
+            result = self.evaluate(complex_positive.pop(0))
+        for child in complex_positive:
+            if not result:
+                return result
+            result &= self.evaluate(child)
+        for child in complex_negative:
+            if not result:
+                return result
+            result -= self.evaluate(child)
+        return result
@@ -0,0 +1,121 @@
+"""
+부분 문자열 검색용 트라이그램(3-gram) 색인
+
+키마다 검색 대상 문자열(소문자로 정규화된 파일명, 태그 등)을 등록해 두면,
+질의 문자열의 트라이그램 posting 집합을 작은 것부터 교집합하여 후보 키만 남긴 뒤
+실제 포함 여부를 확인합니다. 3글자 미만 질의는 트라이그램으로 좁힐 수 없으므로 전체를 확인합니다.
+"""
+
+from typing import Dict, Hashable, Iterable, Optional, Set
+
+TRIGRAM_SIZE = 3
+
+
+def trigrams(text: str) -> Set[str]:
+    """문자열의 모든 트라이그램 집합을 반환합니다. 3글자 미만이면 빈 집합입니다."""
+    return {text[i:i + TRIGRAM_SIZE] for i in range(len(text) - TRIGRAM_SIZE + 1)}
+
+
+class TrigramIndex:
+    """키 → 문자열을 등록하고 부분 문자열 질의로 키를 찾는 트라이그램 색인
+
+    등록된 문자열은 그대로 비교하므로, 대소문자를 무시하려면 호출 측에서 소문자로 넣고
+    소문자 질의를 사용해야 합니다.
+    """
+
+    def __init__(self):
+        self._texts: Dict[Hashable, str] = {}
+        self._postings: Dict[str, Set[Hashable]] = {}
+        self._keys_by_text: Dict[str, Set[Hashable]] = {}
+
+    def add(self, key: Hashable, text: str):
+        """키의 문자열을 등록합니다. 이미 등록된 키면 문자열을 교체합니다."""
+        old_text = self._texts.get(key)
+        if old_text == text:
+            return
+        if old_text is not None:
+            self.remove(key)
+        self._texts[key] = text
+        self._keys_by_text.setdefault(text, set()).add(key)
+        for gram in trigrams(text):
+            self._postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key: Hashable):
+        text = self._texts.pop(key, None)
+        if text is None:
+            return
+        keys = self._keys_by_text.get(text)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_text[text]
+        for gram in trigrams(text):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[gram]
+
+    def clear(self):
+        self._texts = {}
+        self._postings = {}
+        self._keys_by_text = {}
+
+    def candidates(self, query: str) -> Optional[Set[Hashable]]:
+        """질의의 트라이그램을 모두 가진 후보 키 집합을 반환합니다.
+        질의가 3글자 미만이라 좁힐 수 없으면 None을 반환합니다."""
+        grams = trigrams(query)
+        if not grams:
+            return None
+        postings = []
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result &= posting
+            if not result:
+                break
+        return result
+
+    def search(self, query: str) -> Set[Hashable]:
+        """문자열에 query가 포함된 키 집합을 반환합니다."""
+        if not query:
+            return set(self._texts)
+        keys = self.candidates(query)
+        if keys is None:
+            keys = self._texts.keys()
+        return {key for key in keys if query in self._texts[key]}
+
+    def find_exact(self, text: str) -> Set[Hashable]:
+        """문자열이 text와 정확히 같은 키 집합을 반환합니다."""
+        return set(self._keys_by_text.get(text, ()))
+
+    def search_contained_in(self, query: str) -> Set[Hashable]:
+        """문자열이 query의 부분 문자열인 키 집합을 반환합니다.
+        query의 부분 문자열을 열거하여 조회하므로 질의 길이의 제곱에 비례합니다."""
+        result: Set[Hashable] = set()
+        for substring in self._substrings(query):
+            keys = self._keys_by_text.get(substring)
+            if keys:
+                result |= keys
+        return result
+
+    @staticmethod
+    def _substrings(text: str) -> Iterable[str]:
+        seen = set()
+        for start in range(len(text)):
+            for end in range(start + 1, len(text) + 1):
+                substring = text[start:end]
+                if substring not in seen:
+                    seen.add(substring)
+                    yield substring
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._texts
+
+    def __len__(self) -> int:
+        return len(self._texts)
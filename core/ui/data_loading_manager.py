@@ -24,11 +24,25 @@ class DataLoadingManager:
         
     def load_initial_data(self):
         """애플리케이션 시작 시 필요한 초기 데이터를 로드합니다."""
+        self._build_tag_index()
         self._load_workspace_data()
         self._initialize_managers()
         self._load_custom_tags()
         self._set_initial_status()
         
+    def _build_tag_index(self):
+        """태그 역색인을 구축합니다. 파일 목록이 그려지기 전에 완료되어야
+        태그 컬럼 조회가 데이터베이스 왕복 없이 처리됩니다.
+        역색인을 끈 경우에는 태그가 있는 경로의 필터만 구축하여 태그 없는 파일의 조회를 줄입니다."""
+        if hasattr(self.main_window, 'tag_service'):
+            try:
+                if config_manager.is_tag_index_enabled():
+                    self.main_window.tag_service.build_tag_index()
+                else:
+                    self.main_window.tag_service.build_tagged_path_filter()
+            except Exception as e:
+                print(f"Tag index build warning: {e}")
+
     def _load_workspace_data(self):
         """작업공간 데이터를 로드합니다."""
         # 초기 작업공간 경로 설정
@@ -49,6 +49,13 @@ class SignalConnectionManager:
         self.main_window.file_list.file_selection_changed.connect(
             self.main_window.on_file_selection_changed
         )
+
+        # 미리보기 예열: 목록, 선택, 스크롤 위치가 바뀌면 대기열을 다시 만든다
+        self.main_window.file_list.file_selection_changed.connect(self.main_window.schedule_preview_prewarm)
+        self.main_window.file_list.list_view.verticalScrollBar().valueChanged.connect(
+            self.main_window.schedule_preview_prewarm
+        )
+        self.main_window.file_list_viewmodel.files_updated.connect(self.main_window.schedule_preview_prewarm)
         
         
         
@@ -56,10 +63,9 @@ class SignalConnectionManager:
         
     def _connect_search_signals(self):
         """검색 위젯의 시그널을 연결합니다."""
-        # SearchViewModel의 검색 결과 시그널을 FileListViewModel에 연결
-        self.main_window.search_viewmodel.search_results_ready.connect(
-            self.main_window.file_list_viewmodel.set_search_results
-        )
+        # SearchViewModel의 검색 결과 시그널(시작/청크/완료)은 FileListViewModel이 생성 시 직접 구독한다.
+        # 여기서 search_results_ready를 한 번 더 연결하면 스트리밍으로 채운 목록이 다시 리셋된다.
+        pass
         
     def disconnect_all_signals(self):
         """모든 시그널 연결을 해제합니다. (테스트나 정리 시 사용)"""
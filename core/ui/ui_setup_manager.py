@@ -75,7 +75,9 @@ class UISetupManager:
         # 위젯 인스턴스 생성
         directory_tree_widget = DirectoryTreeWidget(initial_workspace)
         file_list_widget = FileListWidget(self.main_window.file_list_viewmodel)
-        file_detail_widget = FileDetailWidget(self.main_window.file_detail_viewmodel)
+        file_detail_widget = FileDetailWidget(
+            self.main_window.file_detail_viewmodel, preview_loader=self.main_window.preview_loader
+        )
         tag_control_widget = TagControlWidget(
             self.main_window.tag_control_viewmodel,
             self.main_window.custom_tag_manager
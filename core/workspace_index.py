@@ -0,0 +1,317 @@
+"""
+작업공간 파일 메타데이터 색인
+
+작업공간 아래 모든 파일의 경로, 파일명, 소문자 파일명, 확장자, 크기, 수정 시각을 메모리에 유지하고
+로컬 SQLite 파일에 저장합니다. 파일명/확장자 검색은 매번 os.walk를 하는 대신 이 색인에서 처리합니다.
+
+갱신은 디렉토리 mtime 비교로 증분 수행합니다. 디렉토리의 mtime은 직속 항목이 추가/삭제/이름 변경될 때
+바뀌므로, mtime이 그대로인 디렉토리는 목록을 다시 읽지 않고 저장된 하위 디렉토리만 확인합니다.
+(파일 내용만 바뀐 경우의 크기/mtime은 해당 디렉토리가 다시 스캔될 때 갱신됩니다.)
+
+소문자 파일명은 트라이그램 색인에도 등록되어, 부분 파일명 검색은 전체 파일 대신 후보 파일만 확인합니다.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+
+from core.path_utils import normalize_path
+from core.trigram_index import TrigramIndex
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FileEntry:
+    path: str
+    basename: str
+    name_lower: str
+    ext: str  # 소문자, 점 포함 (예: ".jpg"), 확장자가 없으면 ""
+    size: int
+    mtime: float
+
+
+@dataclass
+class DirectoryEntry:
+    mtime: float
+    subdirs: List[str] = field(default_factory=list)
+    files: List[str] = field(default_factory=list)
+
+
+def make_file_entry(path: str, size: int, mtime: float) -> FileEntry:
+    basename = os.path.basename(path)
+    return FileEntry(
+        path=path,
+        basename=basename,
+        name_lower=basename.lower(),
+        ext=os.path.splitext(basename)[1].lower(),
+        size=size,
+        mtime=mtime,
+    )
+
+
+class WorkspaceIndexStore:
+    """WorkspaceIndex의 디스크 저장소 (SQLite)"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+        CREATE TABLE IF NOT EXISTS directories (
+            path TEXT PRIMARY KEY,
+            parent TEXT,
+            mtime REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS files (
+            path TEXT PRIMARY KEY,
+            dir TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            mtime REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS files_dir ON files (dir);
+    """
+
+    def __init__(self, db_path: str):
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        # 검색이 작업 스레드에서 실행될 수 있으므로 연결은 WorkspaceIndex의 락으로 보호합니다
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self.SCHEMA)
+
+    def get_root(self) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'root'").fetchone()
+        return row[0] if row else None
+
+    def load(self):
+        """저장된 (directories, files)를 읽어 반환합니다."""
+        rows = self._conn.execute("SELECT path, parent, mtime FROM directories").fetchall()
+        directories: Dict[str, DirectoryEntry] = {path: DirectoryEntry(mtime=mtime) for path, _, mtime in rows}
+        for path, parent, _ in rows:
+            if parent in directories:
+                directories[parent].subdirs.append(path)
+
+        files: Dict[str, FileEntry] = {}
+        for path, directory, size, mtime in self._conn.execute("SELECT path, dir, size, mtime FROM files"):
+            files[path] = make_file_entry(path, size, mtime)
+            if directory in directories:
+                directories[directory].files.append(path)
+        return directories, files
+
+    def save_changes(self, root: str, directories: Dict[str, DirectoryEntry], changed_dirs: List[str],
+                     removed_dirs: List[str], files: Dict[str, FileEntry]):
+        """변경된 디렉토리의 행만 다시 씁니다."""
+        with self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('root', ?)", (root,))
+            for path in removed_dirs:
+                self._conn.execute("DELETE FROM directories WHERE path = ?", (path,))
+                self._conn.execute("DELETE FROM files WHERE dir = ?", (path,))
+            for path in changed_dirs:
+                entry = directories[path]
+                parent = os.path.dirname(path) if path != root else None
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO directories (path, parent, mtime) VALUES (?, ?, ?)",
+                    (path, parent, entry.mtime),
+                )
+                self._conn.execute("DELETE FROM files WHERE dir = ?", (path,))
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO files (path, dir, size, mtime) VALUES (?, ?, ?, ?)",
+                    ((f, path, files[f].size, files[f].mtime) for f in entry.files),
+                )
+
+    def clear(self):
+        with self._conn:
+            self._conn.execute("DELETE FROM meta")
+            self._conn.execute("DELETE FROM directories")
+            self._conn.execute("DELETE FROM files")
+
+    def close(self):
+        self._conn.close()
+
+
+class WorkspaceIndex:
+    """작업공간 파일 메타데이터 색인
+
+    Args:
+        root_path: 작업공간 루트 디렉토리
+        store_dir: 색인 파일을 저장할 디렉토리. 작업공간 경로별로 별도 파일이 만들어집니다.
+        refresh_interval: ensure_fresh() 호출 시 증분 갱신을 다시 수행하기까지의 최소 간격(초)
+    """
+
+    def __init__(self, root_path: str, store_dir: str, refresh_interval: float = 10.0):
+        self.root_path = normalize_path(os.path.abspath(root_path))
+        self.refresh_interval = refresh_interval
+        self._store = WorkspaceIndexStore(os.path.join(store_dir, self.store_file_name(self.root_path)))
+        self._directories: Dict[str, DirectoryEntry] = {}
+        self._files: Dict[str, FileEntry] = {}
+        self._name_trigrams = TrigramIndex()
+        self._loaded = False
+        self._last_refresh = 0.0
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def store_file_name(root_path: str) -> str:
+        digest = hashlib.sha1(root_path.encode("utf-8")).hexdigest()[:16]
+        return f"workspace_index_{digest}.sqlite"
+
+    def ensure_fresh(self):
+        """처음 호출되면 저장소에서 색인을 읽고(없으면 전체 구축), 이후에는 refresh_interval마다 증분 갱신합니다."""
+        with self._lock:
+            if not self._loaded:
+                self._load_or_build()
+            elif time.monotonic() - self._last_refresh >= self.refresh_interval:
+                self.refresh()
+
+    def _load_or_build(self):
+        if self._store.get_root() == self.root_path:
+            self._directories, files = self._store.load()
+            self._files = {}
+            self._name_trigrams.clear()
+            for entry in files.values():
+                self._put_file(entry)
+            self._loaded = True
+            logger.info(f"[WORKSPACE_INDEX] 저장된 색인 로드: {len(self._files)}개 파일")
+            self.refresh()
+        else:
+            self.build()
+
+    def build(self):
+        """저장된 내용을 버리고 전체 색인을 다시 구축합니다."""
+        with self._lock:
+            started = time.monotonic()
+            self._store.clear()
+            self._directories = {}
+            self._files = {}
+            self._name_trigrams.clear()
+            self._loaded = True
+            self.refresh()
+            logger.info(
+                f"[WORKSPACE_INDEX] 색인 구축 완료: {len(self._files)}개 파일, "
+                f"{time.monotonic() - started:.2f}초"
+            )
+
+    def refresh(self):
+        """디렉토리 mtime을 비교하여 바뀐 디렉토리만 다시 읽습니다."""
+        with self._lock:
+            changed_dirs: List[str] = []
+            removed_dirs: List[str] = []
+            stack = [self.root_path]
+            while stack:
+                dir_path = stack.pop()
+                try:
+                    mtime = os.stat(dir_path).st_mtime
+                except OSError:
+                    removed_dirs.extend(self._remove_directory(dir_path))
+                    continue
+
+                known = self._directories.get(dir_path)
+                if known is not None and known.mtime == mtime:
+                    stack.extend(known.subdirs)
+                    continue
+
+                entry = self._scan_directory(dir_path, mtime, known, removed_dirs)
+                self._directories[dir_path] = entry
+                changed_dirs.append(dir_path)
+                stack.extend(entry.subdirs)
+
+            if changed_dirs or removed_dirs:
+                self._store.save_changes(self.root_path, self._directories, changed_dirs, removed_dirs, self._files)
+            self._last_refresh = time.monotonic()
+
+    def _scan_directory(self, dir_path: str, mtime: float, known: Optional[DirectoryEntry],
+                        removed_dirs: List[str]) -> DirectoryEntry:
+        entry = DirectoryEntry(mtime=mtime)
+        try:
+            with os.scandir(dir_path) as it:
+                for item in it:
+                    path = normalize_path(item.path)
+                    try:
+                        if item.is_dir(follow_symlinks=False):
+                            entry.subdirs.append(path)
+                        elif item.is_file():
+                            stat = item.stat()
+                            self._put_file(make_file_entry(path, stat.st_size, stat.st_mtime))
+                            entry.files.append(path)
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.warning(f"[WORKSPACE_INDEX] 디렉토리를 읽을 수 없습니다: {dir_path}, {e}")
+
+        if known is not None:
+            current_files = set(entry.files)
+            for path in known.files:
+                if path not in current_files:
+                    self._drop_file(path)
+            current_subdirs = set(entry.subdirs)
+            for subdir in known.subdirs:
+                if subdir not in current_subdirs:
+                    removed_dirs.extend(self._remove_directory(subdir))
+        return entry
+
+    def _remove_directory(self, dir_path: str) -> List[str]:
+        """디렉토리와 그 하위 항목을 색인에서 제거하고, 제거된 디렉토리 경로 목록을 반환합니다."""
+        removed = []
+        stack = [dir_path]
+        while stack:
+            path = stack.pop()
+            entry = self._directories.pop(path, None)
+            if entry is None:
+                continue
+            removed.append(path)
+            for file_path in entry.files:
+                self._drop_file(file_path)
+            stack.extend(entry.subdirs)
+        return removed
+
+    def _put_file(self, entry: FileEntry):
+        self._files[entry.path] = entry
+        self._name_trigrams.add(entry.path, entry.name_lower)
+
+    def _drop_file(self, path: str):
+        if self._files.pop(path, None) is not None:
+            self._name_trigrams.remove(path)
+
+    def iter_files(self) -> Iterator[FileEntry]:
+        """색인된 파일 항목을 순회합니다. 순회 중 갱신에 안전하도록 스냅샷을 사용합니다."""
+        with self._lock:
+            entries = list(self._files.values())
+        return iter(entries)
+
+    def iter_entries(self, name: str = "", extensions: Optional[List[str]] = None) -> Iterator[FileEntry]:
+        """파일명(부분 문자열, 대소문자 무시)과 확장자 조건에 맞는 파일 항목을 순회합니다.
+        파일명 조건이 있으면 트라이그램 색인으로 후보를 먼저 좁힙니다.
+
+        Args:
+            name: 파일명에 포함되어야 하는 문자열
+            extensions: 확장자 목록 (예: [".jpg", "png"]). 하나라도 파일 확장자에 포함되면 매치
+        """
+        name_lower = name.lower()
+        extensions_lower = [ext.lower() for ext in extensions] if extensions else []
+        with self._lock:
+            if name_lower:
+                candidates = [self._files[path] for path in self._name_trigrams.search(name_lower)]
+            else:
+                candidates = list(self._files.values())
+        for entry in candidates:
+            if extensions_lower and not any(ext in entry.ext for ext in extensions_lower):
+                continue
+            yield entry
+
+    def find_entries(self, name: str = "", extensions: Optional[List[str]] = None) -> List[FileEntry]:
+        """iter_entries()의 결과를 리스트로 반환합니다."""
+        return list(self.iter_entries(name, extensions))
+
+    def find_files(self, name: str = "", extensions: Optional[List[str]] = None) -> List[str]:
+        """find_entries()와 같은 조건으로 파일 경로만 반환합니다."""
+        return [entry.path for entry in self.find_entries(name, extensions)]
+
+    def get_entry(self, file_path: str) -> Optional[FileEntry]:
+        return self._files.get(normalize_path(file_path))
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def close(self):
+        self._store.close()
@@ -4,17 +4,21 @@ import os # os 모듈 추가
 from PyQt5.QtWidgets import QApplication
 from pymongo import MongoClient
 from core.config_manager import config_manager
+from core.repositories.factory import requires_mongodb
 from main_window import MainWindow
 
 logging.basicConfig(level=logging.WARNING, format='[%(levelname)s:%(name)s:%(lineno)d] %(message)s')
 
 if __name__ == '__main__':
     try:
-        # MongoDB 클라이언트 생성
-        client = MongoClient(config_manager.get_mongodb_uri(), serverSelectionTimeoutMS=5000)
-        # 연결 테스트
-        client.admin.command('ping')
-        logging.info("MongoDB에 성공적으로 연결되었습니다.")
+        client = None
+        # MongoDB 저장소를 쓸 때만 서버 연결을 확인 (sqlite 저장소는 서버 없이 실행)
+        if requires_mongodb(config_manager):
+            # MongoDB 클라이언트 생성
+            client = MongoClient(config_manager.get_mongodb_uri(), serverSelectionTimeoutMS=5000)
+            # 연결 테스트
+            client.admin.command('ping')
+            logging.info("MongoDB에 성공적으로 연결되었습니다.")
 
         # QApplication 초기화 - 매개변수 안전하게 처리
         if hasattr(sys, '_MEIPASS'):
@@ -34,7 +38,7 @@ if __name__ == '__main__':
         else:
             logging.warning(f"QSS 파일 '{qss_file_path}'을(를) 찾을 수 없습니다. 스타일이 적용되지 않습니다.")
 
-        # MainWindow에 MongoClient 인스턴스 전달
+        # MainWindow에 MongoClient 인스턴스 전달 (sqlite 저장소면 None)
         window = MainWindow(client)
         sys.exit(app.exec_())
 
@@ -10,6 +10,7 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
     QSpacerItem,
     QSizePolicy,
+    QApplication,
 )
 from PyQt5.uic import loadUi
 from PyQt5.QtCore import QDir, QModelIndex, QEvent, QItemSelectionModel
@@ -23,13 +24,17 @@ from core.custom_tag_manager import CustomTagManager
 from widgets.custom_tag_dialog import CustomTagDialog
 from widgets.batch_remove_tags_dialog import BatchRemoveTagsDialog
 from core.search_manager import SearchManager
+from core.search_executor import SearchExecutor
+from core.preview.preview_cache import PreviewCache
+from core.preview.preview_loader import PreviewLoader
+from core.preview.preview_prewarmer import PrewarmBudget, PreviewPrewarmer
 from core.ui.ui_setup_manager import UISetupManager
 from core.ui.signal_connection_manager import SignalConnectionManager
 from core.ui.data_loading_manager import DataLoadingManager
 
 # 새로 추가된 모듈 임포트
 from core.events import EventBus
-from core.repositories.tag_repository import TagRepository
+from core.repositories.factory import create_tag_repository
 from core.services.tag_service import TagService
 from core.adapters.tag_manager_adapter import TagManagerAdapter
 from viewmodels.tag_control_viewmodel import TagControlViewModel
@@ -41,7 +46,10 @@ logger = logging.getLogger(__name__)
 
 
 class MainWindow(QMainWindow):
-    def __init__(self, mongo_client):
+    # 종료 시 작업 스레드의 디코딩/렌더링이 끝나기를 기다리는 최대 시간
+    SHUTDOWN_WAIT_MSECS = 3000
+
+    def __init__(self, mongo_client=None):
         super().__init__()
 
         # 고정 크기 정의
@@ -50,12 +58,21 @@ class MainWindow(QMainWindow):
         self.is_fixed_size_mode = False  # 최대화 허용으로 변경
 
         # --- 코어 로직 초기화 ---
+        # sqlite 저장소를 쓰면 None
         self.mongo_client = mongo_client
 
         # 새로운 아키텍처 컴포넌트 초기화
         self.event_bus = EventBus()
-        self.tag_repository = TagRepository(mongo_client)
-        self.tag_service = TagService(self.tag_repository, self.event_bus)
+        # 저장소 종류는 설정(storage.backend)으로 정함
+        self.tag_repository = create_tag_repository(config_manager, mongo_client)
+        self.tag_service = TagService(
+            self.tag_repository,
+            self.event_bus,
+            bulk_chunk_size=config_manager.get_bulk_write_chunk_size(),
+            file_tag_cache_entries=config_manager.get_file_tag_cache_max_entries(),
+            file_tag_cache_bytes=config_manager.get_file_tag_cache_max_bytes(),
+            untagged_filter_false_positive_rate=config_manager.get_untagged_filter_false_positive_rate(),
+        )
         self.tag_manager = TagManagerAdapter(self.tag_service)  # TagManagerAdapter 사용
 
         self.custom_tag_manager = CustomTagManager()
@@ -64,7 +81,14 @@ class MainWindow(QMainWindow):
         )  # SearchManager는 TagManagerAdapter를 사용하도록 변경
 
         # ViewModel 초기화
-        self.search_viewmodel = SearchViewModel(self.tag_service, self.search_manager)
+        self.search_executor = SearchExecutor(
+            self.search_manager,
+            chunk_size=config_manager.get_search_chunk_size(),
+            chunk_interval=config_manager.get_search_chunk_interval(),
+        )
+        self.search_viewmodel = SearchViewModel(
+            self.tag_service, self.search_manager, self.search_executor
+        )
         self.tag_control_viewmodel = TagControlViewModel(
             self.tag_service, self.event_bus
         )
@@ -75,6 +99,26 @@ class MainWindow(QMainWindow):
             self.tag_service, self.event_bus, self.search_viewmodel
         )
 
+        # 미리보기 디코딩(작업 스레드) + 디스크/메모리 캐시
+        self.preview_cache = PreviewCache(
+            config_manager.get_preview_cache_dir(),
+            max_bytes=config_manager.get_preview_cache_max_bytes(),
+            memory_entries=config_manager.get_preview_memory_cache_entries(),
+        )
+        self.preview_loader = PreviewLoader(self.preview_cache, parent=self)
+        # 유휴 시간에 목록의 미리보기를 미리 만들어 둠 (입력이 있으면 멈춤)
+        self.preview_prewarmer = None
+        if config_manager.is_preview_prewarm_enabled():
+            self.preview_prewarmer = PreviewPrewarmer(
+                self.preview_loader,
+                PrewarmBudget(
+                    cpu_fraction=config_manager.get_preview_prewarm_cpu_fraction(),
+                    max_bytes_per_second=config_manager.get_preview_prewarm_max_bytes_per_second(),
+                ),
+                parent=self,
+            )
+            QApplication.instance().installEventFilter(self.preview_prewarmer)
+
         # --- 분리된 관리자 클래스 활용 ---
         self.ui_setup = UISetupManager(self)
         self.ui_setup.setup_ui()
@@ -313,6 +357,33 @@ class MainWindow(QMainWindow):
             self.tag_control_viewmodel.update_for_target(None, False)
             self.statusbar.showMessage("파일 선택이 해제되었습니다.")
 
+    def schedule_preview_prewarm(self, *args):
+        """파일 목록/선택/스크롤이 바뀌면 예열 대기열을 현재 화면 기준으로 다시 만듭니다."""
+        if self.preview_prewarmer is None:
+            return
+        file_list = self.ui_setup.get_widget("file_list")
+        first_visible, last_visible = file_list.visible_row_range()
+        center = file_list.current_row()
+        self.preview_prewarmer.set_files(
+            self.file_list_viewmodel.get_current_display_files(),
+            center if center >= 0 else first_visible,
+            first_visible,
+            last_visible,
+        )
+
+    def closeEvent(self, event):
+        # 예열과 화면의 미리보기(이미지/PDF/텍스트)를 모두 취소한 뒤,
+        # 이미 실행 중인 작업이 인터프리터 종료와 겹치지 않도록 제한된 시간 동안 기다린다
+        if self.preview_prewarmer is not None:
+            self.preview_prewarmer.stop()
+        self.ui_setup.get_widget("file_detail").clear_preview()
+        if self.preview_prewarmer is not None and not self.preview_prewarmer.wait_for_done(self.SHUTDOWN_WAIT_MSECS):
+            logger.warning("[MAIN] 종료 시 미리보기 예열 작업이 끝나지 않았습니다")
+        # PDF/텍스트 로더도 미리보기 전용 풀을 쓰므로 함께 기다림 (PDF 문서 닫기 포함)
+        if not self.preview_loader.wait_for_done(self.SHUTDOWN_WAIT_MSECS):
+            logger.warning("[MAIN] 종료 시 미리보기 작업이 끝나지 않았습니다")
+        super().closeEvent(event)
+
     def on_tags_updated(self):
         """태그가 변경될 때 관련 위젯들을 업데이트합니다."""
         try:
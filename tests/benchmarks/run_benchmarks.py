@@ -0,0 +1,257 @@
+"""
+태그/검색/목록 주요 경로 벤치마크
+
+가상 작업공간(workspace_generator)을 만들고 TagService, SearchManager의 각 검색 분기,
+FileListViewModel.set_directory + 태그 필터, FileTableModel.data(한 화면 분량)를 측정하여 JSON으로 저장합니다.
+커밋 간 결과를 비교해 성능 저하를 찾는 용도입니다.
+
+    python -m tests.benchmarks.run_benchmarks --sizes 10k,100k --output bench.json
+    python -m tests.benchmarks.run_benchmarks --sizes 1m --backend sqlite --repeat 3
+
+저장소는 기본적으로 메모리 저장소를 사용해 데이터베이스 비용을 뺀 서비스/ViewModel 비용을 측정하고,
+--backend sqlite로 내장 데이터베이스를 포함한 비용을 측정할 수 있습니다.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+from PyQt5.QtCore import QCoreApplication, Qt
+
+from core.adapters.tag_manager_adapter import TagManagerAdapter
+from core.events import EventBus
+from core.repositories.base import TagUpdate
+from core.repositories.memory_tag_repository import InMemoryTagRepository
+from core.repositories.sqlite_tag_repository import SqliteTagRepository
+from core.search_manager import SearchManager
+from core.services.tag_service import TagService
+from tests.benchmarks.workspace_generator import SyntheticWorkspace, generate_workspace, parse_size
+from viewmodels.file_list_viewmodel import FileListViewModel
+from viewmodels.search_viewmodel import SearchViewModel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = "10k"
+DEFAULT_REPEAT = 5
+SCREEN_ROWS = 40  # 한 화면에 보이는 행 수
+SEED_CHUNK_SIZE = 5000
+
+
+class BenchmarkRecorder:
+    """측정 결과를 모아 JSON으로 저장합니다."""
+
+    def __init__(self, repeat: int):
+        self.repeat = max(1, repeat)
+        self.results: List[dict] = []
+
+    def measure(self, size: int, name: str, func: Callable[[], object],
+                setup: Optional[Callable[[], None]] = None, repeat: Optional[int] = None) -> dict:
+        """func를 repeat번 실행하여 시간(ms)을 기록합니다. setup은 측정에서 제외됩니다."""
+        timings = []
+        result = None
+        for _ in range(repeat or self.repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            result = func()
+            timings.append((time.perf_counter() - start) * 1000.0)
+        record = {
+            "size": size,
+            "name": name,
+            "repeat": len(timings),
+            "min_ms": round(min(timings), 3),
+            "median_ms": round(statistics.median(timings), 3),
+            "mean_ms": round(statistics.fmean(timings), 3),
+        }
+        if isinstance(result, (list, dict, set)):
+            record["result_count"] = len(result)
+        self.results.append(record)
+        logger.info(f"[BENCHMARK] {size} {name}: median {record['median_ms']}ms")
+        return record
+
+    def skip(self, size: int, name: str, reason: str):
+        self.results.append({"size": size, "name": name, "skipped": reason})
+        logger.warning(f"[BENCHMARK] {size} {name} 건너뜀: {reason}")
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _create_repository(backend: str, work_dir: str):
+    if backend == "memory":
+        return InMemoryTagRepository()
+    if backend == "sqlite":
+        return SqliteTagRepository(os.path.join(work_dir, "tags.db"))
+    raise ValueError(f"알 수 없는 저장소: {backend}")
+
+
+def _seed_repository(repository, workspace: SyntheticWorkspace):
+    operations = [TagUpdate(path, tags, [], True) for path, tags in workspace.tags_by_file.items() if tags]
+    for start in range(0, len(operations), SEED_CHUNK_SIZE):
+        repository.bulk_update_tags(operations[start:start + SEED_CHUNK_SIZE], ordered=False)
+
+
+def _load_file_table_model():
+    # widgets 패키지는 멀티미디어 모듈을 함께 불러오므로, 그 환경이 없으면 이 항목만 건너뛴다
+    from widgets.file_list_widget import FileTableModel
+    return FileTableModel
+
+
+def run_suite(size: int, work_dir: str, recorder: BenchmarkRecorder, backend: str = "memory",
+              seed: int = 42) -> None:
+    """size개 파일의 작업공간 하나에 대해 모든 항목을 측정합니다."""
+    workspace_root = os.path.join(work_dir, "workspace")
+    start = time.perf_counter()
+    workspace = generate_workspace(workspace_root, size, seed=seed)
+    logger.info(f"[BENCHMARK] 작업공간 생성 {size}개 ({time.perf_counter() - start:.1f}s), "
+                f"태그 있는 파일 {workspace.tagged_count}개")
+
+    repository = _create_repository(backend, work_dir)
+    _seed_repository(repository, workspace)
+    event_bus = EventBus()
+    tag_service = TagService(repository, event_bus)
+    top_tag = workspace.vocabulary[0]
+    rare_tag = workspace.vocabulary[len(workspace.vocabulary) // 2]
+
+    # --- TagService ---
+    recorder.measure(size, "tag_service.build_tag_index", tag_service.build_tag_index, repeat=1)
+    batch = workspace.file_paths[:min(len(workspace.file_paths), 10000)]
+    counter = iter(range(10 ** 9))
+    recorder.measure(size, f"tag_service.add_tags_to_files[{len(batch)}]",
+                     lambda: tag_service.add_tags_to_files(batch, [f"bench{next(counter)}"]))
+    recorder.measure(size, "tag_service.get_all_tags", tag_service.get_all_tags,
+                     setup=tag_service.clear_cache)
+    recorder.measure(size, "tag_service.get_tag_counts", tag_service.get_tag_counts,
+                     setup=tag_service.clear_cache)
+
+    # --- SearchManager (검색 분기별) ---
+    tag_manager = TagManagerAdapter(tag_service)
+    tag_manager.workspace_path = workspace.root
+    search_manager = SearchManager(tag_manager, index_store_dir=os.path.join(work_dir, "cache"),
+                                   index_refresh_interval=3600)
+    recorder.measure(size, "search.workspace_index_build", search_manager.get_workspace_index, repeat=1)
+    name_query = "file_00001"
+    search_cases: Dict[str, dict] = {
+        "search.filename": {"filename": {"name": name_query, "extensions": []}},
+        "search.extension": {"filename": {"name": "", "extensions": [".md"]}},
+        "search.tags": {"tags": {"query": top_tag}},
+        "search.tags_rare": {"tags": {"query": rare_tag}},
+        "search.tags_boolean": {"tags": {"query": f"{top_tag} AND ({workspace.vocabulary[1]} OR {rare_tag}) "
+                                                  f"NOT {workspace.vocabulary[2]}"}},
+        "search.filename_and_tags": {"filename": {"name": "file_", "extensions": [".jpg"]},
+                                     "tags": {"query": top_tag}},
+        "search.partial_filename": {"partial": {"filename": {"partial": "0001"}}},
+        "search.partial_tags": {"partial": {"tags": {"partial": ["tag0000"]}}},
+        "search.partial_both": {"partial": {"filename": {"partial": "file_0"},
+                                            "tags": {"partial": ["tag0000"]}}},
+    }
+    for name, conditions in search_cases.items():
+        recorder.measure(size, name, lambda conditions=conditions: search_manager.search_files(conditions))
+
+    # --- FileListViewModel / FileTableModel ---
+    search_viewmodel = SearchViewModel(tag_service, search_manager)
+    file_list_viewmodel = FileListViewModel(tag_service, event_bus, search_viewmodel)
+
+    def list_with_filter():
+        file_list_viewmodel.set_directory(workspace.root, recursive=True)
+        file_list_viewmodel.set_tag_filter(top_tag)
+        return file_list_viewmodel.get_current_display_files()
+
+    recorder.measure(size, "file_list.set_directory_with_tag_filter", list_with_filter)
+
+    try:
+        FileTableModel = _load_file_table_model()
+    except ImportError as e:
+        recorder.skip(size, "file_table_model.data_screenful", str(e))
+    else:
+        file_list_viewmodel.set_directory(workspace.root, recursive=True)
+        model = FileTableModel(file_list_viewmodel)
+        first_row = model.rowCount() // 2
+        rows = range(first_row, min(model.rowCount(), first_row + SCREEN_ROWS))
+
+        def paint_screen():
+            return [model.data(model.index(row, column), Qt.DisplayRole) for row in rows for column in range(3)]
+
+        # 행 캐시를 비운 상태(처음 스크롤해 들어온 화면)와 채워진 상태(다시 그리기)를 따로 측정
+        recorder.measure(size, "file_table_model.data_screenful_cold", paint_screen,
+                         setup=file_list_viewmodel.refresh_tags_for_current_files)
+        recorder.measure(size, "file_table_model.data_screenful_warm", paint_screen)
+
+    search_viewmodel.cancel_search()
+    search_manager.get_workspace_index().close()
+    if hasattr(repository, "close"):
+        repository.close()
+
+
+def run_benchmarks(sizes: List[int], output: Optional[str] = None, repeat: int = DEFAULT_REPEAT,
+                   backend: str = "memory", work_dir: Optional[str] = None, keep: bool = False) -> dict:
+    """규모별로 run_suite()를 실행하고 결과를 반환합니다. output이 있으면 JSON으로 저장합니다."""
+    app = QCoreApplication.instance() or QCoreApplication(["benchmark"])
+    recorder = BenchmarkRecorder(repeat)
+    base_dir = work_dir or tempfile.mkdtemp(prefix="filetagger_bench_")
+    try:
+        for size in sizes:
+            size_dir = os.path.join(base_dir, str(size))
+            os.makedirs(size_dir, exist_ok=True)
+            run_suite(size, size_dir, recorder, backend=backend)
+            app.processEvents()
+    finally:
+        if not keep:
+            shutil.rmtree(base_dir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "backend": backend,
+            "repeat": recorder.repeat,
+            "sizes": sizes,
+        },
+        "results": recorder.results,
+    }
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="FileTagger 성능 벤치마크")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="쉼표로 구분한 파일 수 (예: 10k,100k,1m)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="항목별 반복 횟수")
+    parser.add_argument("--backend", choices=["memory", "sqlite"], default="memory", help="태그 저장소")
+    parser.add_argument("--output", default="benchmark_results.json", help="결과 JSON 파일")
+    parser.add_argument("--work-dir", default=None, help="작업공간을 만들 디렉토리 (기본: 임시 디렉토리)")
+    parser.add_argument("--keep", action="store_true", help="측정 후 작업공간을 지우지 않음")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    sizes = [parse_size(size) for size in args.sizes.split(",") if size.strip()]
+    report = run_benchmarks(sizes, args.output, args.repeat, args.backend, args.work_dir, args.keep)
+    for record in report["results"]:
+        if "skipped" in record:
+            print(f"{record['size']:>9} {record['name']:<45} skipped")
+        else:
+            print(f"{record['size']:>9} {record['name']:<45} {record['median_ms']:>10.2f} ms")
+    print(f"결과 저장: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
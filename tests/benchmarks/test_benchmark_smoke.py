@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from tests.benchmarks.run_benchmarks import run_benchmarks
+from tests.benchmarks.workspace_generator import generate_workspace, parse_size
+
+
+pytestmark = pytest.mark.benchmark
+
+
+class TestWorkspaceGenerator:
+
+    def test_parse_size(self):
+        assert parse_size("10k") == 10000
+        assert parse_size("1M") == 1000000
+        assert parse_size("2500") == 2500
+
+    def test_tags_follow_zipf_distribution(self, tmp_path):
+        # When
+        workspace = generate_workspace(str(tmp_path / "ws"), 2000, vocabulary_size=100, files_per_dir=500)
+
+        # Then
+        assert len(workspace.file_paths) == 2000
+        assert len(workspace.directories) == 4
+        counts = {tag: 0 for tag in workspace.vocabulary}
+        for tags in workspace.tags_by_file.values():
+            for tag in tags:
+                counts[tag] += 1
+        # 상위 태그가 하위 태그보다 훨씬 많이 쓰인다
+        assert counts[workspace.vocabulary[0]] > 5 * counts[workspace.vocabulary[50]]
+        # 같은 seed면 같은 배정
+        again = generate_workspace(str(tmp_path / "ws2"), 2000, vocabulary_size=100, files_per_dir=500)
+        assert list(again.tags_by_file.values()) == list(workspace.tags_by_file.values())
+
+
+class TestBenchmarkRunner:
+
+    def test_small_run_writes_all_results(self, qapp, tmp_path):
+        # Given
+        output = tmp_path / "bench.json"
+
+        # When
+        report = run_benchmarks([300], str(output), repeat=1, work_dir=str(tmp_path / "work"))
+
+        # Then
+        saved = json.loads(output.read_text(encoding="utf-8"))
+        assert saved["meta"]["sizes"] == [300]
+        names = {record["name"] for record in saved["results"]}
+        assert {"tag_service.get_all_tags", "search.filename", "search.tags", "search.filename_and_tags",
+                "search.partial_filename", "search.partial_tags",
+                "file_list.set_directory_with_tag_filter"} <= names
+        assert any(name.startswith("tag_service.add_tags_to_files") for name in names)
+        assert any(name.startswith("file_table_model.data_screenful") for name in names)
+        for record in report["results"]:
+            assert "skipped" in record or record["median_ms"] >= 0
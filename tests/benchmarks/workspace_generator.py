@@ -0,0 +1,83 @@
+"""
+벤치마크용 가상 작업공간 생성기
+
+빈 파일을 디렉토리당 files_per_dir개씩 만들고, 파일마다 0~4개의 태그를 붙입니다.
+태그는 순위 k의 태그가 1/k^s 비율로 선택되는 Zipf 분포를 따르므로 소수의 태그가 대부분의 파일에 붙고
+대부분의 태그는 드물게 쓰입니다 (실제 작업공간과 비슷한 posting 크기 분포).
+"""
+
+import os
+import random
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Dict, List
+
+from core.path_utils import normalize_path
+
+EXTENSIONS = [".txt", ".jpg", ".md", ".pdf", ".png"]
+# 파일당 태그 수 0, 1, 2, 3, 4개의 비율 (대부분의 파일은 태그가 없거나 적음)
+TAGS_PER_FILE_WEIGHTS = [0.5, 0.25, 0.15, 0.07, 0.03]
+
+
+@dataclass
+class SyntheticWorkspace:
+    root: str
+    file_paths: List[str]
+    tags_by_file: Dict[str, List[str]]
+    vocabulary: List[str]  # 순위 순 (0번이 가장 많이 쓰이는 태그)
+    directories: List[str] = field(default_factory=list)
+
+    @property
+    def tagged_count(self) -> int:
+        return sum(1 for tags in self.tags_by_file.values() if tags)
+
+
+def parse_size(text: str) -> int:
+    """"10k", "100K", "1m", "2500" 같은 규모 표기를 정수로 바꿉니다."""
+    text = text.strip().lower()
+    multiplier = 1
+    if text.endswith("k"):
+        multiplier, text = 1000, text[:-1]
+    elif text.endswith("m"):
+        multiplier, text = 1000000, text[:-1]
+    return int(float(text) * multiplier)
+
+
+def tag_name(rank: int) -> str:
+    return f"tag{rank:05d}"
+
+
+def generate_workspace(root: str, num_files: int, vocabulary_size: int = 1000, zipf_s: float = 1.1,
+                       files_per_dir: int = 1000, seed: int = 42) -> SyntheticWorkspace:
+    """root 아래에 num_files개의 빈 파일을 만들고 Zipf 분포의 태그를 배정합니다.
+
+    Args:
+        root: 작업공간 디렉토리 (없으면 생성)
+        num_files: 파일 수
+        vocabulary_size: 태그 종류 수
+        zipf_s: Zipf 지수. 클수록 상위 태그에 더 몰립니다.
+        files_per_dir: 디렉토리 하나에 둘 파일 수
+        seed: 같은 값이면 같은 작업공간을 만듭니다.
+    """
+    rng = random.Random(seed)
+    vocabulary = [tag_name(rank) for rank in range(vocabulary_size)]
+    cumulative = list(accumulate(1.0 / (rank + 1) ** zipf_s for rank in range(vocabulary_size)))
+
+    os.makedirs(root, exist_ok=True)
+    file_paths: List[str] = []
+    tags_by_file: Dict[str, List[str]] = {}
+    directories: List[str] = []
+    for index in range(num_files):
+        directory = os.path.join(root, f"d{index // files_per_dir:04d}")
+        if index % files_per_dir == 0:
+            os.makedirs(directory, exist_ok=True)
+            directories.append(normalize_path(directory))
+        path = os.path.join(directory, f"file_{index:07d}{EXTENSIONS[index % len(EXTENSIONS)]}")
+        open(path, "wb").close()
+
+        file_path = normalize_path(path)
+        num_tags = rng.choices(range(len(TAGS_PER_FILE_WEIGHTS)), TAGS_PER_FILE_WEIGHTS)[0]
+        chosen = rng.choices(vocabulary, cum_weights=cumulative, k=num_tags)
+        file_paths.append(file_path)
+        tags_by_file[file_path] = list(dict.fromkeys(chosen))
+    return SyntheticWorkspace(normalize_path(root), file_paths, tags_by_file, vocabulary, directories)
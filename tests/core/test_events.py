@@ -0,0 +1,79 @@
+import pytest
+
+from core.events import EventBus, TagAddedEvent, TagsChangedBatch
+
+
+@pytest.fixture
+def event_bus():
+    return EventBus()
+
+
+def _collect(event_bus):
+    batches = []
+    event_bus.tags_changed.connect(batches.append)
+    return batches
+
+
+class TestEventBusBatching:
+
+    def test_changes_in_one_tick_are_emitted_as_one_batch(self, qtbot, event_bus):
+        # Given
+        batches = _collect(event_bus)
+
+        # When: 같은 이벤트 루프 틱 안에서 여러 번 발행
+        event_bus.publish_tags_changed({"/a.txt": (["x"], [])})
+        event_bus.publish_tags_changed({"/b.txt": (["x"], [])})
+        event_bus.publish_tag_added("/c.txt", "y")
+
+        # Then: 틱이 끝나기 전에는 보내지 않고, 끝나면 한 번만 보낸다
+        assert batches == []
+        qtbot.waitUntil(lambda: len(batches) > 0, timeout=1000)
+        qtbot.wait(10)
+        assert len(batches) == 1
+        assert batches[0].changes == {
+            "/a.txt": (["x"], []),
+            "/b.txt": (["x"], []),
+            "/c.txt": (["y"], []),
+        }
+
+    def test_add_then_remove_keeps_last_change(self, event_bus):
+        # Given
+        batches = _collect(event_bus)
+
+        # When
+        event_bus.publish_tags_changed({"/a.txt": (["x", "y"], [])})
+        event_bus.publish_tags_changed({"/a.txt": ([], ["x"])})
+        event_bus.flush()
+
+        # Then
+        assert batches[0].changes == {"/a.txt": (["y"], ["x"])}
+
+    def test_single_tag_events_are_still_emitted(self, event_bus):
+        # Given
+        added = []
+        event_bus.tag_added.connect(added.append)
+        batches = _collect(event_bus)
+
+        # When
+        event_bus.publish_tag_added("/a.txt", "x")
+
+        # Then: 기존 단건 시그널은 즉시, 배치는 틱이 끝날 때
+        assert len(added) == 1 and isinstance(added[0], TagAddedEvent)
+        assert batches == []
+        event_bus.flush()
+        assert batches[0].changes == {"/a.txt": (["x"], [])}
+
+    def test_flush_without_changes_emits_nothing(self, event_bus):
+        batches = _collect(event_bus)
+
+        event_bus.flush()
+
+        assert batches == []
+
+    def test_batch_membership(self):
+        batch = TagsChangedBatch({"/a.txt": (["x"], [])})
+
+        assert "/a.txt" in batch
+        assert "/b.txt" not in batch
+        assert len(batch) == 1
+        assert batch.file_paths == ["/a.txt"]
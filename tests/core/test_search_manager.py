@@ -0,0 +1,98 @@
+import os
+import pytest
+from unittest.mock import Mock
+
+from core.adapters.tag_manager_adapter import TagManagerAdapter
+from core.search_manager import SearchManager
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    root = tmp_path / "workspace"
+    root.mkdir()
+    (root / "holiday.jpg").touch()
+    (root / "holiday.txt").touch()
+    (root / "sub").mkdir()
+    (root / "sub" / "work_notes.md").touch()
+    return root
+
+
+@pytest.fixture
+def mock_tag_manager(workspace):
+    tag_manager = Mock(spec=TagManagerAdapter)
+    tag_manager.workspace_path = str(workspace)
+    return tag_manager
+
+
+@pytest.fixture
+def search_manager(mock_tag_manager, tmp_path):
+    return SearchManager(mock_tag_manager, index_store_dir=str(tmp_path / "cache"), index_refresh_interval=0)
+
+
+def _names(paths):
+    return sorted(os.path.basename(p) for p in paths)
+
+
+class TestSearchManagerFilename:
+
+    def test_filename_search_uses_workspace_index(self, search_manager):
+        results = search_manager.search_files({'filename': {'name': 'holiday', 'extensions': []}})
+
+        assert _names(results) == ["holiday.jpg", "holiday.txt"]
+
+    def test_extension_search(self, search_manager):
+        results = search_manager.search_files({'filename': {'name': '', 'extensions': ['.md']}})
+
+        assert _names(results) == ["work_notes.md"]
+
+    def test_tag_search_uses_boolean_query(self, search_manager, mock_tag_manager, workspace):
+        mock_tag_manager.find_files_by_tag_query.return_value = [str(workspace / "holiday.jpg")]
+
+        results = search_manager.search_files({'tags': {'query': 'travel AND NOT work'}})
+
+        assert _names(results) == ["holiday.jpg"]
+        mock_tag_manager.find_files_by_tag_query.assert_called_once_with('travel AND NOT work')
+
+    def test_partial_search_with_tags(self, search_manager, mock_tag_manager, workspace):
+        mock_tag_manager.find_tags_by_partial.return_value = ["travel"]
+        mock_tag_manager.get_files_by_tags.return_value = [
+            str(workspace / "holiday.jpg"),
+            str(workspace / "sub" / "work_notes.md"),
+            "/outside/workspace/holiday.png",
+        ]
+
+        results = search_manager.search_files({
+            'partial': {'filename': {'partial': 'holi'}, 'tags': {'partial': ['trav']}}
+        })
+
+        assert _names(results) == ["holiday.jpg"]
+        mock_tag_manager.find_tags_by_partial.assert_called_once_with('trav')
+        mock_tag_manager.get_files_by_tags.assert_called_once_with(["travel"])
+        # 태그 조건이 있으면 파일별 태그 조회를 하지 않는다
+        mock_tag_manager.get_tags_for_file.assert_not_called()
+
+    def test_partial_search_without_matching_tags(self, search_manager, mock_tag_manager):
+        mock_tag_manager.find_tags_by_partial.return_value = []
+
+        results = search_manager.search_files({'partial': {'tags': {'partial': ['nothing']}}})
+
+        assert results == []
+        mock_tag_manager.get_files_by_tags.assert_not_called()
+
+    def test_partial_search_by_filename_and_extension(self, search_manager):
+        results = search_manager.search_files({
+            'partial': {'filename': {'partial': 'HOL'}, 'extensions': {'partial': ['tx']}}
+        })
+
+        assert _names(results) == ["holiday.txt"]
+
+    def test_index_follows_workspace_change(self, search_manager, mock_tag_manager, tmp_path):
+        search_manager.search_files({'filename': {'name': 'holiday', 'extensions': []}})
+        other = tmp_path / "other"
+        other.mkdir()
+        (other / "holiday_other.png").touch()
+
+        mock_tag_manager.workspace_path = str(other)
+        results = search_manager.search_files({'filename': {'name': 'holiday', 'extensions': []}})
+
+        assert _names(results) == ["holiday_other.png"]
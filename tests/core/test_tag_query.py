@@ -0,0 +1,101 @@
+import pytest
+
+from core.tag_query import (
+    AndNode, NotNode, OrNode, TagPostingSource, TagQueryPlanner, TagQuerySyntaxError, TagTerm,
+    parse_tag_query,
+)
+
+
+class RecordingSource(TagPostingSource):
+    """{tag: {paths}}로 답하고 호출을 기록하는 posting 소스"""
+
+    def __init__(self, postings):
+        self.postings = postings
+        self.calls = []
+
+    def posting_size(self, tag):
+        return len(self.postings.get(tag, ()))
+
+    def files_with_all(self, all_of, none_of):
+        self.calls.append(("all", list(all_of), list(none_of)))
+        if all_of:
+            result = set.intersection(*(set(self.postings.get(tag, ())) for tag in all_of))
+        else:
+            result = set().union(*self.postings.values())
+        for tag in none_of:
+            result -= self.postings.get(tag, set())
+        return result
+
+    def files_with_any(self, tags):
+        self.calls.append(("any", list(tags)))
+        return set().union(*(self.postings.get(tag, set()) for tag in tags))
+
+
+POSTINGS = {
+    "project": {"/a", "/b", "/c", "/d"},
+    "draft": {"/a", "/e"},
+    "review": {"/b"},
+    "archived": {"/a", "/c"},
+}
+
+
+class TestParseTagQuery:
+
+    def test_single_tag_and_multi_word_tag(self):
+        assert parse_tag_query("work") == TagTerm("work")
+        assert parse_tag_query("  my   tag ") == TagTerm("my tag")
+
+    def test_keywords_and_precedence(self):
+        # NOT > AND > OR, 연산자 없이 이어진 피연산자는 AND
+        assert parse_tag_query("project AND (draft OR review) NOT archived") == AndNode((
+            TagTerm("project"),
+            OrNode((TagTerm("draft"), TagTerm("review"))),
+            NotNode(TagTerm("archived")),
+        ))
+        assert parse_tag_query("a OR b AND c") == OrNode((TagTerm("a"), AndNode((TagTerm("b"), TagTerm("c")))))
+
+    def test_symbol_operators_match_keywords(self):
+        assert parse_tag_query("중요,문서|긴급") == parse_tag_query("중요 AND 문서 OR 긴급")
+        assert parse_tag_query("a, *b") == AndNode((TagTerm("a"), NotNode(TagTerm("b"))))
+        assert parse_tag_query("NOT NOT a") == TagTerm("a")
+
+    def test_quoted_tags_and_lowercase_keywords_are_names(self):
+        assert parse_tag_query('"R&D, 2024" | "a OR b"') == OrNode((TagTerm("R&D, 2024"), TagTerm("a OR b")))
+        assert parse_tag_query("rock and roll") == TagTerm("rock and roll")
+
+    @pytest.mark.parametrize("text", ["", "   ", "a AND", "(a OR b", "a)", "OR a", '"unterminated', '""'])
+    def test_syntax_errors(self, text):
+        with pytest.raises(TagQuerySyntaxError):
+            parse_tag_query(text)
+
+
+class TestTagQueryPlanner:
+
+    def test_evaluates_boolean_expression(self):
+        planner = TagQueryPlanner(RecordingSource(POSTINGS))
+
+        assert planner.evaluate(parse_tag_query("project AND (draft OR review) NOT archived")) == {"/b"}
+        assert planner.evaluate(parse_tag_query("draft | review")) == {"/a", "/b", "/e"}
+        assert planner.evaluate(parse_tag_query("NOT project")) == {"/e"}
+        assert planner.evaluate(parse_tag_query("project NOT (draft OR review)")) == {"/c", "/d"}
+
+    def test_and_pushes_plain_terms_down_in_posting_size_order(self):
+        # Given
+        source = RecordingSource(POSTINGS)
+
+        # When
+        TagQueryPlanner(source).evaluate(parse_tag_query("project, draft, review, *archived"))
+
+        # Then: 단순 조건은 드문 태그부터 한 번에 조회
+        assert source.calls == [("all", ["review", "draft", "project"], ["archived"])]
+
+    def test_complex_terms_skipped_when_result_empty(self):
+        # Given
+        source = RecordingSource(POSTINGS)
+
+        # When
+        result = TagQueryPlanner(source).evaluate(parse_tag_query("review AND draft AND (project OR archived)"))
+
+        # Then
+        assert result == set()
+        assert source.calls == [("all", ["review", "draft"], [])]
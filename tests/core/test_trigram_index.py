@@ -0,0 +1,67 @@
+from core.trigram_index import TrigramIndex, trigrams
+
+
+def _brute_force(texts, query):
+    return {key for key, text in texts.items() if query in text}
+
+
+class TestTrigramIndex:
+
+    def test_trigrams(self):
+        assert trigrams("abcd") == {"abc", "bcd"}
+        assert trigrams("ab") == set()
+
+    def test_search_matches_brute_force(self):
+        texts = {
+            1: "holiday_photo.jpg",
+            2: "photo_album.png",
+            3: "report.pdf",
+            4: "ph.txt",
+        }
+        index = TrigramIndex()
+        for key, text in texts.items():
+            index.add(key, text)
+
+        for query in ["photo", "pho", "ph", "o", "", "report.pdf", "xyz", ".p", "day_p"]:
+            assert index.search(query) == _brute_force(texts, query), query
+
+    def test_candidates_narrow_by_posting_intersection(self):
+        index = TrigramIndex()
+        index.add("a", "abcdef")
+        index.add("b", "abcxyz")
+
+        assert index.candidates("bcd") == {"a"}
+        assert index.candidates("abc") == {"a", "b"}
+        assert index.candidates("zzz") == set()
+        # 3글자 미만은 좁힐 수 없다
+        assert index.candidates("ab") is None
+
+    def test_remove_and_replace(self):
+        index = TrigramIndex()
+        index.add("a", "alpha")
+        index.add("b", "alphabet")
+
+        index.remove("a")
+        index.add("b", "beta")
+
+        assert index.search("alp") == set()
+        assert index.search("bet") == {"b"}
+        assert len(index) == 1
+
+    def test_search_contained_in(self):
+        index = TrigramIndex()
+        index.add("work", "work")
+        index.add("Work2", "work2")
+        index.add("home", "home")
+
+        assert index.search_contained_in("homework") == {"work", "home"}
+        assert index.search_contained_in("wo") == set()
+
+    def test_find_exact_returns_keys_with_same_text(self):
+        index = TrigramIndex()
+        index.add("Work", "work")
+        index.add("work", "work")
+        index.add("homework", "homework")
+
+        assert index.find_exact("work") == {"Work", "work"}
+        assert index.find_exact("wor") == set()
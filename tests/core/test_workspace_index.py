@@ -0,0 +1,120 @@
+import os
+import pytest
+
+from core.path_utils import normalize_path
+from core.workspace_index import WorkspaceIndex
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    root = tmp_path / "workspace"
+    root.mkdir()
+    (root / "Report.PDF").write_bytes(b"12345")
+    (root / "photo.jpg").touch()
+    (root / "sub").mkdir()
+    (root / "sub" / "notes.txt").touch()
+    (root / "sub" / "photo_2.png").touch()
+    return root
+
+
+@pytest.fixture
+def store_dir(tmp_path):
+    return str(tmp_path / "cache")
+
+
+def _names(paths):
+    return sorted(os.path.basename(p) for p in paths)
+
+
+def _bump_mtime(path):
+    # 파일 시스템 mtime 해상도와 무관하게 디렉토리 변경이 감지되도록 mtime을 명시적으로 바꾼다
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+
+class TestWorkspaceIndex:
+
+    def test_build_indexes_all_files_with_metadata(self, workspace, store_dir):
+        index = WorkspaceIndex(str(workspace), store_dir)
+
+        index.ensure_fresh()
+
+        assert len(index) == 4
+        entry = index.get_entry(str(workspace / "Report.PDF"))
+        assert entry.basename == "Report.PDF"
+        assert entry.name_lower == "report.pdf"
+        assert entry.ext == ".pdf"
+        assert entry.size == 5
+
+    def test_find_files_by_name_and_extension(self, workspace, store_dir):
+        index = WorkspaceIndex(str(workspace), store_dir)
+        index.ensure_fresh()
+
+        assert _names(index.find_files("photo")) == ["photo.jpg", "photo_2.png"]
+        assert _names(index.find_files("", [".pdf"])) == ["Report.PDF"]
+        assert _names(index.find_files("PHOTO", ["png"])) == ["photo_2.png"]
+        assert index.find_files("missing") == []
+
+    def test_refresh_picks_up_added_and_removed_files(self, workspace, store_dir):
+        index = WorkspaceIndex(str(workspace), store_dir)
+        index.ensure_fresh()
+
+        # Given: 파일 추가/삭제와 하위 디렉토리 삭제
+        (workspace / "new_file.txt").touch()
+        (workspace / "photo.jpg").unlink()
+        _bump_mtime(workspace)
+        (workspace / "sub" / "notes.txt").unlink()
+        (workspace / "sub" / "photo_2.png").unlink()
+        (workspace / "sub").rmdir()
+        _bump_mtime(workspace)
+
+        # When
+        index.refresh()
+
+        # Then
+        assert _names(index.find_files()) == ["Report.PDF", "new_file.txt"]
+
+    def test_refresh_detects_new_nested_directory(self, workspace, store_dir):
+        index = WorkspaceIndex(str(workspace), store_dir)
+        index.ensure_fresh()
+
+        nested = workspace / "sub" / "deep"
+        nested.mkdir()
+        (nested / "deep_file.md").touch()
+        _bump_mtime(workspace / "sub")
+
+        index.refresh()
+
+        assert normalize_path(str(nested / "deep_file.md")) in index.find_files("deep")
+
+    def test_index_is_persisted_and_reloaded(self, workspace, store_dir):
+        first = WorkspaceIndex(str(workspace), store_dir)
+        first.ensure_fresh()
+        first.close()
+
+        # Given: 저장 이후 작업공간에 파일 추가
+        (workspace / "sub" / "later.txt").touch()
+        _bump_mtime(workspace / "sub")
+
+        # When: 새 인스턴스가 저장된 색인을 로드
+        second = WorkspaceIndex(str(workspace), store_dir)
+        second.ensure_fresh()
+
+        # Then: 저장된 항목과 증분 갱신된 항목이 모두 보인다
+        assert len(second) == 5
+        assert _names(second.find_files("later")) == ["later.txt"]
+
+    def test_store_file_is_per_workspace(self, tmp_path, store_dir):
+        a = tmp_path / "a"
+        b = tmp_path / "b"
+        a.mkdir()
+        b.mkdir()
+        (a / "only_a.txt").touch()
+
+        index_a = WorkspaceIndex(str(a), store_dir)
+        index_a.ensure_fresh()
+        index_b = WorkspaceIndex(str(b), store_dir)
+        index_b.ensure_fresh()
+
+        assert len(index_a) == 1
+        assert len(index_b) == 0
@@ -47,8 +47,21 @@ def mock_custom_tag_manager():
     return mock_manager
 
 @pytest.fixture
-def main_window(qapp, mock_mongo_client, mock_tag_service, mock_event_bus, mock_custom_tag_manager):
-    with patch('core.services.tag_service.TagService', return_value=mock_tag_service), \
+def mock_tag_repository():
+    # 시작 시 태그 색인/경로 필터 구축이 저장소를 순회하므로 빈 저장소로 응답
+    mock_repository = Mock(spec=TagRepository)
+    mock_repository.tag_collation = None
+    mock_repository.get_all_tags.return_value = []
+    mock_repository.get_tag_counts.return_value = {}
+    mock_repository.iter_tagged_paths.return_value = iter([])
+    return mock_repository
+
+@pytest.fixture
+def main_window(qapp, mock_mongo_client, mock_tag_repository, mock_tag_service, mock_event_bus,
+                mock_custom_tag_manager):
+    # MainWindow는 생성 시점의 이름으로 가져다 쓰므로 main_window 모듈의 이름을 바꿔야 한다
+    with patch('main_window.create_tag_repository', return_value=mock_tag_repository), \
+         patch('main_window.TagService', return_value=mock_tag_service), \
          patch('core.events.EventBus', return_value=mock_event_bus), \
          patch('core.custom_tag_manager.CustomTagManager', return_value=mock_custom_tag_manager), \
          patch('viewmodels.tag_control_viewmodel.TagControlViewModel') as MockTagControlViewModel:
@@ -99,9 +112,15 @@ class TestMainWindowIntegration:
 
         # Mock get_tags_for_file for file_list_viewmodel
         mock_tag_service.get_tags_for_file.return_value = []
+        # 파일 목록은 TagService가 돌려준 경로로 만들고, 행의 태그는 한 번에 조회한다
+        mock_tag_service.get_files_in_directory.return_value = [
+            str(temp_test_dir / "fileB.jpg"), str(temp_test_dir / "fileA.txt"),
+        ]
+        mock_tag_service.get_tags_for_files.side_effect = lambda paths: {path: [] for path in paths}
 
         # When: Select the root directory in the tree view
-        root_index = main_window.directory_tree.tree_view.model().index(str(temp_test_dir))
+        tree = main_window.directory_tree
+        root_index = tree.proxy_model.mapFromSource(tree.model.index(str(temp_test_dir)))
         main_window.directory_tree.tree_view.setCurrentIndex(root_index)
         main_window.directory_tree.directory_selected.emit(str(temp_test_dir), True)
         QApplication.processEvents() # UI 업데이트 대기
@@ -131,7 +150,8 @@ class TestMainWindowIntegration:
         QApplication.processEvents() # UI 업데이트 대기
 
         # Then: File detail and tag control should be updated
-        assert main_window.file_detail.file_path_label.text() == file_path
+        # 긴 경로는 앞부분을 "..."로 줄여 표시
+        assert file_path.endswith(main_window.file_detail.file_path_label.text().lstrip("."))
         assert main_window.tag_control_viewmodel._current_target_path == file_path
         assert main_window.tag_control_viewmodel._is_current_target_dir is False
         assert main_window.tag_control.tagging_tab_widget.currentIndex() == 0 # Should switch to individual tagging tab
@@ -161,7 +181,10 @@ class TestMainWindowIntegration:
         main_window.file_list.file_selection_changed.emit([file_path])
         QApplication.processEvents()
 
-        mock_tag_service.add_tag_to_file.return_value = True
+        # 실제 TagService처럼 추가 후 이벤트를 발행해야 화면이 다시 조회한다
+        mock_tag_service.add_tag_to_file.side_effect = (
+            lambda path, tag: main_window.event_bus.publish_tag_added(path, tag) or True
+        )
         mock_tag_service.get_tags_for_file.return_value = ["new_tag"] # After adding
 
         # When: Add a tag via the individual tag input
@@ -183,8 +206,14 @@ class TestMainWindowIntegration:
         main_window.file_list.file_selection_changed.emit(file_paths)
         QApplication.processEvents()
 
-        mock_tag_service.add_tags_to_files.return_value = {"success": True, "processed": 2, "successful": 2}
-        mock_tag_service.get_tags_for_file.side_effect = [["batch_tag"], ["batch_tag"]] # After adding
+        def add_tags_to_files(paths, tags):
+            # 실제 TagService처럼 변경을 배치 하나로 발행
+            main_window.event_bus.publish_tags_changed({path: (tags, []) for path in paths})
+            return {"success": True, "processed": 2, "successful": 2}
+
+        mock_tag_service.add_tags_to_files.side_effect = add_tags_to_files
+        mock_tag_service.get_tags_for_file.side_effect = None
+        mock_tag_service.get_tags_for_file.return_value = ["batch_tag"] # After adding
 
         # When: Add a tag via the batch tag input
         main_window.tag_control.batch_tag_input.setText("batch_tag")
@@ -206,7 +235,7 @@ class TestMainWindowIntegration:
 
         # When: Simulate context menu request and action click
         # We need to mock the dialog execution to avoid actual UI interaction
-        with patch('widgets.batch_remove_tags_dialog.BatchRemoveTagsDialog') as MockBatchRemoveTagsDialog:
+        with patch('widgets.tag_control_widget.BatchRemoveTagsDialog') as MockBatchRemoveTagsDialog:
             mock_dialog_instance = MockBatchRemoveTagsDialog.return_value
             mock_dialog_instance.exec_.return_value = True # Simulate OK button click
             mock_dialog_instance.get_tags_to_remove.return_value = ["tag1"] # Simulate tags selected for removal
@@ -221,3 +250,16 @@ class TestMainWindowIntegration:
             # Verify that the tags_updated signal was emitted by tag_control
             # This is implicitly tested if the dialog.exec_() returns True and the subsequent logic runs.
             # A more direct way would be to mock the signal and assert it was emitted.
+
+    def test_close_cancels_previews_and_waits_for_workers(self, main_window):
+        # Given
+        main_window.preview_loader.wait_for_done = Mock(return_value=True)
+        file_detail = main_window.ui_setup.get_widget("file_detail")
+        file_detail.clear_preview = Mock(wraps=file_detail.clear_preview)
+
+        # When
+        main_window.close()
+
+        # Then: 미리보기를 모두 취소하고 제한된 시간 동안 작업 스레드를 기다린다
+        file_detail.clear_preview.assert_called()
+        main_window.preview_loader.wait_for_done.assert_called_once_with(MainWindow.SHUTDOWN_WAIT_MSECS)
@@ -0,0 +1,129 @@
+import struct
+
+import pytest
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, QSize
+from PyQt5.QtGui import QColor, QImage
+
+from core.cancellation import CancellationToken
+from core.preview import decoders
+from core.preview.decoders import PreviewError, decode_image
+from core.preview.jpeg_exif import extract_exif_thumbnail
+
+
+def _jpeg_bytes(width, height, color):
+    image = QImage(width, height, QImage.Format_RGB32)
+    image.fill(QColor(color))
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    assert image.save(buffer, "JPEG", 90)
+    return bytes(data)
+
+
+def _exif_segment(orientation=None, thumbnail=None):
+    """IFD0(방향)과 IFD1(썸네일)만 있는 리틀 엔디안 EXIF APP1 세그먼트"""
+    ifd0_entries = [struct.pack("<HHIHH", 0x0112, 3, 1, orientation, 0)] if orientation else []
+    ifd0_offset = 8
+    ifd1_offset = ifd0_offset + 2 + 12 * len(ifd0_entries) + 4 if thumbnail else 0
+    tiff = b"II" + struct.pack("<HI", 42, ifd0_offset)
+    tiff += struct.pack("<H", len(ifd0_entries)) + b"".join(ifd0_entries) + struct.pack("<I", ifd1_offset)
+    if thumbnail:
+        thumbnail_offset = ifd1_offset + 2 + 12 * 2 + 4
+        tiff += struct.pack("<H", 2)
+        tiff += struct.pack("<HHII", 0x0201, 4, 1, thumbnail_offset)
+        tiff += struct.pack("<HHII", 0x0202, 4, 1, len(thumbnail))
+        tiff += struct.pack("<I", 0) + thumbnail
+    payload = b"Exif\x00\x00" + tiff
+    return b"\xff\xe1" + struct.pack(">H", len(payload) + 2) + payload
+
+
+def _write_jpeg(path, width, height, color, orientation=None, thumbnail=None):
+    body = _jpeg_bytes(width, height, color)
+    # SOI 바로 뒤에 APP1(EXIF)을 넣는다
+    path.write_bytes(body[:2] + _exif_segment(orientation, thumbnail) + body[2:])
+    return str(path)
+
+
+def _color_at_center(image):
+    return QColor(image.pixel(image.width() // 2, image.height() // 2))
+
+
+class TestExifThumbnail:
+
+    def test_extracts_thumbnail(self):
+        thumbnail = _jpeg_bytes(160, 120, "blue")
+        data = _jpeg_bytes(10, 10, "red")
+        data = data[:2] + _exif_segment(thumbnail=thumbnail) + data[2:]
+
+        assert extract_exif_thumbnail(data) == thumbnail
+
+    def test_none_without_exif(self):
+        assert extract_exif_thumbnail(_jpeg_bytes(10, 10, "red")) is None
+        assert extract_exif_thumbnail(b"not a jpeg") is None
+
+
+class TestDecodeImage:
+
+    def test_jpeg_decoded_at_target_size(self, tmp_path):
+        path = _write_jpeg(tmp_path / "scan.jpg", 4000, 3000, "red")
+
+        image = decode_image(path, QSize(400, 400), CancellationToken())
+
+        assert image.size() == QSize(400, 300)
+
+    def test_small_target_uses_exif_thumbnail(self, tmp_path):
+        # Given: 본문은 빨강, 썸네일은 파랑
+        path = _write_jpeg(tmp_path / "photo.jpg", 1600, 1200, "red", thumbnail=_jpeg_bytes(160, 120, "blue"))
+
+        # When / Then: 썸네일보다 작은 목표는 썸네일에서, 큰 목표는 본문에서
+        small = decode_image(path, QSize(100, 100), CancellationToken())
+        assert small.size() == QSize(100, 75)
+        assert _color_at_center(small).blue() > 200
+        large = decode_image(path, QSize(400, 400), CancellationToken())
+        assert large.size() == QSize(400, 300)
+        assert _color_at_center(large).red() > 200
+
+    def test_exif_orientation_applied(self, tmp_path):
+        # 방향 6 = 시계 방향 90도 회전 필요
+        path = _write_jpeg(tmp_path / "portrait.jpg", 800, 400, "red", orientation=6,
+                           thumbnail=_jpeg_bytes(160, 80, "blue"))
+
+        assert decode_image(path, QSize(200, 200), CancellationToken()).size() == QSize(100, 200)
+        assert decode_image(path, QSize(40, 40), CancellationToken()).size() == QSize(20, 40)
+
+    def test_rejects_huge_image_without_reduced_decoding_before_reading(self, tmp_path, monkeypatch):
+        # Given: PNG는 원본 크기로 디코딩한 뒤 줄이므로 버퍼가 한도를 넘음
+        path = tmp_path / "huge.png"
+        image = QImage(200, 200, QImage.Format_RGB32)
+        image.fill(QColor("red"))
+        assert image.save(str(path))
+        monkeypatch.setattr(decoders, "MAX_FULL_DECODE_PIXELS", 100 * 100)
+        read = []
+        monkeypatch.setattr(decoders.QImageReader, "read", lambda self: read.append(True) or QImage())
+
+        # When / Then: 픽셀을 읽지 않고 거부
+        with pytest.raises(PreviewError, match="너무 큽니다"):
+            decode_image(str(path), QSize(50, 50), CancellationToken())
+        assert read == []
+
+    def test_image_within_limit_without_reduced_decoding_is_previewed(self, tmp_path, monkeypatch):
+        path = tmp_path / "large.png"
+        image = QImage(200, 100, QImage.Format_RGB32)
+        image.fill(QColor("red"))
+        assert image.save(str(path))
+        monkeypatch.setattr(decoders, "MAX_FULL_DECODE_PIXELS", 200 * 100)
+
+        preview = decode_image(str(path), QSize(50, 50), CancellationToken())
+
+        assert preview.size() == QSize(50, 25)
+        assert _color_at_center(preview) == QColor("red")
+
+    def test_huge_jpeg_uses_dct_reduced_buffer(self, tmp_path, monkeypatch):
+        # Given: 원본은 한도를 넘지만 1/8 축소 디코딩하면 한도 안
+        path = _write_jpeg(tmp_path / "scan.jpg", 800, 800, "red")
+        monkeypatch.setattr(decoders, "MAX_FULL_DECODE_PIXELS", 100 * 100)
+
+        # When / Then
+        assert decode_image(path, QSize(100, 100), CancellationToken()).size() == QSize(100, 100)
+        with pytest.raises(PreviewError, match="너무 큽니다"):
+            decode_image(path, QSize(400, 400), CancellationToken())
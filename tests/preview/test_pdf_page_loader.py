@@ -0,0 +1,215 @@
+import threading
+import time
+
+import fitz  # type: ignore # PyMuPDF
+import pytest
+from PyQt5.QtCore import QSize
+
+from core.cancellation import CancellationToken
+from core.preview import decoders
+from core.preview.decoders import PdfDocument, PreviewError, pdf_zoom_for, render_pdf_first_page
+from core.preview.pdf_page_loader import PdfPageLoader
+from core.preview.preview_cache import PreviewCache
+
+FIRST_PAGE_SIZE = QSize(100, 150)
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    path = tmp_path / "pages.pdf"
+    doc = fitz.open()
+    for _ in range(5):
+        doc.new_page(width=200, height=300)
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+@pytest.fixture
+def page_loader(qtbot):
+    loader = PdfPageLoader()
+    yield loader
+    loader.cancel()
+    loader.wait_for_done(2000)
+
+
+class TestPdfZoom:
+
+    def test_zoom_fits_page_into_target(self):
+        assert pdf_zoom_for(200, 300, QSize(100, 300)) == 0.5
+        assert pdf_zoom_for(200, 300, QSize(1000, 600)) == 2.0
+
+    def test_zoom_is_clamped(self):
+        assert pdf_zoom_for(10, 10, QSize(4000, 4000)) == decoders.MAX_PDF_ZOOM
+
+    def test_empty_target_uses_default_zoom(self):
+        assert pdf_zoom_for(200, 300, QSize()) == decoders.PDF_RENDER_ZOOM
+
+
+class TestPdfDocument:
+
+    def test_renders_directly_at_target_size(self, pdf_file, monkeypatch):
+        # Given: 렌더링 후 축소가 일어나면 실패하도록 _fit을 감시
+        scaled = []
+        original_fit = decoders._fit
+        monkeypatch.setattr(decoders, "_fit", lambda image, size: scaled.append(image.size()) or original_fit(image, size))
+
+        image = render_pdf_first_page(pdf_file, QSize(400, 300), CancellationToken())
+
+        assert image.size() == QSize(200, 300)
+        assert scaled == [QSize(200, 300)]
+
+    def test_reuses_open_document_and_caches_pages(self, pdf_file, monkeypatch):
+        # Given
+        opened = []
+        original_open = fitz.open
+        monkeypatch.setattr(decoders.fitz, "open", lambda *args: opened.append(args) or original_open(*args))
+        document = PdfDocument(pdf_file, max_cached_pages=2)
+        token = CancellationToken()
+
+        # When
+        first = document.render_page(0, QSize(100, 150), token)
+        second = document.render_page(1, QSize(100, 150), token)
+
+        # Then: 파일은 한 번만 열고, 같은 요청은 캐시된 이미지를 돌려줌
+        assert len(opened) == 1
+        assert document.render_page(0, QSize(100, 150), token) is first
+        # 가장 오래 쓰지 않은 1페이지가 밀려남
+        document.render_page(2, QSize(100, 150), token)
+        assert document.render_page(0, QSize(100, 150), token) is first
+        assert document.render_page(1, QSize(100, 150), token) is not second
+        document.close()
+
+    def test_out_of_range_page(self, pdf_file):
+        document = PdfDocument(pdf_file)
+        with pytest.raises(PreviewError):
+            document.render_page(5, QSize(100, 100), CancellationToken())
+        document.close()
+
+
+class TestPdfPageLoader:
+
+    def test_open_reports_page_count(self, qtbot, page_loader, pdf_file):
+        with qtbot.waitSignal(page_loader.document_opened, timeout=5000) as blocker:
+            generation = page_loader.open(pdf_file, FIRST_PAGE_SIZE)
+
+        assert blocker.args == [generation, pdf_file, 5]
+        assert page_loader.page_count == 5
+
+    def test_renders_only_requested_pages_once(self, qtbot, page_loader, pdf_file):
+        # Given
+        ready = []
+        page_loader.page_ready.connect(lambda generation, index, image: ready.append((index, image.size())))
+        with qtbot.waitSignal(page_loader.document_opened, timeout=5000):
+            page_loader.open(pdf_file, FIRST_PAGE_SIZE)
+
+        # When: 같은 페이지를 다시 요청하고, 범위를 벗어난 페이지도 요청 (첫 페이지는 open이 그림)
+        page_loader.request_pages([0, 1, 2], QSize(100, 150))
+        page_loader.request_pages([2, 3, 9], QSize(100, 150))
+        qtbot.waitUntil(lambda: len(ready) == 4, timeout=5000)
+        page_loader.wait_for_done(2000)
+        qtbot.wait(50)
+
+        # Then
+        assert sorted(ready) == [(index, QSize(100, 150)) for index in range(4)]
+
+    def test_results_of_previous_document_are_ignored(self, qtbot, page_loader, pdf_file):
+        # Given
+        with qtbot.waitSignal(page_loader.document_opened, timeout=5000):
+            page_loader.open(pdf_file, FIRST_PAGE_SIZE)
+        ready = []
+        page_loader.page_ready.connect(lambda *args: ready.append(args))
+
+        # When: 요청 직후 다른 문서로 바뀜
+        page_loader.request_pages([1, 2, 3], QSize(100, 150))
+        page_loader.cancel()
+        page_loader.wait_for_done(2000)
+        qtbot.wait(50)
+
+        # Then
+        assert ready == []
+        assert page_loader.page_count == 0
+
+    def test_open_failure_reported(self, qtbot, page_loader, tmp_path):
+        broken = tmp_path / "broken.pdf"
+        broken.write_bytes(b"not a pdf")
+
+        with qtbot.waitSignal(page_loader.page_failed, timeout=5000) as blocker:
+            page_loader.open(str(broken), FIRST_PAGE_SIZE)
+
+        assert blocker.args[1] == -1
+
+    def test_first_page_rendered_with_single_open(self, qtbot, page_loader, pdf_file, monkeypatch):
+        # Given
+        opened = []
+        original_open = fitz.open
+        monkeypatch.setattr(decoders.fitz, "open", lambda *args: opened.append(args) or original_open(*args))
+        ready = []
+        page_loader.page_ready.connect(lambda generation, index, image: ready.append((index, image.size())))
+
+        # When
+        page_loader.open(pdf_file, FIRST_PAGE_SIZE)
+        qtbot.waitUntil(lambda: len(ready) == 1, timeout=5000)
+        page_loader.request_pages([0, 1], FIRST_PAGE_SIZE)
+        qtbot.waitUntil(lambda: len(ready) == 2, timeout=5000)
+
+        # Then: 첫 페이지와 나머지 페이지 모두 같은 문서 핸들로 렌더링
+        assert ready == [(0, FIRST_PAGE_SIZE), (1, FIRST_PAGE_SIZE)]
+        assert len(opened) == 1
+
+    def test_cancel_closes_document(self, qtbot, page_loader, pdf_file, monkeypatch):
+        # Given
+        with qtbot.waitSignal(page_loader.document_opened, timeout=5000):
+            page_loader.open(pdf_file, FIRST_PAGE_SIZE)
+        document = page_loader._document
+        closed = []
+        original_close = document.close
+        monkeypatch.setattr(document, "close",
+                            lambda: closed.append(threading.current_thread()) or original_close())
+
+        # When
+        page_loader.cancel()
+        page_loader.wait_for_done(2000)
+
+        # Then: GC가 아니라 취소 시점에 명시적으로 닫되, _PDF_LOCK을 잡으므로 GUI 스레드에서는 닫지 않음
+        assert len(closed) == 1
+        assert closed[0] is not threading.main_thread()
+        assert document._doc is None
+
+    def test_cancel_does_not_wait_for_running_render(self, qtbot, page_loader, pdf_file):
+        # Given: 작업 스레드가 페이지를 렌더링하는 중 (_PDF_LOCK을 잡고 있음)
+        with qtbot.waitSignal(page_loader.document_opened, timeout=5000):
+            page_loader.open(pdf_file, FIRST_PAGE_SIZE)
+        document = page_loader._document
+
+        # When: 락을 잡은 채로 취소
+        with decoders._PDF_LOCK:
+            started = time.monotonic()
+            page_loader.cancel()
+            elapsed = time.monotonic() - started
+
+        # Then: 취소는 락을 기다리지 않고, 문서는 락이 풀린 뒤 닫힘
+        assert elapsed < 0.5
+        page_loader.wait_for_done(2000)
+        assert document._doc is None
+
+    def test_first_page_served_from_preview_cache(self, qtbot, pdf_file, tmp_path):
+        # Given: 첫 페이지가 같은 크기로 예열되어 있음
+        cache = PreviewCache(str(tmp_path / "cache"))
+        cached = render_pdf_first_page(pdf_file, FIRST_PAGE_SIZE, CancellationToken())
+        cached.fill(0)
+        cache.put(PreviewCache.make_key("pdf", pdf_file, FIRST_PAGE_SIZE), cached)
+        loader = PdfPageLoader(cache=cache)
+        ready = []
+        loader.page_ready.connect(lambda generation, index, image: ready.append((index, image)))
+
+        # When
+        with qtbot.waitSignal(loader.document_opened, timeout=5000):
+            loader.open(pdf_file, FIRST_PAGE_SIZE)
+        loader.wait_for_done(2000)
+        qtbot.wait(50)
+
+        # Then: 다시 렌더링하지 않고 캐시의 이미지를 씀
+        assert [index for index, _ in ready] == [0]
+        assert ready[0][1].pixelColor(0, 0) == cached.pixelColor(0, 0)
+        loader.cancel()
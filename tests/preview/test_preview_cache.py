@@ -0,0 +1,119 @@
+import os
+
+import pytest
+from PyQt5.QtCore import QSize
+from PyQt5.QtGui import QColor, QImage
+
+from core.preview.decoders import PREVIEW_DECODERS
+from core.preview.preview_cache import PreviewCache
+from core.preview.preview_loader import PreviewLoader
+
+
+def _image(color="red", width=64, height=64):
+    image = QImage(width, height, QImage.Format_RGB32)
+    image.fill(QColor(color))
+    return image
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "photo.png"
+    assert _image().save(str(path))
+    return str(path)
+
+
+class TestPreviewCacheKey:
+
+    def test_key_depends_on_file_state_and_target_size(self, source_file):
+        # Given
+        key = PreviewCache.make_key("image", source_file, QSize(200, 200))
+
+        # Then
+        assert key == PreviewCache.make_key("image", source_file, QSize(200, 200))
+        assert key != PreviewCache.make_key("image", source_file, QSize(300, 200))
+        assert key != PreviewCache.make_key("pdf", source_file, QSize(200, 200))
+        os.utime(source_file, ns=(0, 0))
+        assert key != PreviewCache.make_key("image", source_file, QSize(200, 200))
+        assert PreviewCache.make_key("image", source_file + ".missing", QSize(200, 200)) is None
+
+
+class TestPreviewCache:
+
+    def test_persists_across_instances(self, tmp_path):
+        # Given
+        cache = PreviewCache(str(tmp_path / "cache"))
+        assert cache.put("k1", _image("blue"))
+
+        # When: 재시작 (메모리 캐시 없음)
+        reopened = PreviewCache(str(tmp_path / "cache"))
+        image = reopened.get("k1")
+
+        # Then
+        assert image is not None and image.size() == QSize(64, 64)
+        assert reopened.stats()["disk_entries"] == 1
+        assert reopened.get("missing") is None
+        assert reopened.stats()["hits"] == 1 and reopened.stats()["misses"] == 1
+
+    def test_memory_tier_serves_recent_entries(self, tmp_path):
+        cache = PreviewCache(str(tmp_path / "cache"), memory_entries=1)
+        cache.put("k1", _image())
+        cache.put("k2", _image())
+
+        assert cache.stats()["memory_entries"] == 1
+        # 디스크 파일이 사라져도 메모리에 있는 최근 항목은 그대로 조회된다
+        os.remove(cache._path_for("k2"))
+        assert cache.get("k2") is not None
+
+    def test_disk_size_limit_evicts_least_recently_used(self, tmp_path):
+        # Given: 두 항목만 들어가는 한도
+        probe = PreviewCache(str(tmp_path / "probe"))
+        probe.put("probe", _image())
+        entry_size = probe.stats()["disk_bytes"]
+        cache = PreviewCache(str(tmp_path / "cache"), max_bytes=entry_size * 2, memory_entries=0)
+        cache.put("k1", _image())
+        cache.put("k2", _image())
+
+        # When: k1을 사용한 뒤 새 항목 추가
+        assert cache.get("k1") is not None
+        cache.put("k3", _image())
+
+        # Then
+        assert cache.get("k2") is None
+        assert cache.get("k1") is not None and cache.get("k3") is not None
+        assert cache.stats()["disk_bytes"] <= entry_size * 2
+        assert not os.path.exists(cache._path_for("k2"))
+
+    def test_clear_removes_files(self, tmp_path):
+        cache = PreviewCache(str(tmp_path / "cache"))
+        cache.put("k1", _image())
+
+        cache.clear()
+
+        assert cache.stats()["disk_entries"] == 0
+        assert not os.path.exists(cache._path_for("k1"))
+
+
+class TestPreviewLoaderCache:
+
+    def test_second_request_served_from_cache(self, qtbot, tmp_path, source_file, monkeypatch):
+        # Given
+        calls = []
+        decode_image = PREVIEW_DECODERS["image"]
+
+        def counting_decoder(file_path, target_size, token):
+            calls.append(file_path)
+            return decode_image(file_path, target_size, token)
+
+        monkeypatch.setitem(PREVIEW_DECODERS, "image", counting_decoder)
+        loader = PreviewLoader(PreviewCache(str(tmp_path / "cache")))
+
+        # When
+        for _ in range(2):
+            with qtbot.waitSignal(loader.preview_ready, timeout=2000) as blocker:
+                loader.request("image", source_file, QSize(32, 32))
+            assert blocker.args[2].size() == QSize(32, 32)
+        loader.wait_for_done(2000)
+
+        # Then
+        assert calls == [source_file]
+        assert loader.cache.stats()["hits"] == 1
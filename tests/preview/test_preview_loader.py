@@ -0,0 +1,101 @@
+import threading
+
+import fitz  # type: ignore # PyMuPDF
+import pytest
+from PyQt5.QtCore import QSize
+from PyQt5.QtGui import QColor, QImage
+
+from core.preview.decoders import PREVIEW_DECODERS
+from core.preview.preview_loader import PreviewLoader
+
+
+@pytest.fixture
+def image_file(tmp_path):
+    path = tmp_path / "photo.png"
+    image = QImage(800, 400, QImage.Format_RGB32)
+    image.fill(QColor("red"))
+    assert image.save(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def pdf_file(tmp_path):
+    path = tmp_path / "doc.pdf"
+    doc = fitz.open()
+    doc.new_page(width=200, height=300)
+    doc.save(str(path))
+    doc.close()
+    return str(path)
+
+
+@pytest.fixture
+def loader(qtbot):
+    preview_loader = PreviewLoader()
+    yield preview_loader
+    preview_loader.cancel()
+    preview_loader.wait_for_done(2000)
+
+
+class TestPreviewLoader:
+
+    def test_image_decoded_off_gui_thread_and_fitted(self, qtbot, loader, image_file, monkeypatch):
+        # Given
+        decode_threads = []
+        decode_image = PREVIEW_DECODERS["image"]
+
+        def recording_decoder(file_path, target_size, token):
+            decode_threads.append(threading.current_thread())
+            return decode_image(file_path, target_size, token)
+
+        monkeypatch.setitem(PREVIEW_DECODERS, "image", recording_decoder)
+
+        # When
+        with qtbot.waitSignal(loader.preview_ready, timeout=2000) as blocker:
+            generation = loader.request("image", image_file, QSize(200, 200))
+
+        # Then
+        result_generation, file_path, image = blocker.args
+        assert (result_generation, file_path) == (generation, image_file)
+        assert image.size() == QSize(200, 100)
+        assert decode_threads and decode_threads[0] is not threading.main_thread()
+
+    def test_pdf_first_page_rendered(self, qtbot, loader, pdf_file):
+        with qtbot.waitSignal(loader.preview_ready, timeout=5000) as blocker:
+            loader.request("pdf", pdf_file, QSize(100, 300))
+
+        image = blocker.args[2]
+        assert image.width() == 100 and image.height() == 150
+
+    def test_only_latest_request_emits(self, qtbot, loader, image_file, monkeypatch):
+        # Given: 첫 요청은 취소될 때까지 대기한다
+        first_started = threading.Event()
+
+        def slow_decoder(file_path, target_size, token):
+            first_started.set()
+            while not token.is_cancelled():
+                threading.Event().wait(0.01)
+            token.raise_if_cancelled()
+
+        monkeypatch.setitem(PREVIEW_DECODERS, "slow", slow_decoder)
+        ready = []
+        loader.preview_ready.connect(lambda generation, path, image: ready.append(path))
+
+        # When
+        loader.request("slow", "/stale.png", QSize(100, 100))
+        assert first_started.wait(2)
+        with qtbot.waitSignal(loader.preview_ready, timeout=2000):
+            loader.request("image", image_file, QSize(100, 100))
+        loader.wait_for_done(2000)
+        qtbot.wait(20)
+
+        # Then
+        assert ready == [image_file]
+
+    def test_failure_reported(self, qtbot, loader, tmp_path):
+        broken = tmp_path / "broken.jpg"
+        broken.write_bytes(b"not an image")
+
+        with qtbot.waitSignal(loader.preview_failed, timeout=2000) as blocker:
+            loader.request("image", str(broken), QSize(100, 100))
+
+        assert blocker.args[1:] == [str(broken), "이미지 로드 실패"]
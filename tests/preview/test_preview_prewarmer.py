@@ -0,0 +1,177 @@
+import pytest
+from PyQt5.QtCore import QEvent, QSize
+from PyQt5.QtGui import QColor, QImage
+
+from core.preview.preview_cache import PreviewCache
+from core.preview.preview_loader import PreviewLoader
+from core.preview import preview_prewarmer
+from core.preview.preview_prewarmer import PrewarmBudget, PreviewPrewarmer, prioritize
+
+TARGET = QSize(32, 32)
+
+
+@pytest.fixture
+def images(tmp_path):
+    paths = []
+    for index in range(4):
+        path = tmp_path / f"img{index}.png"
+        image = QImage(64, 48, QImage.Format_RGB32)
+        image.fill(QColor("green"))
+        assert image.save(str(path))
+        paths.append(str(path))
+    (tmp_path / "notes.txt").write_text("text")
+    return paths + [str(tmp_path / "notes.txt")]
+
+
+@pytest.fixture
+def loader(qtbot, tmp_path):
+    preview_loader = PreviewLoader(PreviewCache(str(tmp_path / "cache")))
+    yield preview_loader
+    preview_loader.wait_for_done(2000)
+
+
+def _make_prewarmer(loader, idle_delay_ms):
+    return PreviewPrewarmer(loader, PrewarmBudget(cpu_fraction=1.0, max_bytes_per_second=0),
+                            idle_delay_ms=idle_delay_ms)
+
+
+class TestPrewarmBudget:
+
+    def test_delay_keeps_cpu_and_io_within_budget(self):
+        budget = PrewarmBudget(cpu_fraction=0.25, max_bytes_per_second=16 * 1024 * 1024)
+
+        assert budget.delay_after(0.1, 0) == pytest.approx(0.3)
+        assert budget.delay_after(0.5, 32 * 1024 * 1024) == pytest.approx(1.5)
+        assert PrewarmBudget(cpu_fraction=1.0, max_bytes_per_second=0).delay_after(1.0, 10 ** 9) == 0.0
+
+
+class TestPrioritize:
+
+    def test_visible_rows_first_then_outward_from_center(self):
+        paths = [f"/f{i}.png" for i in range(10)]
+
+        order = prioritize(paths, center=5, first_visible=4, last_visible=7, limit=10)
+
+        assert order[:4] == ["/f5.png", "/f4.png", "/f6.png", "/f7.png"]
+        assert order[4:] == ["/f3.png", "/f8.png", "/f2.png", "/f9.png", "/f1.png", "/f0.png"]
+
+    def test_accept_and_limit(self):
+        paths = [f"/f{i}.{'png' if i % 2 else 'txt'}" for i in range(10)]
+
+        order = prioritize(paths, center=0, first_visible=0, last_visible=-1, limit=2,
+                           accept=lambda path: path.endswith(".png"))
+
+        assert order == ["/f1.png", "/f3.png"]
+
+
+class TestPreviewPrewarmer:
+
+    def test_fills_cache_for_listed_images_when_idle(self, qtbot, loader, images):
+        # Given: 화면에서 이미지 미리보기를 한 번 표시하여 목표 크기를 알고 있음
+        with qtbot.waitSignal(loader.preview_ready, timeout=2000):
+            loader.request("image", images[0], TARGET)
+        prewarmer = _make_prewarmer(loader, idle_delay_ms=0)
+
+        # When
+        prewarmer.set_files(images, center=0, first_visible=0, last_visible=1)
+        qtbot.waitUntil(lambda: prewarmer.pending_count() == 0 and prewarmer.prewarmed_count == 3, timeout=3000)
+        prewarmer.wait_for_done(2000)
+
+        # Then: 텍스트 파일은 제외, 이미 캐시에 있던 첫 이미지는 다시 만들지 않음
+        for path in images[:4]:
+            assert loader.cache.contains(PreviewCache.make_key("image", path, TARGET))
+
+    def test_waits_for_idle_and_pauses_on_input(self, qtbot, loader, images):
+        # Given
+        with qtbot.waitSignal(loader.preview_ready, timeout=2000):
+            loader.request("image", images[0], TARGET)
+        prewarmer = _make_prewarmer(loader, idle_delay_ms=200)
+
+        # When: 입력이 계속 들어오는 동안
+        prewarmer.set_files(images)
+        for _ in range(3):
+            qtbot.wait(100)
+            prewarmer.eventFilter(None, QEvent(QEvent.KeyPress))
+
+        # Then: 시작하지 않다가, 입력이 멈추면 예열한다
+        assert prewarmer.prewarmed_count == 0
+        qtbot.waitUntil(lambda: prewarmer.prewarmed_count == 3, timeout=3000)
+        prewarmer.stop()
+        prewarmer.wait_for_done(2000)
+
+    def test_skips_kinds_never_shown(self, qtbot, loader, images):
+        prewarmer = _make_prewarmer(loader, idle_delay_ms=0)
+
+        prewarmer.set_files(images)
+        qtbot.waitUntil(lambda: prewarmer.pending_count() == 0, timeout=3000)
+        prewarmer.wait_for_done(2000)
+
+        assert prewarmer.prewarmed_count == 0
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def perf_counter(self):
+        return self.now
+
+
+class _RecordingPause:
+    """기다린 시간만큼 시계를 앞당기는 일시정지 이벤트. pause_after번째 대기에서 일시정지됨"""
+
+    def __init__(self, clock, pause_after=None):
+        self._clock = clock
+        self._pause_after = pause_after
+        self.waits = []
+
+    def is_set(self):
+        return self._pause_after is not None and len(self.waits) >= self._pause_after
+
+    def wait(self, timeout):
+        self.waits.append(timeout)
+        self._clock.now += timeout
+        return self.is_set()
+
+
+class _FixedDelayBudget:
+    def __init__(self, delay):
+        self._delay = delay
+
+    def delay_after(self, elapsed, bytes_read):
+        return self._delay
+
+
+class TestPrewarmThrottle:
+
+    def _worker_prewarmer(self, loader, paths, budget, monkeypatch, pause_after=None):
+        clock = _FakeClock()
+        monkeypatch.setattr(preview_prewarmer, "time", clock)
+        prewarmer = PreviewPrewarmer(loader, budget, idle_delay_ms=0)
+        prewarmer._paused = _RecordingPause(clock, pause_after)
+        prewarmer._queue.extend(paths)
+        prewarmer._worker_running = True
+        return prewarmer
+
+    def test_long_delay_is_fully_waited_in_slices(self, qtbot, loader, images, monkeypatch):
+        # Given: 파일마다 MAX_THROTTLE_SLEEP보다 긴 5초를 쉬어야 하는 예산
+        prewarmer = self._worker_prewarmer(loader, images[:2], _FixedDelayBudget(5.0), monkeypatch)
+
+        # When
+        prewarmer._run_worker()
+
+        # Then: 2초 이하로 나눠 파일마다 5초를 모두 쉼
+        assert all(wait <= preview_prewarmer.MAX_THROTTLE_SLEEP for wait in prewarmer._paused.waits)
+        assert sum(prewarmer._paused.waits) == pytest.approx(10.0)
+        assert prewarmer.pending_count() == 0
+
+    def test_pause_during_long_delay_stops_worker(self, qtbot, loader, images, monkeypatch):
+        prewarmer = self._worker_prewarmer(loader, images[:3], _FixedDelayBudget(5.0), monkeypatch, pause_after=1)
+
+        prewarmer._run_worker()
+
+        assert prewarmer._paused.waits == [preview_prewarmer.MAX_THROTTLE_SLEEP]
+        assert prewarmer.pending_count() == 2
@@ -0,0 +1,136 @@
+import codecs
+
+import pytest
+from PyQt5.QtCore import QThread
+
+from core.preview.text_preview_loader import TextPreviewLoader
+from core.preview.text_reader import TextChunkReader, detect_encoding, read_text_prefix
+
+
+@pytest.fixture
+def text_loader(qtbot):
+    loader = TextPreviewLoader(chunk_bytes=1024, max_bytes=4096, markdown_max_bytes=2048)
+    yield loader
+    loader.cancel()
+    loader.wait_for_done(2000)
+
+
+class TestDetectEncoding:
+
+    @pytest.mark.parametrize("sample, expected", [
+        (b"plain ascii", "utf-8"),
+        ("한글 텍스트".encode("utf-8"), "utf-8"),
+        ("한글 텍스트".encode("cp949"), "cp949"),
+        (codecs.BOM_UTF8 + "본문".encode("utf-8"), "utf-8-sig"),
+        ("본문".encode("utf-16"), "utf-16"),
+        (b"\x80\xff\xfe\x81", "latin-1"),
+    ])
+    def test_detects_from_sample(self, sample, expected):
+        assert detect_encoding(sample) == expected
+
+    def test_multibyte_char_cut_at_sample_end_is_still_utf8(self):
+        sample = "가나다".encode("utf-8")[:-1]
+        assert detect_encoding(sample) == "utf-8"
+
+
+class TestTextChunkReader:
+
+    def test_reads_in_chunks_across_multibyte_boundaries(self, tmp_path):
+        # Given: 3바이트 문자가 조각 경계에 걸치도록 청크 크기를 정함
+        text = "가나다라마바사" * 20
+        path = tmp_path / "korean.txt"
+        path.write_bytes(text.encode("utf-8"))
+        reader = TextChunkReader(str(path), chunk_bytes=10, max_bytes=0)
+
+        # When
+        chunks = []
+        while not reader.at_end:
+            chunks.append(reader.read_chunk())
+
+        # Then
+        assert "".join(chunks) == text
+        assert len(chunks) == len(text.encode("utf-8")) // 10
+        assert not reader.truncated
+
+    def test_stops_at_max_bytes(self, tmp_path):
+        path = tmp_path / "big.log"
+        path.write_bytes(b"x" * 10000)
+        reader = TextChunkReader(str(path), chunk_bytes=1000, max_bytes=2500)
+
+        total = ""
+        while not reader.at_end:
+            total += reader.read_chunk()
+
+        assert len(total) == 2500
+        assert reader.truncated
+
+    def test_read_text_prefix(self, tmp_path):
+        path = tmp_path / "notes.md"
+        path.write_text("# 제목\n" + "본문\n" * 1000, encoding="cp949")
+
+        text, truncated = read_text_prefix(str(path), 100)
+
+        assert text.startswith("# 제목")
+        assert truncated
+
+
+class TestTextPreviewLoader:
+
+    def test_first_chunk_then_more_on_request(self, qtbot, text_loader, tmp_path):
+        # Given
+        path = tmp_path / "app.log"
+        path.write_bytes(b"a" * 1024 + b"b" * 1024 + b"c" * 100)
+
+        # When / Then: 처음에는 한 조각만 읽음
+        with qtbot.waitSignal(text_loader.chunk_ready, timeout=2000) as blocker:
+            generation = text_loader.open(str(path))
+        assert blocker.args == [generation, str(path), "a" * 1024, False]
+
+        with qtbot.waitSignal(text_loader.chunk_ready, timeout=2000) as blocker:
+            assert text_loader.request_more()
+        assert blocker.args[2] == "b" * 1024
+        # 읽는 중에는 중복 요청하지 않음
+        with qtbot.waitSignal(text_loader.chunk_ready, timeout=2000) as blocker:
+            assert text_loader.request_more()
+            assert not text_loader.request_more()
+        assert blocker.args[2:] == ["c" * 100, True]
+        assert not text_loader.request_more()
+        assert not text_loader.truncated
+
+    def test_markdown_rendered_off_gui_thread_and_bounded(self, qtbot, text_loader, tmp_path):
+        # Given
+        path = tmp_path / "huge.md"
+        path.write_text("# 제목\n\n" + "긴 문단입니다. " * 2000, encoding="utf-8")
+
+        # When
+        with qtbot.waitSignal(text_loader.markdown_ready, timeout=5000) as blocker:
+            text_loader.open(str(path), markdown=True)
+
+        # Then: 문서는 GUI 스레드로 옮겨져 있고 앞부분만 담고 있음
+        document = blocker.args[2]
+        assert document.thread() is QThread.currentThread()
+        assert document.firstBlock().text() == "제목"
+        assert len(document.toPlainText().encode("utf-8")) < 4096
+        assert "앞부분 2 KB만" in document.toPlainText()
+
+    def test_previous_file_results_ignored(self, qtbot, text_loader, tmp_path):
+        first = tmp_path / "first.txt"
+        first.write_text("first", encoding="utf-8")
+        second = tmp_path / "second.txt"
+        second.write_text("second", encoding="utf-8")
+        received = []
+        text_loader.chunk_ready.connect(lambda *args: received.append(args[1]))
+
+        text_loader.open(str(first))
+        text_loader.open(str(second))
+        qtbot.waitUntil(lambda: len(received) > 0, timeout=2000)
+        text_loader.wait_for_done(2000)
+        qtbot.wait(50)
+
+        assert received == [str(second)]
+
+    def test_missing_file_reports_failure(self, qtbot, text_loader, tmp_path):
+        with qtbot.waitSignal(text_loader.failed, timeout=2000) as blocker:
+            text_loader.open(str(tmp_path / "missing.txt"))
+
+        assert blocker.args[1] == str(tmp_path / "missing.txt")
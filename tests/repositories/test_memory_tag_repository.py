@@ -0,0 +1,111 @@
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+from core.events import EventBus
+from core.repositories.base import TagUpdate
+from core.repositories.memory_tag_repository import InMemoryTagRepository
+from core.repositories.sqlite_tag_repository import SqliteTagRepository
+from core.services.tag_service import TagService
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def repository():
+    return InMemoryTagRepository()
+
+
+def _add(path, tags, upsert=True):
+    return TagUpdate(path, tags, [], upsert)
+
+
+def _pull(path, tags):
+    return TagUpdate(path, [], tags, False)
+
+
+class TestInMemoryTagRepository:
+
+    def test_add_to_set_is_idempotent(self, repository):
+        assert repository.add_tag("/a.txt", "x") is True
+        assert repository.add_tag("/a.txt", "x") is False
+        assert repository.get_tags_for_file("/a.txt") == ["x"]
+
+    def test_bulk_update_counts(self, repository):
+        # Given
+        repository.add_tag("/a.txt", "x")
+
+        # When
+        added = repository.bulk_update_tags([_add("/a.txt", ["x"]), _add("/b.txt", ["x"]), _add("/a.txt", ["y"])])
+        not_upserted = repository.bulk_update_tags([_add("/c.txt", ["x"], upsert=False)])
+        pulled = repository.bulk_update_tags([_pull("/a.txt", ["x", "y"]), _pull("/missing.txt", ["x"])])
+
+        # Then
+        assert added == {"modified": 1, "upserted": 1, "failed": []}
+        assert not_upserted == {"modified": 0, "upserted": 0, "failed": []}
+        assert pulled == {"modified": 1, "upserted": 0, "failed": []}
+        # 태그를 모두 제거해도 항목은 남는다
+        assert repository.find_files(["/a.txt", "/c.txt"]) == {"/a.txt": []}
+
+    def test_returned_lists_are_copies(self, repository):
+        repository.add_tag("/a.txt", "x")
+
+        repository.get_tags_for_file("/a.txt").append("mutated")
+        repository.find_files(["/a.txt"])["/a.txt"].append("mutated")
+
+        assert repository.get_tags_for_file("/a.txt") == ["x"]
+
+    def test_does_not_need_pymongo(self):
+        # pymongo가 없는 환경에서도 메모리/SQLite 저장소와 TagService를 쓸 수 있어야 한다
+        code = ("import sys; import core.services.tag_service, core.repositories.memory_tag_repository, "
+                "core.repositories.sqlite_tag_repository; sys.exit('pymongo' in sys.modules)")
+        assert subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT).returncode == 0
+
+    def test_serves_tag_service(self, repository):
+        service = TagService(repository, EventBus())
+
+        service.add_tags_to_files(["/a.txt", "/b.txt"], ["x"])
+        service.remove_tags_from_files(["/a.txt"], ["x"])
+
+        assert service.get_tags_for_files(["/a.txt", "/b.txt"]) == {"/a.txt": [], "/b.txt": ["x"]}
+        assert service.get_files_by_tags(["x"]) == ["/b.txt"]
+
+
+class TestInMemoryMatchesSqlite:
+
+    def test_random_operations_produce_identical_results(self, tmp_path):
+        # Given: 같은 무작위 연산을 두 저장소에 적용
+        rng = random.Random(1234)
+        memory = InMemoryTagRepository()
+        sqlite = SqliteTagRepository(str(tmp_path / "tags.db"))
+        paths = [f"/f{i}.txt" for i in range(30)]
+        tags = [f"t{i}" for i in range(8)]
+
+        for _ in range(40):
+            operations = []
+            for _ in range(rng.randint(1, 10)):
+                path = rng.choice(paths)
+                chosen = rng.sample(tags, rng.randint(1, 3))
+                if rng.random() < 0.6:
+                    operations.append(_add(path, chosen, upsert=rng.random() < 0.8))
+                else:
+                    operations.append(_pull(path, chosen))
+            # Then: 결과 수와 상태가 항상 같다
+            assert memory.bulk_update_tags(operations) == sqlite.bulk_update_tags(operations)
+
+            path, tag = rng.choice(paths), rng.choice(tags)
+            assert memory.add_tag(path, tag) == sqlite.add_tag(path, tag)
+            path, tag = rng.choice(paths), rng.choice(tags)
+            assert memory.remove_tag(path, tag) == sqlite.remove_tag(path, tag)
+
+        assert memory.find_files(paths) == sqlite.find_files(paths)
+        assert memory.get_tag_counts() == sqlite.get_tag_counts()
+        assert memory.get_all_tags() == sqlite.get_all_tags()
+        assert dict(memory.iter_tagged_files()) == dict(sqlite.iter_tagged_files())
+        assert sorted(memory.get_files_by_tags(tags[:3])) == sorted(sqlite.get_files_by_tags(tags[:3]))
+        for all_of, none_of in [(tags[:2], tags[2:4]), ([], tags[:1]), (tags[5:6], [])]:
+            assert (sorted(memory.find_files_by_tag_filter(all_of, none_of))
+                    == sorted(sqlite.find_files_by_tag_filter(all_of, none_of)))
+        sqlite.close()
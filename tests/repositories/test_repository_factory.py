@@ -0,0 +1,43 @@
+import pytest
+from unittest.mock import MagicMock, Mock
+
+from core.repositories.factory import create_tag_repository, requires_mongodb
+from core.repositories.sqlite_tag_repository import SqliteTagRepository
+from core.repositories.tag_repository import TagRepository
+
+
+def _config(backend, sqlite_path=""):
+    config = Mock()
+    config.get_storage_backend.return_value = backend
+    config.get_sqlite_path.return_value = sqlite_path
+    config.get_tag_collation.return_value = None
+    return config
+
+
+class TestCreateTagRepository:
+
+    def test_creates_sqlite_repository(self, tmp_path):
+        config = _config("sqlite", str(tmp_path / "tags.db"))
+
+        repository = create_tag_repository(config)
+
+        assert isinstance(repository, SqliteTagRepository)
+        assert not requires_mongodb(config)
+        repository.close()
+
+    def test_creates_mongodb_repository_with_given_client(self):
+        config = _config("mongodb")
+
+        repository = create_tag_repository(config, MagicMock())
+
+        assert isinstance(repository, TagRepository)
+        assert requires_mongodb(config)
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError):
+            create_tag_repository(_config("cassandra"))
+
+    def test_creates_memory_repository(self):
+        from core.repositories.memory_tag_repository import InMemoryTagRepository
+
+        assert isinstance(create_tag_repository(_config("memory")), InMemoryTagRepository)
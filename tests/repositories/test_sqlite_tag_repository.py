@@ -0,0 +1,134 @@
+import sqlite3
+
+import pytest
+
+from core.repositories.base import TagUpdate
+from core.repositories.sqlite_tag_repository import SqliteTagRepository
+
+
+@pytest.fixture
+def repository(tmp_path):
+    repo = SqliteTagRepository(str(tmp_path / "tags.db"))
+    yield repo
+    repo.close()
+
+
+def _add_all(path_tags):
+    return [TagUpdate(path, tags, [], True) for path, tags in path_tags.items()]
+
+
+class TestSqliteTagRepository:
+
+    def test_uses_wal_and_covering_indexes(self, repository, tmp_path):
+        # Given
+        conn = sqlite3.connect(str(tmp_path / "tags.db"))
+
+        # Then
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        plan = " ".join(row[-1] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT tag_id, COUNT(*) FROM file_tags GROUP BY tag_id"))
+        assert "COVERING INDEX file_tags_tag" in plan
+        conn.close()
+
+    def test_add_and_remove_single_tag(self, repository):
+        # When / Then
+        assert repository.add_tag("/a.txt", "x") is True
+        assert repository.add_tag("/a.txt", "x") is False  # 이미 있음
+        assert repository.add_tag("/a.txt", "y") is True
+        assert repository.get_tags_for_file("/a.txt") == ["x", "y"]
+        assert repository.remove_tag("/a.txt", "x") is True
+        assert repository.remove_tag("/a.txt", "x") is False
+        assert repository.remove_tag("/missing.txt", "x") is False
+        assert repository.get_tags_for_file("/a.txt") == ["y"]
+        assert repository.get_tags_for_file("/missing.txt") == []
+
+    def test_tags_keep_insertion_order(self, repository):
+        repository.bulk_update_tags(_add_all({"/a.txt": ["z", "a", "m"]}))
+        repository.add_tag("/a.txt", "b")
+
+        assert repository.get_tags_for_file("/a.txt") == ["z", "a", "m", "b"]
+
+    def test_bulk_update_counts_match_mongodb(self, repository):
+        # Given
+        repository.add_tag("/a.txt", "x")
+
+        # When
+        result = repository.bulk_update_tags(_add_all({"/a.txt": ["x"], "/b.txt": ["x"], "/c.txt": ["y"]}),
+                                             ordered=False)
+
+        # Then: /a.txt는 이미 x가 있어 변경 없음, 나머지는 새 항목
+        assert result == {"modified": 0, "upserted": 2, "failed": []}
+
+        # When
+        result = repository.bulk_update_tags([
+            TagUpdate(path, [], ["x"], False)
+            for path in ["/a.txt", "/b.txt", "/c.txt", "/missing.txt"]
+        ])
+
+        # Then
+        assert result == {"modified": 2, "upserted": 0, "failed": []}
+        assert repository.find_files(["/missing.txt"]) == {}
+
+    def test_find_files_includes_entries_without_tags(self, repository):
+        # Given
+        repository.bulk_update_tags(_add_all({"/a.txt": ["x"], "/b.txt": ["y"]}))
+        repository.remove_tag("/b.txt", "y")
+
+        # When
+        found = repository.find_files(["/a.txt", "/b.txt", "/c.txt"])
+
+        # Then
+        assert found == {"/a.txt": ["x"], "/b.txt": []}
+
+    def test_tag_counts_and_all_tags_ignore_unused_tags(self, repository):
+        # Given
+        repository.bulk_update_tags(_add_all({"/a.txt": ["x", "y"], "/b.txt": ["x"], "/c.txt": ["gone"]}))
+        repository.remove_tag("/c.txt", "gone")
+
+        # Then
+        assert repository.get_tag_counts() == {"x": 2, "y": 1}
+        assert repository.get_all_tags() == ["x", "y"]
+
+    def test_get_files_by_tags_matches_any(self, repository):
+        repository.bulk_update_tags(_add_all({"/a.txt": ["x"], "/b.txt": ["y"], "/c.txt": ["x", "y"], "/d.txt": ["z"]}))
+
+        assert sorted(repository.get_files_by_tags(["x", "y"])) == ["/a.txt", "/b.txt", "/c.txt"]
+
+    def test_find_files_by_tag_filter(self, repository):
+        repository.bulk_update_tags(_add_all({"/a.txt": ["x"], "/b.txt": ["x", "y"], "/c.txt": ["x", "y", "z"],
+                                              "/d.txt": ["z"]}))
+
+        assert sorted(repository.find_files_by_tag_filter(["y", "x"], [])) == ["/b.txt", "/c.txt"]
+        assert repository.find_files_by_tag_filter(["x", "y"], ["z"]) == ["/b.txt"]
+        assert repository.find_files_by_tag_filter([], ["x"]) == ["/d.txt"]
+        assert repository.find_files_by_tag_filter(["missing"], []) == []
+
+    def test_iter_tagged_files_in_batches(self, repository):
+        # Given
+        path_tags = {f"/f{i}.txt": [f"t{i % 3}", "all"] for i in range(25)}
+        repository.bulk_update_tags(_add_all(path_tags))
+        repository.bulk_update_tags(_add_all({"/empty.txt": []}))
+
+        # When
+        files = dict(repository.iter_tagged_files(batch_size=4))
+        paths = list(repository.iter_tagged_paths(batch_size=4))
+
+        # Then
+        assert files == path_tags
+        assert sorted(paths) == sorted(path_tags)
+
+    def test_delete_file_entry_removes_tags(self, repository):
+        repository.add_tag("/a.txt", "x")
+
+        assert repository.delete_file_entry("/a.txt") is True
+        assert repository.delete_file_entry("/a.txt") is False
+        assert repository.get_tag_counts() == {}
+
+    def test_bulk_update_handles_more_paths_than_bind_limit(self, repository):
+        path_tags = {f"/many/{i}.txt": ["bulk"] for i in range(1200)}
+
+        result = repository.bulk_update_tags(_add_all(path_tags), ordered=False)
+
+        assert result == {"modified": 0, "upserted": 1200, "failed": []}
+        assert len(repository.find_files(list(path_tags))) == 1200
+        assert repository.get_tag_counts() == {"bulk": 1200}
@@ -0,0 +1,192 @@
+import pytest
+from unittest.mock import MagicMock
+from pymongo import MongoClient, ASCENDING, UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError, OperationFailure
+
+from core.config_manager import config_manager
+from core.repositories.base import TagUpdate
+from core.repositories.tag_repository import TagRepository
+
+TEST_DB_NAME = "filetagger_test_db"
+
+
+@pytest.fixture
+def mock_mongo_client():
+    return MagicMock()
+
+
+def _collection_of(client):
+    return client.get_database.return_value.tagged_files
+
+
+class TestTagRepositoryIndexes:
+
+    def test_creates_unique_file_path_and_tags_indexes(self, mock_mongo_client):
+        # When
+        TagRepository(mock_mongo_client)
+
+        # Then
+        collection = _collection_of(mock_mongo_client)
+        collection.create_index.assert_any_call(
+            [("file_path", ASCENDING)], unique=True, name="file_path_unique"
+        )
+        collection.create_index.assert_any_call([("tags", ASCENDING)], name="tags")
+
+    def test_tags_index_uses_collation(self, mock_mongo_client):
+        collation = {"locale": "ko", "strength": 2}
+
+        repository = TagRepository(mock_mongo_client, tag_collation=collation)
+        repository.get_files_by_tags(["Work"])
+
+        collection = _collection_of(mock_mongo_client)
+        collection.create_index.assert_any_call(
+            [("tags", ASCENDING)], name="tags", collation=collation
+        )
+        # 태그 검색도 같은 collation을 사용해야 인덱스를 탄다
+        assert collection.find.call_args.kwargs["collation"] == collation
+
+    def test_tag_filter_uses_all_and_nin(self, mock_mongo_client):
+        repository = TagRepository(mock_mongo_client)
+        collection = _collection_of(mock_mongo_client)
+        collection.find.return_value = [{"file_path": "/a.txt"}]
+
+        assert repository.find_files_by_tag_filter(["rare", "common"], ["archived"]) == ["/a.txt"]
+        assert collection.find.call_args.args[0] == {"tags": {"$all": ["rare", "common"], "$nin": ["archived"]}}
+
+    def test_falls_back_to_plain_index_when_unique_fails(self, mock_mongo_client):
+        collection = _collection_of(mock_mongo_client)
+        collection.create_index.side_effect = [OperationFailure("duplicate key"), None, None]
+
+        TagRepository(mock_mongo_client)
+
+        collection.create_index.assert_any_call([("file_path", ASCENDING)], name="file_path")
+
+    def test_tag_updates_become_add_to_set_and_pull_all(self, mock_mongo_client):
+        # Given
+        repository = TagRepository(mock_mongo_client)
+        collection = _collection_of(mock_mongo_client)
+        collection.bulk_write.return_value = MagicMock(modified_count=1, upserted_count=1)
+
+        # When
+        result = repository.bulk_update_tags([
+            TagUpdate("/a.txt", ["x", "y"], [], True),
+            TagUpdate("/b.txt", [], ["x"], False),
+        ], ordered=False)
+
+        # Then: UpdateOne은 MongoDB 저장소 안에서만 만든다
+        operations = collection.bulk_write.call_args.args[0]
+        assert operations == [
+            UpdateOne({"file_path": "/a.txt"}, {"$addToSet": {"tags": {"$each": ["x", "y"]}}}, upsert=True),
+            UpdateOne({"file_path": "/b.txt"}, {"$pullAll": {"tags": ["x"]}}, upsert=False),
+        ]
+        assert collection.bulk_write.call_args.kwargs["ordered"] is False
+        assert result == {"modified": 1, "upserted": 1, "failed": []}
+
+    def test_bulk_write_error_reports_failed_indices(self, mock_mongo_client):
+        # Given
+        repository = TagRepository(mock_mongo_client)
+        collection = _collection_of(mock_mongo_client)
+        collection.bulk_write.side_effect = BulkWriteError({
+            "writeErrors": [{"index": 1, "code": 11000, "errmsg": "duplicate key"}],
+            "nModified": 1, "nUpserted": 1,
+        })
+
+        updates = [TagUpdate(f"/{i}.txt", ["x"], [], True) for i in range(3)]
+
+        # When
+        unordered = repository.bulk_update_tags(updates, ordered=False)
+        ordered = repository.bulk_update_tags(updates, ordered=True)
+
+        # Then: 순서 있는 쓰기는 실패한 연산 뒤도 실행되지 않은 것으로 본다
+        assert unordered == {"modified": 1, "upserted": 1, "failed": [1]}
+        assert ordered["failed"] == [1, 2]
+
+
+# --- 실제 MongoDB가 필요한 테스트 ---
+
+def _winning_stages(plan: dict) -> set:
+    """explain() 결과의 winningPlan에서 모든 stage 이름을 수집합니다."""
+    stages = set()
+    if "stage" in plan:
+        stages.add(plan["stage"])
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            stages |= _winning_stages(plan[key])
+    for child in plan.get("inputStages", []):
+        stages |= _winning_stages(child)
+    return stages
+
+
+def _stages_of(cursor) -> set:
+    explain = cursor.explain()
+    return _winning_stages(explain["queryPlanner"]["winningPlan"])
+
+
+@pytest.fixture
+def live_mongo_client():
+    client = MongoClient(config_manager.get_mongodb_uri(), serverSelectionTimeoutMS=500)
+    try:
+        client.admin.command("ping")
+    except PyMongoError:
+        pytest.skip("MongoDB 서버에 연결할 수 없습니다")
+    client.drop_database(TEST_DB_NAME)
+    yield client
+    client.drop_database(TEST_DB_NAME)
+    client.close()
+
+
+@pytest.mark.db
+class TestTagRepositoryQueryPlans:
+
+    @pytest.fixture
+    def repository(self, live_mongo_client):
+        repository = TagRepository(live_mongo_client, db_name=TEST_DB_NAME)
+        for i in range(50):
+            repository.add_tag(f"/data/file_{i}.txt", f"tag_{i % 5}")
+        return repository
+
+    def test_file_path_lookup_uses_index(self, repository):
+        collection = repository._collection
+        stages = _stages_of(collection.find({"file_path": "/data/file_1.txt"}).limit(1))
+        assert "IXSCAN" in stages
+        assert "COLLSCAN" not in stages
+
+    def test_tags_in_query_uses_index(self, repository):
+        collection = repository._collection
+        stages = _stages_of(collection.find({"tags": {"$in": ["tag_1", "tag_2"]}}))
+        assert "IXSCAN" in stages
+        assert "COLLSCAN" not in stages
+
+    def test_file_path_in_query_uses_index(self, repository):
+        collection = repository._collection
+        paths = [f"/data/file_{i}.txt" for i in range(10)]
+        stages = _stages_of(collection.find({"file_path": {"$in": paths}}))
+        assert "IXSCAN" in stages
+        assert "COLLSCAN" not in stages
+
+    def test_duplicate_file_path_rejected(self, repository):
+        with pytest.raises(PyMongoError):
+            repository._collection.insert_one({"file_path": "/data/file_1.txt", "tags": []})
+
+
+class TestTagRepositoryAggregation:
+
+    def test_get_tag_counts_uses_unwind_group_pipeline(self, mock_mongo_client):
+        collection = _collection_of(mock_mongo_client)
+        collection.aggregate.return_value = iter([{"_id": "a", "count": 2}, {"_id": "b", "count": 1}])
+        repository = TagRepository(mock_mongo_client)
+
+        counts = repository.get_tag_counts()
+
+        assert counts == {"a": 2, "b": 1}
+        pipeline = collection.aggregate.call_args.args[0]
+        assert pipeline[0] == {"$unwind": "$tags"}
+        assert pipeline[1]["$group"]["_id"] == "$tags"
+
+    def test_get_all_tags_returns_distinct_sorted_tags(self, mock_mongo_client):
+        collection = _collection_of(mock_mongo_client)
+        collection.aggregate.return_value = iter([{"_id": "a"}, {"_id": "b"}])
+        repository = TagRepository(mock_mongo_client)
+
+        assert repository.get_all_tags() == ["a", "b"]
+        collection.find.assert_not_called()
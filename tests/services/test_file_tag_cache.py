@@ -0,0 +1,89 @@
+from core.services.file_tag_cache import FileTagCache
+
+
+class TestFileTagCache:
+
+    def test_get_returns_copy_and_counts_hits_and_misses(self):
+        # Given
+        cache = FileTagCache()
+        cache.put("/a.txt", ["x"])
+
+        # When
+        tags = cache.get("/a.txt")
+        tags.append("y")
+        missing = cache.get("/b.txt")
+
+        # Then
+        assert cache.get("/a.txt") == ["x"]
+        assert missing is None
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+
+    def test_entry_limit_evicts_least_recently_used(self):
+        # Given
+        cache = FileTagCache(max_entries=2)
+        cache.put("/a.txt", ["x"])
+        cache.put("/b.txt", ["x"])
+
+        # When: a를 사용한 뒤 c를 넣으면 b가 내보내진다
+        cache.get("/a.txt")
+        cache.put("/c.txt", ["x"])
+
+        # Then
+        assert "/a.txt" in cache
+        assert "/b.txt" not in cache
+        assert "/c.txt" in cache
+        assert cache.stats()["evictions"] == 1
+
+    def test_byte_limit_evicts_until_under_budget(self):
+        # Given
+        entry_size = FileTagCache._estimate_size("/a.txt", ["tag"])
+        cache = FileTagCache(max_bytes=entry_size * 2)
+
+        # When
+        for path in ["/a.txt", "/b.txt", "/c.txt"]:
+            cache.put(path, ["tag"])
+
+        # Then
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["bytes"] <= entry_size * 2
+        assert "/a.txt" not in cache
+
+    def test_entry_larger_than_budget_is_not_stored(self):
+        cache = FileTagCache(max_bytes=10)
+
+        cache.put("/a.txt", ["tag"])
+
+        assert len(cache) == 0
+        assert cache.stats()["bytes"] == 0
+
+    def test_replace_and_discard_keep_byte_accounting(self):
+        # Given
+        cache = FileTagCache()
+        cache.put("/a.txt", ["x"])
+
+        # When
+        cache.put("/a.txt", ["x", "y", "z"])
+        replaced_bytes = cache.stats()["bytes"]
+        cache.discard("/a.txt")
+
+        # Then
+        assert replaced_bytes == FileTagCache._estimate_size("/a.txt", ["x", "y", "z"])
+        assert cache.stats()["bytes"] == 0
+        assert len(cache) == 0
+
+    def test_peek_does_not_touch_stats_or_order(self):
+        # Given
+        cache = FileTagCache(max_entries=2)
+        cache.put("/a.txt", ["x"])
+        cache.put("/b.txt", ["x"])
+
+        # When
+        assert cache.peek("/a.txt") == ["x"]
+        cache.put("/c.txt", ["x"])
+
+        # Then
+        assert "/a.txt" not in cache
+        assert cache.stats()["hits"] == 0
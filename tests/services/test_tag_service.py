@@ -2,6 +2,8 @@ import pytest
 from unittest.mock import Mock, patch
 import os
 from core.services.tag_service import TagService
+from core.repositories.base import TagUpdate
+from core.repositories.memory_tag_repository import InMemoryTagRepository
 from core.repositories.tag_repository import TagRepository
 from core.events import EventBus
 from core.path_utils import normalize_path
@@ -63,11 +65,16 @@ class TestTagService:
         # Check if add_tags_to_files was called with the expected files and tags
         # Since add_tags_to_files internally calls bulk_update_tags, we check that
         # the bulk_update_tags was called with operations for these files.
-        # This is a simplified check, a more robust test would inspect the UpdateOne objects.
+        # This is a simplified check, a more robust test would inspect the TagUpdate objects.
         assert mock_tag_repository.bulk_update_tags.called
 
         # Verify events were published
-        assert mock_event_bus.publish_tag_added.call_count == 6 # 3 files * 2 tags
+        # 파일 × 태그마다가 아니라 배치 하나로 발행
+        mock_event_bus.publish_tag_added.assert_not_called()
+        mock_event_bus.publish_tags_changed.assert_called_once()
+        changes = mock_event_bus.publish_tags_changed.call_args[0][0]
+        assert sorted(changes) == sorted(expected_files)
+        assert all(added == tags_to_add and removed == [] for added, removed in changes.values())
 
     def test_add_tags_to_directory_recursive(self, tag_service, mock_tag_repository, mock_event_bus, temp_test_dir):
         # Given
@@ -95,7 +102,8 @@ class TestTagService:
             normalize_path(os.path.join(directory_path, "another_file.doc")),
         ]
         assert mock_tag_repository.bulk_update_tags.called
-        assert mock_event_bus.publish_tag_added.call_count == 5 # 5 files * 1 tag
+        mock_event_bus.publish_tags_changed.assert_called_once()
+        assert sorted(mock_event_bus.publish_tags_changed.call_args[0][0]) == sorted(expected_files)
 
     def test_get_files_in_directory_non_recursive(self, tag_service, temp_test_dir):
         # Given
@@ -283,7 +291,10 @@ class TestTagService:
         assert result["processed"] == 2
         assert result["successful"] == 2
         assert mock_tag_repository.bulk_update_tags.called
-        assert mock_event_bus.publish_tag_added.call_count == 2 # One event per file
+        mock_event_bus.publish_tags_changed.assert_called_once_with({
+            "C:/file1.txt": (["bulk_tag"], []),
+            "C:/file2.jpg": (["bulk_tag"], []),
+        })
 
     def test_remove_tags_from_files_success(self, tag_service, mock_tag_repository, mock_event_bus):
         # Given
@@ -300,4 +311,401 @@ class TestTagService:
         assert result["processed"] == 2
         assert result["successful"] == 2
         assert mock_tag_repository.bulk_update_tags.called
-        assert mock_event_bus.publish_tag_removed.call_count == 2 # One event per file
\ No newline at end of file
+        mock_event_bus.publish_tags_changed.assert_called_once_with({
+            "C:/file1.txt": ([], ["bulk_tag"]),
+            "C:/file2.jpg": ([], ["bulk_tag"]),
+        })
+
+    def test_add_tags_to_files_uses_add_to_set_without_reads(self, tag_service, mock_tag_repository):
+        # Given
+        file_paths = ["C:/file1.txt", "C:/file2.jpg"]
+        mock_tag_repository.bulk_update_tags.return_value = {"modified": 1, "upserted": 1}
+
+        # When
+        tag_service.add_tags_to_files(file_paths, ["a", "b", "a"])
+
+        # Then
+        mock_tag_repository.get_tags_for_file.assert_not_called()
+        operations = mock_tag_repository.bulk_update_tags.call_args.args[0]
+        assert mock_tag_repository.bulk_update_tags.call_args.kwargs["ordered"] is False
+        assert operations == [TagUpdate(normalize_path(p), ["a", "b"], [], True) for p in file_paths]
+
+    def test_remove_tags_from_files_uses_pull_all_without_reads(self, tag_service, mock_tag_repository):
+        # Given
+        file_paths = ["C:/file1.txt"]
+        mock_tag_repository.bulk_update_tags.return_value = {"modified": 1, "upserted": 0}
+
+        # When
+        tag_service.remove_tags_from_files(file_paths, ["a"])
+
+        # Then
+        mock_tag_repository.get_tags_for_file.assert_not_called()
+        operation = mock_tag_repository.bulk_update_tags.call_args.args[0][0]
+        assert operation == TagUpdate(normalize_path("C:/file1.txt"), [], ["a"], False)
+
+    def test_add_tags_to_files_in_chunks_with_progress(self, mock_tag_repository, mock_event_bus):
+        # Given
+        service = TagService(mock_tag_repository, mock_event_bus, bulk_chunk_size=2)
+        file_paths = [f"C:/file{i}.txt" for i in range(5)]
+        mock_tag_repository.bulk_update_tags.return_value = {"modified": 0, "upserted": 2}
+        progress = []
+
+        # When
+        result = service.add_tags_to_files(file_paths, ["chunked"], progress_callback=lambda done, total: progress.append((done, total)))
+
+        # Then
+        chunk_sizes = [len(call.args[0]) for call in mock_tag_repository.bulk_update_tags.call_args_list]
+        assert chunk_sizes == [2, 2, 1]
+        assert progress == [(2, 5), (4, 5), (5, 5)]
+        assert result["successful"] == 6 # 청크별 결과 합산
+
+    def test_failed_writes_are_left_out_of_index_and_events(self, mock_tag_repository, mock_event_bus):
+        # Given: 두 번째 파일의 쓰기만 실패
+        mock_tag_repository.iter_tagged_files.return_value = iter([])
+        service = TagService(mock_tag_repository, mock_event_bus)
+        service.build_tag_index()
+        mock_tag_repository.bulk_update_tags.return_value = {"modified": 0, "upserted": 2, "failed": [1]}
+        file_paths = ["/ok1.txt", "/failed.txt", "/ok2.txt"]
+
+        # When
+        service.add_tags_to_files(file_paths, ["x"])
+
+        # Then
+        mock_event_bus.publish_tags_changed.assert_called_once_with({
+            "/ok1.txt": (["x"], []),
+            "/ok2.txt": (["x"], []),
+        })
+        assert set(service.get_files_by_tags(["x"])) == {"/ok1.txt", "/ok2.txt"}
+
+class TestTagServiceIndex:
+
+    @pytest.fixture
+    def indexed_service(self, tag_service, mock_tag_repository):
+        mock_tag_repository.iter_tagged_files.return_value = iter([
+            (normalize_path("C:/docs/a.txt"), ["work", "draft"]),
+            (normalize_path("C:/docs/b.txt"), ["work"]),
+            (normalize_path("C:/docs/c.txt"), ["home"]),
+        ])
+        tag_service.build_tag_index()
+        return tag_service
+
+    def test_build_tag_index(self, indexed_service, mock_tag_repository):
+        assert indexed_service.is_tag_index_built() is True
+        mock_tag_repository.iter_tagged_files.assert_called_once()
+
+    def test_get_files_by_tags_uses_index(self, indexed_service, mock_tag_repository):
+        files = indexed_service.get_files_by_tags(["work"])
+
+        assert files == sorted([normalize_path("C:/docs/a.txt"), normalize_path("C:/docs/b.txt")])
+        mock_tag_repository.get_files_by_tags.assert_not_called()
+
+    def test_get_tags_for_file_uses_index(self, indexed_service, mock_tag_repository):
+        assert indexed_service.get_tags_for_file("C:/docs/a.txt") == ["work", "draft"]
+        assert indexed_service.get_tags_for_file("C:/docs/untagged.txt") == []
+        mock_tag_repository.get_tags_for_file.assert_not_called()
+
+    def test_add_and_remove_tag_updates_index(self, indexed_service, mock_tag_repository):
+        mock_tag_repository.add_tag.return_value = True
+        mock_tag_repository.remove_tag.return_value = True
+
+        indexed_service.add_tag_to_file(normalize_path("C:/docs/c.txt"), "work")
+        assert normalize_path("C:/docs/c.txt") in indexed_service.get_files_by_tags(["work"])
+
+        indexed_service.remove_tag_from_file(normalize_path("C:/docs/c.txt"), "home")
+        assert indexed_service.get_files_by_tags(["home"]) == []
+        assert "home" not in indexed_service.get_all_tags()
+
+    def test_tag_counts_from_index(self, indexed_service, mock_tag_repository):
+        assert indexed_service.get_tag_counts() == {"draft": 1, "home": 1, "work": 2}
+        mock_tag_repository.get_tag_counts.assert_not_called()
+
+    def test_bulk_operations_update_index(self, indexed_service, mock_tag_repository):
+        mock_tag_repository.bulk_update_tags.return_value = {"modified": 2, "upserted": 0}
+        file_paths = [normalize_path("C:/docs/b.txt"), normalize_path("C:/docs/c.txt")]
+
+        indexed_service.add_tags_to_files(file_paths, ["review"])
+        assert indexed_service.get_files_by_tags(["review"]) == sorted(file_paths)
+
+        indexed_service.remove_tags_from_files(file_paths, ["review"])
+        assert indexed_service.get_files_by_tags(["review"]) == []
+
+    def test_get_tag_counts_is_cached_until_tags_change(self, tag_service, mock_tag_repository):
+        # Given
+        mock_tag_repository.get_tag_counts.return_value = {"a": 3, "b": 1}
+        mock_tag_repository.add_tag.return_value = True
+
+        # When
+        first = tag_service.get_tag_counts()
+        second = tag_service.get_tag_counts()
+
+        # Then
+        assert first == second == {"a": 3, "b": 1}
+        mock_tag_repository.get_tag_counts.assert_called_once()
+
+        tag_service.add_tag_to_file("C:/file.txt", "c")
+        tag_service.get_tag_counts()
+        assert mock_tag_repository.get_tag_counts.call_count == 2
+
+    def test_get_all_tagged_files_from_repository_cursor(self, tag_service, mock_tag_repository):
+        mock_tag_repository.iter_tagged_files.return_value = iter([("C:/a.txt", ["x"]), ("C:/b.txt", ["y"])])
+
+        assert tag_service.get_all_tagged_files() == ["C:/a.txt", "C:/b.txt"]
+
+
+class TestTagServicePartialTags:
+
+    def test_find_tags_by_partial_from_index(self, mock_tag_repository, mock_event_bus):
+        mock_tag_repository.iter_tagged_files.return_value = iter([
+            ("/a.txt", ["Work", "travel"]),
+            ("/b.txt", ["homework"]),
+        ])
+        service = TagService(mock_tag_repository, mock_event_bus)
+        service.build_tag_index()
+
+        # 검색어가 태그에 포함되는 경우 (대소문자 무시)
+        assert service.find_tags_by_partial("WOR") == ["Work", "homework"]
+        # 태그가 검색어에 포함되는 경우
+        assert service.find_tags_by_partial("my travel plans") == ["travel"]
+        mock_tag_repository.get_all_tags.assert_not_called()
+
+    def test_find_tags_by_partial_tracks_tag_changes(self, mock_tag_repository, mock_event_bus):
+        mock_tag_repository.iter_tagged_files.return_value = iter([("/a.txt", ["alpha"])])
+        mock_tag_repository.add_tag.return_value = True
+        mock_tag_repository.remove_tag.return_value = True
+        service = TagService(mock_tag_repository, mock_event_bus)
+        service.build_tag_index()
+
+        service.add_tag_to_file("/b.txt", "alphabet")
+        service.remove_tag_from_file("/a.txt", "alpha")
+
+        assert service.find_tags_by_partial("alph") == ["alphabet"]
+
+    def test_find_tags_by_partial_without_index(self, tag_service, mock_tag_repository):
+        mock_tag_repository.get_all_tags.return_value = ["Work", "home", "travel"]
+
+        assert tag_service.find_tags_by_partial("homework") == ["Work", "home"]
+
+
+class TestTagServiceBatchLookup:
+
+    def test_get_tags_for_files_fetches_misses_in_chunks(self, mock_tag_repository, mock_event_bus):
+        # Given: 캐시에 하나가 있고 나머지는 청크 크기 2로 조회
+        service = TagService(mock_tag_repository, mock_event_bus, bulk_chunk_size=2)
+        mock_tag_repository.get_tags_for_file.return_value = ["cached"]
+        service.get_tags_for_file("/a.txt")
+        mock_tag_repository.find_files.side_effect = lambda paths: {p: ["t"] for p in paths if p != "/c.txt"}
+
+        # When
+        result = service.get_tags_for_files(["/a.txt", "/b.txt", "/c.txt", "/d.txt"])
+
+        # Then
+        assert result == {"/a.txt": ["cached"], "/b.txt": ["t"], "/c.txt": [], "/d.txt": ["t"]}
+        assert [c.args[0] for c in mock_tag_repository.find_files.call_args_list] == [
+            ["/b.txt", "/c.txt"], ["/d.txt"]
+        ]
+        # 조회한 결과는 캐시되어 다시 묻지 않는다
+        mock_tag_repository.find_files.reset_mock()
+        service.get_tags_for_files(["/b.txt", "/c.txt"])
+        mock_tag_repository.find_files.assert_not_called()
+
+    def test_get_tags_for_files_from_index(self, mock_tag_repository, mock_event_bus):
+        mock_tag_repository.iter_tagged_files.return_value = iter([("/a.txt", ["x"])])
+        service = TagService(mock_tag_repository, mock_event_bus)
+        service.build_tag_index()
+
+        assert service.get_tags_for_files(["/a.txt", "/b.txt"]) == {"/a.txt": ["x"], "/b.txt": []}
+        mock_tag_repository.find_files.assert_not_called()
+
+
+class TestTagServiceFileTagCache:
+
+    def test_cache_is_bounded_and_counts_evictions(self, mock_tag_repository, mock_event_bus):
+        # Given: 항목 2개까지만 보관
+        service = TagService(mock_tag_repository, mock_event_bus, file_tag_cache_entries=2)
+        mock_tag_repository.get_tags_for_file.side_effect = lambda path: [os.path.basename(path)]
+
+        # When
+        for path in ["/a.txt", "/b.txt", "/c.txt"]:
+            service.get_tags_for_file(path)
+        service.get_tags_for_file("/c.txt")
+
+        # Then
+        stats = service.get_file_tag_cache_stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 3
+
+    def test_evicted_file_is_fetched_again(self, mock_tag_repository, mock_event_bus):
+        # Given
+        service = TagService(mock_tag_repository, mock_event_bus, file_tag_cache_entries=1)
+        mock_tag_repository.get_tags_for_file.return_value = ["t"]
+        service.get_tags_for_file("/a.txt")
+        service.get_tags_for_file("/b.txt")
+
+        # When
+        service.get_tags_for_file("/a.txt")
+
+        # Then
+        assert mock_tag_repository.get_tags_for_file.call_count == 3
+
+    def test_cached_tags_are_not_shared_with_caller(self, tag_service, mock_tag_repository):
+        mock_tag_repository.get_tags_for_file.return_value = ["t"]
+
+        tags = tag_service.get_tags_for_file("/a.txt")
+        tags.append("mutated")
+
+        assert tag_service.get_tags_for_file("/a.txt") == ["t"]
+
+
+class TestTagServiceUntaggedFilter:
+
+    @pytest.fixture
+    def filtered_service(self, mock_tag_repository, mock_event_bus):
+        mock_tag_repository.iter_tagged_paths.return_value = iter(["/tagged.txt"])
+        service = TagService(mock_tag_repository, mock_event_bus)
+        service.build_tagged_path_filter()
+        return service
+
+    def test_untagged_file_answers_without_repository(self, filtered_service, mock_tag_repository):
+        assert filtered_service.get_tags_for_file("/untagged.txt") == []
+        mock_tag_repository.get_tags_for_file.assert_not_called()
+
+    def test_tagged_file_is_still_fetched(self, filtered_service, mock_tag_repository):
+        mock_tag_repository.get_tags_for_file.return_value = ["x"]
+
+        assert filtered_service.get_tags_for_file("/tagged.txt") == ["x"]
+        mock_tag_repository.get_tags_for_file.assert_called_once_with("/tagged.txt")
+
+    def test_batch_lookup_skips_untagged_files(self, filtered_service, mock_tag_repository):
+        mock_tag_repository.find_files.return_value = {"/tagged.txt": ["x"]}
+
+        result = filtered_service.get_tags_for_files(["/tagged.txt", "/untagged.txt"])
+
+        assert result == {"/tagged.txt": ["x"], "/untagged.txt": []}
+        mock_tag_repository.find_files.assert_called_once_with(["/tagged.txt"])
+
+    def test_adding_tags_updates_filter(self, filtered_service, mock_tag_repository):
+        # Given
+        mock_tag_repository.add_tag.return_value = True
+        mock_tag_repository.bulk_update_tags.return_value = {"modified": 0, "upserted": 2}
+
+        # When
+        filtered_service.add_tag_to_file("/single.txt", "a")
+        filtered_service.add_tags_to_files(["/bulk1.txt", "/bulk2.txt"], ["b"])
+        filtered_service.clear_cache()
+        mock_tag_repository.get_tags_for_file.return_value = ["a"]
+
+        # Then: 새로 태그가 붙은 파일은 다시 데이터베이스에서 확인한다
+        assert filtered_service.get_tags_for_file("/single.txt") == ["a"]
+        mock_tag_repository.get_tags_for_file.assert_called_once_with("/single.txt")
+
+    def test_saturated_filter_is_rebuilt_with_larger_capacity(self, filtered_service, mock_tag_repository):
+        # Given
+        mock_tag_repository.add_tag.return_value = True
+        capacity = filtered_service._tagged_path_filter.capacity
+        new_paths = [f"/new_{i}.txt" for i in range(2 * capacity)]
+        mock_tag_repository.iter_tagged_paths.return_value = iter(["/tagged.txt"] + new_paths)
+
+        # When
+        for file_path in new_paths:
+            filtered_service.add_tag_to_file(file_path, "a")
+
+        # Then: 비우지 않고 저장소에서 다시 구축하므로 태그 없는 파일은 계속 조회 없이 응답한다
+        assert filtered_service._tagged_path_filter.capacity > capacity
+        assert not filtered_service._tagged_path_filter.is_saturated()
+        assert filtered_service.get_tags_for_file("/untagged.txt") == []
+        mock_tag_repository.get_tags_for_file.assert_not_called()
+
+    def test_filter_matches_other_path_spellings(self, mock_event_bus):
+        # Given: 저장소는 정규화한 경로로 저장
+        repository = InMemoryTagRepository()
+        service = TagService(repository, mock_event_bus)
+        service.build_tagged_path_filter()
+        stored_path = normalize_path("/tmp/a.txt")
+
+        # When: 정규화되지 않은 표기로 태그 추가
+        service.add_tags_to_files(["/tmp/x/../a.txt"], ["t"])
+
+        # Then: 정규화된 표기로 물어도 태그가 보인다
+        assert service.get_tags_for_file(stored_path) == ["t"]
+        assert service.get_tags_for_files([stored_path]) == {stored_path: ["t"]}
+
+
+class TestTagServiceCaseInsensitiveTagFiles:
+
+    def test_from_index_merges_case_variants(self, mock_tag_repository, mock_event_bus):
+        # Given
+        mock_tag_repository.iter_tagged_files.return_value = iter([
+            ("/a.txt", ["Work"]), ("/b.txt", ["work"]), ("/c.txt", ["homework"]),
+        ])
+        service = TagService(mock_tag_repository, mock_event_bus)
+        service.build_tag_index()
+
+        # When / Then
+        assert service.get_files_by_tag_ignoring_case("WORK") == {"/a.txt", "/b.txt"}
+        assert service.get_files_by_tag_ignoring_case("missing") == set()
+        mock_tag_repository.get_files_by_tags.assert_not_called()
+
+    def test_without_index_uses_one_repository_query(self, tag_service, mock_tag_repository):
+        # Given
+        mock_tag_repository.get_all_tags.return_value = ["Work", "work", "travel"]
+        mock_tag_repository.get_files_by_tags.return_value = ["/a.txt", "/b.txt"]
+
+        # When
+        result = tag_service.get_files_by_tag_ignoring_case("WORK")
+
+        # Then
+        assert result == {"/a.txt", "/b.txt"}
+        mock_tag_repository.get_files_by_tags.assert_called_once_with(["Work", "work"])
+
+
+class TestTagServiceTagQuery:
+
+    def test_query_from_index(self, mock_tag_repository, mock_event_bus):
+        # Given
+        mock_tag_repository.iter_tagged_files.return_value = iter([
+            ("/a.txt", ["project", "draft"]), ("/b.txt", ["project", "review"]),
+            ("/c.txt", ["project", "archived", "draft"]), ("/d.txt", ["draft"]),
+        ])
+        service = TagService(mock_tag_repository, mock_event_bus)
+        service.build_tag_index()
+
+        # When / Then
+        assert service.find_files_by_tag_query("project AND (draft OR review) NOT archived") == ["/a.txt", "/b.txt"]
+        assert service.get_files_with_all_tags(["draft", "project"]) == ["/a.txt", "/c.txt"]
+        mock_tag_repository.find_files_by_tag_filter.assert_not_called()
+
+    def test_query_without_index_pushes_down_all_and_nin(self, tag_service, mock_tag_repository):
+        # Given
+        mock_tag_repository.get_tag_counts.return_value = {"project": 1000, "draft": 10, "archived": 5}
+        mock_tag_repository.find_files_by_tag_filter.return_value = ["/b.txt", "/a.txt"]
+
+        # When
+        result = tag_service.find_files_by_tag_query("project, draft, *archived")
+
+        # Then: 드문 태그부터 $all, 제외 태그는 $nin으로 한 번에 조회
+        assert result == ["/a.txt", "/b.txt"]
+        mock_tag_repository.find_files_by_tag_filter.assert_called_once_with(["draft", "project"], ["archived"])
+
+    def test_query_without_index_skips_unknown_tag(self, tag_service, mock_tag_repository):
+        mock_tag_repository.tag_collation = None
+        mock_tag_repository.get_tag_counts.return_value = {"project": 3}
+
+        assert tag_service.get_files_with_all_tags(["project", "missing"]) == []
+        mock_tag_repository.find_files_by_tag_filter.assert_not_called()
+
+    def test_query_without_index_respects_case_insensitive_collation(self, tag_service, mock_tag_repository):
+        # Given: 저장소는 대소문자를 구분하지 않는 collation으로 비교
+        mock_tag_repository.tag_collation = {"locale": "ko", "strength": 2}
+        mock_tag_repository.get_tag_counts.return_value = {"Project": 3, "Draft": 2}
+        mock_tag_repository.find_files_by_tag_filter.return_value = ["/a.txt"]
+
+        # When
+        result = tag_service.get_files_with_all_tags(["project", "DRAFT"])
+
+        # Then: 이름의 대소문자가 달라도 없는 태그로 보지 않고 저장소에 묻는다
+        assert result == ["/a.txt"]
+        mock_tag_repository.find_files_by_tag_filter.assert_called_once_with(["DRAFT", "project"], [])
+        assert tag_service.get_files_with_all_tags(["project", "missing"]) == []
+        mock_tag_repository.find_files_by_tag_filter.assert_called_once()
@@ -0,0 +1,87 @@
+import os
+
+from core.services.tagged_path_filter import TaggedPathFilter
+
+
+class TestTaggedPathFilter:
+
+    def test_unbuilt_filter_cannot_rule_out_paths(self):
+        path_filter = TaggedPathFilter()
+
+        assert path_filter.might_contain("/a.txt") is True
+        assert path_filter.is_built is False
+
+    def test_registered_paths_are_never_ruled_out(self):
+        # Given
+        paths = [f"/dir/file_{i}.txt" for i in range(5000)]
+        path_filter = TaggedPathFilter(false_positive_rate=0.01)
+
+        # When
+        count = path_filter.build(paths)
+
+        # Then: 블룸 필터는 거짓 음성이 없다
+        assert count == len(paths)
+        assert all(path_filter.might_contain(path) for path in paths)
+
+    def test_false_positive_rate_is_near_target(self):
+        # Given
+        path_filter = TaggedPathFilter(false_positive_rate=0.01)
+        path_filter.build(f"/tagged/{i}.txt" for i in range(5000))
+
+        # When
+        others = [f"/untagged/{i}.txt" for i in range(10000)]
+        false_positives = sum(path_filter.might_contain(path) for path in others)
+
+        # Then
+        assert false_positives / len(others) < 0.03
+
+    def test_add_registers_new_tagged_path(self):
+        # Given
+        path_filter = TaggedPathFilter()
+        path_filter.build([])
+        assert path_filter.might_contain("/new.txt") is False
+
+        # When
+        path_filter.add("/new.txt")
+
+        # Then
+        assert path_filter.might_contain("/new.txt") is True
+
+    def test_path_spellings_are_normalized(self):
+        # Given: 같은 파일을 다른 표기로 등록
+        path_filter = TaggedPathFilter()
+        path_filter.build([os.path.join("dir", "sub", "..", "a.txt")])
+        path_filter.add("dir/./b.txt")
+
+        # Then: 정규화한 표기로 물어도 놓치지 않는다
+        assert path_filter.might_contain(os.path.join("dir", "a.txt")) is True
+        assert path_filter.might_contain(os.path.join("dir", "b.txt")) is True
+        assert path_filter.add(os.path.normpath("dir/b.txt")) is False
+
+    def test_re_adding_known_path_does_not_count(self):
+        # Given
+        path_filter = TaggedPathFilter()
+        path_filter.build(["/a.txt"])
+
+        # When
+        added = [path_filter.add("/a.txt") for _ in range(path_filter.capacity + 1)]
+
+        # Then: 같은 경로를 계속 태그해도 용량이 차지 않는다
+        assert not any(added)
+        assert len(path_filter) == 1
+        assert not path_filter.is_saturated()
+
+    def test_saturation_and_clear(self):
+        # Given
+        path_filter = TaggedPathFilter()
+        path_filter.build([])
+
+        # When: 오탐으로 이미 있는 것처럼 보이는 경로는 세지 않으므로 넉넉히 추가
+        for i in range(2 * path_filter.capacity):
+            path_filter.add(f"/{i}.txt")
+
+        # Then
+        assert path_filter.is_saturated()
+        path_filter.clear()
+        assert path_filter.is_built is False
+        assert path_filter.might_contain("/anything.txt") is True
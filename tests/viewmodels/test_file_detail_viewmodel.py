@@ -4,7 +4,7 @@ from PyQt5.QtCore import QObject, pyqtSignal
 
 from viewmodels.file_detail_viewmodel import FileDetailViewModel
 from core.services.tag_service import TagService
-from core.events import EventBus, TagAddedEvent, TagRemovedEvent
+from core.events import EventBus, TagsChangedBatch
 
 @pytest.fixture
 def mock_tag_service():
@@ -90,7 +90,7 @@ class TestFileDetailViewModel:
         mock_tag_service.remove_tag_from_file.assert_called_once_with(file_path, tag)
         # Verify show_message signal is emitted
 
-    def test_on_tag_added_event_updates_current_file(self, file_detail_viewmodel, mock_tag_service):
+    def test_tag_added_batch_updates_current_file(self, file_detail_viewmodel, mock_tag_service):
         # Given
         file_path = "C:/test/file.txt"
         mock_tag_service.get_tags_for_file.return_value = ["tag1", "tag2"] # Initial tags
@@ -98,15 +98,15 @@ class TestFileDetailViewModel:
         mock_tag_service.get_tags_for_file.reset_mock() # Reset mock after initial update_for_file
         mock_tag_service.get_tags_for_file.return_value = ["tag1", "tag2", "new_tag"] # Mock updated tags
 
-        event = TagAddedEvent(file_path, "new_tag", 123.45)
+        batch = TagsChangedBatch({file_path: (["new_tag"], [])})
         
         # When
-        file_detail_viewmodel._on_tag_added(event)
+        file_detail_viewmodel._on_tags_changed(batch)
 
         # Then
         mock_tag_service.get_tags_for_file.assert_called_once_with(file_path)
 
-    def test_on_tag_removed_event_updates_current_file(self, file_detail_viewmodel, mock_tag_service):
+    def test_tag_removed_batch_updates_current_file(self, file_detail_viewmodel, mock_tag_service):
         # Given
         file_path = "C:/test/file.txt"
         mock_tag_service.get_tags_for_file.return_value = ["tag1", "tag2", "removed_tag"] # Initial tags
@@ -114,10 +114,24 @@ class TestFileDetailViewModel:
         mock_tag_service.get_tags_for_file.reset_mock() # Reset mock after initial update_for_file
         mock_tag_service.get_tags_for_file.return_value = ["tag1", "tag2"] # Mock updated tags
 
-        event = TagRemovedEvent(file_path, "removed_tag", 123.45)
+        batch = TagsChangedBatch({file_path: ([], ["removed_tag"])})
         
         # When
-        file_detail_viewmodel._on_tag_removed(event)
+        file_detail_viewmodel._on_tags_changed(batch)
+
+        # Then
+        mock_tag_service.get_tags_for_file.assert_called_once_with(file_path)
+
+    def test_tags_changed_batch_updates_current_file_once(self, file_detail_viewmodel, mock_tag_service):
+        # Given
+        file_path = "C:/test/file.txt"
+        mock_tag_service.get_tags_for_file.return_value = ["tag1"]
+        file_detail_viewmodel.update_for_file(file_path)
+        mock_tag_service.get_tags_for_file.reset_mock()
+        batch = TagsChangedBatch({file_path: (["a", "b"], ["tag1"]), "C:/other.txt": (["a"], [])})
+
+        # When
+        file_detail_viewmodel._on_tags_changed(batch)
 
         # Then
         mock_tag_service.get_tags_for_file.assert_called_once_with(file_path)
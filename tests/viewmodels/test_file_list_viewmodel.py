@@ -0,0 +1,222 @@
+import os
+import pytest
+from unittest.mock import Mock
+
+from core.events import EventBus, TagsChangedBatch
+from core.services.tag_service import TagService
+from viewmodels.file_list_viewmodel import FileListViewModel
+from viewmodels.search_viewmodel import SearchViewModel
+
+
+@pytest.fixture
+def mock_tag_service():
+    service = Mock(spec=TagService)
+    service.get_tags_for_files.side_effect = lambda file_paths: {file_path: [] for file_path in file_paths}
+    return service
+
+
+@pytest.fixture
+def mock_event_bus():
+    return Mock(spec=EventBus)
+
+
+@pytest.fixture
+def mock_search_viewmodel():
+    return Mock(spec=SearchViewModel)
+
+
+@pytest.fixture
+def file_list_viewmodel(mock_tag_service, mock_event_bus, mock_search_viewmodel):
+    return FileListViewModel(mock_tag_service, mock_event_bus, mock_search_viewmodel)
+
+
+def _record(viewmodel, events, *signal_names):
+    for name in signal_names:
+        getattr(viewmodel, name).connect(lambda *args, name=name: events.append((name, args)))
+
+
+class TestFileListViewModelSearchStreaming:
+
+    def test_subscribes_to_search_stream(self, file_list_viewmodel, mock_search_viewmodel):
+        mock_search_viewmodel.search_results_started.connect.assert_called_once_with(
+            file_list_viewmodel.begin_search_results
+        )
+        mock_search_viewmodel.search_results_chunk.connect.assert_called_once_with(
+            file_list_viewmodel.append_search_results
+        )
+
+    def test_chunks_are_appended_with_row_ranges(self, file_list_viewmodel):
+        # Given
+        events = []
+        _record(file_list_viewmodel, events, 'files_about_to_be_appended', 'files_appended')
+        file_list_viewmodel.begin_search_results()
+
+        # When
+        file_list_viewmodel.append_search_results(["/b/zeta.txt", "/a/alpha.txt"])
+        file_list_viewmodel.append_search_results(["/c/Beta.txt"])
+
+        # Then
+        assert events == [
+            ('files_about_to_be_appended', (0, 1)),
+            ('files_appended', (["/b/zeta.txt", "/a/alpha.txt"],)),
+            ('files_about_to_be_appended', (2, 2)),
+            ('files_appended', (["/c/Beta.txt"],)),
+        ]
+        assert file_list_viewmodel.is_search_mode()
+        assert file_list_viewmodel.get_current_display_files() == ["/b/zeta.txt", "/a/alpha.txt", "/c/Beta.txt"]
+
+    def test_final_results_reorder_instead_of_reset(self, file_list_viewmodel):
+        # Given
+        events = []
+        file_list_viewmodel.begin_search_results()
+        file_list_viewmodel.append_search_results(["/b/zeta.txt", "/a/alpha.txt", "/c/Beta.txt"])
+        _record(file_list_viewmodel, events, 'files_updated', 'files_about_to_be_reordered', 'files_reordered')
+
+        # When
+        file_list_viewmodel.set_search_results(["/b/zeta.txt", "/a/alpha.txt", "/c/Beta.txt"])
+
+        # Then
+        assert [name for name, _ in events] == ['files_about_to_be_reordered', 'files_reordered']
+        assert file_list_viewmodel.get_current_display_files() == ["/a/alpha.txt", "/c/Beta.txt", "/b/zeta.txt"]
+
+    def test_results_without_stream_reset_list(self, file_list_viewmodel):
+        events = []
+        _record(file_list_viewmodel, events, 'files_updated', 'files_reordered')
+
+        file_list_viewmodel.set_search_results(["/b.txt", "/a.txt"])
+
+        assert events == [('files_updated', (["/a.txt", "/b.txt"],))]
+
+    def test_late_chunk_after_leaving_search_is_ignored(self, file_list_viewmodel, mock_tag_service):
+        events = []
+        mock_tag_service.get_files_in_directory.return_value = ["/dir/a.txt"]
+        file_list_viewmodel.begin_search_results()
+        file_list_viewmodel.set_directory("/dir")
+        _record(file_list_viewmodel, events, 'files_about_to_be_appended')
+
+        file_list_viewmodel.append_search_results(["/late.txt"])
+
+        assert events == []
+        assert file_list_viewmodel.get_current_display_files() == ["/dir/a.txt"]
+
+
+class TestFileListViewModelRowCache:
+
+    def test_directory_listing_prefetches_tags_in_one_call(self, file_list_viewmodel, mock_tag_service):
+        # Given
+        files = ["/dir/b.txt", "/dir/sub/a.txt"]
+        mock_tag_service.get_files_in_directory.return_value = list(files)
+        mock_tag_service.get_tags_for_files.side_effect = lambda file_paths: {"/dir/b.txt": ["x", "y"]}
+
+        # When
+        file_list_viewmodel.set_directory("/dir", recursive=True)
+        rows = [file_list_viewmodel.get_row(i) for i in range(2)]
+
+        # Then: 한 번의 일괄 조회로 행 데이터가 준비되고 파일별 조회는 없다
+        mock_tag_service.get_tags_for_files.assert_called_once()
+        mock_tag_service.get_tags_for_file.assert_not_called()
+        assert rows[0].name == "a.txt"
+        assert rows[0].tags_text == ""
+        assert rows[0].path_text == os.path.join("sub", "a.txt")
+        assert rows[1].tags_text == "x, y"
+        assert rows[1].path_text == "b.txt"
+
+    def test_tag_filter_intersects_tag_posting(self, file_list_viewmodel, mock_tag_service):
+        # Given
+        mock_tag_service.get_files_in_directory.return_value = ["/dir/c.txt", "/dir/a.txt", "/dir/b.txt"]
+        mock_tag_service.get_files_by_tag_ignoring_case.return_value = {"/dir/c.txt", "/dir/b.txt", "/other/x.txt"}
+        file_list_viewmodel.set_directory("/dir")
+        mock_tag_service.get_tags_for_files.reset_mock()
+
+        # When
+        file_list_viewmodel.set_tag_filter(" work ")
+
+        # Then: 파일별 태그 조회 없이 한 번의 집합 조회로 거르고 정렬 순서는 유지
+        mock_tag_service.get_files_by_tag_ignoring_case.assert_called_once_with("work")
+        mock_tag_service.get_tags_for_files.assert_not_called()
+        mock_tag_service.get_tags_for_file.assert_not_called()
+        assert file_list_viewmodel.get_current_display_files() == ["/dir/b.txt", "/dir/c.txt"]
+        assert file_list_viewmodel.get_row_for_path("/dir/c.txt") == 1
+
+    def test_search_rows_are_fetched_by_window(self, file_list_viewmodel, mock_tag_service):
+        # Given
+        file_list_viewmodel.ROW_PREFETCH_WINDOW = 2
+        file_list_viewmodel.set_search_results(["/r/a.txt", "/r/b.txt", "/r/c.txt"])
+
+        # When
+        first = file_list_viewmodel.get_row(0)
+        file_list_viewmodel.get_row(1)
+        file_list_viewmodel.get_row(2)
+
+        # Then
+        assert first.path_text == "/r/a.txt"
+        assert [c.args[0] for c in mock_tag_service.get_tags_for_files.call_args_list] == [
+            ["/r/a.txt", "/r/b.txt"], ["/r/c.txt"]
+        ]
+        assert file_list_viewmodel.get_row(3) is None
+
+
+class TestFileListViewModelTagRowUpdates:
+
+    @pytest.fixture
+    def listed_viewmodel(self, file_list_viewmodel, mock_tag_service):
+        mock_tag_service.get_files_in_directory.return_value = [f"/dir/file_{i}.txt" for i in range(10)]
+        file_list_viewmodel.set_directory("/dir")
+        return file_list_viewmodel
+
+    def test_row_index_follows_display_list(self, listed_viewmodel):
+        assert listed_viewmodel.get_row_for_path("/dir/file_3.txt") == 3
+        assert listed_viewmodel.get_row_for_path("/elsewhere.txt") == -1
+
+    def test_subscribes_to_tag_batches(self, file_list_viewmodel, mock_event_bus):
+        mock_event_bus.tags_changed.connect.assert_called_once_with(file_list_viewmodel._on_tags_changed)
+
+    def test_tag_batch_emits_targeted_row_update(self, listed_viewmodel):
+        events = []
+        _record(listed_viewmodel, events, 'files_updated', 'tag_rows_changed')
+
+        listed_viewmodel._on_tags_changed(TagsChangedBatch({"/dir/file_4.txt": (["new"], [])}))
+
+        # 목록 전체를 다시 알리지 않는다 (모델 리셋 없음)
+        assert events == [('tag_rows_changed', (4, 4))]
+
+    def test_bulk_batch_is_reported_as_one_range(self, listed_viewmodel):
+        ranges = []
+        listed_viewmodel.tag_rows_changed.connect(lambda first, last: ranges.append((first, last)))
+
+        changes = {f"/dir/file_{i}.txt": (["bulk"], []) for i in (7, 2, 5)}
+        changes["/not/listed.txt"] = ([], ["bulk"])
+        listed_viewmodel._on_tags_changed(TagsChangedBatch(changes))
+
+        assert ranges == [(2, 7)]
+
+    def test_batch_for_unlisted_files_emits_nothing(self, listed_viewmodel):
+        ranges = []
+        listed_viewmodel.tag_rows_changed.connect(lambda first, last: ranges.append((first, last)))
+
+        listed_viewmodel._on_tags_changed(TagsChangedBatch({"/not/listed.txt": (["x"], [])}))
+
+        assert ranges == []
+
+    def test_tag_batch_invalidates_row_cache(self, listed_viewmodel, mock_tag_service):
+        assert listed_viewmodel.get_row(1).tags_text == ""
+        mock_tag_service.get_tags_for_files.side_effect = lambda file_paths: {p: ["fresh"] for p in file_paths}
+
+        listed_viewmodel._on_tags_changed(TagsChangedBatch({"/dir/file_1.txt": (["fresh"], [])}))
+
+        assert listed_viewmodel.get_row(1).tags_text == "fresh"
+        assert listed_viewmodel.get_row(2).tags_text == ""
+
+    def test_tag_batch_with_other_path_spelling_invalidates_row_cache(self, listed_viewmodel, mock_tag_service):
+        # Given: 목록은 정규화된 경로, 배치는 다른 표기
+        listed_path = os.path.normpath("/dir/file_1.txt")
+        mock_tag_service.get_files_in_directory.return_value = [listed_path]
+        listed_viewmodel.set_directory("/dir")
+        assert listed_viewmodel.get_row(0).tags_text == ""
+        mock_tag_service.get_tags_for_files.side_effect = lambda file_paths: {p: ["fresh"] for p in file_paths}
+
+        # When
+        listed_viewmodel._on_tags_changed(TagsChangedBatch({"/dir/sub/../file_1.txt": (["fresh"], [])}))
+
+        # Then
+        assert listed_viewmodel.get_row(0).tags_text == "fresh"
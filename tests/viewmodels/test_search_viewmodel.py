@@ -0,0 +1,145 @@
+import logging
+import threading
+import pytest
+from unittest.mock import Mock
+
+from core.search_executor import SearchExecutor
+from core.search_manager import SearchManager
+from core.services.tag_service import TagService
+from core.tag_query import TagQuerySyntaxError
+from viewmodels.search_viewmodel import SearchViewModel
+
+
+@pytest.fixture
+def mock_tag_service():
+    return Mock(spec=TagService)
+
+
+@pytest.fixture
+def mock_search_manager():
+    return Mock(spec=SearchManager)
+
+
+@pytest.fixture
+def search_viewmodel(qtbot, mock_tag_service, mock_search_manager):
+    viewmodel = SearchViewModel(mock_tag_service, mock_search_manager)
+    yield viewmodel
+    viewmodel.cancel_search()
+    viewmodel._search_executor.wait_for_done(2000)
+
+
+class TestSearchViewModel:
+
+    def test_search_runs_off_gui_thread(self, qtbot, search_viewmodel, mock_search_manager):
+        # Given
+        search_threads = []
+
+        def iter_search_results(conditions, cancel_token=None):
+            search_threads.append(threading.current_thread())
+            return ["/a.txt", "/b.txt"]
+
+        mock_search_manager.iter_search_results.side_effect = iter_search_results
+        conditions = {'tags': {'query': 'work'}}
+
+        # When
+        with qtbot.waitSignals(
+            [search_viewmodel.search_completed, search_viewmodel.search_results_ready], timeout=2000
+        ) as blocker:
+            search_viewmodel.perform_search(conditions)
+
+        # Then
+        assert search_threads and search_threads[0] is not threading.main_thread()
+        assert blocker.all_signals_and_args[0].args == (2, "태그: 'work'")
+        assert blocker.all_signals_and_args[1].args == (["/a.txt", "/b.txt"],)
+
+    def test_only_latest_search_emits_results(self, qtbot, search_viewmodel, mock_search_manager):
+        # Given: 첫 검색은 취소될 때까지 대기한다
+        first_started = threading.Event()
+
+        def iter_search_results(conditions, cancel_token=None):
+            if conditions['tags']['query'] == 'slow':
+                first_started.set()
+                while not cancel_token.is_cancelled():
+                    threading.Event().wait(0.01)
+                cancel_token.raise_if_cancelled()
+            return [conditions['tags']['query']]
+
+        mock_search_manager.iter_search_results.side_effect = iter_search_results
+        received = []
+        search_viewmodel.search_results_ready.connect(received.append)
+
+        # When
+        first_generation = search_viewmodel.perform_search({'tags': {'query': 'slow'}})
+        assert first_started.wait(2)
+        with qtbot.waitSignal(search_viewmodel.search_results_ready, timeout=2000):
+            second_generation = search_viewmodel.perform_search({'tags': {'query': 'fast'}})
+        qtbot.wait(50)
+
+        # Then
+        assert second_generation > first_generation
+        assert received == [['fast']]
+
+    def test_clear_search_drops_pending_results(self, qtbot, search_viewmodel, mock_search_manager):
+        release = threading.Event()
+
+        def iter_search_results(conditions, cancel_token=None):
+            release.wait(2)
+            return ["/a.txt"]
+
+        mock_search_manager.iter_search_results.side_effect = iter_search_results
+        received = []
+        search_viewmodel.search_results_ready.connect(received.append)
+
+        search_viewmodel.perform_search({'tags': {'query': 'work'}})
+        with qtbot.waitSignal(search_viewmodel.search_cleared, timeout=1000):
+            search_viewmodel.clear_search()
+        release.set()
+        search_viewmodel._search_executor.wait_for_done(2000)
+        qtbot.wait(50)
+
+        assert received == []
+
+    def test_search_failure_is_reported(self, qtbot, search_viewmodel, mock_search_manager):
+        mock_search_manager.iter_search_results.side_effect = RuntimeError("boom")
+
+        with qtbot.waitSignal(search_viewmodel.search_failed, timeout=2000) as blocker:
+            search_viewmodel.perform_search({'tags': {'query': 'work'}})
+
+        assert blocker.args == ["boom"]
+
+    def test_syntax_error_clears_results_without_traceback(self, qtbot, search_viewmodel, mock_search_manager, caplog):
+        # Given: 입력 중인 검색식
+        mock_search_manager.iter_search_results.side_effect = TagQuerySyntaxError("닫는 괄호가 없습니다")
+        failures = []
+        search_viewmodel.search_failed.connect(failures.append)
+
+        # When
+        with caplog.at_level(logging.INFO, logger="core.search_executor"):
+            with qtbot.waitSignal(search_viewmodel.search_results_ready, timeout=2000) as blocker:
+                search_viewmodel.perform_search({'tags': {'query': '(a'}})
+
+        # Then: 오류를 알리고 이전 결과를 비우며, 추적 정보는 남기지 않는다
+        assert failures == ["닫는 괄호가 없습니다"]
+        assert blocker.args == [[]]
+        assert all(record.exc_info is None for record in caplog.records)
+
+    def test_results_are_streamed_in_chunks(self, qtbot, mock_tag_service, mock_search_manager):
+        # Given: 청크 크기 2
+        executor = SearchExecutor(mock_search_manager, chunk_size=2, chunk_interval=60)
+        viewmodel = SearchViewModel(mock_tag_service, mock_search_manager, executor)
+        mock_search_manager.iter_search_results.side_effect = (
+            lambda conditions, cancel_token=None: iter(["/1", "/2", "/3", "/4", "/5"])
+        )
+        started = []
+        chunks = []
+        viewmodel.search_results_started.connect(lambda: started.append(True))
+        viewmodel.search_results_chunk.connect(chunks.append)
+
+        # When
+        with qtbot.waitSignal(viewmodel.search_results_ready, timeout=2000) as blocker:
+            viewmodel.perform_search({'tags': {'query': 'work'}})
+
+        # Then
+        assert started == [True]
+        assert chunks == [["/1", "/2"], ["/3", "/4"], ["/5"]]
+        assert blocker.args == [["/1", "/2", "/3", "/4", "/5"]]
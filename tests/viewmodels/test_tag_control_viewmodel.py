@@ -4,7 +4,7 @@ from PyQt5.QtCore import QObject, pyqtSignal
 
 from viewmodels.tag_control_viewmodel import TagControlViewModel
 from core.services.tag_service import TagService
-from core.events import EventBus, TagAddedEvent, TagRemovedEvent
+from core.events import EventBus, TagsChangedBatch
 
 @pytest.fixture
 def mock_tag_service():
@@ -124,7 +124,7 @@ class TestTagControlViewModel:
         # Verify show_message signal is emitted
         # EventBus publish_tag_added will be called by tag_service, not directly by viewmodel here
 
-    def test_on_tag_added_event_updates_current_file(self, tag_control_viewmodel, mock_tag_service, mock_event_bus):
+    def test_tag_added_batch_updates_current_file(self, tag_control_viewmodel, mock_tag_service, mock_event_bus):
         # Given
         file_path = "C:/test/file.txt"
         mock_tag_service.get_tags_for_file.return_value = ["tag1", "tag2"] # Initial tags for update_for_target
@@ -132,16 +132,16 @@ class TestTagControlViewModel:
         mock_tag_service.get_tags_for_file.reset_mock() # Reset mock after initial update_for_target
         mock_tag_service.get_tags_for_file.return_value = ["tag1", "tag2", "new_tag"] # Mock updated tags
 
-        event = TagAddedEvent(file_path, "new_tag", 123.45)
+        batch = TagsChangedBatch({file_path: (["new_tag"], [])})
         
         # When
-        tag_control_viewmodel._on_tag_added(event)
+        tag_control_viewmodel._on_tags_changed(batch)
 
         # Then
         mock_tag_service.get_tags_for_file.assert_called_once_with(file_path)
         # Verify tags_updated signal is emitted (assuming update_tags_for_current_target emits it)
 
-    def test_on_tag_removed_event_updates_current_file(self, tag_control_viewmodel, mock_tag_service, mock_event_bus):
+    def test_tag_removed_batch_updates_current_file(self, tag_control_viewmodel, mock_tag_service, mock_event_bus):
         # Given
         file_path = "C:/test/file.txt"
         mock_tag_service.get_tags_for_file.return_value = ["tag1", "tag2", "removed_tag"] # Initial tags for update_for_target
@@ -149,10 +149,36 @@ class TestTagControlViewModel:
         mock_tag_service.get_tags_for_file.reset_mock() # Reset mock after initial update_for_target
         mock_tag_service.get_tags_for_file.return_value = ["tag1", "tag2"] # Mock updated tags
 
-        event = TagRemovedEvent(file_path, "removed_tag", 123.45)
+        batch = TagsChangedBatch({file_path: ([], ["removed_tag"])})
         
         # When
-        tag_control_viewmodel._on_tag_removed(event)
+        tag_control_viewmodel._on_tags_changed(batch)
 
         # Then
         mock_tag_service.get_tags_for_file.assert_called_once_with(file_path)
+
+    def test_tags_changed_batch_refreshes_multi_selection_once(self, tag_control_viewmodel, mock_tag_service):
+        # Given
+        file_paths = ["C:/test/a.txt", "C:/test/b.txt"]
+        mock_tag_service.get_tags_for_file.return_value = ["tag1"]
+        tag_control_viewmodel.update_for_target(file_paths, False)
+        mock_tag_service.get_tags_for_file.reset_mock()
+        batch = TagsChangedBatch({path: (["bulk"], []) for path in file_paths + ["C:/other.txt"]})
+
+        # When
+        tag_control_viewmodel._on_tags_changed(batch)
+
+        # Then: 선택된 파일마다 한 번씩, 배치 전체에 대해 한 번만 갱신
+        assert mock_tag_service.get_tags_for_file.call_count == len(file_paths)
+
+    def test_tags_changed_batch_ignores_unrelated_files(self, tag_control_viewmodel, mock_tag_service):
+        # Given
+        mock_tag_service.get_tags_for_file.return_value = ["tag1"]
+        tag_control_viewmodel.update_for_target("C:/test/file.txt", False)
+        mock_tag_service.get_tags_for_file.reset_mock()
+
+        # When
+        tag_control_viewmodel._on_tags_changed(TagsChangedBatch({"C:/other.txt": (["x"], [])}))
+
+        # Then
+        mock_tag_service.get_tags_for_file.assert_not_called()
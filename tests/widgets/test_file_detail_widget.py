@@ -0,0 +1,150 @@
+from unittest.mock import Mock
+
+import fitz  # type: ignore # PyMuPDF
+import pytest
+from PyQt5.QtCore import QSize
+from PyQt5.QtGui import QColor, QImage
+from PyQt5.QtWidgets import QLabel, QTextBrowser
+
+from viewmodels.file_detail_viewmodel import FileDetailViewModel
+from widgets import preview_handlers
+from widgets.file_detail_widget import FileDetailWidget
+from widgets.preview_handlers import PreviewHandler, TextPreviewHandler, VideoPreviewHandler
+
+
+@pytest.fixture
+def detail_widget(qtbot):
+    widget = FileDetailWidget(Mock(spec=FileDetailViewModel))
+    qtbot.addWidget(widget)
+    widget.show()
+    yield widget
+    widget.clear_preview()
+    widget.preview_loader.wait_for_done(2000)
+
+
+class TestLazyPreviewWidgets:
+
+    def test_startup_builds_no_format_widgets(self, detail_widget):
+        assert detail_widget._preview_handlers == {}
+        assert detail_widget.current_preview_widget is detail_widget.unsupported_label
+
+    def test_only_used_format_is_created(self, qtbot, detail_widget, tmp_path):
+        # Given
+        path = tmp_path / "notes.txt"
+        path.write_text("hello preview", encoding="utf-8")
+
+        # When
+        detail_widget.update_preview(str(path))
+
+        # Then: 텍스트 핸들러만 만들어지고 비디오 플레이어는 만들어지지 않음
+        assert set(detail_widget._preview_handlers) == {TextPreviewHandler}
+        assert VideoPreviewHandler not in detail_widget._preview_handlers
+        browser = detail_widget.current_preview_widget
+        assert isinstance(browser, QTextBrowser)
+        qtbot.waitUntil(lambda: browser.toPlainText() == "hello preview", timeout=2000)
+
+    def test_image_preview_shown(self, qtbot, detail_widget, tmp_path):
+        path = tmp_path / "photo.png"
+        image = QImage(50, 40, QImage.Format_RGB32)
+        image.fill(QColor("red"))
+        assert image.save(str(path))
+
+        detail_widget.update_preview(str(path))
+
+        label = detail_widget.current_preview_widget
+        assert isinstance(label, QLabel)
+        qtbot.waitUntil(lambda: label.pixmap() is not None and not label.pixmap().isNull(), timeout=2000)
+
+    def test_first_preview_requested_at_laid_out_size(self, qtbot, tmp_path):
+        # Given: 아직 화면에 나오지 않은(레이아웃 전) 위젯
+        widget = FileDetailWidget(Mock(spec=FileDetailViewModel))
+        qtbot.addWidget(widget)
+        widget.resize(900, 800)
+        path = tmp_path / "photo.png"
+        image = QImage(2000, 1500, QImage.Format_RGB32)
+        image.fill(QColor("red"))
+        assert image.save(str(path))
+        requested = []
+        original_request = widget.preview_loader.request
+        widget.preview_loader.request = lambda kind, file_path, size: requested.append(QSize(size)) or original_request(kind, file_path, size)
+
+        # When: 처음 미리보기를 만든 직후 화면에 표시됨
+        widget.update_preview(str(path))
+        widget.show()
+        qtbot.waitUntil(lambda: len(requested) == 1, timeout=2000)
+
+        # Then: 기본/최소 크기가 아니라 레이아웃이 정한 라벨 크기로 요청
+        label = widget.current_preview_widget
+        assert requested == [label.size()]
+        assert label.width() == 900
+        widget.clear_preview()
+        widget.preview_loader.wait_for_done(2000)
+
+    def test_pdf_pages_rendered_lazily(self, qtbot, detail_widget, tmp_path):
+        # Given
+        path = tmp_path / "manual.pdf"
+        doc = fitz.open()
+        for _ in range(30):
+            doc.new_page(width=200, height=300)
+        doc.save(str(path))
+        doc.close()
+
+        # When
+        detail_widget.update_preview(str(path))
+
+        # Then: 모든 페이지 자리는 만들어지지만 렌더링은 보이는 근처 페이지만
+        handler = detail_widget._preview_handlers[preview_handlers.PdfPreviewHandler]
+        qtbot.waitUntil(lambda: len(handler.pdf_page_labels) == 30, timeout=5000)
+        labels = handler.pdf_page_labels
+        qtbot.waitUntil(lambda: labels[1].pixmap() is not None and not labels[1].pixmap().isNull(), timeout=5000)
+        qtbot.waitUntil(lambda: labels[0].pixmap() is not None and not labels[0].pixmap().isNull(), timeout=5000)
+        assert labels[-1].pixmap() is None or labels[-1].pixmap().isNull()
+
+    def test_unknown_extension_is_unsupported(self, detail_widget, tmp_path):
+        path = tmp_path / "archive.bin"
+        path.write_bytes(b"\x00")
+
+        detail_widget.update_preview(str(path))
+
+        assert detail_widget.current_preview_widget is detail_widget.unsupported_label
+        assert detail_widget._preview_handlers == {}
+
+
+class TestPreviewHandlerRegistry:
+
+    def test_registered_handler_used_without_editing_widget(self, detail_widget, tmp_path, monkeypatch):
+        # Given: 새 형식 핸들러를 등록
+        shown = []
+        cleared = []
+
+        class CustomHandler(PreviewHandler):
+            extensions = (".custom",)
+
+            def create_widget(self):
+                return QLabel("custom")
+
+            def show(self, file_path):
+                shown.append(file_path)
+
+            def clear(self):
+                cleared.append(True)
+
+        monkeypatch.setattr(preview_handlers, "PREVIEW_HANDLERS", dict(preview_handlers.PREVIEW_HANDLERS))
+        preview_handlers.register_preview_handler(CustomHandler)
+        path = tmp_path / "data.CUSTOM"
+        path.write_text("x", encoding="utf-8")
+
+        # When
+        detail_widget.update_preview(str(path))
+        detail_widget.clear_preview()
+
+        # Then
+        assert shown == [str(path)]
+        assert cleared == [True]
+
+    def test_builtin_extensions_registered(self):
+        assert preview_handlers.preview_handler_class_for("a.JPG") is preview_handlers.ImagePreviewHandler
+        assert preview_handlers.preview_handler_class_for("a.pdf") is preview_handlers.PdfPreviewHandler
+        assert preview_handlers.preview_handler_class_for("a.md") is TextPreviewHandler
+        assert preview_handlers.preview_handler_class_for("a.mkv") is VideoPreviewHandler
+        assert preview_handlers.preview_handler_class_for("a.xyz") is None
@@ -3,7 +3,7 @@ from typing import List
 import logging
 
 from core.services.tag_service import TagService
-from core.events import EventBus, TagAddedEvent, TagRemovedEvent
+from core.events import EventBus, TagsChangedBatch
 
 logger = logging.getLogger(__name__)
 
@@ -18,18 +18,12 @@ class FileDetailViewModel(QObject):
         self._event_bus = event_bus
         self._current_file_path: str = None
 
-        # EventBus 구독
-        self._event_bus.tag_removed.connect(self._on_tag_removed)
-        self._event_bus.tag_added.connect(self._on_tag_added)
+        # EventBus 구독 (일괄 작업의 변경은 배치 하나로 받아 한 번만 갱신)
+        self._event_bus.tags_changed.connect(self._on_tags_changed)
 
-    def _on_tag_added(self, event: TagAddedEvent):
-        # 현재 파일과 관련된 태그 변경 시 UI 업데이트
-        if event.file_path == self._current_file_path:
-            self.update_for_file(self._current_file_path)
-
-    def _on_tag_removed(self, event: TagRemovedEvent):
-        # 현재 파일과 관련된 태그 변경 시 UI 업데이트
-        if event.file_path == self._current_file_path:
+    def _on_tags_changed(self, batch: TagsChangedBatch):
+        # 현재 파일이 배치에 포함되어 있으면 한 번만 UI 업데이트
+        if self._current_file_path in batch.changes:
             self.update_for_file(self._current_file_path)
 
     def update_for_file(self, file_path: str):
@@ -1,15 +1,36 @@
 from PyQt5.QtCore import QObject, pyqtSignal
-from typing import List
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 import os
 
 from core.services.tag_service import TagService
-from core.events import EventBus, TagAddedEvent, TagRemovedEvent
+from core.events import EventBus, TagsChangedBatch
 from core.path_utils import normalize_path
 
+@dataclass
+class FileRow:
+    """테이블 한 행에 표시할 값 (페인트 시 계산하지 않도록 미리 만들어 둠)"""
+    file_path: str
+    name: str
+    tags: List[str]
+    tags_text: str
+    path_text: str
+
+
 class FileListViewModel(QObject):
+    # 캐시에 없는 행을 요청받으면 그 행부터 이만큼의 행 태그를 한 번에 가져온다
+    ROW_PREFETCH_WINDOW = 200
+
     # UI 업데이트를 위한 시그널
     files_updated = pyqtSignal(list) # file_paths
     show_message = pyqtSignal(str, int) # message, duration
+    # 검색 결과 스트리밍용 시그널 (모델이 beginInsertRows/layoutAboutToBeChanged를 먼저 호출할 수 있도록 변경 전후로 발생)
+    files_about_to_be_appended = pyqtSignal(int, int) # first_row, last_row
+    files_appended = pyqtSignal(list) # appended file_paths
+    files_about_to_be_reordered = pyqtSignal()
+    files_reordered = pyqtSignal()
+    # 태그 컬럼만 다시 그려야 하는 행 범위 (목록 자체는 그대로)
+    tag_rows_changed = pyqtSignal(int, int) # first_row, last_row
 
     def __init__(self, tag_service: TagService, event_bus: EventBus, search_viewmodel: 'SearchViewModel'):
         super().__init__()
@@ -23,56 +44,158 @@ class FileListViewModel(QObject):
         self._current_directory: str = ""
         self._tag_filter: str = "" # 현재 적용된 태그 필터
         self._is_search_mode: bool = False # 검색 모드 여부
+        self._is_streaming_search: bool = False # 검색 결과를 청크로 받는 중인지 여부
+        self._row_cache: Dict[str, FileRow] = {} # 파일 경로 → 표시용 행 데이터
+        self._row_by_path: Dict[str, int] = {} # 파일 경로 → 현재 표시 목록의 행 번호
 
-        # EventBus 구독
-        self._event_bus.tag_added.connect(self._on_tag_changed)
-        self._event_bus.tag_removed.connect(self._on_tag_changed)
+        # EventBus 구독 (일괄 작업의 변경은 EventBus가 한 번의 배치로 모아 보낸다)
+        self._event_bus.tags_changed.connect(self._on_tags_changed)
 
         # SearchViewModel 구독
+        self._search_viewmodel.search_results_started.connect(self.begin_search_results)
+        self._search_viewmodel.search_results_chunk.connect(self.append_search_results)
         self._search_viewmodel.search_results_ready.connect(self.set_search_results)
 
-    def _on_tag_changed(self, event):
-        # 태그가 변경된 파일이 현재 목록에 있는지 확인
-        if event.file_path in self.get_current_display_files():
-            # 파일 목록을 다시 로드하는 대신, files_updated 시그널을 보내
-            # 모델이 특정 행의 태그를 다시 그리도록 유도
-            self.files_updated.emit(self.get_current_display_files())
+    def _on_tags_changed(self, batch: TagsChangedBatch):
+        rows = []
+        current_files = self.get_current_display_files()
+        for file_path in batch.changes:
+            # 배치의 경로 표기가 목록과 다를 수 있으므로 정규화한 경로로도 버린다
+            self._row_cache.pop(file_path, None)
+            self._row_cache.pop(normalize_path(file_path), None)
+            # 태그가 변경된 파일이 현재 목록에 있는지 확인
+            row = self.get_row_for_path(file_path)
+            if row >= 0:
+                # 행 캐시는 목록에 표시된 경로를 키로 씀
+                self._row_cache.pop(current_files[row], None)
+                rows.append(row)
+        # 배치 하나를 한 번의 범위 갱신으로 알린다
+        if rows:
+            self.tag_rows_changed.emit(min(rows), max(rows))
 
     def refresh_tags_for_current_files(self):
-        """현재 표시된 모든 파일의 태그 정보를 새로고침합니다."""
-        self.files_updated.emit(self.get_current_display_files())
+        """현재 표시된 모든 파일의 태그 정보를 새로고침합니다.
+        파일 목록 자체는 변경되지 않고, 태그 컬럼만 업데이트됩니다."""
+        self._row_cache.clear()
+        current_files = self.get_current_display_files()
+        if current_files:
+            self.tag_rows_changed.emit(0, len(current_files) - 1)
+
+    def get_row_for_path(self, file_path: str) -> int:
+        """현재 표시 목록에서 파일의 행 번호를 반환합니다. 없으면 -1"""
+        row = self._row_by_path.get(file_path)
+        if row is None:
+            row = self._row_by_path.get(normalize_path(file_path))
+        return -1 if row is None else row
+
+    def _rebuild_row_index(self):
+        self._row_by_path = {file_path: row for row, file_path in enumerate(self.get_current_display_files())}
 
     def set_directory(self, directory_path: str, recursive: bool = False, file_extensions: List[str] = None):
         self._current_directory = directory_path
         self._recursive = recursive
         self._file_extensions = file_extensions
         self._is_search_mode = False
+        self._is_streaming_search = False
         self._tag_filter = ""
+        self._row_cache.clear()
 
         self._all_files = self._tag_service.get_files_in_directory(directory_path, recursive, file_extensions)
         self._all_files.sort(key=lambda x: os.path.basename(x).lower())
+        # 행 데이터는 get_row()가 보이는 범위부터 ROW_PREFETCH_WINDOW개씩 가져온다
         self._apply_filter()
+        self._rebuild_row_index()
         self.files_updated.emit(self._filtered_files)
 
     def set_tag_filter(self, tag_text: str):
         self._tag_filter = tag_text.strip()
         self._apply_filter()
+        self._rebuild_row_index()
         self.files_updated.emit(self._filtered_files)
 
     def set_search_results(self, file_paths: List[str]):
+        # 청크로 이미 모두 받은 결과라면 목록을 다시 만들지 않고 정렬만 한다
+        if self._is_streaming_search and self._is_search_mode and len(file_paths) == len(self._search_results):
+            self._is_streaming_search = False
+            self.files_about_to_be_reordered.emit()
+            self._search_results.sort(key=lambda x: os.path.basename(x).lower())
+            self._rebuild_row_index()
+            self.files_reordered.emit()
+            return
+
+        self._is_streaming_search = False
+        self._row_cache.clear()
         self._search_results = sorted(file_paths, key=lambda x: os.path.basename(x).lower())
         self._is_search_mode = True
+        self._rebuild_row_index()
+        self.files_updated.emit(self._search_results)
+
+    def begin_search_results(self):
+        """새 검색 결과 스트리밍을 시작합니다. 목록을 비우고 검색 모드로 전환합니다."""
+        self._search_results = []
+        self._is_search_mode = True
+        self._is_streaming_search = True
+        self._row_cache.clear()
+        self._row_by_path = {}
         self.files_updated.emit(self._search_results)
 
+    def append_search_results(self, file_paths: List[str]):
+        """스트리밍 중인 검색 결과 청크를 도착 순서대로 목록 끝에 추가합니다.
+        최종 정렬은 set_search_results()에서 한 번만 수행합니다."""
+        if not (self._is_search_mode and self._is_streaming_search) or not file_paths:
+            return
+        first = len(self._search_results)
+        self.files_about_to_be_appended.emit(first, first + len(file_paths) - 1)
+        self._search_results.extend(file_paths)
+        for row, file_path in enumerate(file_paths, start=first):
+            self._row_by_path[file_path] = row
+        self.files_appended.emit(list(file_paths))
+
     def _apply_filter(self):
         if not self._tag_filter:
             self._filtered_files = list(self._all_files)
         else:
-            self._filtered_files = []
-            for file_path in self._all_files:
-                tags = self._tag_service.get_tags_for_file(file_path)
-                if self._tag_filter.lower() in [tag.lower() for tag in tags]:
-                    self._filtered_files.append(file_path)
+            # 파일마다 태그를 확인하지 않고, 태그의 파일 집합과 디렉토리 목록의 교집합으로 거른다 (정렬 순서 유지)
+            tagged_files = self._tag_service.get_files_by_tag_ignoring_case(self._tag_filter)
+            self._filtered_files = [file_path for file_path in self._all_files if file_path in tagged_files]
+
+    def _prefetch_rows(self, file_paths: List[str]):
+        """행 캐시에 없는 파일들의 태그를 한 번에 조회하여 표시용 행 데이터를 만듭니다."""
+        missing = [file_path for file_path in file_paths if file_path not in self._row_cache]
+        if not missing:
+            return
+        tags_by_file = self._tag_service.get_tags_for_files(missing)
+        for file_path in missing:
+            self._row_cache[file_path] = self._make_row(file_path, tags_by_file.get(file_path, []))
+
+    def _make_row(self, file_path: str, tags: List[str]) -> FileRow:
+        if self._is_search_mode or not self._current_directory:
+            path_text = file_path
+        else:
+            try:
+                path_text = os.path.relpath(file_path, self._current_directory)
+            except ValueError:
+                path_text = file_path
+        return FileRow(
+            file_path=file_path,
+            name=os.path.basename(file_path),
+            tags=list(tags),
+            tags_text=", ".join(tags) if tags else "",
+            path_text=path_text,
+        )
+
+    def get_row(self, index: int) -> Optional[FileRow]:
+        """표시 중인 index번째 행의 데이터를 반환합니다.
+        캐시에 없으면 그 행부터 ROW_PREFETCH_WINDOW개 행을 한 번에 가져옵니다."""
+        current_files = self.get_current_display_files()
+        if index < 0 or index >= len(current_files):
+            return None
+        file_path = current_files[index]
+        row = self._row_cache.get(file_path)
+        if row is None:
+            self._prefetch_rows(current_files[index:index + self.ROW_PREFETCH_WINDOW])
+            row = self._row_cache[file_path]
+        return row
 
     def get_file_path_at_index(self, index: int) -> str:
         if self._is_search_mode:
@@ -1,28 +1,59 @@
 from PyQt5.QtCore import QObject, pyqtSignal
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from core.services.tag_service import TagService
 from core.search_manager import SearchManager
+from core.search_executor import SearchExecutor
 
 class SearchViewModel(QObject):
     # UI 업데이트를 위한 시그널
     search_completed = pyqtSignal(int, str) # count, summary
     search_requested = pyqtSignal(dict) # search_conditions
     search_results_ready = pyqtSignal(list) # file_paths
+    search_results_started = pyqtSignal() # 새 검색의 첫 결과가 도착하기 직전
+    search_results_chunk = pyqtSignal(list) # file_paths (스트리밍 중간 결과)
     search_cleared = pyqtSignal() # no args
+    search_failed = pyqtSignal(str) # error message
 
-    def __init__(self, tag_service: TagService, search_manager: SearchManager):
+    def __init__(self, tag_service: TagService, search_manager: SearchManager,
+                 search_executor: Optional[SearchExecutor] = None):
         super().__init__()
         self._tag_service = tag_service
         self._search_manager = search_manager
+        self._streaming_generation = None
+        # 검색은 작업 스레드에서 실행하고, 최신 요청의 결과만 받는다
+        self._search_executor = search_executor or SearchExecutor(search_manager, parent=self)
+        self._search_executor.results_chunk.connect(self._on_search_results_chunk)
+        self._search_executor.results_ready.connect(self._on_search_results)
+        self._search_executor.search_failed.connect(self._on_search_failed)
 
-    def perform_search(self, search_conditions: Dict):
-        search_results = self._search_manager.search_files(search_conditions)
+    def perform_search(self, search_conditions: Dict) -> int:
+        """검색을 비동기로 시작하고 세대 번호를 반환합니다.
+        진행 중인 이전 검색은 취소되며, 결과 시그널은 가장 최근 검색에 대해서만 발생합니다."""
+        self.search_requested.emit(search_conditions)
+        return self._search_executor.submit(search_conditions)
+
+    def cancel_search(self):
+        self._search_executor.cancel()
+
+    def _on_search_results_chunk(self, generation: int, file_paths: list):
+        if self._streaming_generation != generation:
+            self._streaming_generation = generation
+            self.search_results_started.emit()
+        self.search_results_chunk.emit(file_paths)
+
+    def _on_search_results(self, generation: int, search_conditions: Dict, search_results: list):
         summary = self._generate_summary(search_conditions)
         self.search_completed.emit(len(search_results), summary)
         self.search_results_ready.emit(search_results)
 
+    def _on_search_failed(self, generation: int, message: str):
+        self.search_failed.emit(message)
+        # 이전 검색 결과가 실패한 검색의 결과처럼 남지 않도록 비운다
+        self.search_results_ready.emit([])
+
     def clear_search(self):
+        self.cancel_search()
         self.search_cleared.emit()
 
     def update_search_results(self, count: int, summary: str):
@@ -2,7 +2,7 @@ from PyQt5.QtCore import QObject, pyqtSignal
 from typing import List
 
 from core.services.tag_service import TagService
-from core.events import EventBus, TagAddedEvent, TagRemovedEvent
+from core.events import EventBus, TagsChangedBatch
 
 class TagControlViewModel(QObject):
     # UI 업데이트를 위한 시그널
@@ -23,18 +23,15 @@ class TagControlViewModel(QObject):
         self._individual_tags: List[str] = []
         self._batch_tags: List[str] = []
 
-        # EventBus 구독
-        self._event_bus.tag_added.connect(self._on_tag_added)
-        self._event_bus.tag_removed.connect(self._on_tag_removed)
+        # EventBus 구독 (일괄 작업의 변경은 배치 하나로 받아 한 번만 갱신)
+        self._event_bus.tags_changed.connect(self._on_tags_changed)
 
-    def _on_tag_added(self, event: TagAddedEvent):
-        # 현재 대상 파일/디렉토리와 관련된 태그 변경 시 UI 업데이트
-        if event.file_path == self._current_target_path or event.file_path in self._current_target_paths:
-            self.update_tags_for_current_target()
-
-    def _on_tag_removed(self, event: TagRemovedEvent):
-        # 현재 대상 파일/디렉토리와 관련된 태그 변경 시 UI 업데이트
-        if event.file_path == self._current_target_path or event.file_path in self._current_target_paths:
+    def _on_tags_changed(self, batch: TagsChangedBatch):
+        # 현재 대상 중 하나라도 배치에 포함되어 있으면 한 번만 UI 업데이트
+        targets = set(self._current_target_paths)
+        if self._current_target_path:
+            targets.add(self._current_target_path)
+        if not targets.isdisjoint(batch.changes):
             self.update_tags_for_current_target()
 
     def update_for_target(self, target, is_dir):
@@ -14,7 +14,44 @@ class FileTableModel(QAbstractTableModel):
     def __init__(self, file_list_viewmodel: FileListViewModel, parent=None):
         super().__init__(parent)
         self.viewmodel = file_list_viewmodel
+        self._persistent_paths = []
         
+        # 검색 결과 스트리밍: 모델 리셋 없이 행 추가/정렬
+        self.viewmodel.files_about_to_be_appended.connect(self._on_files_about_to_be_appended)
+        self.viewmodel.files_appended.connect(self._on_files_appended)
+        self.viewmodel.files_about_to_be_reordered.connect(self._on_files_about_to_be_reordered)
+        self.viewmodel.files_reordered.connect(self._on_files_reordered)
+        self.viewmodel.tag_rows_changed.connect(self._on_tag_rows_changed)
+        
+    def _on_files_about_to_be_appended(self, first, last):
+        self.beginInsertRows(QModelIndex(), first, last)
+
+    def _on_files_appended(self, file_paths):
+        self.endInsertRows()
+
+    def _on_files_about_to_be_reordered(self):
+        self.layoutAboutToBeChanged.emit()
+        # 선택/현재 항목이 정렬 후에도 같은 파일을 가리키도록 경로를 기억
+        self._persistent_paths = [
+            (index, self.viewmodel.get_file_path_at_index(index.row()))
+            for index in self.persistentIndexList()
+        ]
+
+    def _on_files_reordered(self):
+        old_indexes = []
+        new_indexes = []
+        for index, file_path in self._persistent_paths:
+            row = self.viewmodel.get_row_for_path(file_path)
+            old_indexes.append(index)
+            new_indexes.append(self.index(row, index.column()) if row >= 0 else QModelIndex())
+        self._persistent_paths = []
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def _on_tag_rows_changed(self, first, last):
+        # 태그 컬럼 (인덱스 1)에 대해서만 dataChanged 시그널 발생
+        self.dataChanged.emit(self.index(first, 1), self.index(last, 1), [Qt.DisplayRole])
+
     def set_directory(self, directory_path, recursive=False, file_extensions=None):
         self.beginResetModel()
         self.viewmodel.set_directory(directory_path, recursive, file_extensions)
@@ -31,6 +68,8 @@ class FileTableModel(QAbstractTableModel):
         self.endResetModel()
 
     def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0  # 테이블 모델이므로 하위 행 없음
         return len(self.viewmodel.get_current_display_files())
         
     def columnCount(self, parent=QModelIndex()):
@@ -40,33 +79,25 @@ class FileTableModel(QAbstractTableModel):
         if not index.isValid():
             return QVariant()
             
-        current_files = self.viewmodel.get_current_display_files()
-        if index.row() >= len(current_files):
+        # 표시 문자열은 ViewModel의 행 캐시에서 가져온다 (태그는 창 단위로 일괄 조회됨)
+        # 목록이 바뀌는 중에 뷰가 옛 행 번호로 물을 수 있음. 그 밖의 오류는 숨기지 않는다
+        try:
+            row = self.viewmodel.get_row(index.row())
+        except (IndexError, KeyError):
+            return QVariant()
+        if row is None:
             return QVariant()
-        
-        file_path = current_files[index.row()]
         
         if role == Qt.DisplayRole:
             if index.column() == 0:  # 파일명
-                return os.path.basename(file_path)
+                return row.name
             elif index.column() == 1:  # 태그
-                try:
-                    tags = self.viewmodel.get_tags_for_file(file_path)
-                    return ", ".join(tags) if tags else ""
-                except Exception:
-                    return ""
+                return row.tags_text
             elif index.column() == 2:  # 경로
-                if self.viewmodel.is_search_mode():
-                    return file_path
-                elif self.viewmodel.get_current_directory():
-                    try:
-                        return os.path.relpath(file_path, self.viewmodel.get_current_directory())
-                    except ValueError:
-                        return file_path
-                return file_path
+                return row.path_text
                     
         elif role == Qt.UserRole:  # 전체 파일 경로 반환
-            return file_path
+            return row.file_path
             
         return QVariant()
         
@@ -85,15 +116,8 @@ class FileTableModel(QAbstractTableModel):
         """현재 표시된 모든 파일의 태그 정보를 새로고침합니다.
         파일 목록 자체는 변경되지 않고, 태그 컬럼만 업데이트됩니다.
         """
-        current_display_files = self.viewmodel.get_current_display_files()
-        
-        if not current_display_files:
-            return
-
-        # 태그 컬럼 (인덱스 1)에 대해서만 dataChanged 시그널 발생
-        top_left = self.index(0, 1)
-        bottom_right = self.index(len(current_display_files) - 1, 1)
-        self.dataChanged.emit(top_left, bottom_right)
+        # ViewModel이 행 캐시를 비우고 tag_rows_changed를 보내면 _on_tag_rows_changed에서 갱신
+        self.viewmodel.refresh_tags_for_current_files()
 
 
 class FileListWidget(QWidget):
@@ -214,14 +238,27 @@ class FileListWidget(QWidget):
         """모델의 태그 정보를 새로고침하도록 요청합니다."""
         self.model.refresh_tags_for_current_files()
 
+    def visible_row_range(self):
+        """화면에 보이는 첫 행과 마지막 행 (행이 없으면 (0, -1))"""
+        row_count = self.model.rowCount()
+        if row_count == 0:
+            return 0, -1
+        first = self.list_view.rowAt(0)
+        last = self.list_view.rowAt(self.list_view.viewport().height() - 1)
+        first = first if first >= 0 else 0
+        last = last if last >= 0 else row_count - 1
+        return first, last
+
+    def current_row(self):
+        """현재 행 (없으면 -1)"""
+        return self.list_view.currentIndex().row()
+
     def index_from_path(self, file_path):
         """주어진 파일 경로에 해당하는 QModelIndex를 반환합니다."""
-        current_files = self.viewmodel.get_current_display_files()
-        try:
-            row = current_files.index(file_path)
-            return self.model.index(row, 0) # 첫 번째 컬럼의 인덱스 반환
-        except ValueError:
+        row = self.viewmodel.get_row_for_path(file_path)
+        if row < 0:
             return QModelIndex() # 파일을 찾지 못하면 유효하지 않은 인덱스 반환
+        return self.model.index(row, 0) # 첫 번째 컬럼의 인덱스 반환
 
     def _on_selection_changed(self, selected, deselected):
         selected_paths = self.get_selected_file_paths()
@@ -0,0 +1,353 @@
+"""
+미리보기 핸들러
+
+파일 형식마다 미리보기 위젯을 만들고 파일을 표시하는 핸들러를 확장자로 등록합니다.
+FileDetailWidget은 선택한 파일의 확장자로 핸들러를 찾아 위젯을 전환하기만 합니다.
+
+- 핸들러는 그 형식을 처음 미리볼 때 만들어지고, 위젯도 그때 만들어집니다.
+  비디오를 열지 않으면 QtMultimedia를 불러오지도 않습니다.
+- 새 형식은 PreviewHandler를 상속하고 @register_preview_handler를 붙이면 됩니다.
+
+    @register_preview_handler
+    class AudioPreviewHandler(PreviewHandler):
+        extensions = (".mp3", ".flac")
+        def create_widget(self): ...
+        def show(self, file_path): ...
+"""
+
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Type
+
+from PyQt5.QtCore import QSize, Qt, QTimer
+from PyQt5.QtGui import QPixmap, QTextCursor
+from PyQt5.QtWidgets import QLabel, QScrollArea, QSizePolicy, QTextBrowser, QVBoxLayout, QWidget
+
+from core.preview.decoders import PREVIEW_EXTENSIONS
+from core.preview.pdf_page_loader import PdfPageLoader
+from core.preview.text_preview_loader import TextPreviewLoader, format_truncated_notice
+
+if TYPE_CHECKING:
+    from widgets.file_detail_widget import FileDetailWidget
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_LABEL_STYLE = "background-color: #f8f9fa; border: 1px solid #e9ecef; padding: 20px;"
+
+# 확장자(소문자, 점 포함) → 핸들러 클래스
+PREVIEW_HANDLERS: Dict[str, Type["PreviewHandler"]] = {}
+
+
+def register_preview_handler(handler_class: Type["PreviewHandler"]) -> Type["PreviewHandler"]:
+    """handler_class를 그 extensions의 미리보기 핸들러로 등록합니다 (클래스 데코레이터)."""
+    for extension in handler_class.extensions:
+        PREVIEW_HANDLERS[extension.lower()] = handler_class
+    return handler_class
+
+
+def preview_handler_class_for(file_path: str) -> Optional[Type["PreviewHandler"]]:
+    """파일 확장자에 등록된 핸들러 클래스. 없으면 None"""
+    return PREVIEW_HANDLERS.get(os.path.splitext(file_path)[1].lower())
+
+
+def create_preview_label(text: str) -> QLabel:
+    label = QLabel(text)
+    label.setAlignment(Qt.AlignCenter)
+    label.setStyleSheet(PREVIEW_LABEL_STYLE)
+    label.setMinimumSize(400, 300)
+    label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+    return label
+
+
+class PreviewHandler(ABC):
+    """한 파일 형식의 미리보기
+
+    Args:
+        owner: 미리보기를 표시하는 FileDetailWidget (현재 파일, 공용 PreviewLoader 제공)
+    """
+
+    extensions: Tuple[str, ...] = ()
+
+    def __init__(self, owner: "FileDetailWidget"):
+        self.owner = owner
+        self._widget: Optional[QWidget] = None
+
+    @property
+    def widget(self) -> QWidget:
+        """미리보기 위젯. 처음 접근할 때 만듭니다."""
+        if self._widget is None:
+            self._widget = self.create_widget()
+        return self._widget
+
+    @property
+    def is_created(self) -> bool:
+        return self._widget is not None
+
+    @abstractmethod
+    def create_widget(self) -> QWidget:
+        """미리보기 위젯을 만듭니다. widget에 처음 접근할 때 한 번 호출됩니다."""
+
+    @abstractmethod
+    def show(self, file_path: str):
+        """file_path를 표시합니다. owner가 이미 이 핸들러의 위젯으로 전환한 뒤 호출됩니다."""
+
+    def clear(self):
+        """진행 중인 작업을 취소하고 위젯을 비웁니다. 위젯이 만들어진 뒤에만 호출됩니다."""
+
+    def call_after_layout(self, file_path: str, callback):
+        """위젯이 레이아웃에서 실제 크기를 받은 뒤 callback()을 호출합니다.
+        처음 만든 위젯은 레이아웃 전까지 기본 크기이므로 크기에 맞춘 미리보기 요청은 이것으로 미룹니다.
+        그 사이 다른 파일로 바뀌었으면 호출하지 않습니다."""
+        def run():
+            if self.owner.current_file_path == file_path:
+                callback()
+        QTimer.singleShot(0, run)
+
+
+@register_preview_handler
+class ImagePreviewHandler(PreviewHandler):
+    extensions = PREVIEW_EXTENSIONS["image"]
+
+    def create_widget(self) -> QWidget:
+        return create_preview_label("이미지 미리보기")
+
+    def show(self, file_path: str):
+        logger.debug(f"이미지 파일 처리 시작: {file_path}")
+        self.widget.clear()
+        self.widget.setText(self.owner.LOADING_PLACEHOLDER_TEXT)
+        self.call_after_layout(file_path, lambda: self.owner.request_preview("image", file_path, self.widget))
+
+    def clear(self):
+        self.widget.clear()
+        self.widget.setText("이미지 미리보기")
+
+
+@register_preview_handler
+class TextPreviewHandler(PreviewHandler):
+    """텍스트 파일은 작업 스레드에서 첫 조각만 읽고, 끝까지 스크롤하면 다음 조각을 읽습니다.
+    마크다운은 앞부분만 작업 스레드에서 문서로 만들어 표시합니다."""
+
+    extensions = (".txt", ".md", ".py", ".js", ".html", ".css")
+    MARKDOWN_EXTENSIONS = (".md",)
+
+    def __init__(self, owner: "FileDetailWidget"):
+        super().__init__(owner)
+        self.text_preview_loader = TextPreviewLoader(parent=owner)
+        self.text_preview_loader.chunk_ready.connect(self._on_text_chunk_ready)
+        self.text_preview_loader.markdown_ready.connect(self._on_markdown_ready)
+        self.text_preview_loader.failed.connect(self._on_text_failed)
+        self._chunks_shown = 0
+        self._plain_text_document = None
+
+    def create_widget(self) -> QWidget:
+        text_browser = QTextBrowser()
+        text_browser.setLineWrapMode(QTextBrowser.NoWrap)
+        text_browser.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        text_browser.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        text_browser.setMinimumSize(400, 300)
+        text_browser.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        text_browser.setStyleSheet(
+            "QTextBrowser { background-color: #ffffff; border: 1px solid #e9ecef; padding: 20px; }"
+        )
+        # 마크다운 문서로 바뀌었다가 일반 텍스트로 돌아올 때 다시 쓰는 기본 문서
+        self._plain_text_document = text_browser.document()
+        text_browser.verticalScrollBar().valueChanged.connect(self._on_text_scrolled)
+        return text_browser
+
+    def show(self, file_path: str):
+        logger.info(f"텍스트 파일 처리 시작: {file_path}")
+        self.clear()
+        self.widget.setPlainText(self.owner.LOADING_PLACEHOLDER_TEXT)
+        self._chunks_shown = 0
+        markdown = os.path.splitext(file_path)[1].lower() in self.MARKDOWN_EXTENSIONS
+        self.text_preview_loader.open(file_path, markdown=markdown)
+
+    def clear(self):
+        """마크다운 문서를 내려놓고 빈 기본 문서로 되돌립니다."""
+        self.text_preview_loader.cancel()
+        text_browser = self.widget
+        document = text_browser.document()
+        if document is not self._plain_text_document:
+            text_browser.setDocument(self._plain_text_document)
+            document.deleteLater()
+        text_browser.clear()
+
+    def _on_text_chunk_ready(self, generation, file_path, text, at_end):
+        if file_path != self.owner.current_file_path:
+            return
+        if self._chunks_shown == 0:
+            self.widget.setPlainText(text)
+        else:
+            # 보고 있는 위치가 움직이지 않도록 위젯 커서가 아닌 별도 커서로 끝에 붙임
+            cursor = QTextCursor(self.widget.document())
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(text)
+        self._chunks_shown += 1
+        if at_end and self.text_preview_loader.truncated:
+            self.widget.append(format_truncated_notice(self.text_preview_loader.bytes_read))
+        logger.debug(f"텍스트 파일 로드: {file_path}, 누적 {self.text_preview_loader.bytes_read} 바이트")
+
+    def _on_text_scrolled(self, value):
+        scroll_bar = self.widget.verticalScrollBar()
+        if self._chunks_shown and value >= scroll_bar.maximum() - scroll_bar.pageStep():
+            self.text_preview_loader.request_more()
+
+    def _on_markdown_ready(self, generation, file_path, document):
+        if file_path != self.owner.current_file_path:
+            document.deleteLater()
+            return
+        document.setParent(self.widget)
+        document.setDefaultFont(self.widget.font())
+        self.widget.setDocument(document)
+
+    def _on_text_failed(self, generation, file_path, message):
+        if file_path != self.owner.current_file_path:
+            return
+        self.widget.setPlainText(f"파일을 읽을 수 없습니다: {message}")
+        logger.error(f"텍스트 파일 로드 실패: {file_path}, 오류: {message}")
+
+
+@register_preview_handler
+class PdfPreviewHandler(PreviewHandler):
+    """문서를 한 번 열어 첫 페이지를 그리고(캐시/예열 공유), 나머지 페이지 자리를 만들어
+    스크롤로 보이게 된 페이지만 같은 문서 핸들로 렌더링합니다."""
+
+    extensions = PREVIEW_EXTENSIONS["pdf"]
+
+    # 페이지 라벨 수 상한 (렌더링은 보이는 페이지만)
+    MAX_PDF_PAGES_TO_PREVIEW = 200
+    # 보이는 영역 아래로 미리 렌더링할 거리 (뷰포트 높이의 배수)
+    PDF_PREFETCH_VIEWPORTS = 1
+    PDF_PAGE_SPACING = 8
+
+    def __init__(self, owner: "FileDetailWidget"):
+        super().__init__(owner)
+        # 2페이지부터는 스크롤해서 보이게 될 때 렌더링
+        self.pdf_page_loader = PdfPageLoader(cache=owner.preview_loader.cache, parent=owner)
+        self.pdf_page_loader.document_opened.connect(self._on_pdf_document_opened)
+        self.pdf_page_loader.page_ready.connect(self._on_pdf_page_ready)
+        self.pdf_page_loader.page_failed.connect(self._on_pdf_page_failed)
+        self._pdf_page_size = QSize()
+        self.pdf_preview_label = None
+        self.pdf_pages_layout = None
+        self.pdf_page_labels = []
+
+    def create_widget(self) -> QWidget:
+        # 페이지를 세로로 나열, 첫 페이지 라벨은 항상 있음
+        self.pdf_preview_label = create_preview_label("PDF 미리보기")
+        pdf_pages_container = QWidget()
+        self.pdf_pages_layout = QVBoxLayout(pdf_pages_container)
+        self.pdf_pages_layout.setContentsMargins(0, 0, 0, 0)
+        self.pdf_pages_layout.setSpacing(self.PDF_PAGE_SPACING)
+        self.pdf_pages_layout.addWidget(self.pdf_preview_label)
+        self.pdf_page_labels = [self.pdf_preview_label]
+
+        pdf_scroll_area = QScrollArea()
+        pdf_scroll_area.setWidgetResizable(True)
+        pdf_scroll_area.setWidget(pdf_pages_container)
+        pdf_scroll_area.setMinimumSize(400, 300)
+        pdf_scroll_area.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        pdf_scroll_area.verticalScrollBar().valueChanged.connect(self._load_visible_pdf_pages)
+        return pdf_scroll_area
+
+    def show(self, file_path: str):
+        logger.debug(f"PDF 파일 처리 시작: {file_path}")
+        self._clear_pdf_pages()
+        self.pdf_preview_label.clear()
+        self.pdf_preview_label.setText(self.owner.LOADING_PLACEHOLDER_TEXT)
+        self.call_after_layout(file_path, lambda: self._open_pdf(file_path))
+
+    def _open_pdf(self, file_path: str):
+        self._pdf_page_size = self._pdf_page_target_size()
+        # 첫 페이지는 PreviewLoader를 거치지 않으므로 예열이 쓸 크기를 따로 알림
+        self.owner.preview_loader.remember_target_size("pdf", self._pdf_page_size)
+        self.pdf_page_loader.open(file_path, self._pdf_page_size)
+
+    def clear(self):
+        self._clear_pdf_pages()
+        self.pdf_preview_label.clear()
+        self.pdf_preview_label.setText("PDF 미리보기")
+
+    def _pdf_page_target_size(self):
+        """한 페이지가 뷰포트 안에 들어가는 크기 (렌더링 배율은 이 크기에서 계산)"""
+        viewport = self.widget.viewport().size()
+        # 스타일시트의 padding/border만큼 라벨 안쪽이 좁아짐
+        self.pdf_preview_label.ensurePolished()
+        margins = self.pdf_preview_label.contentsMargins()
+        return QSize(
+            max(1, viewport.width() - margins.left() - margins.right()),
+            max(1, viewport.height() - margins.top() - margins.bottom()),
+        )
+
+    def _on_pdf_document_opened(self, generation, file_path, page_count):
+        if file_path != self.owner.current_file_path:
+            return
+        page_total = min(page_count, self.MAX_PDF_PAGES_TO_PREVIEW)
+        for index in range(1, page_total):
+            label = QLabel(f"{index + 1} / {page_count} 페이지")
+            label.setAlignment(Qt.AlignCenter)
+            label.setStyleSheet(PREVIEW_LABEL_STYLE)
+            # 렌더링 전에도 한 페이지 높이를 차지해야 보이는 페이지를 올바르게 계산할 수 있음
+            label.setMinimumHeight(self.widget.viewport().height())
+            self.pdf_pages_layout.addWidget(label)
+            self.pdf_page_labels.append(label)
+        logger.debug(f"PDF 페이지 {page_count}개 중 {page_total}개 표시: {file_path}")
+        # 새 라벨의 위치는 레이아웃이 갱신된 뒤에 정해짐
+        QTimer.singleShot(0, self._load_visible_pdf_pages)
+
+    def _load_visible_pdf_pages(self, *args):
+        """뷰포트(와 그 아래 PDF_PREFETCH_VIEWPORTS만큼)에 걸친 페이지의 렌더링을 요청합니다."""
+        if len(self.pdf_page_labels) <= 1:
+            return
+        # 새로 넣은 라벨은 스크롤 영역이 컨테이너 크기를 늘리기 전까지 겹쳐 배치되므로 먼저 늘림
+        container = self.widget.widget()
+        needed_height = container.sizeHint().height()
+        if container.height() < needed_height:
+            container.resize(container.width(), needed_height)
+        self.pdf_pages_layout.activate()
+        viewport_height = self.widget.viewport().height()
+        top = self.widget.verticalScrollBar().value()
+        bottom = top + viewport_height * (1 + self.PDF_PREFETCH_VIEWPORTS)
+        visible = [
+            index for index, label in enumerate(self.pdf_page_labels)
+            if index > 0 and label.y() < bottom and label.y() + label.height() > top
+        ]
+        self.pdf_page_loader.request_pages(visible, self._pdf_page_size)
+
+    def _on_pdf_page_ready(self, generation, index, image):
+        if 0 <= index < len(self.pdf_page_labels):
+            self.pdf_page_labels[index].setPixmap(QPixmap.fromImage(image))
+
+    def _on_pdf_page_failed(self, generation, index, message):
+        # 문서를 열지 못했으면(-1) 첫 페이지 자리에 표시
+        label_index = max(index, 0)
+        if label_index < len(self.pdf_page_labels):
+            self.pdf_page_labels[label_index].setText(message)
+        logger.error(f"PDF 페이지 미리보기 실패: {self.owner.current_file_path}, 페이지: {index}, 오류: {message}")
+
+    def _clear_pdf_pages(self):
+        """PDF 작업을 취소하고 첫 페이지 라벨만 남깁니다."""
+        self.pdf_page_loader.cancel()
+        for label in self.pdf_page_labels[1:]:
+            self.pdf_pages_layout.removeWidget(label)
+            label.deleteLater()
+        self.pdf_page_labels = [self.pdf_preview_label]
+        self.widget.verticalScrollBar().setValue(0)
+
+
+@register_preview_handler
+class VideoPreviewHandler(PreviewHandler):
+    extensions = (".mp4", ".avi", ".mkv", ".mov", ".webm")
+
+    def create_widget(self) -> QWidget:
+        # QtMultimedia는 비디오를 처음 미리볼 때 불러옴
+        from widgets.video_player_widget import VideoPlayerWidget
+        return VideoPlayerWidget()
+
+    def show(self, file_path: str):
+        logger.debug(f"비디오 파일 처리 시작: {file_path}")
+        self.widget.play(file_path)
+
+    def clear(self):
+        self.widget.stop()
@@ -25,6 +25,7 @@ class SearchWidget(QWidget):
         """ViewModel의 시그널을 위젯의 슬롯에 연결합니다."""
         self.viewmodel.search_completed.connect(self.update_search_results)
         self.viewmodel.search_cleared.connect(self.clear_search)
+        self.viewmodel.search_failed.connect(self.show_search_error)
         
         # 디바운싱 타이머 단순화
         self._debounce_timer = QTimer()
@@ -82,7 +83,10 @@ class SearchWidget(QWidget):
         self.tag_input.setPlaceholderText("태그 검색 (예: 중요,문서|긴급)")
         self.tag_input.setFixedHeight(36)
         self.tag_input.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        self.tag_input.setToolTip("쉼표(,)는 AND, 파이프(|)는 OR, 별표(*)는 NOT 조건입니다.")
+        self.tag_input.setToolTip(
+            "쉼표(,)/AND는 AND, 파이프(|)/OR는 OR, 별표(*)/NOT은 NOT 조건입니다.\n"
+            "괄호로 묶을 수 있습니다. 예: 프로젝트 AND (초안 OR 검토) NOT 보관"
+        )
         main_fields_layout.addWidget(self.tag_input, 3)
 
         main_layout.addWidget(main_fields_container, 65)  # stretch=65로 65% 차지
@@ -444,10 +448,12 @@ class SearchWidget(QWidget):
         
         self.result_count_label.setText("검색 결과")
         self.search_conditions_label.clear()
+        self.search_conditions_label.setToolTip("")
         
     def update_search_results(self, count: int, conditions_summary: str = ""):
         """검색 결과 업데이트"""
         self.result_count_label.setText(f"{count}개 검색됨")
+        self.search_conditions_label.setToolTip("")
         
         # 사용자가 입력한 검색값들만 조건표시창에 표시
         display_conditions = []
@@ -509,6 +515,12 @@ class SearchWidget(QWidget):
         else:
             self.search_conditions_label.clear()
 
+    def show_search_error(self, message: str):
+        """검색 실패(검색식 오류 등)를 결과 표시 영역에 알립니다."""
+        self.result_count_label.setText("검색 오류")
+        self.search_conditions_label.setText(message)
+        self.search_conditions_label.setToolTip(message)
+
     def show_advanced_panel(self, show: bool):
         """고급 검색 패널 표시/숨김"""
         self.advanced_panel.setVisible(show)
@@ -0,0 +1,327 @@
+"""
+비디오 미리보기 위젯
+
+QtMultimedia는 불러오는 데 시간이 걸리고 미디어 백엔드를 초기화하므로,
+비디오를 처음 미리볼 때 이 모듈을 불러옵니다 (widgets.preview_handlers.VideoPreviewHandler).
+"""
+
+import logging
+
+from PyQt5.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QSlider,
+    QToolButton,
+    QStyle,
+    QSizePolicy,
+    QSpacerItem,
+)
+from PyQt5.QtCore import Qt, QUrl
+from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
+from PyQt5.QtMultimediaWidgets import QVideoWidget
+
+logger = logging.getLogger(__name__)
+
+
+class ClickableSlider(QSlider):
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            # 클릭 위치를 슬라이더 값으로 변환
+            if self.orientation() == Qt.Horizontal:
+                value = (
+                    self.minimum()
+                    + ((self.maximum() - self.minimum()) * event.x()) / self.width()
+                )
+            else:  # Qt.Vertical
+                value = (
+                    self.maximum()
+                    - ((self.maximum() - self.minimum()) * event.y()) / self.height()
+                )
+            self.setValue(int(value))
+            self.sliderMoved.emit(int(value))
+        super().mousePressEvent(event)
+
+
+class VideoPlayerWidget(QWidget):
+    """비디오 화면과 재생 컨트롤"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._setup_ui()
+
+    def _setup_ui(self):
+        video_layout = QVBoxLayout(self)
+        video_layout.setContentsMargins(0, 0, 0, 0)  # 여백 제거
+        video_layout.setSpacing(0)  # 간격 제거
+        
+        self.video_widget = QVideoWidget()
+        self.video_widget.setMinimumSize(400, 300)
+        self.video_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.video_widget.setStyleSheet(
+            "QVideoWidget { background-color: #000000; border-radius: 8px; }"
+        )
+        video_layout.addWidget(self.video_widget)
+        
+        # 현대적인 비디오 컨트롤 패널
+        self.controls_panel = QWidget()
+        self.controls_panel.setStyleSheet("""
+            QWidget {
+                background-color: rgba(255, 255, 255, 0.9);
+                border-radius: 8px;
+                border: 1px solid rgba(0, 0, 0, 0.1);
+            }
+        """)
+        self.controls_panel.setMaximumHeight(100)
+        
+        controls_layout = QVBoxLayout(self.controls_panel)
+        controls_layout.setContentsMargins(12, 8, 12, 8)
+        controls_layout.setSpacing(1)
+        
+        # 상단: 진행바
+        progress_layout = QHBoxLayout()
+        progress_layout.setContentsMargins(0, 5, 0, 5)
+        progress_layout.setSpacing(8)
+        
+        self.current_time_label = QLabel("00:00")
+        self.current_time_label.setStyleSheet("""
+            QLabel {
+                color: #333333;
+                font-size: 10px;
+                font-weight: 500;
+                min-width: 35px;
+                max-width: 35px;
+                min-height: 14px;
+                padding: 0px;
+                border: none;
+                background: transparent;
+            }
+        """)
+        
+        self.position_slider = ClickableSlider(Qt.Horizontal)
+        self.position_slider.setRange(0, 0)
+        self.position_slider.sliderMoved.connect(self.set_position)
+        self.position_slider.setStyleSheet("""
+            QSlider {
+                border: none;
+                background: transparent;
+            }
+            QSlider::groove:horizontal {
+                border: none;
+                height: 4px;
+                background: rgba(0, 0, 0, 0.2);
+                border-radius: 2px;
+            }
+            QSlider::sub-page:horizontal {
+                background: #0078d4;
+                border-radius: 2px;
+            }
+            QSlider::handle:horizontal {
+                background: #ffffff;
+                border: 2px solid #0078d4;
+                width: 12px;
+                height: 12px;
+                border-radius: 6px;
+                margin: -4px 0;
+            }
+            QSlider::handle:horizontal:hover {
+                background: #f0f0f0;
+            }
+        """)
+        
+        self.total_time_label = QLabel("00:00")
+        self.total_time_label.setStyleSheet("""
+            QLabel {
+                color: #333333;
+                font-size: 10px;
+                font-weight: 500;
+                min-width: 35px;
+                max-width: 35px;
+                min-height: 14px;
+                padding: 0px;
+                border: none;
+                background: transparent;
+            }
+        """)
+        
+        progress_layout.addWidget(self.current_time_label)
+        progress_layout.addWidget(self.position_slider, 1)
+        progress_layout.addWidget(self.total_time_label)
+        
+        # 하단: 컨트롤 버튼들 (가운데 정렬)
+        buttons_layout = QHBoxLayout()
+        buttons_layout.setContentsMargins(0, 5, 0, 15)
+        buttons_layout.setSpacing(10)
+        
+        # 공통 버튼 스타일
+        button_style = """
+            QToolButton {
+                background-color: rgba(0, 0, 0, 0.1);
+                border: none;
+                border-radius: 10px;
+                padding: 2px;
+                width: 18px;
+                height: 18px;
+            }
+            QToolButton:hover {
+                background-color: rgba(0, 0, 0, 0.2);
+            }
+            QToolButton:pressed {
+                background-color: rgba(0, 0, 0, 0.3);
+            }
+        """
+        
+        # 재생/일시정지 버튼
+        self.play_button = QToolButton()
+        self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+        self.play_button.setStyleSheet(button_style)
+        self.play_button.setFixedSize(18, 18)
+        
+        # 정지 버튼
+        self.stop_button = QToolButton()
+        self.stop_button.setIcon(self.style().standardIcon(QStyle.SP_MediaStop))
+        self.stop_button.setStyleSheet(button_style)
+        self.stop_button.setFixedSize(18, 18)
+        
+        # 볼륨 버튼
+        self.volume_button = QToolButton()
+        self.volume_button.setIcon(self.style().standardIcon(QStyle.SP_MediaVolume))
+        self.volume_button.setStyleSheet(button_style)
+        self.volume_button.setFixedSize(18, 18)
+        
+        # 버튼들을 가운데 정렬
+        buttons_layout.addItem(QSpacerItem(20, 0, QSizePolicy.Expanding, QSizePolicy.Minimum))
+        buttons_layout.addWidget(self.play_button)
+        buttons_layout.addWidget(self.stop_button)
+        buttons_layout.addWidget(self.volume_button)
+        # 볼륨 슬라이더는 처음엔 추가하지 않음 (동적으로 추가/제거)
+        buttons_layout.addItem(QSpacerItem(20, 0, QSizePolicy.Expanding, QSizePolicy.Minimum))
+
+        # 볼륨 슬라이더 (가로형, 버튼 오른쪽에 위치)
+        self.volume_slider = QSlider(Qt.Horizontal)
+        self.volume_slider.setRange(0, 100)
+        self.volume_slider.setValue(50)
+        self.volume_slider.hide()
+        self.volume_slider.setMinimumWidth(80)
+        self.volume_slider.setMaximumWidth(120)
+        self.volume_slider.setFixedHeight(20)
+        self.volume_slider.setStyleSheet("""
+            QSlider {
+                border: none;
+                background: transparent;
+            }
+            QSlider::groove:horizontal {
+                border: none;
+                height: 4px;
+                background: rgba(0, 0, 0, 0.2);
+                border-radius: 2px;
+            }
+            QSlider::sub-page:horizontal {
+                background: #0078d4;
+                border-radius: 2px;
+            }
+            QSlider::handle:horizontal {
+                background: #ffffff;
+                border: 2px solid #0078d4;
+                width: 12px;
+                height: 12px;
+                border-radius: 6px;
+                margin: -4px 0;
+            }
+            QSlider::handle:horizontal:hover {
+                background: #f0f0f0;
+            }
+        """)
+        self._volume_slider_added = False
+
+        # 레이아웃 조립
+        controls_layout.addLayout(progress_layout)
+        controls_layout.addLayout(buttons_layout)
+        
+        # 컨트롤 패널을 비디오 레이아웃에 추가 (여백 포함)
+        video_layout.addWidget(self.controls_panel)
+        video_layout.setContentsMargins(8, 8, 8, 8)  # 비디오 컨테이너에 여백 추가
+        video_layout.setSpacing(10)  # 비디오 위젯과 컨트롤 패널 사이 간격
+        
+
+        # 비디오 플레이어 설정
+        self.media_player = QMediaPlayer(None, QMediaPlayer.VideoSurface)
+        self.media_player.setVideoOutput(self.video_widget)
+        
+        # 비디오 컨트롤 연결
+        self.play_button.clicked.connect(self.toggle_play_pause)
+        self.stop_button.clicked.connect(self.media_player.stop)
+        self.volume_button.clicked.connect(self.toggle_volume_slider)
+        self.volume_slider.valueChanged.connect(self.media_player.setVolume)
+        self.media_player.positionChanged.connect(self.position_changed)
+        self.media_player.durationChanged.connect(self.duration_changed)
+        self.media_player.stateChanged.connect(self.update_play_button_icon)
+
+    def play(self, file_path):
+        """file_path를 처음부터 재생합니다."""
+        self.stop()
+        self.media_player.setMedia(QMediaContent(QUrl.fromLocalFile(file_path)))
+        self.media_player.play()
+
+    def stop(self):
+        """재생을 멈추고 미디어와 컨트롤을 초기 상태로 되돌립니다."""
+        if self.media_player.state() == QMediaPlayer.PlayingState:
+            self.media_player.stop()
+        self.media_player.setMedia(QMediaContent())
+        self.position_slider.setRange(0, 0)
+        self.position_slider.setValue(0)
+        self.current_time_label.setText("00:00")
+        self.total_time_label.setText("00:00")
+        self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+        
+        # 볼륨 슬라이더 숨기기
+        self.volume_slider.hide()
+        self.volume_slider.setValue(50)
+
+    def toggle_play_pause(self):
+        if self.media_player.state() == QMediaPlayer.PlayingState:
+            self.media_player.pause()
+        else:
+            self.media_player.play()
+
+    def update_play_button_icon(self, state):
+        if state == QMediaPlayer.PlayingState:
+            self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPause))
+        else:
+            self.play_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+
+    def toggle_volume_slider(self):
+        # 볼륨 버튼 오른쪽에 플로팅으로 표시/숨김
+        if self.volume_slider.isVisible():
+            self.volume_slider.hide()
+        else:
+            # 볼륨 버튼의 글로벌 위치 계산
+            button_rect = self.volume_button.rect()
+            button_global = self.volume_button.mapToGlobal(button_rect.topRight())
+            parent_global = self.controls_panel.mapToGlobal(self.controls_panel.rect().topLeft())
+            # controls_panel 기준 상대 좌표
+            x = button_global.x() - parent_global.x() + 8  # 약간 오른쪽 여유
+            y = button_global.y() - parent_global.y() - (self.volume_slider.height() - button_rect.height()) // 2
+            # 슬라이더를 controls_panel 위에 플로팅으로 표시
+            self.volume_slider.setParent(self.controls_panel)
+            self.volume_slider.setGeometry(x, y, self.volume_slider.width(), self.volume_slider.height())
+            self.volume_slider.show()
+            self.volume_slider.raise_()
+
+    def position_changed(self, position):
+        self.position_slider.setValue(position)
+        self.current_time_label.setText(self.format_time(position))
+
+    def duration_changed(self, duration):
+        self.position_slider.setRange(0, duration)
+        self.total_time_label.setText(self.format_time(duration))
+
+    def set_position(self, position):
+        self.media_player.setPosition(position)
+
+    def format_time(self, milliseconds):
+        seconds = int(milliseconds / 1000)
+        minutes = int(seconds / 60)
+        seconds %= 60
+        return f"{minutes:02d}:{seconds:02d}"